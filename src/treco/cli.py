@@ -1,9 +1,16 @@
 import click
 import os
 import json
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 from treco import RaceCoordinator
+from treco.orchestrator.distributed import (
+    CoordinatorNode,
+    DistributedNode,
+    WorkerNode,
+    parse_address,
+)
+from treco.orchestrator.tuner import DEFAULT_STRATEGIES, DEFAULT_SYNC_MECHANISMS, RaceTuner
 from treco.logging import get_logger, setup_logging
 from treco.console import error, print_banner, success, warning
 
@@ -133,8 +140,62 @@ def apply_type_hint(value: Any, type_hint: str) -> Any:
     is_flag=True,
     help='Validate configuration without executing the attack'
 )
+@click.option(
+    '--coordinator',
+    metavar='HOST:PORT',
+    help='Coordinate a distributed race: listen for workers on HOST:PORT'
+)
+@click.option(
+    '--workers',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='Number of workers to wait for (with --coordinator)'
+)
+@click.option(
+    '--worker',
+    metavar='HOST:PORT',
+    help='Join a distributed race as a worker of the coordinator at HOST:PORT'
+)
+@click.option(
+    '--tune',
+    is_flag=True,
+    help='Search threads, connection strategy and sync mechanism of a race state'
+)
+@click.option(
+    '--tune-state',
+    metavar='STATE',
+    help='Race state to tune (default: the first race state)'
+)
+@click.option(
+    '--tune-strategies',
+    metavar='LIST',
+    default=','.join(DEFAULT_STRATEGIES),
+    show_default=True,
+    help='Comma-separated connection strategies to try'
+)
+@click.option(
+    '--tune-sync',
+    metavar='LIST',
+    default=','.join(DEFAULT_SYNC_MECHANISMS),
+    show_default=True,
+    help='Comma-separated sync mechanisms to try'
+)
+@click.option(
+    '--tune-max-threads',
+    type=click.IntRange(min=1),
+    help='Largest thread count to try (default: 4x the configured threads)'
+)
+@click.option(
+    '--tune-output',
+    type=click.Path(dir_okay=False, writable=True),
+    help='Write the winning settings as a YAML overlay to this file'
+)
 def main(config_file: str, variables: Dict[str, Any], log_level: str, 
-         no_banner: bool, validate_only: bool):
+         no_banner: bool, validate_only: bool, coordinator: Optional[str],
+         workers: int, worker: Optional[str], tune: bool, tune_state: Optional[str],
+         tune_strategies: str, tune_sync: str, tune_max_threads: Optional[int],
+         tune_output: Optional[str]):
     """
     TRECO - Tactical Race Exploitation & Concurrency Orchestrator
     
@@ -147,7 +208,18 @@ def main(config_file: str, variables: Dict[str, Any], log_level: str,
         treco attack.yaml --set username=carlos --set password=secret
         treco attack.yaml -s threads=50 -s host=target.com
         treco attack.yaml --set passwords=@wordlist.txt
+        treco attack.yaml --coordinator 0.0.0.0:7000 --workers 2
+        treco attack.yaml --worker 10.0.0.1:7000
+        treco attack.yaml --tune --tune-max-threads 100 --tune-output tuned.yaml
     """
+    if coordinator and worker:
+        raise click.UsageError("--coordinator and --worker are mutually exclusive")
+    if tune and (coordinator or worker):
+        raise click.UsageError("--tune cannot be combined with distributed options")
+    try:
+        node = create_node(coordinator, workers, worker)
+    except ValueError as e:
+        raise click.BadParameter(str(e)) from e
     
     # Setup logging with configured level
     setup_logging(log_level)
@@ -156,11 +228,19 @@ def main(config_file: str, variables: Dict[str, Any], log_level: str,
     if not no_banner and not validate_only:
         print_banner()
     
-    # Run validation or full attack
+    # Run validation, tuning or full attack
     if validate_only:
         return validate_config(config_file)
+    elif tune:
+        tuner_options = {
+            'state_name': tune_state,
+            'strategies': split_list(tune_strategies),
+            'sync_mechanisms': split_list(tune_sync),
+            'max_threads': tune_max_threads or 0,
+        }
+        return run_tune(config_file, variables, tuner_options, tune_output)
     else:
-        results = run_attack(config_file, variables)
+        results = run_attack(config_file, variables, node)
         return results
 
 
@@ -223,13 +303,44 @@ def validate_config(config_path: str) -> int:
         return 1
 
 
-def run_attack(config_path: str, variables: Dict[str, Any]) -> int:
+def split_list(value: str) -> List[str]:
+    """Split a comma-separated option value."""
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def create_node(
+    coordinator: Optional[str], workers: int, worker: Optional[str]
+) -> Optional[DistributedNode]:
+    """
+    Create the distributed race node selected on the command line.
+
+    Args:
+        coordinator: HOST:PORT to listen on as coordinator
+        workers: Number of workers the coordinator waits for
+        worker: HOST:PORT of the coordinator to join as worker
+
+    Returns:
+        CoordinatorNode, WorkerNode, or None for a standalone run
+    """
+    if coordinator:
+        host, port = parse_address(coordinator)
+        return CoordinatorNode(host, port, workers)
+    if worker:
+        host, port = parse_address(worker)
+        return WorkerNode(host, port)
+    return None
+
+
+def run_attack(
+    config_path: str, variables: Dict[str, Any], node: Optional[DistributedNode] = None
+) -> int:
     """
     Execute the race condition attack.
 
     Args:
         config_path: Path to configuration file
         variables: Input variables for the attack
+        node: Distributed race node, if any
 
     Returns:
         Exit code (0 for success, non-zero for failure)
@@ -238,7 +349,7 @@ def run_attack(config_path: str, variables: Dict[str, Any]) -> int:
 
     try:
         # Create and run coordinator
-        coordinator = RaceCoordinator(config_path, variables)
+        coordinator = RaceCoordinator(config_path, variables, node=node)
         results = coordinator.run()
 
         # Success output
@@ -258,5 +369,62 @@ def run_attack(config_path: str, variables: Dict[str, Any]) -> int:
         logger.debug(traceback.format_exc())
         return 1
 
+
+def run_tune(
+    config_path: str,
+    variables: Dict[str, Any],
+    tuner_options: Dict[str, Any],
+    output_path: Optional[str] = None,
+) -> int:
+    """
+    Search race parameters and report the best configuration.
+
+    Args:
+        config_path: Path to configuration file
+        variables: Input variables for the attack
+        tuner_options: Keyword arguments for RaceTuner
+        output_path: File to write the YAML overlay to (default: stdout)
+
+    Returns:
+        Exit code (0 for success, non-zero for failure)
+    """
+    logger = get_logger()
+
+    try:
+        tuner = RaceTuner(config_path, variables, **tuner_options)
+        best = tuner.run()
+
+        print(f"\nTrials ({len(tuner.trials)}):")
+        for trial in tuner.trials:
+            print(f"  {trial.describe()}")
+
+        if best.failure or best.error_rate > tuner.max_error_rate:
+            print(warning("\nNo configuration met the error rate limit"))
+            return 1
+
+        overlay = tuner.overlay(best)
+        if output_path:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(overlay)
+            print()
+            print(success(f"Best configuration written to {output_path}"))
+        else:
+            print()
+            print(success("Best configuration:"))
+            print(overlay)
+
+        return 0
+
+    except KeyboardInterrupt:
+        print(f"\n{warning('Tuning interrupted by user')}")
+        return 130
+
+    except Exception as e:
+        import sys
+        import traceback
+        print(f"\n{error(f'Tuning failed: {e}')}", file=sys.stderr)
+        logger.debug(traceback.format_exc())
+        return 1
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
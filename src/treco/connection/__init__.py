@@ -7,6 +7,8 @@ HTTP connections in multi-threaded race attacks.
 Strategies:
     - PreconnectStrategy: Pre-establish individual connections per thread
     - MultiplexedStrategy: Single HTTP/2 connection shared by all threads
+    - SinglePacketStrategy: HTTP/2 single-packet attack (final frames in one write)
+    - LastByteStrategy: HTTP/1.1 last-byte sync (final byte per connection withheld)
     - LazyStrategy: Connect on-demand (NOT recommended for races)
     - PooledStrategy: Shared connection pool (NOT recommended for races)
 
@@ -25,20 +27,25 @@ Example:
     response = client.send(request)
 """
 
-from typing import Optional
+from typing import Optional, Union
 
 from .base import ConnectionStrategy
 from .preconnect import PreconnectStrategy
 from .multiplexed import MultiplexedStrategy
+from .single_packet import SinglePacketStrategy
+from .last_byte import LastByteStrategy
 from .lazy import LazyStrategy
 from .pooled import PooledStrategy
 from ..sync.base import SyncMechanism
+from ..sync.aio import AsyncSyncMechanism
 
 
 # Registry of available strategies
 CONNECTION_STRATEGIES = {
     "preconnect": PreconnectStrategy,
     "multiplexed": MultiplexedStrategy,
+    "single_packet": SinglePacketStrategy,
+    "last_byte": LastByteStrategy,
     "lazy": LazyStrategy,
     "pooled": PooledStrategy,
 }
@@ -46,22 +53,40 @@ CONNECTION_STRATEGIES = {
 
 def create_connection_strategy(
     strategy_type: str,
-    sync: Optional[SyncMechanism] = None,
+    sync: Optional[Union[SyncMechanism, AsyncSyncMechanism]] = None,
     bypass_proxy: bool = False,
+    send_engine: str = "httpx",
+    warmup: str = "handshake",
+    warmup_path: str = "/",
+    engine: str = "threads",
+    kernel_timestamps: bool = False,
 ) -> ConnectionStrategy:
     """
     Factory function to create connection strategy by name.
 
     Args:
-        strategy_type: Type of strategy ("preconnect", "multiplexed", "lazy", "pooled")
+        strategy_type: Type of strategy ("preconnect", "multiplexed", "single_packet",
+            "last_byte", "lazy", "pooled")
         sync: Optional sync mechanism for connection coordination
         bypass_proxy: Whether to bypass proxy for this strategy
+        send_engine: "httpx" (default) or "raw" to write pre-serialized bytes
+                     straight to the socket (preconnect and last_byte only)
+        warmup: How connections are warmed up before the race: "handshake"
+                (TCP/TLS/HTTP/2 preface only, default), "head", "options" or "get"
+        warmup_path: Path requested by request-based warmup modes
+        engine: "threads" (default) or "asyncio" to use the strategy's async
+                lifecycle (sync must then be an AsyncSyncMechanism)
+        kernel_timestamps: Enable SO_TIMESTAMPING on race sockets (strategies
+                           that own their sockets: raw preconnect, last_byte
+                           and single_packet)
 
     Returns:
         Instance of ConnectionStrategy
 
     Raises:
-        ValueError: If strategy_type is not recognized
+        ValueError: If strategy_type or warmup is not recognized, or the
+                    strategy does not support the requested send engine,
+                    race engine or kernel timestamps
 
     Example:
         # Pre-established connections (recommended for races)
@@ -70,8 +95,21 @@ def create_connection_strategy(
         # HTTP/2 multiplexed (single connection)
         strategy = create_connection_strategy("multiplexed")
         
+        # HTTP/2 single-packet attack
+        strategy = create_connection_strategy("single_packet")
+        
+        # HTTP/1.1 last-byte synchronization
+        strategy = create_connection_strategy("last_byte", sync=barrier)
+        
         # Bypass proxy for race attack
         strategy = create_connection_strategy("preconnect", bypass_proxy=True)
+        
+        # Raw socket send engine
+        strategy = create_connection_strategy("preconnect", send_engine="raw")
+        
+        # Asyncio race engine
+        sync = create_async_sync_mechanism("barrier")
+        strategy = create_connection_strategy("preconnect", sync=sync, engine="asyncio")
     """
     if strategy_type not in CONNECTION_STRATEGIES:
         raise ValueError(
@@ -81,14 +119,37 @@ def create_connection_strategy(
 
     strategy_class = CONNECTION_STRATEGIES[strategy_type]
     
-    # All strategies now accept bypass_proxy in base class
-    return strategy_class(sync=sync, bypass_proxy=bypass_proxy)
+    if engine == "asyncio":
+        if not strategy_class.supports_async_engine:
+            raise ValueError(
+                f"Connection strategy '{strategy_type}' does not support the asyncio engine. "
+                f"Supported: {[name for name, cls in CONNECTION_STRATEGIES.items() if cls.supports_async_engine]}"
+            )
+        if send_engine == "raw":
+            raise ValueError("The raw send engine is not supported by the asyncio engine")
+    
+    if send_engine == "raw":
+        if not strategy_class.supports_raw_engine:
+            raise ValueError(
+                f"Connection strategy '{strategy_type}' does not support the raw send engine. "
+                f"Supported: {[name for name, cls in CONNECTION_STRATEGIES.items() if cls.supports_raw_engine]}"
+            )
+        strategy = strategy_class(sync=sync, bypass_proxy=bypass_proxy, raw=True)
+    else:
+        # All strategies now accept bypass_proxy in base class
+        strategy = strategy_class(sync=sync, bypass_proxy=bypass_proxy)
+    
+    strategy.configure_warmup(warmup, warmup_path)
+    strategy.configure_timestamps(kernel_timestamps)
+    return strategy
 
 
 __all__ = [
     "ConnectionStrategy",
     "PreconnectStrategy",
     "MultiplexedStrategy",
+    "SinglePacketStrategy",
+    "LastByteStrategy",
     "LazyStrategy",
     "PooledStrategy",
     "create_connection_strategy",
@@ -4,15 +4,25 @@ Base interface for connection strategies.
 Defines the contract that all connection strategies must implement.
 """
 
+import logging
+import socket
+import ssl
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import httpx
 
+from ..http.timestamping import kernel_timestamps_supported
+from ..models.config import SocketConfig
+from ..http.sockopts import connect_socket, describe_socket_options, socket_options, unsupported_options
+from .transport import AsyncPrewarmedBackend, PrewarmedBackend, shared_ssl_context, tls_sessions
+
 if TYPE_CHECKING:
     from treco.http import HTTPClient
     from treco.sync.base import SyncMechanism
 
+logger = logging.getLogger("treco")
+
 
 class ConnectionStrategy(ABC):
     """
@@ -26,11 +36,19 @@ class ConnectionStrategy(ABC):
         2. prepare(num_threads, client): Setup configuration (main thread)
         3. connect(thread_id): Establish connection (each worker thread)
         4. get_session(thread_id): Get session for requests
-        5. cleanup(): Release resources (main thread)
+        5. stage_request(thread_id, request): Pre-send data (optional, each worker thread)
+        6. cleanup(): Release resources (main thread)
+
+    Strategies with supports_async_engine also implement the same lifecycle
+    for race.engine: asyncio, with httpx.AsyncClient sessions: prepare_async(),
+    connect_async(), get_async_session() and cleanup_async(), all called from
+    one event loop. The connection sync mechanism is then an AsyncSyncMechanism.
 
     The choice of strategy significantly impacts race timing:
         - preconnect: Individual HTTP/2 connections per thread (< 10ms window)
         - multiplexed: Single HTTP/2 connection shared (< 1ms window)
+        - single_packet: Final HTTP/2 frames flushed in one TCP write
+        - last_byte: Final byte of each HTTP/1.1 request withheld until release
         - lazy: Connect on-demand (> 100ms window, not recommended)
         - pooled: Shared pool (serialized, defeats race purpose)
 
@@ -56,6 +74,15 @@ class ConnectionStrategy(ABC):
                 pass
     """
 
+    # Whether the strategy can hand out RawSession objects (race.send_engine: raw)
+    supports_raw_engine: bool = False
+
+    # Whether the strategy implements the async lifecycle (race.engine: asyncio)
+    supports_async_engine: bool = False
+
+    # Warmup modes: handshake-only, or a lightweight request with this method
+    WARMUP_MODES = ("handshake", "head", "options", "get")
+
     def __init__(
         self, 
         sync: Optional["SyncMechanism"] = None,
@@ -82,10 +109,21 @@ class ConnectionStrategy(ABC):
         
         # Configuration set in prepare()
         self._base_url: str = ""
+        self._host: str = ""
+        self._port: int = 0
+        self._tls_enabled: bool = False
         self._verify_cert: bool = True
         self._follow_redirects: bool = False
         self._proxy = None
         self._http_client: Optional["HTTPClient"] = None
+        self._socket_config = SocketConfig()
+        
+        # Warmup behaviour (see configure_warmup)
+        self._warmup_mode: str = "handshake"
+        self._warmup_path: str = "/"
+
+        # Kernel TX/RX timestamps on race sockets (see configure_timestamps)
+        self._kernel_timestamps: bool = False
 
     @property
     def sync(self) -> Optional["SyncMechanism"]:
@@ -97,15 +135,65 @@ class ConnectionStrategy(ABC):
         """Set the sync mechanism for connection coordination."""
         self._sync = value
 
-    def _build_client_kwargs(self, limits: Optional[httpx.Limits] = None) -> Dict[str, Any]:
+    def configure_warmup(self, mode: str = "handshake", path: str = "/") -> None:
+        """
+        Configure how connections are warmed up before the race.
+        
+        Args:
+            mode: "handshake" completes TCP, TLS/ALPN and the HTTP/2 preface
+                  without sending a request. "head", "options" and "get" send
+                  a lightweight request with that method to path instead.
+            path: Path used by request-based warmup modes
+            
+        Raises:
+            ValueError: If mode is not recognized
+        """
+        if mode not in self.WARMUP_MODES:
+            raise ValueError(f"Unknown warmup mode: {mode}. Available: {list(self.WARMUP_MODES)}")
+        self._warmup_mode = mode
+        self._warmup_path = path
+
+    def configure_timestamps(self, enabled: bool) -> None:
+        """
+        Enable kernel TX/RX timestamps (SO_TIMESTAMPING) on race sockets.
+
+        Only strategies that open their sockets themselves can timestamp
+        them; sessions then expose the timestamps of their last request as
+        kernel_timestamps.
+
+        Args:
+            enabled: Whether to timestamp race sockets
+
+        Raises:
+            ValueError: If the strategy does not own its sockets
+        """
+        if enabled and not self._owns_sockets():
+            raise ValueError(
+                f"{type(self).__name__} does not support kernel timestamps; use send_engine 'raw' "
+                f"(preconnect), last_byte or single_packet"
+            )
+        if enabled and not kernel_timestamps_supported():
+            logger.warning(f"{type(self).__name__}: kernel timestamps (SO_TIMESTAMPING) require Linux")
+        self._kernel_timestamps = enabled
+
+    def _owns_sockets(self) -> bool:
+        """Whether race requests are written to sockets opened by the strategy."""
+        return False
+
+    def _build_client_kwargs(
+        self, limits: Optional[httpx.Limits] = None, asynchronous: bool = False
+    ) -> Dict[str, Any]:
         """
         Build common kwargs for httpx.Client construction.
         
         Centralizes the configuration logic shared across all strategies:
-        proxy handling, mTLS certificates, timeouts, etc.
+        proxy handling, mTLS certificates, timeouts, socket options, etc.
+        Direct connections go through an explicit transport that carries
+        the target.socket options and local address.
         
         Args:
             limits: Optional connection limits. If None, uses default limits.
+            asynchronous: Build kwargs for httpx.AsyncClient()
             
         Returns:
             Dictionary of kwargs ready for httpx.Client()
@@ -123,22 +211,68 @@ class ConnectionStrategy(ABC):
         if not self._bypass_proxy and self._proxy:
             proxy_url = self._proxy.to_client_proxy()
         
-        # Get mTLS certificate if configured
+        # TLS: one shared context per target (CA bundle and mTLS cert loaded once)
+        verify: Any = self._verify_cert
         cert = None
-        if self._http_client:
+        if self._tls_enabled:
+            verify = self._get_ssl_context(["http/1.1", "h2"] if self._http2 else ["http/1.1"])
+        elif self._http_client:
             cert = self._http_client._get_client_cert()
         
+        transport_class = httpx.AsyncHTTPTransport if asynchronous else httpx.HTTPTransport
+        transport = transport_class(
+            verify=verify,
+            cert=cert,
+            http2=self._http2,
+            limits=limits,
+            socket_options=socket_options(self._socket_config),
+            local_address=self._socket_config.bind or None,
+        )
+        
         return {
             "http2": self._http2,
-            "verify": self._verify_cert,
+            "verify": verify,
             "timeout": httpx.Timeout(self._timeout),
             "base_url": self._base_url,
             "follow_redirects": self._follow_redirects,
             "limits": limits,
             "proxy": proxy_url,
             "cert": cert,
+            "transport": transport,
         }
 
+    def _create_client(self, limits: Optional[httpx.Limits] = None) -> httpx.Client:
+        """
+        Create an httpx.Client for connecting to the target.
+        
+        Direct connections go through PrewarmedBackend, so TLS handshakes
+        resume sessions from the shared context and handshake-only warmup
+        can park connections for the client.
+        
+        Args:
+            limits: Optional connection limits (see _build_client_kwargs)
+            
+        Returns:
+            Configured httpx.Client
+        """
+        client = httpx.Client(**self._build_client_kwargs(limits))
+        PrewarmedBackend.install(client)
+        return client
+
+    def _create_async_client(self, limits: Optional[httpx.Limits] = None) -> httpx.AsyncClient:
+        """
+        Create an httpx.AsyncClient for connecting to the target (asyncio engine).
+        
+        Args:
+            limits: Optional connection limits (see _build_client_kwargs)
+            
+        Returns:
+            Configured httpx.AsyncClient
+        """
+        client = httpx.AsyncClient(**self._build_client_kwargs(limits, asynchronous=True))
+        AsyncPrewarmedBackend.install(client)
+        return client
+
     def _store_client_config(self, http_client: "HTTPClient") -> None:
         """
         Store common configuration from HTTP client.
@@ -150,20 +284,119 @@ class ConnectionStrategy(ABC):
         scheme = "https" if config.tls.enabled else "http"
         
         self._base_url = f"{scheme}://{config.host}:{config.port}"
+        self._host = config.host
+        self._port = config.port
+        self._tls_enabled = config.tls.enabled
         self._verify_cert = config.tls.verify_cert
         self._follow_redirects = config.http.follow_redirects
         self._proxy = config.proxy
         self._http_client = http_client
+        self._socket_config = config.socket
+
+    def _create_ssl_context(self, alpn_protocols: Optional[List[str]] = None) -> ssl.SSLContext:
+        """
+        Build a new SSL context for the target.
+        
+        Mirrors the verification and mTLS settings of the HTTP client.
+        Prefer _get_ssl_context(), which shares one context per target.
+        
+        Args:
+            alpn_protocols: Optional ALPN protocols to advertise (e.g. ["h2"])
+            
+        Returns:
+            Configured ssl.SSLContext
+        """
+        ctx = httpx.create_ssl_context(verify=self._verify_cert)
+        
+        cert = self._http_client._get_client_cert() if self._http_client else None
+        if isinstance(cert, str):
+            ctx.load_cert_chain(cert)
+        elif cert:
+            ctx.load_cert_chain(*cert)
+        
+        if alpn_protocols:
+            ctx.set_alpn_protocols(alpn_protocols)
+        
+        return ctx
+
+    def _get_ssl_context(self, alpn_protocols: Optional[List[str]] = None) -> ssl.SSLContext:
+        """
+        Get the shared SSL context for the target.
+        
+        Contexts are cached per target, TLS settings and ALPN list, so every
+        connection (across threads, strategies and races) reuses the same
+        loaded CA bundle and client certificate, and TLS sessions can be
+        resumed.
+        
+        Args:
+            alpn_protocols: ALPN protocols to advertise
+            
+        Returns:
+            Shared ssl.SSLContext
+        """
+        cert = self._http_client._get_client_cert() if self._http_client else None
+        key = (
+            self._host,
+            self._port,
+            self._verify_cert,
+            cert,
+            tuple(alpn_protocols or ()),
+        )
+        return shared_ssl_context(key, lambda: self._create_ssl_context(alpn_protocols))
+
+    def _open_socket(self, alpn_protocols: Optional[List[str]] = None) -> Tuple[socket.socket, bytes]:
+        """
+        Open a raw TCP (and TLS, if enabled) socket to the target.
+        
+        Used by strategies that write request bytes themselves instead of
+        going through httpx. target.socket options are set before connecting
+        (Nagle is disabled by default so staged frames and the final release
+        write are not held back by the kernel). TLS handshakes use the shared
+        context and resume cached sessions.
+        
+        Args:
+            alpn_protocols: Optional ALPN protocols to advertise during TLS
+            
+        Returns:
+            Tuple of (connected socket, data already received from the
+            server while collecting TLS session tickets)
+        """
+        sock = connect_socket(
+            self._host,
+            self._port,
+            self._timeout,
+            socket_options(self._socket_config),
+            local_address=self._socket_config.bind or None,
+        )
+        
+        early = b""
+        if self._tls_enabled:
+            ctx = self._get_ssl_context(alpn_protocols)
+            sock, early = tls_sessions.wrap_socket(ctx, sock, self._host, self._port, self._timeout)
+        
+        return sock, early
 
     def _warmup_connection(self, client: httpx.Client) -> None:
         """
-        Establish TCP/TLS connection with a warmup request.
+        Establish TCP/TLS connection ahead of the race.
+        
+        In "handshake" mode, only TCP, TLS/ALPN and the HTTP/2 preface and
+        SETTINGS exchange are performed, and the connection is parked for the
+        client's first request. Proxied clients fall back to a HEAD request.
+        Other modes send a single request with the configured method and path.
         
         Args:
             client: httpx.Client to warm up
         """
+        mode = self._warmup_mode
+        if mode == "handshake":
+            if self._warmup_handshake(client):
+                return
+            logger.debug("Handshake-only warmup not available for this client, falling back to HEAD")
+            mode = "head"
+        
         try:
-            with client.stream("GET", "/", headers={"Connection": "keep-alive"}) as _:
+            with client.stream(mode.upper(), self._warmup_path, headers={"Connection": "keep-alive"}) as _:
                 pass
         except httpx.HTTPStatusError:
             # HTTP error is fine - connection is established
@@ -172,6 +405,69 @@ class ConnectionStrategy(ABC):
             # Connection error - but socket might still be ready
             pass
 
+    def _uses_proxy(self) -> bool:
+        """Whether the strategy's clients connect through the configured proxy."""
+        return bool(not self._bypass_proxy and self._proxy and self._proxy.to_client_proxy())
+
+    def _warmup_handshake(self, client: httpx.Client) -> bool:
+        """
+        Complete connection handshakes without sending an HTTP request.
+        
+        Args:
+            client: httpx.Client whose pool receives the warmed connection
+            
+        Returns:
+            False if the client cannot use a pre-established connection
+            (e.g. it goes through a proxy), True otherwise
+        """
+        if self._uses_proxy():
+            return False
+        
+        backend = PrewarmedBackend.install(client)
+        if backend is None:
+            return False
+        
+        url = client.base_url
+        port = url.port or (443 if url.scheme == "https" else 80)
+        ssl_context = PrewarmedBackend.ssl_context_of(client) if url.scheme == "https" else None
+        
+        try:
+            backend.warm(url.host, port, ssl_context, http2=self._http2, timeout=self._timeout)
+        except Exception as e:
+            # Connection will be attempted again on the first request
+            logger.debug(f"Handshake warmup failed: {e}")
+        return True
+
+    async def _warmup_connection_async(self, client: httpx.AsyncClient) -> None:
+        """
+        Async counterpart of _warmup_connection() for httpx.AsyncClient.
+        
+        Args:
+            client: httpx.AsyncClient to warm up
+        """
+        mode = self._warmup_mode
+        if mode == "handshake":
+            backend = None if self._uses_proxy() else AsyncPrewarmedBackend.install(client)
+            if backend is not None:
+                url = client.base_url
+                port = url.port or (443 if url.scheme == "https" else 80)
+                ssl_context = PrewarmedBackend.ssl_context_of(client) if url.scheme == "https" else None
+                try:
+                    await backend.warm(url.host, port, ssl_context, http2=self._http2, timeout=self._timeout)
+                except Exception as e:
+                    logger.debug(f"Handshake warmup failed: {e}")
+                return
+            logger.debug("Handshake-only warmup not available for this client, falling back to HEAD")
+            mode = "head"
+        
+        try:
+            async with client.stream(mode.upper(), self._warmup_path, headers={"Connection": "keep-alive"}) as _:
+                pass
+        except httpx.HTTPStatusError:
+            pass
+        except httpx.RequestError:
+            pass
+
     def prepare(self, num_threads: int, http_client: "HTTPClient") -> None:
         """
         Prepare the strategy for the given number of threads.
@@ -188,6 +484,7 @@ class ConnectionStrategy(ABC):
         
         # Store common configuration
         self._store_client_config(http_client)
+        self._log_socket_options()
         
         # Prepare sync mechanism if provided
         if self._sync:
@@ -196,6 +493,13 @@ class ConnectionStrategy(ABC):
         # Call subclass-specific preparation
         self._prepare(num_threads, http_client)
 
+    def _log_socket_options(self) -> None:
+        """Log the socket options applied to connections to the target."""
+        logger.info(f"Socket options: {describe_socket_options(self._socket_config)}")
+        missing = unsupported_options(self._socket_config)
+        if missing:
+            logger.warning(f"Socket options not supported on this platform, ignored: {', '.join(missing)}")
+
     @abstractmethod
     def _prepare(self, num_threads: int, http_client: "HTTPClient") -> None:
         """
@@ -231,7 +535,7 @@ class ConnectionStrategy(ABC):
         if self._sync:
             self._sync.wait(thread_id)
 
-    def _connect(self, thread_id: int) -> None:
+    def _connect(self, thread_id: int) -> None:  # noqa: B027
         """
         Subclass-specific connection logic.
         
@@ -243,6 +547,23 @@ class ConnectionStrategy(ABC):
         """
         pass
 
+    def stage_request(self, thread_id: int, request: httpx.Request) -> None:  # noqa: B027
+        """
+        Stage a prepared request before the race sync point.
+        
+        Called from within each worker thread after the request is built
+        and BEFORE the race sync point. Strategies that split a request on
+        the wire (e.g. single-packet) push everything but the final piece
+        here, so only the release write happens inside the race window.
+        
+        Default does nothing (the whole request is sent by get_session().send()).
+        
+        Args:
+            thread_id: ID of the calling thread
+            request: Request built with get_session(thread_id).build_request()
+        """
+        pass
+
     @abstractmethod
     def get_session(self, thread_id: int) -> Any:
         """
@@ -267,4 +588,83 @@ class ConnectionStrategy(ABC):
         This method is called after all threads complete.
         It should close sessions, release resources, etc.
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def prepare_async(self, num_threads: int, http_client: "HTTPClient") -> None:
+        """
+        Prepare the strategy for the asyncio engine.
+        
+        Same as prepare(), but called from the event loop; delegates to
+        _prepare_async().
+        
+        Args:
+            num_threads: Number of tasks that will need connections
+            http_client: HTTP client with configuration
+        """
+        self._num_threads = num_threads
+        self._store_client_config(http_client)
+        self._log_socket_options()
+        
+        if self._sync:
+            self._sync.prepare(num_threads)
+        
+        await self._prepare_async(num_threads)
+
+    async def _prepare_async(self, num_threads: int) -> None:  # noqa: B027
+        """
+        Subclass-specific preparation for the asyncio engine.
+        
+        Default does nothing (for strategies that open connections per task).
+        
+        Args:
+            num_threads: Number of tasks that will need connections
+        """
+        pass
+
+    async def connect_async(self, thread_id: int) -> None:
+        """
+        Establish connection for a task (asyncio engine).
+        
+        Calls _connect_async(), then waits at the connection sync point.
+        
+        Args:
+            thread_id: ID of the calling task
+            
+        Raises:
+            ConnectionError: If connection establishment fails
+        """
+        await self._connect_async(thread_id)
+        
+        if self._sync:
+            await self._sync.wait(thread_id)
+
+    async def _connect_async(self, thread_id: int) -> None:  # noqa: B027
+        """
+        Subclass-specific connection logic for the asyncio engine.
+        
+        Default does nothing (for strategies that don't pre-connect).
+        
+        Args:
+            thread_id: ID of the calling task
+        """
+        pass
+
+    def get_async_session(self, thread_id: int) -> httpx.AsyncClient:
+        """
+        Get the httpx.AsyncClient for a task (asyncio engine).
+        
+        Args:
+            thread_id: ID of the calling task
+            
+        Raises:
+            NotImplementedError: If the strategy does not support the asyncio engine
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support the asyncio engine")
+
+    async def cleanup_async(self) -> None:  # noqa: B027
+        """
+        Close async clients and release resources (asyncio engine).
+        
+        Default does nothing (for strategies without async resources).
+        """
+        pass
@@ -0,0 +1,109 @@
+"""
+Last-byte synchronization strategy for HTTP/1.1.
+
+Pre-sends each request except its final byte over a per-thread
+connection, so only one byte per connection is written in the race window.
+"""
+
+import logging
+from typing import Dict, Optional
+
+import httpx
+
+from .preconnect import PreconnectStrategy
+from ..sync.base import SyncMechanism
+
+logger = logging.getLogger("treco")
+
+
+class LastByteStrategy(PreconnectStrategy):
+    """
+    HTTP/1.1 last-byte synchronization.
+
+    Like PreconnectStrategy, every thread owns a connection established
+    before the race sync point. The connection is a raw socket: the request
+    is serialized once and written up to its final byte in stage_request().
+    After release, send() writes the single withheld byte and reads the
+    response, so header encoding, body encoding and pool checkout all happen
+    outside the race window.
+
+    Benefits:
+        - One byte per connection written inside the race window
+        - Server has parsed nearly all of every request before release
+        - Works with any HTTP/1.1 server
+
+    Limitations:
+        - HTTP/1.1 only
+        - Always connects directly (proxies are not supported)
+
+    Example:
+        strategy = LastByteStrategy(sync=BarrierSync())
+        strategy.prepare(num_threads, http_client)
+
+        # In each thread:
+        strategy.connect(thread_id)
+        client = strategy.get_session(thread_id)
+        request = client.build_request("POST", "/api", content=body)
+        strategy.stage_request(thread_id, request)
+        # ... wait at barrier ...
+        response = client.send(request)
+    """
+
+    supports_async_engine = False
+
+    def __init__(
+        self,
+        sync: Optional[SyncMechanism] = None,
+        bypass_proxy: bool = False,
+        raw: bool = False,
+    ):
+        """
+        Initialize the last-byte strategy.
+
+        Args:
+            sync: Sync mechanism for coordinating connection establishment
+            bypass_proxy: Whether to bypass proxy for this strategy
+            raw: Return RawResponse objects (raw send engine) instead of
+                 converting responses to httpx.Response
+        """
+        super().__init__(sync=sync, http2=False, bypass_proxy=bypass_proxy, raw=True)
+        self._httpx_responses = not raw
+        self._withheld: Dict[int, int] = {}
+
+    @property
+    def withheld_bytes(self) -> Dict[int, int]:
+        """Number of bytes withheld until release, by thread ID."""
+        return dict(self._withheld)
+
+    def _prepare(self, num_threads: int, http_client) -> None:
+        """
+        Store connection configuration and create the request builder.
+
+        Args:
+            num_threads: Number of threads that will connect
+            http_client: HTTP client with configuration
+        """
+        self._withheld.clear()
+        super()._prepare(num_threads, http_client)
+
+    def stage_request(self, thread_id: int, request: httpx.Request) -> None:
+        """
+        Write the serialized request except its final byte.
+
+        Args:
+            thread_id: ID of the calling thread
+            request: Request to stage
+        """
+        withheld = self._clients[thread_id].prepare(request, withhold=1)
+        self._withheld[thread_id] = withheld
+
+        logger.debug(f"[Thread {thread_id}] Request staged, withholding {withheld} byte(s)")
+
+    def cleanup(self) -> None:
+        """Close all sockets and release resources."""
+        if self._withheld:
+            summary = ", ".join(f"{tid}:{n}" for tid, n in sorted(self._withheld.items()))
+            logger.info(f"LastByteStrategy withheld bytes per thread: {summary}")
+            self._withheld.clear()
+
+        super().cleanup()
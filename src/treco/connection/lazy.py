@@ -48,15 +48,18 @@ class LazyStrategy(ConnectionStrategy):
         response = client.post(url, content=data)  # Connection happens HERE
     """
 
-    def __init__(self, sync: Optional[SyncMechanism] = None):
+    supports_async_engine = True
+
+    def __init__(self, sync: Optional[SyncMechanism] = None, bypass_proxy: bool = False):
         """
         Initialize lazy strategy.
         
         Args:
             sync: Sync mechanism (usually not needed for lazy strategy)
+            bypass_proxy: Whether to bypass proxy for this strategy
         """
         # Use HTTP/2 by default for lazy strategy
-        super().__init__(sync=sync, http2=True)
+        super().__init__(sync=sync, bypass_proxy=bypass_proxy, http2=True)
 
     def _prepare(self, num_threads: int, http_client) -> None:
         """
@@ -98,7 +101,7 @@ class LazyStrategy(ConnectionStrategy):
         """
         logger.debug(f"[Thread {thread_id}] Creating new httpx.Client (lazy)")
         
-        return httpx.Client(**self._build_client_kwargs())
+        return self._create_client()
 
     def cleanup(self) -> None:
         """
@@ -106,4 +109,18 @@ class LazyStrategy(ConnectionStrategy):
 
         Clients are created by threads and should be closed by them.
         """
-        logger.debug("LazyStrategy cleanup (nothing to do)")
\ No newline at end of file
+        logger.debug("LazyStrategy cleanup (nothing to do)")
+
+    def get_async_session(self, thread_id: int) -> httpx.AsyncClient:
+        """
+        Create a new httpx.AsyncClient on demand (asyncio engine).
+
+        Args:
+            thread_id: Task identifier (for logging)
+
+        Returns:
+            New httpx.AsyncClient
+        """
+        logger.debug(f"[Thread {thread_id}] Creating new httpx.AsyncClient (lazy)")
+
+        return self._create_async_client()
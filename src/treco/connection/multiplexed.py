@@ -46,6 +46,8 @@ class MultiplexedStrategy(ConnectionStrategy):
         response = client.send(request)
     """
 
+    supports_async_engine = True
+
     def __init__(
         self, 
         sync: Optional[SyncMechanism] = None, 
@@ -61,6 +63,7 @@ class MultiplexedStrategy(ConnectionStrategy):
         # Always use HTTP/2 for multiplexed strategy
         super().__init__(sync=sync, bypass_proxy=bypass_proxy, http2=True)
         self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
 
     def _prepare(self, num_threads: int, http_client) -> None:
         """
@@ -78,8 +81,7 @@ class MultiplexedStrategy(ConnectionStrategy):
                 pass
         
         # Create single shared HTTP/2 client (no per-connection limits)
-        kwargs = self._build_client_kwargs(limits=None)
-        self._client = httpx.Client(**kwargs)
+        self._client = self._create_client(limits=None)
         
         # Warm up connection
         self._warmup_connection(self._client)
@@ -127,4 +129,41 @@ class MultiplexedStrategy(ConnectionStrategy):
             except Exception:
                 pass
             self._client = None
-        logger.debug("MultiplexedStrategy cleaned up")
\ No newline at end of file
+        logger.debug("MultiplexedStrategy cleaned up")
+
+    async def _prepare_async(self, num_threads: int) -> None:
+        """
+        Create the shared HTTP/2 async client and establish connection.
+        
+        Args:
+            num_threads: Number of tasks (for logging only)
+        """
+        await self.cleanup_async()
+        
+        self._async_client = self._create_async_client(limits=None)
+        await self._warmup_connection_async(self._async_client)
+        
+        logger.info(f"MultiplexedStrategy (asyncio) ready: 1 HTTP/2 connection for {num_threads} tasks")
+
+    def get_async_session(self, thread_id: int) -> httpx.AsyncClient:
+        """
+        Get the shared httpx.AsyncClient.
+        
+        Args:
+            thread_id: Task ID (unused, all get same client)
+            
+        Raises:
+            RuntimeError: If prepare_async() wasn't called
+        """
+        if not self._async_client:
+            raise RuntimeError("MultiplexedStrategy.prepare_async() must be called before get_async_session()")
+        return self._async_client
+
+    async def cleanup_async(self) -> None:
+        """Close the shared async client."""
+        if self._async_client:
+            try:
+                await self._async_client.aclose()
+            except Exception:
+                pass
+            self._async_client = None
@@ -60,6 +60,7 @@ class PooledStrategy(ConnectionStrategy):
         self, 
         sync: Optional[SyncMechanism] = None, 
         pool_size: int = 5,
+        bypass_proxy: bool = False,
     ):
         """
         Initialize pool.
@@ -67,9 +68,10 @@ class PooledStrategy(ConnectionStrategy):
         Args:
             sync: Sync mechanism (usually not needed for pooled strategy)
             pool_size: Maximum number of clients in the pool
+            bypass_proxy: Whether to bypass proxy for this strategy
         """
         # Use HTTP/2 by default
-        super().__init__(sync=sync, http2=True)
+        super().__init__(sync=sync, bypass_proxy=bypass_proxy, http2=True)
         self._pool: queue.Queue = queue.Queue()
         self._pool_size = pool_size
 
@@ -90,7 +92,7 @@ class PooledStrategy(ConnectionStrategy):
 
         # Create pool clients with pre-established connections
         for i in range(actual_pool_size):
-            client = httpx.Client(**self._build_client_kwargs())
+            client = self._create_client()
             
             # Warm up connection
             self._warmup_connection(client)
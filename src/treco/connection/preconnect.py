@@ -7,11 +7,13 @@ window, ensuring minimal latency during the actual attack.
 
 import threading
 import logging
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
 import httpx
 
 from .base import ConnectionStrategy
+from ..http.raw import RawSession
+from ..http.timestamping import SocketTimestamper
 from ..sync.base import SyncMechanism
 
 logger = logging.getLogger("treco")
@@ -31,6 +33,8 @@ class PreconnectStrategy(ConnectionStrategy):
         - Clean prepare/send separation
         - Proper TLS certificate verification control
         - Proxy support with bypass option
+        - Optional raw send engine (pre-serialized bytes over a plain socket)
+        - Async lifecycle for the asyncio race engine (one httpx.AsyncClient per task)
     
     Example:
         strategy = PreconnectStrategy(sync=BarrierSync())
@@ -44,11 +48,15 @@ class PreconnectStrategy(ConnectionStrategy):
         response = client.send(request)
     """
 
+    supports_raw_engine = True
+    supports_async_engine = True
+
     def __init__(
         self, 
         sync: Optional[SyncMechanism] = None, 
         http2: bool = False, 
         bypass_proxy: bool = False,
+        raw: bool = False,
     ):
         """
         Initialize the preconnect strategy.
@@ -59,9 +67,15 @@ class PreconnectStrategy(ConnectionStrategy):
                    HTTP/1.1 creates separate connections per thread which
                    gives more reliable parallel request timing.
             bypass_proxy: Whether to bypass proxy for this strategy
+            raw: Use the raw send engine: each thread gets a RawSession over
+                 its own socket instead of an httpx.Client (HTTP/1.1 only)
         """
-        super().__init__(sync=sync, bypass_proxy=bypass_proxy, http2=http2)
-        self._clients: Dict[int, httpx.Client] = {}
+        super().__init__(sync=sync, bypass_proxy=bypass_proxy, http2=http2 and not raw)
+        self._raw = raw
+        self._httpx_responses = False
+        self._clients: Dict[int, Union[httpx.Client, RawSession]] = {}
+        self._async_clients: Dict[int, httpx.AsyncClient] = {}
+        self._request_builder: Optional[httpx.Client] = None
         self._lock = threading.Lock()
 
     def _prepare(self, num_threads: int, http_client) -> None:
@@ -75,9 +89,21 @@ class PreconnectStrategy(ConnectionStrategy):
         # Clear any existing clients from previous runs
         self._cleanup_clients()
         
-        logger.info(f"PreconnectStrategy (httpx) ready: {num_threads} threads")
+        if self._raw:
+            if self._proxy and not self._bypass_proxy and self._proxy.to_client_proxy():
+                logger.warning(f"{type(self).__name__}: proxy is ignored by the raw engine, connecting directly")
+            
+            # Used only to build requests with the usual httpx defaults
+            self._request_builder = httpx.Client(**self._build_client_kwargs())
+        
+        engine = "raw" if self._raw else "httpx"
+        logger.info(f"{type(self).__name__} ({engine}) ready: {num_threads} threads")
         logger.debug(f"Target: {self._base_url} (HTTP/2: {self._http2}, verify: {self._verify_cert})")
 
+    def _owns_sockets(self) -> bool:
+        """Raw sessions write to sockets opened by the strategy."""
+        return self._raw
+
     def _connect(self, thread_id: int) -> None:
         """
         Establish a persistent connection for this thread.
@@ -95,11 +121,22 @@ class PreconnectStrategy(ConnectionStrategy):
         logger.debug(f"[Thread {thread_id}] Connecting to {self._base_url}...")
         
         try:
-            # Build client with common configuration
-            client = httpx.Client(**self._build_client_kwargs())
-            
-            # Warm up connection
-            self._warmup_connection(client)
+            if self._raw:
+                sock, early = self._open_socket(alpn_protocols=["http/1.1"])
+                client = RawSession(
+                    sock,
+                    self._request_builder,
+                    httpx_responses=self._httpx_responses,
+                    early_data=early,
+                    timestamper=SocketTimestamper.attach(sock) if self._kernel_timestamps else None,
+                    cork=self._socket_config.cork,
+                )
+            else:
+                # Build client with common configuration
+                client = self._create_client()
+                
+                # Warm up connection
+                self._warmup_connection(client)
             
             with self._lock:
                 self._clients[thread_id] = client
@@ -110,21 +147,33 @@ class PreconnectStrategy(ConnectionStrategy):
             logger.error(f"[Thread {thread_id}] Connection failed: {e}")
             raise ConnectionError(f"Thread {thread_id} failed to connect: {e}") from e
 
-    def get_session(self, thread_id: int) -> httpx.Client:
+    def get_session(self, thread_id: int) -> Union[httpx.Client, RawSession]:
         """
-        Get the httpx client for a thread.
+        Get the client for a thread.
         
         Args:
             thread_id: Thread ID
             
         Returns:
-            httpx.Client with established connection
+            httpx.Client with established connection, or RawSession
+            when the raw engine is enabled
             
         Raises:
             KeyError: If connect() wasn't called for this thread
         """
         return self._clients[thread_id]
 
+    def stage_request(self, thread_id: int, request: httpx.Request) -> None:
+        """
+        Serialize the request ahead of the race sync point (raw engine only).
+        
+        Args:
+            thread_id: ID of the calling thread
+            request: Request built with get_session(thread_id).build_request()
+        """
+        if self._raw:
+            self._clients[thread_id].prepare(request)
+
     def _cleanup_clients(self) -> None:
         """Close all existing clients."""
         with self._lock:
@@ -138,4 +187,65 @@ class PreconnectStrategy(ConnectionStrategy):
     def cleanup(self) -> None:
         """Close all clients and release resources."""
         self._cleanup_clients()
-        logger.debug("PreconnectStrategy cleaned up")
\ No newline at end of file
+        
+        if self._request_builder:
+            try:
+                self._request_builder.close()
+            except Exception:
+                pass
+            self._request_builder = None
+        
+        logger.debug(f"{type(self).__name__} cleaned up")
+
+    async def _prepare_async(self, num_threads: int) -> None:
+        """
+        Close async clients left over from a previous run.
+        
+        Args:
+            num_threads: Number of tasks that will connect
+        """
+        await self.cleanup_async()
+        logger.info(f"{type(self).__name__} (asyncio) ready: {num_threads} tasks")
+
+    async def _connect_async(self, thread_id: int) -> None:
+        """
+        Create and warm up an httpx.AsyncClient for this task.
+        
+        Args:
+            thread_id: ID of the connecting task
+            
+        Raises:
+            ConnectionError: If connection fails
+        """
+        try:
+            client = self._create_async_client()
+            self._async_clients[thread_id] = client
+            await self._warmup_connection_async(client)
+        except Exception as e:
+            logger.error(f"[Thread {thread_id}] Connection failed: {e}")
+            raise ConnectionError(f"Thread {thread_id} failed to connect: {e}") from e
+
+    def get_async_session(self, thread_id: int) -> httpx.AsyncClient:
+        """
+        Get the async client for a task.
+        
+        Args:
+            thread_id: Task ID
+            
+        Returns:
+            httpx.AsyncClient with established connection
+            
+        Raises:
+            KeyError: If connect_async() wasn't called for this task
+        """
+        return self._async_clients[thread_id]
+
+    async def cleanup_async(self) -> None:
+        """Close all async clients."""
+        clients = list(self._async_clients.values())
+        self._async_clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception:
+                pass
@@ -0,0 +1,538 @@
+"""
+Single-packet connection strategy using HTTP/2.
+
+Opens one HTTP/2 connection, pre-sends every stream except its final
+frame, and releases all streams with a single TCP write.
+"""
+
+import socket
+import threading
+import time
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+import h2.config
+import h2.connection
+import h2.errors
+import h2.events
+import h2.exceptions
+import h2.settings
+
+from .base import ConnectionStrategy
+from ..http.partial import send_request
+from ..http.sockopts import corked
+from ..http.timestamping import KernelTimestamps, SocketTimestamper
+from ..sync.base import SyncMechanism
+
+logger = logging.getLogger("treco")
+
+
+# Headers that are illegal in HTTP/2 (RFC 9113, section 8.2.2)
+_CONNECTION_SPECIFIC_HEADERS = {
+    b"host",
+    b"connection",
+    b"keep-alive",
+    b"proxy-connection",
+    b"transfer-encoding",
+    b"upgrade",
+}
+
+# Payload size above which the release write no longer fits one TCP segment
+_TYPICAL_MSS = 1400
+
+# How long to wait for the kernel TX timestamp of the release write
+_TX_TIMESTAMP_TIMEOUT = 0.1
+
+
+class _StagedStream:
+    """
+    Per-stream bookkeeping for a staged request.
+
+    stream_id is None for requests that did not fit the flow-control window
+    and are sent normally at release time.
+    """
+
+    def __init__(self, thread_id: int, stream_id: Optional[int], request: httpx.Request, final_chunk: bytes):
+        self.thread_id = thread_id
+        self.stream_id = stream_id
+        self.request = request
+        self.final_chunk = final_chunk
+        self.flushed = False
+        self.flushed_ns: Optional[int] = None
+        self.head_ns: Optional[int] = None
+        self.tx_ns: Optional[int] = None
+        self.rx_ns: Optional[int] = None
+        self.body_limit: Optional[int] = None
+        self.done = threading.Event()
+        self.status: int = 0
+        self.headers: List[Tuple[bytes, bytes]] = []
+        self.body = bytearray()
+        self.error: Optional[str] = None
+
+
+class SinglePacketSession:
+    """
+    Per-thread handle returned by SinglePacketStrategy.get_session().
+
+    Exposes the subset of the httpx.Client interface used by race workers:
+    build_request() and send().
+    """
+
+    def __init__(self, strategy: "SinglePacketStrategy", thread_id: int):
+        self._strategy = strategy
+        self._thread_id = thread_id
+
+    def build_request(self, *args, **kwargs) -> httpx.Request:
+        """Build a request with the same defaults as an httpx.Client."""
+        return self._strategy._request_builder.build_request(*args, **kwargs)
+
+    @property
+    def kernel_timestamps(self) -> Optional[KernelTimestamps]:
+        """Kernel timestamps of this thread's stream (None unless enabled)."""
+        staged = self._strategy._by_thread.get(self._thread_id)
+        if self._strategy._timestamper is None or staged is None:
+            return None
+        return KernelTimestamps(tx_ns=staged.tx_ns, rx_ns=staged.rx_ns)
+
+    @property
+    def unstaged(self) -> bool:
+        """Whether this thread's request was sent without staging (body over the flow-control window)."""
+        staged = self._strategy._by_thread.get(self._thread_id)
+        return staged is not None and staged.stream_id is None
+
+    def send(self, request: httpx.Request, body_limit: Optional[int] = None) -> httpx.Response:
+        """
+        Release the staged request and wait for its response.
+
+        The first thread to call send() flushes the final frame of every
+        staged stream in one write; later callers find their frame already
+        on the wire and only wait for the response.
+
+        Args:
+            request: Staged request
+            body_limit: Cancel the stream after this many body bytes (0: head only)
+        """
+        return self._strategy._send(self._thread_id, request, body_limit)
+
+
+class SinglePacketStrategy(ConnectionStrategy):
+    """
+    HTTP/2 single-packet attack over one connection.
+
+    Unlike MultiplexedStrategy, requests do not go through httpx.Client.send()
+    at release time. Each thread stages its stream before the race sync point:
+    HEADERS and all of the body except the final byte are written immediately.
+    When the threads are released, the final DATA frame (carrying END_STREAM)
+    of every staged stream is serialized into one buffer and written with a
+    single sendall(), so all requests complete on the server from the same
+    TCP segment.
+
+    Benefits:
+        - Release window bounded by one TCP write instead of N sends
+        - No GIL/connection-lock jitter between streams
+        - Single TCP/TLS handshake
+
+    Limitations:
+        - Requires HTTP/2 on the server (ALPN "h2" or h2c prior knowledge)
+        - Always connects directly (proxies are not supported)
+        - Thread group delays are not applied per stream: the first released
+          thread flushes every staged stream
+        - Number of threads is bounded by the server's MAX_CONCURRENT_STREAMS
+        - Bodies that do not fit the server's flow-control window are not
+          staged; they are sent normally over a separate connection when released
+
+    Example:
+        strategy = SinglePacketStrategy()
+        strategy.prepare(num_threads, http_client)
+
+        # In each thread:
+        client = strategy.get_session(thread_id)
+        request = client.build_request("POST", "/api", content=body)
+        strategy.stage_request(thread_id, request)
+        # ... wait at barrier ...
+        response = client.send(request)
+    """
+
+    def __init__(
+        self,
+        sync: Optional[SyncMechanism] = None,
+        bypass_proxy: bool = False,
+    ):
+        """
+        Initialize the single-packet strategy.
+
+        Args:
+            sync: Sync mechanism (optional, mainly for API consistency)
+            bypass_proxy: Whether to bypass proxy for this strategy
+        """
+        super().__init__(sync=sync, bypass_proxy=bypass_proxy, http2=True)
+        self._sock: Optional[socket.socket] = None
+        self._timestamper: Optional[SocketTimestamper] = None
+        self._h2: Optional[h2.connection.H2Connection] = None
+        self._request_builder: Optional[httpx.Client] = None
+
+        # _state_lock guards the h2 state machine and socket writes,
+        # _read_lock ensures a single thread reads from the socket at a time
+        self._state_lock = threading.Lock()
+        self._read_lock = threading.Lock()
+
+        self._streams: Dict[int, _StagedStream] = {}
+        self._by_thread: Dict[int, _StagedStream] = {}
+        self._closed_error: Optional[str] = None
+
+    def _prepare(self, num_threads: int, http_client) -> None:
+        """
+        Open the HTTP/2 connection and complete the SETTINGS exchange.
+
+        Args:
+            num_threads: Number of threads that will stage streams
+            http_client: HTTP client with configuration
+        """
+        self.cleanup()
+
+        if self._proxy and not self._bypass_proxy and self._proxy.to_client_proxy():
+            logger.warning("SinglePacketStrategy: proxy is ignored, connecting directly to target")
+
+        self._sock, early = self._open_socket(alpn_protocols=["h2"])
+
+        if self._tls_enabled:
+            negotiated = self._sock.selected_alpn_protocol()
+            if negotiated != "h2":
+                self.cleanup()
+                raise ConnectionError(
+                    f"single_packet requires HTTP/2 but server negotiated: {negotiated or 'http/1.1'}"
+                )
+
+        if self._kernel_timestamps:
+            self._timestamper = SocketTimestamper.attach(self._sock)
+
+        config = h2.config.H2Configuration(client_side=True, header_encoding=None)
+        self._h2 = h2.connection.H2Connection(config=config)
+        self._h2.local_settings = h2.settings.Settings(
+            client=True,
+            initial_values={
+                h2.settings.SettingCodes.ENABLE_PUSH: 0,
+                h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: 100,
+                h2.settings.SettingCodes.INITIAL_WINDOW_SIZE: 2**24,
+            },
+        )
+        self._h2.initiate_connection()
+        self._h2.increment_flow_control_window(2**24)
+        self._sock.sendall(self._h2.data_to_send())
+
+        # Wait for the server SETTINGS so stream limits are known before staging
+        self._wait_for_remote_settings(early)
+
+        max_streams = self._h2.remote_settings.max_concurrent_streams
+        if max_streams is not None and num_threads > max_streams:
+            logger.warning(
+                f"SinglePacketStrategy: {num_threads} threads exceed server "
+                f"MAX_CONCURRENT_STREAMS ({max_streams})"
+            )
+
+        # Used only to build requests with the usual httpx defaults
+        self._request_builder = httpx.Client(**self._build_client_kwargs())
+
+        logger.info(f"SinglePacketStrategy ready: 1 HTTP/2 connection for {num_threads} threads")
+        logger.debug(f"Target: {self._base_url} (verify: {self._verify_cert})")
+
+    def _wait_for_remote_settings(self, early: bytes = b"") -> None:
+        """
+        Read from the socket until the server's SETTINGS frame is received.
+
+        Args:
+            early: Bytes already received during the TLS handshake
+        """
+        while True:
+            data = early or self._sock.recv(65535)
+            early = b""
+            if not data:
+                raise ConnectionError("Connection closed during HTTP/2 handshake")
+
+            events = self._h2.receive_data(data)
+            self._sock.sendall(self._h2.data_to_send())
+
+            for event in events:
+                if isinstance(event, h2.events.RemoteSettingsChanged):
+                    return
+                if isinstance(event, h2.events.ConnectionTerminated):
+                    raise ConnectionError(f"Server terminated HTTP/2 connection: {event.error_code}")
+
+    def _owns_sockets(self) -> bool:
+        """The shared HTTP/2 connection is opened by the strategy."""
+        return True
+
+    def _connect(self, thread_id: int) -> None:
+        """
+        No-op for single-packet strategy.
+
+        The shared connection is established in _prepare().
+
+        Args:
+            thread_id: Thread ID (unused)
+        """
+        logger.debug(f"[Thread {thread_id}] Using shared HTTP/2 connection (single-packet)")
+
+    def get_session(self, thread_id: int) -> SinglePacketSession:
+        """
+        Get the session handle for a thread.
+
+        Args:
+            thread_id: Thread ID
+
+        Returns:
+            SinglePacketSession bound to this thread
+
+        Raises:
+            RuntimeError: If prepare() wasn't called
+        """
+        if not self._h2:
+            raise RuntimeError("SinglePacketStrategy.prepare() must be called before get_session()")
+        return SinglePacketSession(self, thread_id)
+
+    def stage_request(self, thread_id: int, request: httpx.Request) -> None:
+        """
+        Send HEADERS and all but the final byte of the body for this thread.
+
+        Args:
+            thread_id: ID of the calling thread
+            request: Request to stage
+        """
+        body = request.read()
+        headers = self._build_h2_headers(request)
+
+        with self._state_lock:
+            window = self._staging_window()
+            if len(body) > window:
+                self._by_thread[thread_id] = _StagedStream(thread_id, None, request, b"")
+                logger.warning(
+                    f"[Thread {thread_id}] Body of {len(body)} bytes exceeds the HTTP/2 "
+                    f"flow-control window ({window}), sending it without staging"
+                )
+                return
+
+            stream_id = self._h2.get_next_available_stream_id()
+            self._h2.send_headers(stream_id, headers, end_stream=False)
+
+            # Everything but the last byte goes out now; bodiless requests
+            # withhold an empty DATA frame carrying END_STREAM instead
+            head, final_chunk = body[:-1], body[-1:]
+            max_frame = self._h2.max_outbound_frame_size
+            for offset in range(0, len(head), max_frame):
+                self._h2.send_data(stream_id, head[offset:offset + max_frame])
+
+            staged = _StagedStream(thread_id, stream_id, request, final_chunk)
+            self._streams[stream_id] = staged
+            self._by_thread[thread_id] = staged
+
+            self._sock.sendall(self._h2.data_to_send())
+
+        logger.debug(
+            f"[Thread {thread_id}] Staged stream {stream_id} "
+            f"({len(head)} body bytes sent, final frame withheld)"
+        )
+
+    def _staging_window(self) -> int:
+        """
+        Body bytes a new stream can stage without waiting for WINDOW_UPDATE.
+
+        This is local_flow_control_window() of the stream about to be opened
+        (the smaller of the connection window and the server's initial stream
+        window), less the final bytes other staged streams still withhold.
+        """
+        withheld = sum(len(s.final_chunk) for s in self._streams.values() if not s.flushed)
+        connection_window = self._h2.outbound_flow_control_window - withheld
+        return min(connection_window, self._h2.remote_settings.initial_window_size)
+
+    def _build_h2_headers(self, request: httpx.Request) -> List[Tuple[bytes, bytes]]:
+        """Convert an httpx request into an HTTP/2 header block."""
+        authority = request.headers.get("host", request.url.netloc.decode("ascii"))
+        headers = [
+            (b":method", request.method.encode("ascii")),
+            (b":authority", authority.encode("ascii")),
+            (b":scheme", request.url.scheme.encode("ascii")),
+            (b":path", request.url.raw_path),
+        ]
+        headers.extend(
+            (name.lower(), value)
+            for name, value in request.headers.raw
+            if name.lower() not in _CONNECTION_SPECIFIC_HEADERS
+        )
+        return headers
+
+    def _flush_pending(self) -> None:
+        """
+        Write the final frame of every staged, not yet released stream.
+
+        All frames are serialized first and written with a single sendall()
+        so they share one TCP segment whenever they fit.
+        """
+        with self._state_lock:
+            pending = [s for s in self._streams.values() if not s.flushed]
+            if not pending:
+                return
+
+            for staged in pending:
+                if staged.final_chunk:
+                    self._h2.send_data(staged.stream_id, staged.final_chunk, end_stream=True)
+                else:
+                    self._h2.end_stream(staged.stream_id)
+                staged.flushed = True
+
+            payload = self._h2.data_to_send()
+            with corked(self._sock, self._socket_config.cork):
+                self._sock.sendall(payload)
+
+            flushed_ns = time.perf_counter_ns()
+
+            # Read now: later control frames (WINDOW_UPDATE, ...) would
+            # otherwise be taken for the last write
+            tx_ns = self._timestamper.wait_tx(_TX_TIMESTAMP_TIMEOUT) if self._timestamper else None
+            for staged in pending:
+                staged.flushed_ns = flushed_ns
+                staged.tx_ns = tx_ns
+
+        logger.debug(f"SinglePacketStrategy: released {len(pending)} streams in {len(payload)} bytes")
+        if len(payload) > _TYPICAL_MSS:
+            logger.warning(
+                f"SinglePacketStrategy: release write is {len(payload)} bytes and may "
+                f"span multiple TCP segments"
+            )
+
+    def _send(self, thread_id: int, request: httpx.Request, body_limit: Optional[int] = None) -> httpx.Response:
+        """Release staged streams and wait for this thread's response."""
+        staged = self._by_thread.get(thread_id)
+        if staged is None:
+            raise RuntimeError(f"Thread {thread_id} has no staged request; call stage_request() first")
+        staged.body_limit = body_limit
+
+        self._flush_pending()
+
+        if staged.stream_id is None:
+            return send_request(self._request_builder, request, body_limit)
+
+        while not staged.done.is_set():
+            with self._read_lock:
+                if staged.done.is_set():
+                    break
+                self._receive_events()
+
+        if staged.error:
+            raise httpx.RemoteProtocolError(staged.error, request=request)
+
+        # Events happened on whichever thread flushed or read; replay their times
+        trace = request.extensions.get("trace")
+        if trace is not None:
+            trace("http2.send_request_body.complete", {"request": request, "timestamp_ns": staged.flushed_ns})
+            trace("http2.receive_response_headers.complete", {"request": request, "timestamp_ns": staged.head_ns})
+
+        response = httpx.Response(
+            status_code=staged.status,
+            headers=staged.headers,
+            stream=httpx.ByteStream(bytes(staged.body[:body_limit])),
+            request=request,
+            extensions={"http_version": b"HTTP/2"},
+        )
+        response.read()
+        return response
+
+    def _receive_events(self) -> None:
+        """Read one chunk from the socket and dispatch HTTP/2 events to streams."""
+        rx_ns = None
+        if self._timestamper is not None and not getattr(self._sock, "pending", int)():
+            rx_ns = self._timestamper.peek_rx(self._sock.gettimeout())
+
+        try:
+            data = self._sock.recv(65535)
+        except (socket.timeout, OSError) as e:
+            self._fail_all(f"Connection error while reading response: {e}")
+            return
+
+        if not data:
+            self._fail_all("Server closed the HTTP/2 connection")
+            return
+
+        with self._state_lock:
+            events = self._h2.receive_data(data)
+
+            for event in events:
+                staged = self._streams.get(getattr(event, "stream_id", None))
+
+                if isinstance(event, h2.events.ResponseReceived) and staged:
+                    staged.head_ns = time.perf_counter_ns()
+                    staged.rx_ns = rx_ns
+                    for name, value in event.headers:
+                        if name == b":status":
+                            staged.status = int(value)
+                        elif not name.startswith(b":"):
+                            staged.headers.append((name, value))
+                    if staged.body_limit == 0 and event.stream_ended is None:
+                        self._cancel(staged)
+                elif isinstance(event, h2.events.DataReceived):
+                    if staged and not staged.done.is_set():
+                        staged.body.extend(event.data)
+                        if staged.body_limit is not None and len(staged.body) >= staged.body_limit:
+                            self._cancel(staged)
+                    self._h2.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.StreamEnded) and staged:
+                    staged.done.set()
+                elif isinstance(event, h2.events.StreamReset) and staged and not staged.done.is_set():
+                    staged.error = f"Stream {event.stream_id} reset by server (error code {event.error_code})"
+                    staged.done.set()
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    self._closed_error = f"Server terminated HTTP/2 connection: {event.error_code}"
+
+            outgoing = self._h2.data_to_send()
+            if outgoing:
+                self._sock.sendall(outgoing)
+
+        if self._closed_error:
+            self._fail_all(self._closed_error)
+
+    def _cancel(self, staged: _StagedStream) -> None:
+        """Finish a stream at its body limit and tell the server to stop sending it."""
+        staged.done.set()
+        try:
+            self._h2.reset_stream(staged.stream_id, error_code=h2.errors.ErrorCodes.CANCEL)
+        except h2.exceptions.StreamClosedError:
+            pass
+
+    def _fail_all(self, message: str) -> None:
+        """Mark every unfinished stream as failed so waiting threads return."""
+        for staged in list(self._streams.values()):
+            if not staged.done.is_set():
+                staged.error = message
+                staged.done.set()
+
+    def cleanup(self) -> None:
+        """Close the HTTP/2 connection and the request builder."""
+        if self._timestamper:
+            self._timestamper.close()
+            self._timestamper = None
+
+        if self._sock:
+            try:
+                if self._h2:
+                    self._h2.close_connection()
+                    self._sock.sendall(self._h2.data_to_send())
+            except Exception:
+                pass
+            try:
+                self._sock.close()
+            except Exception:
+                pass
+            self._sock = None
+
+        if self._request_builder:
+            try:
+                self._request_builder.close()
+            except Exception:
+                pass
+            self._request_builder = None
+
+        self._h2 = None
+        self._streams.clear()
+        self._by_thread.clear()
+        self._closed_error = None
+        logger.debug("SinglePacketStrategy cleaned up")
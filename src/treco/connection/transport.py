@@ -0,0 +1,783 @@
+"""
+Network backend for handshake-only connection warmup and TLS reuse.
+
+Plugs into the httpcore connection pool behind an httpx.Client (or
+httpx.AsyncClient) so that TCP, TLS (with ALPN) and the HTTP/2 preface
+can be completed ahead of time, without sending any HTTP request to the
+application. TLS contexts are shared per target and sessions are resumed
+across connections.
+"""
+
+import logging
+import select
+import socket
+import ssl
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.settings
+import httpcore
+import httpx
+
+logger = logging.getLogger("treco")
+
+
+# RFC 9113 client connection preface
+H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+# How long the first handshake to a target waits for TLS 1.3 session tickets
+_TICKET_WAIT = 0.05
+
+# How long other connections wait for that first handshake before doing a full one
+_GATE_WAIT = 1.0
+
+_ssl_contexts: Dict[Hashable, ssl.SSLContext] = {}
+_ssl_contexts_lock = threading.Lock()
+
+
+def shared_ssl_context(key: Hashable, factory: Callable[[], ssl.SSLContext]) -> ssl.SSLContext:
+    """
+    Return the SSL context registered under key, creating it on first use.
+
+    CA bundles and client certificates are loaded once per key instead of
+    once per connection, and sessions can only be resumed within the same
+    context.
+
+    Args:
+        key: Identifies the target and TLS settings (host, port, verify, cert, ALPN)
+        factory: Builds the context when the key is first seen
+
+    Returns:
+        Shared ssl.SSLContext
+    """
+    with _ssl_contexts_lock:
+        ctx = _ssl_contexts.get(key)
+        if ctx is None:
+            ctx = factory()
+            _ssl_contexts[key] = ctx
+        return ctx
+
+
+def clear_ssl_contexts() -> None:
+    """
+    Forget all shared SSL contexts and the TLS sessions cached for them.
+
+    The next connection to every target loads its context again and does a
+    full handshake.
+    """
+    with _ssl_contexts_lock:
+        _ssl_contexts.clear()
+    tls_sessions.clear()
+
+
+class TLSSessionCache:
+    """
+    Thread-safe TLS session store used to resume handshakes.
+
+    The first handshake to a target is a full one; concurrent connections to
+    the same target wait for it and then resume its session. For TLS 1.3,
+    where tickets arrive after the handshake, the first connection briefly
+    reads to collect them; any application data read is returned to the
+    caller so it can be replayed.
+
+    Example:
+        ssl_sock, early = tls_sessions.wrap_socket(ctx, sock, "example.com", 443)
+    """
+
+    def __init__(self):
+        self._sessions: Dict[Tuple[int, str, int], ssl.SSLSession] = {}
+        self._gates: Dict[Tuple[int, str, int], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.full_handshakes = 0
+        self.resumed_handshakes = 0
+
+    def clear(self) -> None:
+        """Drop all cached sessions and reset the handshake counters."""
+        with self._lock:
+            self._sessions.clear()
+            self._gates.clear()
+            self.full_handshakes = 0
+            self.resumed_handshakes = 0
+
+    def _gate(self, key: Tuple[int, str, int]) -> threading.Lock:
+        with self._lock:
+            return self._gates.setdefault(key, threading.Lock())
+
+    def wrap_socket(
+        self,
+        ssl_context: ssl.SSLContext,
+        sock: socket.socket,
+        server_hostname: Optional[str],
+        port: int,
+        timeout: Optional[float] = None,
+    ) -> Tuple[ssl.SSLSocket, bytes]:
+        """
+        Perform the TLS handshake, resuming a cached session if possible.
+
+        Args:
+            ssl_context: Shared context (sessions are bound to it)
+            sock: Connected TCP socket
+            server_hostname: SNI / certificate hostname
+            port: Target port (part of the session key)
+            timeout: Handshake timeout in seconds
+
+        Returns:
+            Tuple of (TLS socket, application data read while collecting tickets)
+        """
+        key = (id(ssl_context), server_hostname or "", port)
+
+        session = self._sessions.get(key)
+        if session is not None:
+            return self._handshake(ssl_context, sock, server_hostname, key, timeout, session), b""
+
+        # Serialize first handshakes so the others can resume. The wait is
+        # bounded: servers that handshake one connection at a time would
+        # otherwise deadlock on connections parked behind the gate.
+        gate = self._gate(key)
+        if not gate.acquire(timeout=_GATE_WAIT):
+            return self._handshake(ssl_context, sock, server_hostname, key, timeout, None), b""
+
+        try:
+            session = self._sessions.get(key)
+            if session is not None:
+                return self._handshake(ssl_context, sock, server_hostname, key, timeout, session), b""
+
+            ssl_sock = self._handshake(ssl_context, sock, server_hostname, key, timeout, None)
+            early = b""
+            if not (ssl_sock.session and ssl_sock.session.has_ticket):
+                early = self._collect_tickets(ssl_sock, timeout)
+            if ssl_sock.session is not None:
+                self._sessions[key] = ssl_sock.session
+            return ssl_sock, early
+        finally:
+            gate.release()
+
+    def _handshake(
+        self,
+        ssl_context: ssl.SSLContext,
+        sock: socket.socket,
+        server_hostname: Optional[str],
+        key: Tuple[int, str, int],
+        timeout: Optional[float],
+        session: Optional[ssl.SSLSession],
+    ) -> ssl.SSLSocket:
+        sock.settimeout(timeout)
+        ssl_sock = ssl_context.wrap_socket(sock, server_hostname=server_hostname, session=session)
+
+        with self._lock:
+            if ssl_sock.session_reused:
+                self.resumed_handshakes += 1
+            else:
+                self.full_handshakes += 1
+
+        if session is not None and not ssl_sock.session_reused:
+            # Server declined the ticket: keep the fresh session instead
+            self._sessions[key] = ssl_sock.session
+        logger.debug(
+            f"TLS handshake with {server_hostname}:{key[2]} "
+            f"({'resumed' if ssl_sock.session_reused else 'full'})"
+        )
+        return ssl_sock
+
+    @staticmethod
+    def _collect_tickets(ssl_sock: ssl.SSLSocket, timeout: Optional[float]) -> bytes:
+        """Read briefly so OpenSSL processes post-handshake session tickets."""
+        early = bytearray()
+        try:
+            ssl_sock.settimeout(_TICKET_WAIT)
+            while not (ssl_sock.session and ssl_sock.session.has_ticket):
+                data = ssl_sock.recv(65535)
+                if not data:
+                    break
+                early.extend(data)
+        except (socket.timeout, ssl.SSLWantReadError):
+            pass
+        finally:
+            ssl_sock.settimeout(timeout)
+        return bytes(early)
+
+
+tls_sessions = TLSSessionCache()
+
+
+class TLSStream(httpcore.NetworkStream):
+    """httpcore network stream over a TLS socket created by TLSSessionCache."""
+
+    def __init__(self, sock: ssl.SSLSocket):
+        self._sock = sock
+
+    def read(self, max_bytes: int, timeout: Optional[float] = None) -> bytes:
+        try:
+            self._sock.settimeout(timeout)
+            return self._sock.recv(max_bytes)
+        except socket.timeout as e:
+            raise httpcore.ReadTimeout(str(e)) from e
+        except OSError as e:
+            raise httpcore.ReadError(str(e)) from e
+
+    def write(self, buffer: bytes, timeout: Optional[float] = None) -> None:
+        if not buffer:
+            return
+        try:
+            self._sock.settimeout(timeout)
+            self._sock.sendall(buffer)
+        except socket.timeout as e:
+            raise httpcore.WriteTimeout(str(e)) from e
+        except OSError as e:
+            raise httpcore.WriteError(str(e)) from e
+
+    def close(self) -> None:
+        self._sock.close()
+
+    def start_tls(
+        self,
+        ssl_context: ssl.SSLContext,
+        server_hostname: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> httpcore.NetworkStream:
+        return self
+
+    def get_extra_info(self, info: str) -> Any:
+        if info == "ssl_object":
+            return self._sock
+        if info == "client_addr":
+            return self._sock.getsockname()
+        if info == "server_addr":
+            return self._sock.getpeername()
+        if info == "socket":
+            return self._sock
+        if info == "is_readable":
+            if self._sock.pending():
+                return True
+            readable, _, _ = select.select([self._sock], [], [], 0)
+            return bool(readable)
+        return None
+
+
+class ResumableTCPStream(httpcore.NetworkStream):
+    """
+    Plain TCP stream whose start_tls() resumes cached TLS sessions.
+
+    Wraps a stream from the underlying backend; everything except
+    start_tls() is delegated.
+    """
+
+    def __init__(self, stream: httpcore.NetworkStream, host: str, port: int):
+        self._stream = stream
+        self._host = host
+        self._port = port
+
+    def read(self, max_bytes: int, timeout: Optional[float] = None) -> bytes:
+        return self._stream.read(max_bytes, timeout)
+
+    def write(self, buffer: bytes, timeout: Optional[float] = None) -> None:
+        self._stream.write(buffer, timeout)
+
+    def close(self) -> None:
+        self._stream.close()
+
+    def start_tls(
+        self,
+        ssl_context: ssl.SSLContext,
+        server_hostname: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> httpcore.NetworkStream:
+        sock = self._stream.get_extra_info("socket")
+        if sock is None or isinstance(sock, ssl.SSLSocket):
+            return self._stream.start_tls(ssl_context, server_hostname, timeout)
+
+        try:
+            ssl_sock, early = tls_sessions.wrap_socket(
+                ssl_context, sock, server_hostname or self._host, self._port, timeout
+            )
+        except socket.timeout as e:
+            self.close()
+            raise httpcore.ConnectTimeout(str(e)) from e
+        except OSError as e:
+            self.close()
+            raise httpcore.ConnectError(str(e)) from e
+
+        stream = TLSStream(ssl_sock)
+        return PrewarmedStream(stream, replay=early) if early else stream
+
+    def get_extra_info(self, info: str) -> Any:
+        return self._stream.get_extra_info(info)
+
+
+def _h2_connection_init() -> Tuple[h2.connection.H2Connection, bytes]:
+    """
+    Build the client connection preface exactly as httpcore sends it.
+
+    Returns:
+        Tuple of (h2 state machine, preface + SETTINGS + WINDOW_UPDATE bytes)
+    """
+    conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=True))
+    conn.local_settings = h2.settings.Settings(
+        client=True,
+        initial_values={
+            h2.settings.SettingCodes.ENABLE_PUSH: 0,
+            h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: 100,
+            h2.settings.SettingCodes.MAX_HEADER_LIST_SIZE: 65536,
+        },
+    )
+    del conn.local_settings[h2.settings.SettingCodes.ENABLE_CONNECT_PROTOCOL]
+    conn.initiate_connection()
+    conn.increment_flow_control_window(2**24)
+    return conn, conn.data_to_send()
+
+
+def _h2_settings_received(conn: h2.connection.H2Connection, data: bytes) -> bool:
+    """
+    Feed bytes read during the HTTP/2 handshake to the state machine.
+
+    Returns:
+        True once the server SETTINGS frame has been received
+
+    Raises:
+        httpcore.ConnectError: If the server closed or terminated the connection
+    """
+    if not data:
+        raise httpcore.ConnectError("Connection closed during HTTP/2 handshake")
+    events = conn.receive_data(data)
+    if any(isinstance(e, h2.events.RemoteSettingsChanged) for e in events):
+        return True
+    if any(isinstance(e, h2.events.ConnectionTerminated) for e in events):
+        raise httpcore.ConnectError("Server terminated HTTP/2 connection during handshake")
+    return False
+
+
+class PrewarmedStream(httpcore.NetworkStream):
+    """
+    Network stream whose handshakes were completed during warmup.
+
+    start_tls() is a no-op when TLS is already established. For HTTP/2,
+    the connection preface already sent during warmup is stripped from the
+    first write, and the bytes read while waiting for the server SETTINGS
+    are replayed to httpcore on its first reads.
+    """
+
+    def __init__(self, stream: httpcore.NetworkStream, sent_preface: bytes = b"", replay: bytes = b""):
+        self._stream = stream
+        self._sent_preface = sent_preface
+        self._replay = bytearray(replay)
+        self._first_write = True
+
+    def read(self, max_bytes: int, timeout: Optional[float] = None) -> bytes:
+        if self._replay:
+            data = bytes(self._replay[:max_bytes])
+            del self._replay[:max_bytes]
+            return data
+        return self._stream.read(max_bytes, timeout)
+
+    def write(self, buffer: bytes, timeout: Optional[float] = None) -> None:
+        if self._first_write and self._sent_preface:
+            self._first_write = False
+            if buffer.startswith(self._sent_preface):
+                buffer = buffer[len(self._sent_preface):]
+            elif buffer.startswith(H2_PREFACE):
+                # Settings differ from ours: the extra SETTINGS and
+                # WINDOW_UPDATE frames are legal, only the preface is not
+                logger.debug("HTTP/2 client settings differ from warmup, sending them again")
+                buffer = buffer[len(H2_PREFACE):]
+        self._first_write = False
+        self._stream.write(buffer, timeout)
+
+    def close(self) -> None:
+        self._stream.close()
+
+    def start_tls(
+        self,
+        ssl_context: ssl.SSLContext,
+        server_hostname: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> httpcore.NetworkStream:
+        if self._stream.get_extra_info("ssl_object") is not None:
+            return self
+        return self._stream.start_tls(ssl_context, server_hostname, timeout)
+
+    def get_extra_info(self, info: str) -> Any:
+        if info == "is_readable" and self._replay:
+            return True
+        return self._stream.get_extra_info(info)
+
+
+def _apply_socket_options(stream: Any, socket_options: Optional[Iterable[Any]]) -> None:
+    """
+    Set socket options on a connected stream.
+
+    httpcore always enables TCP_NODELAY after the configured options, so
+    they are applied again once the connection is open.
+    """
+    sock = stream.get_extra_info("socket")
+    if sock is None:
+        return
+    for option in socket_options or ():
+        sock.setsockopt(*option)
+
+
+class PrewarmedBackend(httpcore.NetworkBackend):
+    """
+    httpcore network backend that hands out pre-established streams.
+
+    warm() completes the handshakes for one connection and parks the
+    stream. When the pool later opens a connection to the same host and
+    port, connect_tcp() returns a parked stream instead of dialing, so the
+    first request goes out on an already negotiated connection. All TLS
+    handshakes go through tls_sessions, so they resume cached sessions.
+
+    Example:
+        backend = PrewarmedBackend.install(client)
+        backend.warm("example.com", 443, ssl_context, http2=True)
+        client.send(request)   # Uses the warmed connection
+    """
+
+    def __init__(self, backend: Optional[httpcore.NetworkBackend] = None):
+        """
+        Initialize the backend.
+
+        Args:
+            backend: Backend used to dial new connections (default: httpcore.SyncBackend)
+        """
+        self._backend = backend or httpcore.SyncBackend()
+        self._parked: Dict[Tuple[str, int], List[PrewarmedStream]] = {}
+        self._lock = threading.Lock()
+
+        # Socket options and local address of the pool (used by warm())
+        self._socket_options: Optional[Iterable[Any]] = None
+        self._local_address: Optional[str] = None
+
+    @classmethod
+    def install(cls, client: httpx.Client) -> Optional["PrewarmedBackend"]:
+        """
+        Install the backend into an httpx.Client's connection pool.
+
+        Only direct connections are supported: returns None when requests
+        to the client's base_url go through a proxy (mounted transports) or
+        a custom transport.
+
+        Args:
+            client: Client whose default transport should use this backend
+
+        Returns:
+            Installed PrewarmedBackend, or None if unsupported
+        """
+        transport = client._transport_for_url(client.base_url)
+        if transport is not getattr(client, "_transport", None):
+            return None
+        pool = getattr(transport, "_pool", None)
+        if type(pool) is not httpcore.ConnectionPool:
+            return None
+
+        backend = pool._network_backend
+        if not isinstance(backend, cls):
+            backend = cls(backend)
+            pool._network_backend = backend
+        backend._socket_options = pool._socket_options
+        backend._local_address = pool._local_address
+        return backend
+
+    @staticmethod
+    def ssl_context_of(client: httpx.Client) -> Optional[ssl.SSLContext]:
+        """Return the SSL context used by a client's connection pool."""
+        pool = getattr(client._transport_for_url(client.base_url), "_pool", None)
+        return getattr(pool, "_ssl_context", None)
+
+    def warm(
+        self,
+        host: str,
+        port: int,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        http2: bool = False,
+        timeout: Optional[float] = None,
+    ) -> PrewarmedStream:
+        """
+        Complete TCP, TLS/ALPN and HTTP/2 preface for one connection and park it.
+
+        Args:
+            host: Target hostname
+            port: Target port
+            ssl_context: SSL context for TLS (None for plain TCP)
+            http2: Whether HTTP/2 is offered via ALPN
+            timeout: Connect/read timeout in seconds
+
+        Returns:
+            The parked stream
+        """
+        dialed = self._backend.connect_tcp(
+            host, port, timeout=timeout, local_address=self._local_address, socket_options=self._socket_options
+        )
+        _apply_socket_options(dialed, self._socket_options)
+        stream = ResumableTCPStream(dialed, host, port)
+        sent_preface = b""
+        replay = b""
+
+        try:
+            if ssl_context is not None:
+                # Same ALPN list httpcore sets before its own start_tls()
+                ssl_context.set_alpn_protocols(["http/1.1", "h2"] if http2 else ["http/1.1"])
+                stream = stream.start_tls(ssl_context, server_hostname=host, timeout=timeout)
+
+                ssl_object = stream.get_extra_info("ssl_object")
+                if ssl_object is not None and ssl_object.selected_alpn_protocol() == "h2":
+                    sent_preface, replay = self._exchange_h2_settings(stream, timeout)
+        except Exception:
+            stream.close()
+            raise
+
+        warmed = PrewarmedStream(stream, sent_preface=sent_preface, replay=replay)
+        with self._lock:
+            self._parked.setdefault((host, port), []).append(warmed)
+        return warmed
+
+    @staticmethod
+    def _exchange_h2_settings(stream: httpcore.NetworkStream, timeout: Optional[float]) -> Tuple[bytes, bytes]:
+        """
+        Send the HTTP/2 preface and wait for the server SETTINGS frame.
+
+        Returns:
+            Tuple of (bytes sent, bytes received to replay to httpcore)
+        """
+        conn, preface = _h2_connection_init()
+        stream.write(preface, timeout)
+
+        received = bytearray()
+        while True:
+            data = stream.read(65535, timeout)
+            received.extend(data)
+            if _h2_settings_received(conn, data):
+                return preface, bytes(received)
+
+    def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.NetworkStream:
+        with self._lock:
+            parked = self._parked.get((host, port))
+            if parked:
+                return parked.pop(0)
+        stream = self._backend.connect_tcp(
+            host, port, timeout=timeout, local_address=local_address, socket_options=socket_options
+        )
+        _apply_socket_options(stream, socket_options)
+        return ResumableTCPStream(stream, host, port)
+
+    def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.NetworkStream:
+        return self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    def sleep(self, seconds: float) -> None:
+        self._backend.sleep(seconds)
+
+    def close(self) -> None:
+        """Close any parked streams that were never used."""
+        with self._lock:
+            for streams in self._parked.values():
+                for stream in streams:
+                    try:
+                        stream.close()
+                    except Exception:
+                        pass
+            self._parked.clear()
+
+
+class AsyncPrewarmedStream(httpcore.AsyncNetworkStream):
+    """Async counterpart of PrewarmedStream, used by AsyncPrewarmedBackend."""
+
+    def __init__(self, stream: httpcore.AsyncNetworkStream, sent_preface: bytes = b"", replay: bytes = b""):
+        self._stream = stream
+        self._sent_preface = sent_preface
+        self._replay = bytearray(replay)
+        self._first_write = True
+
+    async def read(self, max_bytes: int, timeout: Optional[float] = None) -> bytes:
+        if self._replay:
+            data = bytes(self._replay[:max_bytes])
+            del self._replay[:max_bytes]
+            return data
+        return await self._stream.read(max_bytes, timeout)
+
+    async def write(self, buffer: bytes, timeout: Optional[float] = None) -> None:
+        if self._first_write and self._sent_preface:
+            if buffer.startswith(self._sent_preface):
+                buffer = buffer[len(self._sent_preface):]
+            elif buffer.startswith(H2_PREFACE):
+                logger.debug("HTTP/2 client settings differ from warmup, sending them again")
+                buffer = buffer[len(H2_PREFACE):]
+        self._first_write = False
+        await self._stream.write(buffer, timeout)
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+    async def start_tls(
+        self,
+        ssl_context: ssl.SSLContext,
+        server_hostname: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        if self._stream.get_extra_info("ssl_object") is not None:
+            return self
+        return await self._stream.start_tls(ssl_context, server_hostname, timeout)
+
+    def get_extra_info(self, info: str) -> Any:
+        if info == "is_readable" and self._replay:
+            return True
+        return self._stream.get_extra_info(info)
+
+
+class AsyncPrewarmedBackend(httpcore.AsyncNetworkBackend):
+    """
+    httpcore async network backend that hands out pre-established streams.
+
+    Async counterpart of PrewarmedBackend for httpx.AsyncClient. The TLS
+    handshake is done by the event loop, so it uses the client's (shared)
+    SSL context but cannot resume sessions through tls_sessions.
+
+    Example:
+        backend = AsyncPrewarmedBackend.install(client)
+        await backend.warm("example.com", 443, ssl_context, http2=True)
+        await client.send(request)   # Uses the warmed connection
+    """
+
+    def __init__(self, backend: Optional[httpcore.AsyncNetworkBackend] = None):
+        """
+        Initialize the backend.
+
+        Args:
+            backend: Backend used to dial new connections (default: httpcore.AnyIOBackend)
+        """
+        self._backend = backend or httpcore.AnyIOBackend()
+        self._parked: Dict[Tuple[str, int], List[AsyncPrewarmedStream]] = {}
+
+        # Socket options and local address of the pool (used by warm())
+        self._socket_options: Optional[Iterable[Any]] = None
+        self._local_address: Optional[str] = None
+
+    @classmethod
+    def install(cls, client: httpx.AsyncClient) -> Optional["AsyncPrewarmedBackend"]:
+        """
+        Install the backend into an httpx.AsyncClient's connection pool.
+
+        Args:
+            client: Client whose default transport should use this backend
+
+        Returns:
+            Installed AsyncPrewarmedBackend, or None if unsupported
+            (proxy or custom transport)
+        """
+        transport = client._transport_for_url(client.base_url)
+        if transport is not getattr(client, "_transport", None):
+            return None
+        pool = getattr(transport, "_pool", None)
+        if type(pool) is not httpcore.AsyncConnectionPool:
+            return None
+
+        backend = pool._network_backend
+        if not isinstance(backend, cls):
+            backend = cls(backend)
+            pool._network_backend = backend
+        backend._socket_options = pool._socket_options
+        backend._local_address = pool._local_address
+        return backend
+
+    async def warm(
+        self,
+        host: str,
+        port: int,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        http2: bool = False,
+        timeout: Optional[float] = None,
+    ) -> AsyncPrewarmedStream:
+        """
+        Complete TCP, TLS/ALPN and HTTP/2 preface for one connection and park it.
+
+        Args:
+            host: Target hostname
+            port: Target port
+            ssl_context: SSL context for TLS (None for plain TCP)
+            http2: Whether HTTP/2 is offered via ALPN
+            timeout: Connect/read timeout in seconds
+
+        Returns:
+            The parked stream
+        """
+        stream = await self._backend.connect_tcp(
+            host, port, timeout=timeout, local_address=self._local_address, socket_options=self._socket_options
+        )
+        _apply_socket_options(stream, self._socket_options)
+        sent_preface = b""
+        replay = b""
+
+        try:
+            if ssl_context is not None:
+                ssl_context.set_alpn_protocols(["http/1.1", "h2"] if http2 else ["http/1.1"])
+                stream = await stream.start_tls(ssl_context, server_hostname=host, timeout=timeout)
+
+                ssl_object = stream.get_extra_info("ssl_object")
+                if ssl_object is not None and ssl_object.selected_alpn_protocol() == "h2":
+                    conn, sent_preface = _h2_connection_init()
+                    await stream.write(sent_preface, timeout)
+
+                    received = bytearray()
+                    while True:
+                        data = await stream.read(65535, timeout)
+                        received.extend(data)
+                        if _h2_settings_received(conn, data):
+                            break
+                    replay = bytes(received)
+        except BaseException:
+            await stream.aclose()
+            raise
+
+        warmed = AsyncPrewarmedStream(stream, sent_preface=sent_preface, replay=replay)
+        self._parked.setdefault((host, port), []).append(warmed)
+        return warmed
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        parked = self._parked.get((host, port))
+        if parked:
+            return parked.pop(0)
+        stream = await self._backend.connect_tcp(
+            host, port, timeout=timeout, local_address=local_address, socket_options=socket_options
+        )
+        _apply_socket_options(stream, socket_options)
+        return stream
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[Iterable[Any]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+    async def aclose(self) -> None:
+        """Close any parked streams that were never used."""
+        for streams in self._parked.values():
+            for stream in streams:
+                try:
+                    await stream.aclose()
+                except Exception:
+                    pass
+        self._parked.clear()
@@ -8,5 +8,19 @@ from .client import HTTPClient
 from .parser import HTTPParser
 from .extractor import ExtractorRegistry, get_extractor
 from .adapter import HttpxResponseAdapter
+from .compiler import CompiledRequest, compile_request
+from .raw import HTTP11Reader, RawResponse, request_bytes, serialize_request
 
-__all__ = ["HTTPClient", "HTTPParser", "HttpxResponseAdapter", "ExtractorRegistry", "get_extractor"]
+__all__ = [
+    "HTTPClient",
+    "HTTPParser",
+    "CompiledRequest",
+    "compile_request",
+    "HttpxResponseAdapter",
+    "ExtractorRegistry",
+    "get_extractor",
+    "HTTP11Reader",
+    "RawResponse",
+    "request_bytes",
+    "serialize_request",
+]
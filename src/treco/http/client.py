@@ -11,7 +11,7 @@ from pathlib import Path
 import logging
 
 from treco.models import TargetConfig
-from treco.http.parser import HTTPParser
+from treco.http.compiler import compile_request
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +37,6 @@ class HTTPClient:
             http2: Whether to use HTTP/2 (default: False for compatibility)
         """
         self.config = target
-        self.parser = HTTPParser()
         self._http2 = http2
 
         # Build base URL
@@ -183,16 +182,16 @@ class HTTPClient:
         Returns:
             httpx.Response object
         """
-        method, path, headers, body = self.parser.parse(http_raw)
-        url = self.base_url + path
+        compiled = compile_request(http_raw)
+        url = self.base_url + compiled.target
         
         client = self.get_client(bypass_proxy)
 
         response = client.request(
-            method=method,
+            method=compiled.method,
             url=url,
-            headers=headers,
-            content=body if body else None,
+            headers=compiled.headers,
+            content=compiled.body,
         )
 
         return response
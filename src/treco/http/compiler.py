@@ -0,0 +1,111 @@
+"""
+Bytes-level request compiler.
+
+Turns a rendered HTTP request into a CompiledRequest in one pass over its
+bytes: the request line and headers are split on line ends (LF or CRLF),
+header names and values stay bytes, and the body is a slice of the input,
+so binary bodies pass through unchanged. A Content-Length header written
+in the template is set to the actual body length.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+
+import httpx
+
+# First line that is empty or whitespace only ends the headers
+_BLANK_LINE = re.compile(rb"\n[ \t\r]*\n")
+
+# "METHOD /path HTTP/1.1" or "METHOD /path"
+_REQUEST_LINE = re.compile(rb"(\w+)\s+(\S+)(?:\s+HTTP/[\d.]+)?")
+
+
+@dataclass(frozen=True)
+class CompiledRequest:
+    """
+    A rendered request, parsed once and ready to be built for any client.
+
+    Attributes:
+        method: HTTP method (upper case)
+        target: Request target as written (path or absolute URL)
+        headers: Header (name, value) pairs in template order, as bytes
+        body: Request body, or None if empty
+
+    Example:
+        compiled = compile_request(http_text)
+        request = compiled.build(client)
+        wire = request_bytes(request)   # raw engines
+    """
+
+    method: str
+    target: str
+    headers: Tuple[Tuple[bytes, bytes], ...]
+    body: Optional[bytes]
+
+    def build(self, client: Union[httpx.Client, httpx.AsyncClient]) -> httpx.Request:
+        """
+        Build an httpx request with the client's defaults and base_url.
+
+        Args:
+            client: httpx.Client, httpx.AsyncClient or RawSession
+
+        Returns:
+            httpx.Request
+        """
+        return client.build_request(
+            method=self.method,
+            url=self.target,
+            headers=self.headers,
+            content=self.body,
+        )
+
+
+def compile_request(http_raw: Union[str, bytes]) -> CompiledRequest:
+    """
+    Compile raw HTTP request text.
+
+    Surrounding whitespace of the request and of the body is ignored, as
+    with HTTPParser.
+
+    Args:
+        http_raw: Rendered HTTP request (text is encoded as UTF-8)
+
+    Returns:
+        CompiledRequest
+
+    Raises:
+        ValueError: If the request line is invalid
+    """
+    data = http_raw.encode("utf-8") if isinstance(http_raw, str) else http_raw
+    data = data.strip()
+
+    separator = _BLANK_LINE.search(data)
+    if separator:
+        head, body = data[: separator.start()], data[separator.end() :].strip()
+    else:
+        head, body = data, b""
+
+    lines = head.split(b"\n")
+    request_line = lines[0].strip()
+    match = _REQUEST_LINE.fullmatch(request_line)
+    if not match:
+        raise ValueError(f"Invalid HTTP request line: {request_line.decode('utf-8', 'replace')}")
+
+    headers = []
+    for line in lines[1:]:
+        name, colon, value = line.partition(b":")
+        if not colon:
+            continue  # Skip malformed lines
+        name = name.strip()
+        value = value.strip()
+        if name.lower() == b"content-length":
+            value = str(len(body)).encode("ascii")
+        headers.append((name, value))
+
+    return CompiledRequest(
+        method=match.group(1).decode("ascii").upper(),
+        target=match.group(2).decode("utf-8"),
+        headers=tuple(headers),
+        body=body or None,
+    )
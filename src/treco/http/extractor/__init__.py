@@ -21,10 +21,11 @@ The extractor will be automatically discovered and available via:
     get_extractor('xpath')
 """
 
-from typing import Dict, Optional
+from typing import Dict, Mapping, Optional, Union
 
 from treco.models.config import ExtractPattern
 from treco.http.extractor.base import BaseExtractor, ExtractorRegistry, ResponseProtocol, UnknownExtractorError, register_extractor
+from treco.http.extractor.plan import ExtractPlan
 
 def get_extractor(pattern_type: str) -> BaseExtractor:
     """
@@ -43,19 +44,25 @@ def get_extractor(pattern_type: str) -> BaseExtractor:
 
 
 def extract_all(
-    response: ResponseProtocol, extracts: Dict[str, ExtractPattern], context: Optional[Dict] = None
+    response: ResponseProtocol,
+    extracts: Union[ExtractPlan, Dict[str, ExtractPattern]],
+    context: Optional[Mapping] = None,
 ) -> Dict[str, Optional[str]]:
     """
     Run all patterns in `extracts` against `response`.
 
     Args:
         response: HTTP response object
-        extracts: Dict[logical_name, ExtractPattern]
+        extracts: ExtractPlan, or Dict[logical_name, ExtractPattern] to
+                  compile the patterns on every call
         context: Optional execution context for accessing variables
         
     Returns:
         Dictionary mapping logical names to extracted values
     """
+    if isinstance(extracts, ExtractPlan):
+        return extracts.run(response, context)
+
     results: Dict[str, Optional[str]] = {}
 
     for name, pattern in extracts.items():
@@ -70,6 +77,7 @@ __all__ = [
     # Core classes
     'BaseExtractor',
     'ExtractorRegistry',
+    'ExtractPlan',
     
     # Decorator
     'register_extractor',
@@ -27,16 +27,45 @@ class ResponseProtocol(Protocol):
     def json(self) -> Any: ...
 
 
+# How much of the response body an extractor reads (BaseExtractor.body_access)
+BODY_NONE = "none"      # Status, headers, cookies or context only
+BODY_PREFIX = "prefix"  # Searches the text; works on a capped body
+BODY_FULL = "full"      # Parses a complete document
+
+
 class BaseExtractor(ABC):
     """
     Abstract base class for data extractors.
 
     Extractors are responsible for extracting structured data
     from HTTP responses based on specific extraction logic.
+
+    body_access tells the validator which response.read modes the
+    extractor works with (BODY_NONE, BODY_PREFIX or BODY_FULL).
+
+    compile() prepares a pattern once, when the config is loaded;
+    extract() accepts the raw pattern or the result of compile().
     """
 
     _extractor_type: str = ""
     _extractor_aliases: List[str] = []
+    body_access: str = BODY_FULL
+
+    def compile(self, pattern: Any) -> Any:
+        """
+        Prepare a pattern for repeated extraction.
+
+        Args:
+            pattern: Extraction pattern as written in the config
+
+        Returns:
+            Pattern in a form extract() accepts (unchanged by default)
+
+        Raises:
+            Exception: If the pattern is invalid; extract() is then given
+                       the raw pattern and reports the problem itself
+        """
+        return pattern
 
     @abstractmethod
     def extract(self, response: ResponseProtocol, pattern: Any, context: Optional[Dict[str, Any]] = None) -> Optional[Any]:
@@ -192,7 +221,7 @@ class ExtractorRegistry:
             module_name = module_info.name
             
             # Skip special modules
-            if module_name in ('__init__', 'base', 'registry'):
+            if module_name in ('__init__', 'base', 'registry', 'plan'):
                 continue
             
             # Import the module to trigger registration
@@ -5,9 +5,9 @@ Extracts data between left and right delimiters from HTTP responses.
 """
 
 import logging
-from typing import Any, Optional, Dict
+from typing import Any, NamedTuple, Optional, Dict, Union
 
-from treco.http.extractor.base import BaseExtractor, ResponseProtocol, register_extractor
+from treco.http.extractor.base import BODY_PREFIX, BaseExtractor, ResponseProtocol, register_extractor
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +19,15 @@ MARKER_EOL = "$"   # End of line
 MARKER_BOL = "^"   # Beginning of line
 
 
+class Boundaries(NamedTuple):
+    """A boundary pattern split into its parts (BoundaryExtractor.compile())."""
+
+    left: str
+    right: str
+    use_bol: bool
+    use_eol: bool
+
+
 @register_extractor('boundary', aliases=['between', 'delimited'])
 class BoundaryExtractor(BaseExtractor):
     """
@@ -38,10 +47,41 @@ class BoundaryExtractor(BaseExtractor):
     by using a different separator (see extract method).
     """
 
+    body_access = BODY_PREFIX
+
+    def compile(self, pattern: str, separator: str = BOUNDARY_SEPARATOR) -> Boundaries:
+        """
+        Split a boundary pattern once.
+
+        Args:
+            pattern: Boundary pattern in format "left|||right"
+            separator: Separator between boundaries (default: '|||')
+
+        Returns:
+            Boundaries
+
+        Raises:
+            ValueError: If the separator is not in the pattern
+        """
+        if separator not in pattern:
+            raise ValueError(f"separator '{separator}' not found in pattern '{pattern}'")
+
+        left_boundary, right_boundary = pattern.split(separator, 1)
+
+        # ^ marks the beginning of line, $ the end of line
+        use_bol = left_boundary == MARKER_BOL
+        use_eol = right_boundary == MARKER_EOL
+        return Boundaries(
+            left="" if use_bol else left_boundary,
+            right="" if use_eol else right_boundary,
+            use_bol=use_bol,
+            use_eol=use_eol,
+        )
+
     def extract(
         self, 
         response: ResponseProtocol, 
-        pattern: str,
+        pattern: Union[str, Boundaries],
         context: Optional[Dict] = None,
         separator: str = BOUNDARY_SEPARATOR
     ) -> Optional[Any]:
@@ -50,7 +90,7 @@ class BoundaryExtractor(BaseExtractor):
 
         Args:
             response: HTTP response object
-            pattern: Boundary pattern in format "left|||right"
+            pattern: Boundary pattern in format "left|||right", or Boundaries
             context: Optional execution context (not used by this extractor)
             separator: Separator between boundaries (default: '|||')
 
@@ -90,29 +130,17 @@ class BoundaryExtractor(BaseExtractor):
         References:
             - Similar to Apache JMeter's Boundary Extractor
         """
-        if separator not in pattern:
-            logger.warning(
-                f"[Extractor] Invalid boundary pattern: separator '{separator}' "
-                f"not found in pattern '{pattern}'."
-            )
-            return None
+        if not isinstance(pattern, Boundaries):
+            try:
+                pattern = self.compile(pattern, separator)
+            except ValueError as e:
+                logger.warning(f"[Extractor] Invalid boundary pattern: {e}.")
+                return None
 
-        parts = pattern.split(separator, 1)
-        left_boundary = parts[0]
-        right_boundary = parts[1] if len(parts) > 1 else ""
+        left_boundary, right_boundary, use_bol, use_eol = pattern
 
         response_text = response.text
 
-        # Handle ^ marker (beginning of line)
-        use_bol = left_boundary == MARKER_BOL
-        if use_bol:
-            left_boundary = ""
-
-        # Handle $ marker (end of line)
-        use_eol = right_boundary == MARKER_EOL
-        if use_eol:
-            right_boundary = ""
-
         # Find left boundary
         if left_boundary:
             left_index = response_text.find(left_boundary)
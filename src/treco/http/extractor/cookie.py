@@ -7,7 +7,7 @@ Extracts cookie values from HTTP response Set-Cookie headers.
 import logging
 from typing import Any, Optional, Dict
 
-from treco.http.extractor.base import BaseExtractor, ResponseProtocol, register_extractor
+from treco.http.extractor.base import BODY_NONE, BaseExtractor, ResponseProtocol, register_extractor
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,8 @@ class CookieExtractor(BaseExtractor):
     Registered as 'cookie' with aliases 'cookies', 'set_cookie', and 'set-cookie'.
     """
 
+    body_access = BODY_NONE
+
     def extract(self, response: ResponseProtocol, pattern: str, context: Optional[Dict] = None) -> Optional[Any]:
         """
         Extract cookie value from response.
@@ -7,7 +7,7 @@ Extracts data from HTTP response headers.
 import logging
 from typing import Any, Optional, Dict
 
-from treco.http.extractor.base import BaseExtractor, ResponseProtocol, register_extractor
+from treco.http.extractor.base import BODY_NONE, BaseExtractor, ResponseProtocol, register_extractor
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +21,8 @@ class HeaderExtractor(BaseExtractor):
     Registered as 'header' with aliases 'headers' and 'http_header'.
     """
 
+    body_access = BODY_NONE
+
     def extract(self, response: ResponseProtocol, pattern: str, context: Optional[Dict] = None) -> Optional[Any]:
         """
         Extract data from response headers.
@@ -6,10 +6,10 @@ Extracts data from JSON responses using JSONPath expressions.
 
 import json
 import logging
-from typing import Any, Optional, Dict
-from jsonpath_ng import parse
+from typing import Any, Optional, Dict, Union
+from jsonpath_ng import JSONPath, parse
 
-from treco.http.extractor.base import BaseExtractor, ResponseProtocol, register_extractor
+from treco.http.extractor.base import BODY_FULL, BaseExtractor, ResponseProtocol, register_extractor
 
 logger = logging.getLogger(__name__)
 
@@ -23,13 +23,29 @@ class JPathExtractor(BaseExtractor):
     Registered as 'jpath' with aliases 'jsonpath' and 'json_path'.
     """
 
-    def extract(self, response: ResponseProtocol, pattern: str, context: Optional[Dict] = None) -> Optional[Any]:
+    body_access = BODY_FULL
+
+    def compile(self, pattern: str) -> JSONPath:
+        """
+        Parse the JSONPath expression once.
+
+        Args:
+            pattern: JSONPath expression string
+
+        Returns:
+            Parsed expression
+        """
+        return parse(pattern)
+
+    def extract(
+        self, response: ResponseProtocol, pattern: Union[str, JSONPath], context: Optional[Dict] = None
+    ) -> Optional[Any]:
         """
         Extract data from response using JSONPath expression.
 
         Args:
             response: HTTP response object
-            pattern: JSONPath expression string
+            pattern: JSONPath expression string or parsed expression
             context: Optional context dict (unused)
 
         Returns:
@@ -57,7 +73,7 @@ class JPathExtractor(BaseExtractor):
 
         # Parse and execute JSONPath expression
         try:
-            expr = parse(pattern)
+            expr = parse(pattern) if isinstance(pattern, str) else pattern
             matches = [match.value for match in expr.find(data)]
         except Exception as e:
             logger.debug(f"JSONPath parse/find error for pattern '{pattern}': {e}")
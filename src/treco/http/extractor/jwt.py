@@ -11,11 +11,15 @@ import base64
 import logging
 from typing import Any, Dict, Optional, Union
 from datetime import datetime, timezone
+from jwt.algorithms import get_default_algorithms
 
-from treco.http.extractor.base import BaseExtractor, ResponseProtocol, register_extractor
+from treco.http.extractor.base import BODY_NONE, BaseExtractor, ResponseProtocol, register_extractor
 
 logger = logging.getLogger(__name__)
 
+# Pattern key holding the verification key prepared by compile()
+PREPARED_KEY = "_prepared_key"
+
 
 @register_extractor('jwt', aliases=['json_web_token'])
 class JWTExtractor(BaseExtractor):
@@ -53,6 +57,36 @@ class JWTExtractor(BaseExtractor):
             check: expired
     """
 
+    body_access = BODY_NONE
+
+    def compile(self, pattern: Union[str, Dict[str, Any]]) -> Union[str, Dict[str, Any]]:
+        """
+        Prepare the verification key of a literal secret once.
+
+        Secrets given as template variables are resolved per response and
+        are left as they are, as are secrets listed with algorithms of
+        different key types.
+
+        Args:
+            pattern: Configuration dict with JWT extraction parameters
+
+        Returns:
+            Copy of the pattern with the prepared key, or the pattern itself
+        """
+        if not isinstance(pattern, dict) or not pattern.get('verify'):
+            return pattern
+
+        secret = pattern.get('secret')
+        if not isinstance(secret, str) or secret.strip().startswith('{{'):
+            return pattern
+
+        available = get_default_algorithms()
+        algorithms = [available[name] for name in pattern.get('algorithms', ['HS256'])]
+        if len({type(algorithm) for algorithm in algorithms}) != 1:
+            return pattern
+
+        return {**pattern, PREPARED_KEY: algorithms[0].prepare_key(secret.strip())}
+
     def extract(self, response: ResponseProtocol, pattern: Union[str, Dict[str, Any]], context: Optional[Dict] = None) -> Optional[Any]:
         """
         Extract data from a JWT token.
@@ -97,12 +131,14 @@ class JWTExtractor(BaseExtractor):
             # Decode the token
             if verify:
                 # Verify signature
-                secret = pattern.get('secret')
-                if not secret:
-                    raise ValueError("JWT verification requires 'secret' parameter")
-                
-                # Resolve secret from context if it's a template variable
-                secret = self._resolve_source(secret, context or {})
+                secret = pattern.get(PREPARED_KEY)
+                if secret is None:
+                    secret = pattern.get('secret')
+                    if not secret:
+                        raise ValueError("JWT verification requires 'secret' parameter")
+
+                    # Resolve secret from context if it's a template variable
+                    secret = self._resolve_source(secret, context or {})
                 
                 algorithms = pattern.get('algorithms', ['HS256'])
                 decoded = jwt.decode(
@@ -0,0 +1,110 @@
+"""
+Precompiled extraction plans.
+
+An ExtractPlan holds the extractor of every extract pattern of a state,
+with the pattern prepared once by BaseExtractor.compile() (compiled regex,
+parsed JSONPath, compiled XPath, JWT verification key). The loader builds
+one per state, so each response only costs the matching itself.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional
+
+from treco.http.extractor.base import BaseExtractor, ExtractorRegistry, ResponseProtocol
+from treco.models.config import ExtractPattern
+
+logger = logging.getLogger(__name__)
+
+_UNPARSED = object()
+
+
+class _SharedResponse:
+    """
+    Response wrapper that parses a JSON body once for all extractors.
+
+    The body text is already decoded once by the responses themselves.
+    """
+
+    def __init__(self, response: ResponseProtocol):
+        self._response = response
+        self._json: Any = _UNPARSED
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    def json(self) -> Any:
+        if self._json is _UNPARSED:
+            self._json = self._response.json()
+        return self._json
+
+
+@dataclass
+class ExtractStep:
+    """
+    One extract pattern, ready to run.
+
+    Attributes:
+        name: Variable the extracted value is stored in
+        extractor: Extractor for the pattern type
+        pattern: Pattern as returned by extractor.compile() (the raw
+                 pattern if it did not compile)
+    """
+
+    name: str
+    extractor: BaseExtractor
+    pattern: Any
+
+
+class ExtractPlan:
+    """
+    The extract patterns of a state, compiled once.
+
+    Plans sent to worker processes are pickled as their patterns and
+    compiled again on arrival, since compiled XPath expressions cannot be
+    pickled.
+
+    Example:
+        plan = ExtractPlan(state.extract)
+        extracted = plan.run(response)
+    """
+
+    def __init__(self, extracts: Dict[str, ExtractPattern]):
+        """
+        Compile the patterns.
+
+        Args:
+            extracts: Dict[logical_name, ExtractPattern]
+
+        Raises:
+            UnknownExtractorError: If a pattern type has no extractor
+        """
+        self.extracts = extracts
+        self.steps: List[ExtractStep] = []
+
+        for name, pattern in extracts.items():
+            extractor = ExtractorRegistry.get_instance(pattern.pattern_type)
+            try:
+                compiled = extractor.compile(pattern.pattern_data)
+            except Exception as e:
+                logger.debug(f"Extract pattern '{name}' not precompiled: {e}")
+                compiled = pattern.pattern_data
+            self.steps.append(ExtractStep(name=name, extractor=extractor, pattern=compiled))
+
+    def run(self, response: ResponseProtocol, context: Optional[Mapping] = None) -> Dict[str, Optional[Any]]:
+        """
+        Run all patterns against a response.
+
+        Args:
+            response: HTTP response object
+            context: Optional execution context for accessing variables
+
+        Returns:
+            Dictionary mapping logical names to extracted values
+        """
+        if len(self.steps) > 1:
+            response = _SharedResponse(response)
+        return {step.name: step.extractor.extract(response, step.pattern, context) for step in self.steps}
+
+    def __reduce__(self):
+        return ExtractPlan, (self.extracts,)
@@ -6,9 +6,9 @@ Extracts data from HTTP responses using regular expression patterns.
 
 import re
 import logging
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Pattern, Union
 
-from treco.http.extractor.base import BaseExtractor, ResponseProtocol, register_extractor
+from treco.http.extractor.base import BODY_PREFIX, BaseExtractor, ResponseProtocol, register_extractor
 
 logger = logging.getLogger(__name__)
 
@@ -37,13 +37,29 @@ class RegExExtractor(BaseExtractor):
         # data = {"token": "abc123", "balance": "1000.50"}
     """
 
-    def extract(self, response: ResponseProtocol, pattern: str, context: Optional[Dict] = None) -> Optional[str]:
+    body_access = BODY_PREFIX
+
+    def compile(self, pattern: str) -> Pattern[str]:
+        """
+        Compile the regex once instead of going through the re module cache.
+
+        Args:
+            pattern: Regex pattern string
+
+        Returns:
+            Compiled pattern
+        """
+        return re.compile(pattern)
+
+    def extract(
+        self, response: ResponseProtocol, pattern: Union[str, Pattern[str]], context: Optional[Dict] = None
+    ) -> Optional[str]:
         """
         Extract data from response using regex patterns.
 
         Args:
             response: HTTP response object
-            pattern: Regex pattern string
+            pattern: Regex pattern string or compiled pattern
 
         Returns:
             Extracted value or None if not found
@@ -55,7 +71,8 @@ class RegExExtractor(BaseExtractor):
         """
         response_text = response.text
 
-        match = re.search(pattern, response_text)
+        regex = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern)
+        match = regex.search(response_text)
 
         if match:
             # Extract first captured group
@@ -67,7 +84,7 @@ class RegExExtractor(BaseExtractor):
                 return match.group(0)
 
         # Pattern didn't match, store None
-        logger.warning(f"[Extractor] Pattern '{pattern}' not found in response.")
+        logger.warning(f"[Extractor] Pattern '{regex.pattern}' not found in response.")
         return None
 
     def _convert_type(self, value: str) -> Any:
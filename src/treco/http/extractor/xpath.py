@@ -5,10 +5,10 @@ Extracts data from XML/HTML responses using XPath expressions.
 """
 
 import logging
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Union
 from lxml import etree # type: ignore
 
-from treco.http.extractor.base import BaseExtractor, ResponseProtocol, register_extractor
+from treco.http.extractor.base import BODY_FULL, BaseExtractor, ResponseProtocol, register_extractor
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +22,29 @@ class XPathExtractor(BaseExtractor):
     Registered as 'xpath' with aliases 'xml_path' and 'html_path'.
     """
 
-    def extract(self, response: ResponseProtocol, pattern: str, context: Optional[Dict] = None) -> Optional[Any]:
+    body_access = BODY_FULL
+
+    def compile(self, pattern: str) -> etree.XPath:
+        """
+        Compile the XPath expression once.
+
+        Args:
+            pattern: XPath expression string
+
+        Returns:
+            Compiled expression, callable on a parsed tree
+        """
+        return etree.XPath(pattern)
+
+    def extract(
+        self, response: ResponseProtocol, pattern: Union[str, etree.XPath], context: Optional[Dict] = None
+    ) -> Optional[Any]:
         """
         Extract data from response using XPath expression.
 
         Args:
             response: HTTP response object
-            pattern: XPath expression string
+            pattern: XPath expression string or compiled expression
 
         Returns:
             Extracted data or None if not found
@@ -52,14 +68,24 @@ class XPathExtractor(BaseExtractor):
         if tree is None:
             return None
 
+        if isinstance(pattern, etree.XPath):
+            path = pattern.path
+        else:
+            path = pattern
+            try:
+                pattern = etree.XPath(path)
+            except etree.XPathSyntaxError as e:
+                logger.warning(f"[Extractor] Invalid XPath expression '{path}': {e}")
+                return None
+
         try:
-            matches = tree.xpath(pattern)
+            matches = pattern(tree)
         except etree.XPathEvalError as e:
-            logger.warning(f"[Extractor] Invalid XPath expression '{pattern}': {e}")
+            logger.warning(f"[Extractor] Invalid XPath expression '{path}': {e}")
             return None
 
         if not matches:
-            logger.warning(f"[Extractor] XPath pattern '{pattern}' not found in response.")
+            logger.warning(f"[Extractor] XPath pattern '{path}' not found in response.")
             return None
 
         # Return first match, converting element to text if needed
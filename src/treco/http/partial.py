@@ -0,0 +1,87 @@
+"""
+Partial response reads (state response.read).
+
+Race threads often only need the status line and headers, or the first
+bytes of the body, to tell whether a race was won. Reading less frees the
+thread and the connection sooner: httpx clients stream the response and
+close it at the limit, the raw and single-packet sessions stop their own
+readers (see RawSession.send() and SinglePacketSession.send()).
+
+A response cut short is returned fully read with the body it got so far.
+Its connection cannot carry another request: httpx closes it, the raw
+reader refuses to read from it again.
+"""
+
+from typing import Any, Optional
+
+import httpx
+
+
+def _truncated(response: httpx.Response, body: bytes, request: httpx.Request) -> httpx.Response:
+    """Build a read response from a streamed one and its (decoded) body prefix."""
+    headers = [(name, value) for name, value in response.headers.raw if name.lower() != b"content-encoding"]
+    return httpx.Response(
+        status_code=response.status_code,
+        headers=headers,
+        content=body,
+        request=request,
+        extensions=response.extensions,
+    )
+
+
+def send_request(client: Any, request: httpx.Request, body_limit: Optional[int] = None) -> Any:
+    """
+    Send a request, reading at most body_limit bytes of the response body.
+
+    Args:
+        client: Session from ConnectionStrategy.get_session()
+        request: Request to send
+        body_limit: Body bytes to read (0: headers only, None: whole body)
+
+    Returns:
+        Response of the session's usual type
+    """
+    if body_limit is None:
+        return client.send(request)
+    if not isinstance(client, httpx.Client):
+        return client.send(request, body_limit=body_limit)
+
+    response = client.send(request, stream=True)
+    body = bytearray()
+    try:
+        if body_limit:
+            for chunk in response.iter_bytes():
+                body.extend(chunk)
+                if len(body) >= body_limit:
+                    break
+    finally:
+        response.close()
+    return _truncated(response, bytes(body[:body_limit]), request)
+
+
+async def asend_request(client: httpx.AsyncClient, request: httpx.Request, body_limit: Optional[int] = None) -> httpx.Response:
+    """
+    Async counterpart of send_request() for httpx.AsyncClient.
+
+    Args:
+        client: Async client from the strategy
+        request: Request to send
+        body_limit: Body bytes to read (0: headers only, None: whole body)
+
+    Returns:
+        httpx.Response
+    """
+    if body_limit is None:
+        return await client.send(request)
+
+    response = await client.send(request, stream=True)
+    body = bytearray()
+    try:
+        if body_limit:
+            async for chunk in response.aiter_bytes():
+                body.extend(chunk)
+                if len(body) >= body_limit:
+                    break
+    finally:
+        await response.aclose()
+    return _truncated(response, bytes(body[:body_limit]), request)
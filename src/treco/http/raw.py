@@ -0,0 +1,525 @@
+"""
+Raw HTTP/1.1 wire helpers.
+
+Serializes httpx requests to bytes and reads HTTP/1.1 responses directly
+from a socket, for connection strategies that write to the wire themselves.
+"""
+
+import functools
+import json
+import logging
+import socket
+from dataclasses import dataclass, field
+from http.cookies import CookieError, SimpleCookie
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from .sockopts import corked
+from .timestamping import KernelTimestamps, SocketTimestamper
+
+logger = logging.getLogger(__name__)
+
+
+# Status codes that never carry a body (RFC 9110, section 6.4.1)
+_NO_BODY_STATUS = {204, 304}
+
+_RECV_SIZE = 65536
+
+# Request extension holding the serialized request (see request_bytes())
+_WIRE_EXTENSION = "treco.wire"
+
+
+def serialize_request(request: httpx.Request) -> bytes:
+    """
+    Serialize an httpx request to HTTP/1.1 wire format.
+
+    Headers are written exactly as built by httpx (including Host and
+    Content-Length), so the bytes match what httpx itself would send.
+
+    Args:
+        request: Request built with httpx.Client.build_request()
+
+    Returns:
+        Complete request (request line, headers and body) as bytes
+
+    Example:
+        request = client.build_request("POST", "/api", content=b"x=1")
+        sock.sendall(serialize_request(request))
+    """
+    target = request.url.raw_path
+    lines = [request.method.encode("ascii") + b" " + target + b" HTTP/1.1"]
+    lines.extend(name + b": " + value for name, value in request.headers.raw)
+    head = b"\r\n".join(lines) + b"\r\n\r\n"
+    return head + request.read()
+
+
+def request_bytes(request: httpx.Request) -> memoryview:
+    """
+    Serialize a request once and return the same buffer on later calls.
+
+    The bytes are kept in the request's extensions, so a request staged
+    again (e.g. in every round of a race) is not serialized again, and
+    slices of the returned view do not copy.
+
+    Args:
+        request: Request built with httpx.Client.build_request()
+
+    Returns:
+        Read-only view of serialize_request(request)
+    """
+    data = request.extensions.get(_WIRE_EXTENSION)
+    if data is None:
+        data = request.extensions[_WIRE_EXTENSION] = memoryview(serialize_request(request))
+    return data
+
+
+@dataclass
+class RawResponse:
+    """
+    HTTP response as read from the wire.
+
+    Satisfies ResponseProtocol, so extractors and when-blocks accept it
+    without going through httpx. Header, cookie and body decoding are
+    deferred until first access.
+
+    Attributes:
+        status_code: HTTP status code
+        reason: Reason phrase from the status line
+        http_version: Version from the status line (e.g. "HTTP/1.1")
+        raw_headers: Raw header list in wire order
+        raw_content: Response body with transfer coding removed
+        url: URL of the request that produced this response
+    """
+
+    status_code: int
+    reason: str = ""
+    http_version: str = "HTTP/1.1"
+    raw_headers: List[Tuple[bytes, bytes]] = field(default_factory=list)
+    raw_content: bytes = b""
+    url: str = ""
+    _headers: Optional[httpx.Headers] = field(default=None, init=False, repr=False)
+    _content: Optional[bytes] = field(default=None, init=False, repr=False)
+    _text: Optional[str] = field(default=None, init=False, repr=False)
+
+    @property
+    def reason_phrase(self) -> str:
+        """Reason phrase (alias matching httpx.Response)."""
+        return self.reason
+
+    @property
+    def headers(self) -> httpx.Headers:
+        """Case-insensitive response headers."""
+        if self._headers is None:
+            self._headers = httpx.Headers(self.raw_headers)
+        return self._headers
+
+    @property
+    def content(self) -> bytes:
+        """Response body with Content-Encoding (gzip, deflate, ...) removed."""
+        if self._content is None:
+            encoding = self.headers.get("content-encoding", "identity").strip().lower()
+            if encoding in ("", "identity"):
+                self._content = self.raw_content
+            else:
+                self._content = self.to_httpx(httpx.Request("GET", self.url or "http://localhost/")).content
+        return self._content
+
+    @property
+    def text(self) -> str:
+        """Response body decoded with the charset from Content-Type (default UTF-8)."""
+        if self._text is None:
+            charset = "utf-8"
+            for param in self.headers.get("content-type", "").split(";")[1:]:
+                key, _, value = param.partition("=")
+                if key.strip().lower() == "charset" and value.strip():
+                    charset = value.strip().strip('"')
+            try:
+                self._text = self.content.decode(charset, errors="replace")
+            except LookupError:
+                self._text = self.content.decode("utf-8", errors="replace")
+        return self._text
+
+    @property
+    def cookies(self) -> Dict[str, str]:
+        """Cookies set by the response (name -> value)."""
+        cookies: Dict[str, str] = {}
+        for value in self.headers.get_list("set-cookie"):
+            parsed = SimpleCookie()
+            try:
+                parsed.load(value)
+            except CookieError:
+                continue
+            cookies.update({name: morsel.value for name, morsel in parsed.items()})
+        return cookies
+
+    def json(self) -> Any:
+        """Parse the body as JSON."""
+        return json.loads(self.content)
+
+    def to_httpx(self, request: httpx.Request) -> httpx.Response:
+        """
+        Convert to a fully read httpx.Response.
+
+        Content-Encoding (gzip, deflate, ...) is decoded by httpx.
+
+        Args:
+            request: Request that produced this response
+
+        Returns:
+            httpx.Response bound to the request
+        """
+        response = httpx.Response(
+            status_code=self.status_code,
+            headers=self.raw_headers,
+            stream=httpx.ByteStream(self.raw_content),
+            request=request,
+            extensions={
+                "http_version": self.http_version.encode("ascii"),
+                "reason_phrase": self.reason.encode("latin-1"),
+            },
+        )
+        response.read()
+        return response
+
+
+class HTTP11Reader:
+    """
+    Minimal HTTP/1.1 response reader over a blocking socket.
+
+    Supports Content-Length, chunked transfer coding and read-until-close
+    bodies, and skips interim 1xx responses. Bytes received past the end
+    of a response are kept for the next read on the same connection.
+
+    With a body limit the reader stops early; the rest of that body stays
+    unread, so the connection cannot carry another response.
+
+    Example:
+        reader = HTTP11Reader(sock)
+        sock.sendall(serialize_request(request))
+        raw = reader.read_response(request.method)
+    """
+
+    def __init__(self, sock: socket.socket, initial: bytes = b""):
+        """
+        Initialize the reader.
+
+        Args:
+            sock: Connected socket (plain or TLS)
+            initial: Bytes already received from the socket
+        """
+        self._sock = sock
+        self._buffer = bytearray(initial)
+        self._eof = False
+        self._truncated = False
+
+    @property
+    def buffered(self) -> int:
+        """Number of received bytes not consumed yet."""
+        pending = getattr(self._sock, "pending", None)
+        return len(self._buffer) + (pending() if pending is not None else 0)
+
+    def _fill(self) -> bool:
+        """Receive more data into the buffer. Returns False on EOF."""
+        if self._eof:
+            return False
+        data = self._sock.recv(_RECV_SIZE)
+        if not data:
+            self._eof = True
+            return False
+        self._buffer.extend(data)
+        return True
+
+    def _read_until(self, delimiter: bytes) -> bytes:
+        """Read up to and including delimiter, returning the part before it."""
+        start = 0
+        while True:
+            index = self._buffer.find(delimiter, start)
+            if index != -1:
+                data = bytes(self._buffer[:index])
+                del self._buffer[:index + len(delimiter)]
+                return data
+            start = max(0, len(self._buffer) - len(delimiter) + 1)
+            if not self._fill():
+                raise httpx.RemoteProtocolError("Server disconnected before sending a complete response")
+
+    def _read_exact(self, size: int) -> bytes:
+        """Read exactly size bytes."""
+        while len(self._buffer) < size:
+            if not self._fill():
+                raise httpx.RemoteProtocolError(
+                    f"Server disconnected with {size - len(self._buffer)} body bytes outstanding"
+                )
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def _read_to_close(self, limit: Optional[int] = None) -> Tuple[bytes, bool]:
+        """Read until the server closes the connection or limit bytes arrived."""
+        while limit is None or len(self._buffer) < limit:
+            if not self._fill():
+                break
+        else:
+            data = bytes(self._buffer[:limit])
+            del self._buffer[:limit]
+            return data, False
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data, True
+
+    def _read_chunked(self, limit: Optional[int] = None) -> Tuple[bytes, bool]:
+        """Read a chunked body, discarding extensions and trailers."""
+        body = bytearray()
+        while True:
+            if limit is not None and len(body) >= limit:
+                return bytes(body[:limit]), False
+            size_line = self._read_until(b"\r\n")
+            try:
+                size = int(size_line.split(b";", 1)[0].strip(), 16)
+            except ValueError as e:
+                raise httpx.RemoteProtocolError(f"Invalid chunk size: {size_line!r}") from e
+            if size == 0:
+                break
+            body.extend(self._read_exact(size))
+            self._read_until(b"\r\n")
+
+        # Trailer section ends with an empty line
+        while self._read_until(b"\r\n"):
+            pass
+        return bytes(body), True
+
+    def _read_head(self) -> Tuple[str, int, str, List[Tuple[bytes, bytes]]]:
+        """Read and parse the status line and headers."""
+        head = self._read_until(b"\r\n\r\n")
+        status_line, _, header_block = head.partition(b"\r\n")
+
+        parts = status_line.split(b" ", 2)
+        if len(parts) < 2 or not parts[0].startswith(b"HTTP/"):
+            raise httpx.RemoteProtocolError(f"Invalid status line: {status_line!r}")
+        try:
+            status = int(parts[1])
+        except ValueError as e:
+            raise httpx.RemoteProtocolError(f"Invalid status code: {parts[1]!r}") from e
+        reason = parts[2].decode("latin-1") if len(parts) > 2 else ""
+
+        headers = []
+        for line in header_block.split(b"\r\n"):
+            if not line:
+                continue
+            name, sep, value = line.partition(b":")
+            if not sep:
+                raise httpx.RemoteProtocolError(f"Invalid header line: {line!r}")
+            headers.append((name.strip(), value.strip()))
+
+        return parts[0].decode("ascii"), status, reason, headers
+
+    def read_response(
+        self,
+        method: str = "GET",
+        on_head: Optional[Callable[[], None]] = None,
+        body_limit: Optional[int] = None,
+    ) -> RawResponse:
+        """
+        Read one response from the socket.
+
+        Args:
+            method: Method of the request being answered (HEAD has no body)
+            on_head: Called once the final response head has been read
+            body_limit: Stop after this many body bytes (0: head only,
+                        None: whole body)
+
+        Returns:
+            RawResponse with the decoded body (at most body_limit bytes)
+
+        Raises:
+            httpx.RemoteProtocolError: If the response is malformed or truncated,
+                or a previous body was left unread
+        """
+        if self._truncated:
+            raise httpx.RemoteProtocolError("Previous response body was not read to the end")
+
+        version, status, reason, headers = self._read_head()
+        while 100 <= status < 200:
+            version, status, reason, headers = self._read_head()
+        if on_head is not None:
+            on_head()
+
+        if method.upper() == "HEAD" or status in _NO_BODY_STATUS:
+            body = b""
+        else:
+            body, complete = self._read_body(headers, body_limit)
+            self._truncated = not complete
+
+        return RawResponse(
+            status_code=status,
+            reason=reason,
+            http_version=version,
+            raw_headers=headers,
+            raw_content=body,
+        )
+
+    def _read_body(self, headers: List[Tuple[bytes, bytes]], limit: Optional[int] = None) -> Tuple[bytes, bool]:
+        """
+        Read the body according to the framing headers.
+
+        Returns:
+            Tuple of (body, whether the whole body was read)
+        """
+        transfer_encoding: Optional[bytes] = None
+        content_length: Optional[bytes] = None
+        for name, value in headers:
+            lname = name.lower()
+            if lname == b"transfer-encoding":
+                transfer_encoding = value.lower()
+            elif lname == b"content-length":
+                content_length = value
+
+        if transfer_encoding and transfer_encoding.endswith(b"chunked"):
+            return self._read_chunked(limit)
+        if content_length is not None:
+            try:
+                size = int(content_length)
+            except ValueError as e:
+                raise httpx.RemoteProtocolError(f"Invalid Content-Length: {content_length!r}") from e
+            if limit is not None and limit < size:
+                return self._read_exact(limit), False
+            return self._read_exact(size), True
+        return self._read_to_close(limit)
+
+
+class RawSession:
+    """
+    httpx.Client-like session that writes pre-serialized bytes to a socket.
+
+    Requests are built with a regular httpx.Client (so defaults such as
+    User-Agent and Host match), serialized once per request, and written
+    with a single sendall() in send(). No httpx transport, pool or h11
+    state machine is involved between release and the write.
+
+    Example:
+        session = RawSession(sock, httpx.Client(base_url=base_url))
+        request = session.build_request("POST", "/api", content=body)
+        session.prepare(request)
+        # ... wait at barrier ...
+        response = session.send(request)
+    """
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        request_builder: httpx.Client,
+        httpx_responses: bool = False,
+        early_data: bytes = b"",
+        timestamper: Optional[SocketTimestamper] = None,
+        cork: bool = False,
+    ):
+        """
+        Initialize the session.
+
+        Args:
+            sock: Connected socket (plain or TLS)
+            request_builder: Client used only to build requests
+            httpx_responses: Return httpx.Response instead of RawResponse from send()
+            early_data: Bytes already received from the socket (e.g. while
+                        collecting TLS session tickets)
+            timestamper: Kernel timestamping of sock; send() then stores the
+                         TX/RX timestamps of each request in kernel_timestamps
+            cork: Cork the socket around the release write (TCP_CORK)
+        """
+        self.kernel_timestamps: Optional[KernelTimestamps] = None
+        self._timestamper = timestamper
+        self._cork = cork
+        self._sock = sock
+        self._reader = HTTP11Reader(sock, initial=early_data)
+        self._request_builder = request_builder
+        self._httpx_responses = httpx_responses
+        self._pending: Optional[memoryview] = None
+        self._pending_request: Optional[httpx.Request] = None
+
+    def build_request(self, *args, **kwargs) -> httpx.Request:
+        """Build a request with the same defaults as an httpx.Client."""
+        return self._request_builder.build_request(*args, **kwargs)
+
+    def prepare(self, request: httpx.Request, withhold: int = 0) -> int:
+        """
+        Serialize a request and optionally pre-send all but its tail.
+
+        Args:
+            request: Request to prepare
+            withhold: Number of trailing bytes to keep back until send();
+                      everything before them is written immediately
+
+        Returns:
+            Number of bytes withheld until send()
+        """
+        data = request_bytes(request)
+        withhold = min(withhold, len(data))
+
+        if withhold:
+            self._sock.sendall(data[:-withhold])
+            self._pending = data[-withhold:]
+        else:
+            self._pending = data
+
+        self._pending_request = request
+        return len(self._pending) if withhold else 0
+
+    def send(self, request: httpx.Request, body_limit: Optional[int] = None):
+        """
+        Write the prepared bytes (or the whole request) and read the response.
+
+        A trace callback in request.extensions["trace"] gets the httpcore
+        events marking the end of the write and of the response head.
+
+        Args:
+            request: Request to send
+            body_limit: Stop reading after this many body bytes (0: head only)
+
+        Returns:
+            RawResponse, or httpx.Response if httpx_responses was set
+
+        Raises:
+            httpx.NetworkError: If the socket fails
+            httpx.RemoteProtocolError: If the response is malformed
+        """
+        if self._pending is not None and self._pending_request is request:
+            data = self._pending
+        else:
+            data = request_bytes(request)
+        self._pending = None
+        self._pending_request = None
+
+        trace = request.extensions.get("trace")
+        on_head = None
+        if trace is not None:
+            on_head = functools.partial(trace, "http11.receive_response_headers.complete", {"request": request})
+
+        try:
+            with corked(self._sock, self._cork):
+                self._sock.sendall(data)
+            if trace is not None:
+                trace("http11.send_request_body.complete", {"request": request})
+            if self._timestamper is not None:
+                rx_ns = None if self._reader.buffered else self._timestamper.peek_rx(self._sock.gettimeout())
+            raw = self._reader.read_response(request.method, on_head, body_limit)
+        except (socket.timeout, OSError) as e:
+            raise httpx.NetworkError(str(e), request=request) from e
+
+        # Nothing is written between the release write and the response
+        if self._timestamper is not None:
+            self.kernel_timestamps = KernelTimestamps(tx_ns=self._timestamper.last_tx(), rx_ns=rx_ns)
+
+        if self._httpx_responses:
+            return raw.to_httpx(request)
+
+        raw.url = str(request.url)
+        return raw
+
+    def close(self) -> None:
+        """Close the underlying socket."""
+        if self._timestamper is not None:
+            self._timestamper.close()
+        try:
+            self._sock.close()
+        except Exception:
+            pass
@@ -0,0 +1,134 @@
+"""
+Socket options of race connections (target.socket).
+
+Options are applied to every connection to the target: to raw sockets
+opened by the strategies themselves (preconnect with the raw send engine,
+last_byte, single_packet), where buffer sizes are set before connecting,
+and to httpx connections through the connection pool's socket_options and
+local_address, where they are set right after connecting.
+
+TCP_CORK is not a connection-wide option: raw sockets cork around each
+release write (see corked()), so the write leaves in full segments once
+uncorked. The Linux-only TCP_QUICKACK and TCP_CORK are skipped on other
+platforms (see unsupported_options()).
+"""
+
+import socket
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+from ..models.config import SocketConfig
+
+SocketOption = Tuple[int, int, int]
+
+_TCP_QUICKACK = getattr(socket, "TCP_QUICKACK", None)
+_TCP_CORK = getattr(socket, "TCP_CORK", None)
+
+
+def socket_options(config: SocketConfig) -> List[SocketOption]:
+    """
+    Build the setsockopt() arguments for a socket configuration.
+
+    Args:
+        config: target.socket configuration
+
+    Returns:
+        (level, option, value) tuples, as accepted by httpx transports
+    """
+    options = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, int(config.nodelay))]
+    if config.quickack and _TCP_QUICKACK is not None:
+        options.append((socket.IPPROTO_TCP, _TCP_QUICKACK, 1))
+    if config.sndbuf:
+        options.append((socket.SOL_SOCKET, socket.SO_SNDBUF, config.sndbuf))
+    if config.rcvbuf:
+        options.append((socket.SOL_SOCKET, socket.SO_RCVBUF, config.rcvbuf))
+    return options
+
+
+def describe_socket_options(config: SocketConfig) -> str:
+    """Describe the applied socket options for startup logs."""
+    parts = [f"TCP_NODELAY={'on' if config.nodelay else 'off'}"]
+    if config.quickack:
+        parts.append("TCP_QUICKACK=on" if _TCP_QUICKACK is not None else "TCP_QUICKACK=unsupported")
+    if config.sndbuf:
+        parts.append(f"SO_SNDBUF={config.sndbuf}")
+    if config.rcvbuf:
+        parts.append(f"SO_RCVBUF={config.rcvbuf}")
+    if config.cork:
+        parts.append("TCP_CORK=release writes" if _TCP_CORK is not None else "TCP_CORK=unsupported")
+    if config.bind:
+        parts.append(f"bind={config.bind}")
+    return ", ".join(parts)
+
+
+def unsupported_options(config: SocketConfig) -> List[str]:
+    """Return the names of configured options this platform lacks."""
+    missing = []
+    if config.quickack and _TCP_QUICKACK is None:
+        missing.append("quickack")
+    if config.cork and _TCP_CORK is None:
+        missing.append("cork")
+    return missing
+
+
+def connect_socket(
+    host: str,
+    port: int,
+    timeout: Optional[float],
+    options: List[SocketOption],
+    local_address: Optional[str] = None,
+) -> socket.socket:
+    """
+    Open a TCP connection with socket options set before connecting.
+
+    Like socket.create_connection(), but buffer sizes take effect for the
+    handshake (SO_RCVBUF decides the advertised window scale).
+
+    Args:
+        host: Target hostname
+        port: Target port
+        timeout: Connect timeout in seconds
+        options: Options from socket_options()
+        local_address: Local IP address to bind to
+
+    Returns:
+        Connected socket
+    """
+    error: Optional[OSError] = None
+    for family, kind, proto, _, address in socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM):
+        sock = socket.socket(family, kind, proto)
+        try:
+            for option in options:
+                sock.setsockopt(*option)
+            sock.settimeout(timeout)
+            if local_address:
+                sock.bind((local_address, 0))
+            sock.connect(address)
+            return sock
+        except OSError as e:
+            sock.close()
+            error = e
+    raise error or OSError(f"getaddrinfo returned no addresses for {host}")
+
+
+@contextmanager
+def corked(sock: socket.socket, enabled: bool) -> Iterator[None]:
+    """
+    Cork a socket for the duration of a write (TCP_CORK).
+
+    Data written while corked is held back and sent in full segments when
+    the socket is uncorked on exit.
+
+    Args:
+        sock: Connected socket (plain or TLS)
+        enabled: Whether to cork (no-op when False or unsupported)
+    """
+    if not enabled or _TCP_CORK is None:
+        yield
+        return
+
+    sock.setsockopt(socket.IPPROTO_TCP, _TCP_CORK, 1)
+    try:
+        yield
+    finally:
+        sock.setsockopt(socket.IPPROTO_TCP, _TCP_CORK, 0)
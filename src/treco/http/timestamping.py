@@ -0,0 +1,224 @@
+"""
+Kernel socket timestamps (Linux SO_TIMESTAMPING).
+
+time.perf_counter_ns() around a send includes Python, the HTTP client and
+the scheduler. With SO_TIMESTAMPING the kernel reports when a write was
+handed to the network device (TX software timestamp, read from the socket's
+error queue) and when response data arrived (RX software timestamp, read
+from the ancillary data of a peek at the receive queue). Both are
+CLOCK_REALTIME nanoseconds.
+
+Timestamps are read through a duplicate of the socket's descriptor, so
+they work for TLS sockets too and never consume application data.
+"""
+
+import logging
+import os
+import select
+import socket
+import struct
+import sys
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger("treco")
+
+# <linux/net_tstamp.h> and <linux/errqueue.h>
+SO_TIMESTAMPING = getattr(socket, "SO_TIMESTAMPING", 37)
+SOF_TIMESTAMPING_TX_SOFTWARE = 1 << 1
+SOF_TIMESTAMPING_RX_SOFTWARE = 1 << 3
+SOF_TIMESTAMPING_SOFTWARE = 1 << 4
+SOF_TIMESTAMPING_OPT_ID = 1 << 7
+SOF_TIMESTAMPING_OPT_TSONLY = 1 << 11
+SO_EE_ORIGIN_TIMESTAMPING = 4
+SCM_TSTAMP_SND = 0
+
+_FLAGS = (
+    SOF_TIMESTAMPING_TX_SOFTWARE
+    | SOF_TIMESTAMPING_RX_SOFTWARE
+    | SOF_TIMESTAMPING_SOFTWARE
+    | SOF_TIMESTAMPING_OPT_ID
+    | SOF_TIMESTAMPING_OPT_TSONLY
+)
+
+# Error queue messages of IPv4 and IPv6 sockets (IP_RECVERR, IPV6_RECVERR)
+_RECVERR = {(socket.IPPROTO_IP, 11), (socket.IPPROTO_IPV6, 25)}
+
+# struct scm_timestamping: three struct timespec (software, deprecated, hardware)
+_TIMESPEC = struct.Struct("@ll")
+# struct sock_extended_err: errno, origin, type, code, pad, info, data
+_EXTENDED_ERR = struct.Struct("=IBBBBII")
+_ANCILLARY_SIZE = 512
+
+
+@dataclass
+class KernelTimestamps:
+    """
+    Kernel timestamps of one request.
+
+    Attributes:
+        tx_ns: When the release write left for the network device
+        rx_ns: When the first bytes of the response arrived
+    """
+
+    tx_ns: Optional[int] = None
+    rx_ns: Optional[int] = None
+
+
+def kernel_timestamps_supported() -> bool:
+    """Return True if SO_TIMESTAMPING can be used on this platform."""
+    return sys.platform.startswith("linux")
+
+
+def _software_timestamp(ancdata: List[Tuple[int, int, bytes]]) -> Optional[int]:
+    """Return the software timestamp of an SCM_TIMESTAMPING control message."""
+    for level, kind, data in ancdata:
+        if level == socket.SOL_SOCKET and kind == SO_TIMESTAMPING and len(data) >= _TIMESPEC.size:
+            seconds, nanoseconds = _TIMESPEC.unpack_from(data)
+            if seconds or nanoseconds:
+                return seconds * 1_000_000_000 + nanoseconds
+    return None
+
+
+class SocketTimestamper:
+    """
+    Reads kernel TX and RX timestamps of one connected socket.
+
+    Example:
+        stamper = SocketTimestamper.attach(sock)
+        sock.sendall(data)
+        rx_ns = stamper.peek_rx(timeout=5.0)
+        response = read_response(sock)
+        tx_ns = stamper.last_tx()
+    """
+
+    def __init__(self, sock: socket.socket):
+        """
+        Enable timestamping on a socket.
+
+        Args:
+            sock: Connected socket (plain or TLS)
+
+        Raises:
+            OSError: If the kernel rejects SO_TIMESTAMPING
+        """
+        self._sock = socket.socket(sock.family, sock.type, sock.proto, fileno=os.dup(sock.fileno()))
+        try:
+            self._sock.setsockopt(socket.SOL_SOCKET, SO_TIMESTAMPING, _FLAGS)
+        except OSError:
+            self._sock.close()
+            raise
+
+        self._readable = select.poll()
+        self._readable.register(self._sock.fileno(), select.POLLIN)
+        self._errors = select.poll()
+        self._errors.register(self._sock.fileno(), select.POLLERR)
+
+        # Latest TX timestamp drained from the error queue, until last_tx()
+        self._tx_key = -1
+        self._tx_ns: Optional[int] = None
+
+    @classmethod
+    def attach(cls, sock: socket.socket) -> Optional["SocketTimestamper"]:
+        """
+        Enable timestamping on a socket if the platform supports it.
+
+        Returns:
+            SocketTimestamper, or None if unavailable
+        """
+        if not kernel_timestamps_supported():
+            return None
+        try:
+            return cls(sock)
+        except OSError as e:
+            logger.debug(f"Kernel timestamps unavailable: {e}")
+            return None
+
+    def peek_rx(self, timeout: Optional[float]) -> Optional[int]:
+        """
+        Wait for incoming data and return its RX timestamp without reading it.
+
+        poll() reports POLLERR while TX timestamps are queued, so these are
+        moved aside (for last_tx()) until data arrives.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None: no limit)
+
+        Returns:
+            RX timestamp of the first queued segment, or None
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait_ms = -1 if deadline is None else max(0, int((deadline - time.monotonic()) * 1000))
+            events = self._readable.poll(wait_ms)
+            if not events:
+                return None
+            if any(mask & select.POLLIN for _, mask in events):
+                break
+            if not self._drain_errors():
+                # POLLERR without queued timestamps: a socket error
+                return None
+        try:
+            _, ancdata, _, _ = self._sock.recvmsg(1, _ANCILLARY_SIZE, socket.MSG_PEEK | socket.MSG_DONTWAIT)
+        except OSError:
+            return None
+        return _software_timestamp(ancdata)
+
+    def wait_tx(self, timeout: float) -> Optional[int]:
+        """
+        Wait for the TX timestamp of the last write.
+
+        Used when more writes may follow soon (e.g. HTTP/2 control frames),
+        which would otherwise be taken for the last write.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+        """
+        self._errors.poll(int(timeout * 1000))
+        return self.last_tx()
+
+    def last_tx(self) -> Optional[int]:
+        """
+        Drain the error queue and return the TX timestamp of the latest write.
+
+        Returns:
+            TX timestamp of the write with the highest byte offset since
+            the previous call, or None
+        """
+        self._drain_errors()
+        latest_ns = self._tx_ns
+        self._tx_key, self._tx_ns = -1, None
+        return latest_ns
+
+    def _drain_errors(self) -> int:
+        """
+        Read the error queue, keeping the TX timestamp of the latest write.
+
+        Returns:
+            Number of messages read
+        """
+        count = 0
+        while True:
+            try:
+                _, ancdata, _, _ = self._sock.recvmsg(
+                    0, _ANCILLARY_SIZE, socket.MSG_ERRQUEUE | socket.MSG_DONTWAIT
+                )
+            except OSError:
+                return count
+            count += 1
+
+            key = None
+            for level, kind, data in ancdata:
+                if (level, kind) in _RECVERR and len(data) >= _EXTENDED_ERR.size:
+                    _, origin, _, _, _, tstype, tskey = _EXTENDED_ERR.unpack_from(data)
+                    if origin == SO_EE_ORIGIN_TIMESTAMPING and tstype == SCM_TSTAMP_SND:
+                        key = tskey
+
+            stamp = _software_timestamp(ancdata)
+            if key is not None and stamp is not None and key >= self._tx_key:
+                self._tx_key, self._tx_ns = key, stamp
+
+    def close(self) -> None:
+        """Close the duplicate descriptor (the socket itself stays open)."""
+        self._sock.close()
@@ -7,6 +7,7 @@ Provides configurable log levels with special handling for YAML logger output.
 import logging
 import sys
 from enum import IntEnum
+from typing import Optional
 
 
 class LogLevel(IntEnum):
@@ -25,6 +26,10 @@ YAML_OUTPUT = 25  # Between INFO (20) and WARNING (30)
 logging.addLevelName(YAML_OUTPUT, "OUTPUT")
 
 
+# Level name of the last setup_logging() call (passed on to worker processes)
+_level_name = None
+
+
 # Log level name mapping
 LOG_LEVEL_NAMES = {
     "quiet": LogLevel.QUIET,
@@ -79,6 +84,8 @@ def setup_logging(level_name: str = "quiet") -> logging.Logger:
     Returns:
         Configured logger instance
     """
+    global _level_name
+    _level_name = level_name
     level = LOG_LEVEL_NAMES.get(level_name, LogLevel.QUIET)
 
     # Get TRECO logger
@@ -96,6 +103,11 @@ def setup_logging(level_name: str = "quiet") -> logging.Logger:
     return logger
 
 
+def get_level_name() -> Optional[str]:
+    """Return the level name passed to setup_logging(), or None if it was never called."""
+    return _level_name
+
+
 def get_logger() -> logging.Logger:
     """Get the TRECO logger instance."""
     return logging.getLogger("treco")
@@ -7,7 +7,11 @@ providing type safety and validation.
 
 from abc import ABC
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Any
+from typing import TYPE_CHECKING, Optional, Dict, List, Any, Union
+
+if TYPE_CHECKING:
+    from treco.http.extractor import ExtractPlan
+    from treco.template.partial import TemplatePlan
 
 @dataclass
 class BaseConfig(ABC):
@@ -68,6 +72,41 @@ class HTTPConfig:
     follow_redirects: bool = True
     timeout: int = 10  # in seconds
 
+
+@dataclass
+class WorkerPoolConfig(BaseConfig):
+    """
+    Persistent race worker pool configuration.
+
+    Attributes:
+        size: Workers started up front (0: threads of the largest race state)
+        stack_size_kb: Stack size of worker threads in KiB (0: interpreter default)
+    """
+
+    size: int = 0
+    stack_size_kb: int = 0
+
+@dataclass
+class SocketConfig(BaseConfig):
+    """
+    Socket options of connections to the target.
+
+    Attributes:
+        nodelay: Disable Nagle's algorithm (TCP_NODELAY)
+        quickack: Acknowledge received data immediately (TCP_QUICKACK, Linux)
+        sndbuf: Send buffer size in bytes (SO_SNDBUF, 0: kernel default)
+        rcvbuf: Receive buffer size in bytes (SO_RCVBUF, 0: kernel default)
+        cork: Coalesce each release write into full segments (TCP_CORK, Linux)
+        bind: Local address to connect from (empty: chosen by the kernel)
+    """
+
+    nodelay: bool = True
+    quickack: bool = False
+    sndbuf: int = 0
+    rcvbuf: int = 0
+    cork: bool = False
+    bind: str = ""
+
 @dataclass
 class ProxyAuth:
     """
@@ -121,6 +160,8 @@ class TargetConfig(BaseConfig):
         reuse_connection: Whether to reuse TCP connections
         tls: TLS/SSL configuration
         http: HTTP client configuration
+        proxy: Proxy configuration
+        socket: Socket options of connections to the target
     """
 
     host: str
@@ -130,6 +171,7 @@ class TargetConfig(BaseConfig):
     tls: TLSConfig = field(default_factory=TLSConfig)
     http: HTTPConfig = field(default_factory=HTTPConfig)
     proxy: Optional[ProxyConfig] = None
+    socket: SocketConfig = field(default_factory=SocketConfig)
 
 
 @dataclass
@@ -183,8 +225,12 @@ class ThreadGroup:
         name: Group identifier (used in logging and context)
         threads: Number of threads in this group
         delay_ms: Delay in milliseconds AFTER barrier release (default: 0)
+        delay_us: Additional delay in microseconds
+        delay_ns: Additional delay in nanoseconds
         request: HTTP request template for this group
         variables: Optional group-specific variables
+        request_plan: request split into thread-invariant and per-thread
+                      segments (set by the loader)
     """
     
     name: str
@@ -192,6 +238,14 @@ class ThreadGroup:
     delay_ms: int = 0
     request: str = ""
     variables: Dict[str, Any] = field(default_factory=dict)
+    delay_us: int = 0
+    delay_ns: int = 0
+    request_plan: Optional["TemplatePlan"] = field(default=None, repr=False, compare=False)
+
+    @property
+    def offset_ns(self) -> int:
+        """Total send offset from the release, in nanoseconds."""
+        return self.delay_ms * 1_000_000 + self.delay_us * 1_000 + self.delay_ns
 
 
 @dataclass
@@ -201,12 +255,25 @@ class RaceConfig:
 
     Attributes:
         threads: Number of concurrent threads for the race (legacy mode)
-        sync_mechanism: Synchronization strategy (barrier, countdown_latch, semaphore)
+        sync_mechanism: Synchronization strategy (barrier, countdown_latch, semaphore,
+            spin_barrier, hybrid, eventfd)
         connection_strategy: Connection establishment strategy (preconnect, lazy, pooled)
         reuse_connections: Whether threads reuse connections
         thread_propagation: How to propagate threads after race (single, parallel)
         input_mode: How to distribute input values across threads (same, distribute, product, random)
         thread_groups: Optional list of thread groups (new mode)
+        send_engine: How requests are written after release (httpx, raw)
+        warmup: How connections are warmed up (handshake, head, options, get)
+        warmup_path: Path requested by request-based warmup modes
+        engine: How race threads are run (threads, asyncio, processes)
+        processes: Worker processes for the processes engine (0: one per core)
+        cpu_affinity: Pin race threads to CPUs ("spread", "0-3,8" or a list of CPUs)
+        scheduling: Scheduling policy of race threads (default, high, fifo, rr)
+        rounds: Maximum number of rounds fired on the same connections (threads engine)
+        round_delay_ms: Pause between rounds in milliseconds
+        until: Jinja2 expression checked after each round; stops the race once true
+        timeline: Record per-thread phase timestamps (RaceResult.timeline)
+        kernel_timestamps: Record kernel TX/RX timestamps of race sockets (Linux SO_TIMESTAMPING)
     """
 
     threads: int = 20
@@ -216,6 +283,18 @@ class RaceConfig:
     thread_propagation: str = "single"
     input_mode: str = "same"
     thread_groups: Optional[List[ThreadGroup]] = None
+    send_engine: str = "httpx"
+    warmup: str = "handshake"
+    warmup_path: str = "/"
+    engine: str = "threads"
+    processes: int = 0
+    cpu_affinity: Optional[Union[str, List[int]]] = None
+    scheduling: str = "default"
+    rounds: int = 1
+    round_delay_ms: float = 0
+    until: str = ""
+    timeline: bool = False
+    kernel_timestamps: bool = False
 
 
 @dataclass
@@ -265,6 +344,29 @@ class StateOptions:
 
     proxy_bypass: bool = False
 
+@dataclass
+class ResponseConfig:
+    """
+    How race threads read responses.
+
+    Attributes:
+        read: "full" (whole body), "headers" (status line and headers only)
+              or "capped" (at most max_bytes of the body)
+        max_bytes: Body bytes kept in capped mode
+    """
+
+    read: str = "full"
+    max_bytes: int = 65536
+
+    @property
+    def body_limit(self) -> Optional[int]:
+        """Body bytes to read: None for the whole body, 0 for headers only."""
+        if self.read == "headers":
+            return 0
+        if self.read == "capped":
+            return self.max_bytes
+        return None
+
 @dataclass
 class State:
     """
@@ -284,6 +386,10 @@ class State:
         race: Optional race configuration (makes this a race state)
         logger: Logger configuration for state entry/exit
         input: Optional input configuration for dynamic values (state-level override)
+        response: How race threads read responses
+        request_plan: Race request split into thread-invariant and
+                      per-thread segments (set by the loader)
+        extract_plan: extract patterns compiled once (set by the loader)
     """
 
     name: str
@@ -295,6 +401,9 @@ class State:
     logger: LoggerConfig = field(default_factory=LoggerConfig)
     options: StateOptions = field(default_factory=StateOptions)
     input: Dict[str, Any] = field(default_factory=dict)
+    response: ResponseConfig = field(default_factory=ResponseConfig)
+    request_plan: Optional["TemplatePlan"] = field(default=None, repr=False, compare=False)
+    extract_plan: Optional["ExtractPlan"] = field(default=None, repr=False, compare=False)
 
     def get_options(self) -> StateOptions:
         """Get options with defaults."""
@@ -317,9 +426,11 @@ class Config(BaseConfig):
         target: Server and execution configuration
         entrypoint: Initial state and input variables
         states: Dictionary mapping state names to State objects
+        worker_pool: Race worker pool shared by all race states
     """
 
     metadata: Metadata
     target: TargetConfig
     entrypoint: Entrypoint
     states: Dict[str, State]
+    worker_pool: WorkerPoolConfig = field(default_factory=WorkerPoolConfig)
@@ -3,12 +3,20 @@ Execution context for maintaining state across attack stages.
 
 The ExecutionContext stores variables extracted during the attack flow,
 such as authentication tokens, account balances, IDs, etc.
+
+Variables are kept in layers: a context created with copy() reads through
+to its parent and writes to its own layer, and build_template_context()
+puts the variables of a state or thread on top of the context the same
+way. Templates see one mapping and nothing is copied.
 """
 
 import logging
+import threading
 
+from collections import ChainMap
+from types import MappingProxyType
 from typing import TYPE_CHECKING
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, MutableMapping, Optional
 
 if TYPE_CHECKING:
     from treco.models.config import TargetConfig, RaceConfig
@@ -53,7 +61,8 @@ class ExecutionContext:
             argv: Command-line arguments dictionary
             env: Environment variables dictionary
         """
-        self._input: Dict[str, Any] = {}
+        self._input: ChainMap = ChainMap({})
+        self._grow_lock = threading.Lock()
         self._argv = argv or {}
         self._env = env or {}
 
@@ -80,6 +89,40 @@ class ExecutionContext:
         """
         return self._input.get(key, default)
 
+    def reserve_list(self, key: str, size: int) -> None:
+        """
+        Make sure a list variable has at least size slots.
+
+        Race attacks call this before starting their threads, so each
+        thread later writes its own slot with set_list_item() without
+        growing (or locking) the shared list.
+
+        Args:
+            key: Variable name
+            size: Number of slots (one per race thread)
+        """
+        lst = self._input.maps[0].get(key)
+        if not isinstance(lst, list):
+            inherited = self._input.get(key)
+            lst = self._input[key] = list(inherited) if isinstance(inherited, list) else []
+        if len(lst) < size:
+            lst.extend([None] * (size - len(lst)))
+
+    def copy(self) -> "ExecutionContext":
+        """
+        Create a child context layered on top of this one.
+
+        The child reads variables through to this context without copying
+        them; variables it sets (including list items) are stored in its
+        own layer and are not seen by this context or its other children.
+
+        Returns:
+            Child ExecutionContext sharing argv and env
+        """
+        child = ExecutionContext(self._argv, self._env)
+        child._input = self._input.new_child()
+        return child
+
     def set_list_item(self, key: str, index: int, value: Any) -> None:
         """
         Set an item in a list variable stored in the context.
@@ -92,18 +135,21 @@ class ExecutionContext:
             index: Index to set
             value: Value to set at the index
         """
-        # Ensure the key exists and is a list
-        # If it doesn't exist or isn't a list, initialize it as an empty list
-        if key not in self._input or not isinstance(self._input[key], list):
-            self._input[key] = []
-
-        lst = self._input[key]
-
-        # Dynamically grow the list if the index is beyond current size
-        # This allows threads to write to their index without coordination
-        # Example: Thread 15 writing to index 15 when list only has 10 items
-        while len(lst) <= index:
-            lst.append(None)
+        local = self._input.maps[0]
+        lst = local.get(key)
+
+        # Slots reserved with reserve_list() are written directly; creating
+        # or growing the list is serialized so concurrent writers cannot
+        # lose each other's items. A list inherited from a parent layer is
+        # copied into this layer first, so the parent is never written.
+        if not isinstance(lst, list) or len(lst) <= index:
+            with self._grow_lock:
+                lst = local.get(key)
+                if not isinstance(lst, list):
+                    inherited = self._input.get(key)
+                    lst = local[key] = list(inherited) if isinstance(inherited, list) else []
+                if len(lst) <= index:
+                    lst.extend([None] * (index + 1 - len(lst)))
 
         # Store the value at the specified index
         lst[index] = value
@@ -175,17 +221,29 @@ class ExecutionContext:
         """
         return self._input.setdefault(key, default)
 
+    def view(self) -> Mapping[str, Any]:
+        """
+        Return a read-only, live view of all variables.
+
+        Unlike to_dict(), nothing is copied: the view reads through the
+        context's layers and reflects later changes.
+
+        Returns:
+            Read-only mapping of all stored variables
+        """
+        return MappingProxyType(self._input)
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Export all variables as a dictionary.
 
-        This is useful for template rendering where the entire context
-        needs to be passed to Jinja2.
+        The result is a flat copy; use view() to read variables without
+        copying them.
 
         Returns:
             Dictionary containing all stored variables
         """
-        return self._input.copy()
+        return dict(self._input)
 
     def __repr__(self) -> str:
         """String representation for debugging."""
@@ -201,14 +259,18 @@ def build_template_context(
     input_data: Optional[Dict[str, Any]] = None,
     group: Optional[Dict[str, Any]] = None,
     **extra: Any,
-) -> Dict[str, Any]:
+) -> MutableMapping[str, Any]:
     """
-    Build a template context dictionary for Jinja2 rendering.
+    Build a template context mapping for Jinja2 rendering.
     
-    Centralizes the construction of context dictionaries used throughout
+    Centralizes the construction of context mappings used throughout
     the codebase for template rendering, reducing duplication and ensuring
     consistency.
     
+    The given values form a layer on top of a live view of the context's
+    variables; the context is not copied, and keys set on the result are
+    stored in that layer only.
+    
     The response is automatically wrapped in ResponseWrapper for consistent
     access regardless of whether it's httpx.Response or dict.
     
@@ -223,7 +285,7 @@ def build_template_context(
         **extra: Additional key-value pairs to include
         
     Returns:
-        Dictionary ready for use with TemplateEngine.render()
+        Mapping ready for use with TemplateEngine.render()
         
     Example:
         # Response is automatically wrapped
@@ -238,8 +300,7 @@ def build_template_context(
         # {{ response.cookie('session') }}
         # {{ response.header('Content-Type') }}
     """
-    ctx = context.to_dict()
-    ctx["target"] = target
+    ctx: Dict[str, Any] = {"target": target}
     
     if thread is not None:
         ctx["thread"] = thread
@@ -259,4 +320,4 @@ def build_template_context(
     
     ctx.update(extra)
     
-    return ctx
\ No newline at end of file
+    return ChainMap(ctx, context.view())
\ No newline at end of file
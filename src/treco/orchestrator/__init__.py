@@ -9,12 +9,16 @@ Components:
     - RaceExecutor: Handles multi-threaded race attacks
     - ResultAnalyzer: Analyzes race results and timing
     - ParallelExecutor: Handles parallel thread propagation
+    - CoordinatorNode/WorkerNode: Distributed races across processes and hosts
+    - RaceTuner: Searches race parameters for a race state
 """
 
 from .coordinator import RaceCoordinator
 from .race_executor import RaceExecutor, RaceResult
 from .result_analyzer import ResultAnalyzer
 from .parallel_executor import ParallelExecutor
+from .distributed import CoordinatorNode, DistributedNode, WorkerNode
+from .tuner import RaceTuner, TrialResult
 
 __all__ = [
     "RaceCoordinator",
@@ -22,4 +26,9 @@ __all__ = [
     "RaceResult",
     "ResultAnalyzer",
     "ParallelExecutor",
+    "CoordinatorNode",
+    "DistributedNode",
+    "WorkerNode",
+    "RaceTuner",
+    "TrialResult",
 ]
\ No newline at end of file
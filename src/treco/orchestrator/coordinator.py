@@ -6,7 +6,7 @@ Orchestrates the entire attack flow including race condition attacks.
 
 import os
 import traceback
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
 
 import logging
 
@@ -14,13 +14,17 @@ from treco.models import Config, State, ExecutionContext
 from treco.models.config import BaseConfig, RaceConfig
 from treco.parser import YAMLLoader
 from treco.template import TemplateEngine
-from treco.http import HTTPClient, HTTPParser
+from treco.http import HTTPClient
 from treco.state import StateMachine, StateExecutor
 from treco.state.executor import ExecutionResult
 
 from .race_executor import RaceExecutor, RaceResult
 from .result_analyzer import ResultAnalyzer
 from .parallel_executor import ParallelExecutor
+from .worker_pool import RaceWorkerPool
+
+if TYPE_CHECKING:
+    from .distributed import DistributedNode
 
 
 logger = logging.getLogger(__name__)
@@ -49,6 +53,7 @@ class RaceCoordinator:
         config_path: str,
         cli_inputs: Optional[Dict[str, Any]] = None,
         log_level: str = "info",
+        node: Optional["DistributedNode"] = None,
     ):
         """
         Initialize the coordinator.
@@ -57,10 +62,12 @@ class RaceCoordinator:
             config_path: Path to YAML configuration file
             cli_inputs: Command-line input variables to override config
             log_level: Logging level (debug, info, warning, error)
+            node: Distributed race node (coordinator or worker), if any
         """
         self.config_path = config_path
         self.cli_inputs = cli_inputs or {}
         self.log_level = log_level
+        self.node = node
 
         # Load configuration
         loader = YAMLLoader()
@@ -75,14 +82,16 @@ class RaceCoordinator:
         # Initialize components
         self.engine = TemplateEngine()
         self.http_client = HTTPClient(self.config.target)
-        self.http_parser = HTTPParser()
+
+        # Race workers are started by the first threads engine race
+        self.worker_pool: Optional[RaceWorkerPool] = None
 
         # Initialize executors
         self.race_executor = RaceExecutor(
             http_client=self.http_client,
-            http_parser=self.http_parser,
             template_engine=self.engine,
             entrypoint_input=self.config.entrypoint.input,
+            release_time=node.release_time if node else None,
         )
         self.result_analyzer = ResultAnalyzer()
         self.parallel_executor = ParallelExecutor(
@@ -98,8 +107,36 @@ class RaceCoordinator:
         # Initialize state machine
         self.machine = StateMachine(self.config, self.context, self.state_executor)
 
+        # Results of the last race of each race state
+        self.race_results: Dict[str, List[RaceResult]] = {}
+
         self._log_startup()
 
+    def _create_worker_pool(self) -> Optional[RaceWorkerPool]:
+        """
+        Spawn the race worker pool.
+
+        Sized by worker_pool.size, or by the largest race state run on the
+        threads engine. Returns None when no state needs it.
+        """
+        pool_config = self.config.worker_pool
+        size = pool_config.size
+
+        if not size:
+            for state in self.config.states.values():
+                race = state.race
+                if race is None or race.engine != "threads":
+                    continue
+                if race.thread_groups:
+                    threads = sum(group.threads for group in race.thread_groups)
+                else:
+                    threads = race.threads
+                size = max(size, threads)
+
+        if not size:
+            return None
+        return RaceWorkerPool(size, pool_config.stack_size_kb)
+
     def _log_startup(self) -> None:
         """Log startup information."""
         logger.info(f"\n{'='*70}")
@@ -159,6 +196,9 @@ class RaceCoordinator:
             List of execution results
         """
         try:
+            if self.node:
+                self.node.start()
+
             results = self.machine.run()
 
             logger.info(f"\n{'='*70}")
@@ -174,6 +214,10 @@ class RaceCoordinator:
             traceback.print_exc()
             raise
         finally:
+            if self.node:
+                self.node.close()
+            if self.worker_pool:
+                self.worker_pool.shutdown()
             self.http_client.close()
 
     def execute_race(self, state: State, context: ExecutionContext) -> ExecutionResult:
@@ -189,11 +233,20 @@ class RaceCoordinator:
         Returns:
             ExecutionResult with aggregated race results
         """
+        # Spawn the worker pool on the first race that uses it
+        if self.worker_pool is None and state.race is not None and state.race.engine == "threads":
+            self.worker_pool = self._create_worker_pool()
+            self.race_executor.worker_pool = self.worker_pool
+
         # Execute race attack
         race_results = self.race_executor.execute(state, context)
 
-        # Analyze results
-        self.result_analyzer.analyze(race_results)
+        # Analyze results (of every node in distributed mode)
+        if self.node:
+            self.race_results[state.name] = self.node.gather_results(state.name, race_results)
+        else:
+            self.race_results[state.name] = race_results
+        self.result_analyzer.analyze(self.race_results[state.name])
 
         # Get race config
         race_config: RaceConfig = state.race  # type: ignore
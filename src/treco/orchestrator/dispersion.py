@@ -0,0 +1,163 @@
+"""
+Send-start dispersion of a race (the race window).
+
+The race window is how far apart the requests actually left, not how far
+apart their responses came back: response times add the server's own
+latency variance. Every result records when its send started
+(RaceResult.send_start_ns); the dispersion is measured on those timestamps,
+each taken relative to the first send of its round and corrected by the
+thread group's intended offset, so a group that is meant to fire 250μs later
+does not count as spread.
+
+With race.kernel_timestamps, the kernel's TX timestamps of the release
+writes (RaceResult.tx_timestamp_ns) replace the send starts: they leave out
+the time spent in Python and the HTTP client before the write.
+
+Offsets are sorted once; percentiles are read by index and the histogram is
+filled in one pass, so thousands of results cost one sort.
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from treco.orchestrator.race_executor import RaceResult
+
+PERCENTILES = (50, 90, 99)
+HISTOGRAM_BINS = 10
+
+# Verdict thresholds on the send-start spread
+EXCELLENT_SPREAD_NS = 1_000_000
+GOOD_SPREAD_NS = 100_000_000
+
+
+@dataclass
+class Dispersion:
+    """
+    Spread of send starts around the first send.
+
+    Attributes:
+        count: Number of sends
+        first_ns: Offset of the first send (non-zero for a thread group
+                  that started after the others)
+        spread_ns: Last minus first send start
+        percentiles_ns: Send start offset by percentile (PERCENTILES)
+        histogram: Number of sends per equal-width bin over [0, spread_ns]
+    """
+
+    count: int
+    spread_ns: int
+    first_ns: int = 0
+    percentiles_ns: Dict[int, int] = field(default_factory=dict)
+    histogram: List[int] = field(default_factory=list)
+
+    @property
+    def verdict(self) -> str:
+        """Verdict from the spread: "excellent", "good" or "poor"."""
+        if self.spread_ns < EXCELLENT_SPREAD_NS:
+            return "excellent"
+        if self.spread_ns < GOOD_SPREAD_NS:
+            return "good"
+        return "poor"
+
+
+def measure_dispersion(sorted_offsets_ns: Sequence[int], bins: int = HISTOGRAM_BINS) -> Dispersion:
+    """
+    Measure the dispersion of sorted send start offsets.
+
+    Args:
+        sorted_offsets_ns: Send start offsets in ascending order
+        bins: Number of histogram bins
+
+    Returns:
+        Dispersion relative to the first offset
+    """
+    count = len(sorted_offsets_ns)
+    if not count:
+        return Dispersion(count=0, spread_ns=0)
+
+    first = sorted_offsets_ns[0]
+    spread = sorted_offsets_ns[-1] - first
+
+    percentiles = {
+        p: sorted_offsets_ns[min(count - 1, (p * count) // 100)] - first
+        for p in PERCENTILES
+    }
+
+    histogram = [0] * bins
+    for offset in sorted_offsets_ns:
+        index = (offset - first) * bins // spread if spread else 0
+        histogram[min(index, bins - 1)] += 1
+
+    return Dispersion(
+        count=count, spread_ns=spread, first_ns=first, percentiles_ns=percentiles, histogram=histogram
+    )
+
+
+def kernel_timestamped(results: Sequence["RaceResult"]) -> bool:
+    """
+    Return True if every sent request has a kernel TX timestamp.
+
+    Kernel timestamps are on another clock than send starts, so they are
+    only used when none is missing.
+    """
+    sent = [result for result in results if result.send_start_ns is not None]
+    return bool(sent) and all(result.tx_timestamp_ns is not None for result in sent)
+
+
+def send_offsets(results: Sequence["RaceResult"]) -> List[Tuple[int, str]]:
+    """
+    Turn send times into offsets from the first send of their round.
+
+    Send times are the kernel TX timestamps when kernel_timestamped(),
+    the send starts otherwise.
+
+    Args:
+        results: Race results; those without send_start_ns are skipped
+
+    Returns:
+        (offset_ns, group name) pairs sorted by offset, each offset reduced
+        by the thread group's intended offset
+    """
+    kernel = kernel_timestamped(results)
+    first_by_round: Dict[int, int] = {}
+    sent = []
+    for result in results:
+        if result.send_start_ns is None:
+            continue
+        sent_ns = result.tx_timestamp_ns if kernel else result.send_start_ns
+        start = sent_ns - (result.target_offset_ns or 0)
+        sent.append((result.round, start, result.group))
+        if start < first_by_round.get(result.round, start + 1):
+            first_by_round[result.round] = start
+
+    offsets = [(start - first_by_round[number], group) for number, start, group in sent]
+    offsets.sort()
+    return offsets
+
+
+def analyze_dispersion(
+    results: Sequence["RaceResult"],
+) -> Tuple[Optional[Dispersion], Dict[str, Dispersion]]:
+    """
+    Measure the dispersion of all sends and of each thread group.
+
+    Args:
+        results: Race results of one race (any number of rounds)
+
+    Returns:
+        Tuple of (overall dispersion or None if nothing was sent,
+        dispersion by group name, empty without thread groups)
+    """
+    offsets = send_offsets(results)
+    if not offsets:
+        return None, {}
+
+    # Splitting the sorted pairs keeps every group's offsets sorted
+    by_group: Dict[str, List[int]] = {}
+    for offset, group in offsets:
+        if group:
+            by_group.setdefault(group, []).append(offset)
+
+    overall = measure_dispersion([offset for offset, _ in offsets])
+    return overall, {name: measure_dispersion(values) for name, values in by_group.items()}
@@ -0,0 +1,490 @@
+"""
+Distributed race coordination.
+
+Several TRECO processes, on one or several hosts, run the same config and
+release their race threads at one agreed absolute time. This spreads a race
+over more source addresses, ports, CPUs and NIC queues than one box has.
+
+One process is the coordinator: it takes part in the race like any other
+node, accepts the workers on a TCP control channel, picks the release time
+and collects every node's results for a single analysis pass. Workers
+estimate their clock offset to the coordinator (NTP-style, keeping the
+sample with the lowest round trip) and convert the release time to their
+own clock.
+
+Control messages are JSON objects, one per line:
+
+    worker -> coordinator: hello, ping, ready, results
+    coordinator -> worker: welcome, pong, release
+
+Example:
+    # Host A
+    treco attack.yaml --coordinator 0.0.0.0:7000 --workers 2
+    # Hosts B and C
+    treco attack.yaml --worker hostA:7000
+"""
+
+import json
+import queue
+import socket
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional, Tuple
+
+import logging
+
+from .race_executor import RaceResult
+
+logger = logging.getLogger(__name__)
+
+# Clock samples taken when a worker joins and before each release
+JOIN_CLOCK_SAMPLES = 8
+ROUND_CLOCK_SAMPLES = 4
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """
+    Parse a HOST:PORT control channel address.
+
+    Args:
+        address: Address string (e.g. "0.0.0.0:7000" or "[::1]:7000")
+
+    Returns:
+        Tuple of (host, port)
+
+    Raises:
+        ValueError: If the address is not HOST:PORT
+    """
+    host, sep, port = address.rpartition(":")
+    if not sep or not host or not port.isdigit():
+        raise ValueError(f"Invalid address '{address}', expected HOST:PORT")
+    return host.strip("[]"), int(port)
+
+
+def to_coordinator_clock(results: List[RaceResult], offset_ns: int = 0) -> None:
+    """
+    Move send starts from this host's monotonic clock to the coordinator's.
+
+    Send starts are time.perf_counter_ns() values, which cannot be compared
+    across hosts; the race window of a distributed race is measured on the
+    coordinator's time.time_ns() clock instead. Kernel timestamps are
+    already on the local time.time_ns() clock and are only offset.
+
+    Args:
+        results: Local race results, updated in place
+        offset_ns: Offset of the coordinator's clock to the local one
+    """
+    shift = time.time_ns() - time.perf_counter_ns() + offset_ns
+    for result in results:
+        if result.send_start_ns is not None:
+            result.send_start_ns += shift
+        if result.tx_timestamp_ns is not None:
+            result.tx_timestamp_ns += offset_ns
+        if result.rx_timestamp_ns is not None:
+            result.rx_timestamp_ns += offset_ns
+
+
+class ControlChannel:
+    """
+    One end of a JSON-lines control connection.
+
+    send() may be called from several threads; recv() from one.
+    """
+
+    def __init__(self, sock: socket.socket):
+        """
+        Wrap a connected socket.
+
+        Args:
+            sock: Connected TCP socket
+        """
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock = sock
+        self._rfile = sock.makefile("rb")
+        self._lock = threading.Lock()
+
+    def send(self, message: Dict[str, Any]) -> None:
+        """Send one message."""
+        data = json.dumps(message, default=str).encode() + b"\n"
+        with self._lock:
+            self.sock.sendall(data)
+
+    def recv(self) -> Dict[str, Any]:
+        """
+        Receive one message.
+
+        Raises:
+            ConnectionError: If the peer closed the connection
+        """
+        line = self._rfile.readline()
+        if not line:
+            raise ConnectionError("Control channel closed by peer")
+        return json.loads(line)
+
+    def close(self) -> None:
+        """Close the connection."""
+        try:
+            self._rfile.close()
+            self.sock.close()
+        except OSError:
+            pass
+
+
+class DistributedNode(ABC):
+    """
+    Base class for distributed race participants.
+
+    Race executors call release_time() once all their local threads are
+    connected and staged; the coordinator calls gather_results() with the
+    local results of each race.
+    """
+
+    def __init__(self):
+        """Initialize the release counter."""
+        self.round = 0
+
+    @abstractmethod
+    def start(self) -> None:
+        """Join the distributed race (blocks until all nodes are present)."""
+        pass
+
+    @abstractmethod
+    def release_time(self) -> int:
+        """
+        Agree on the release time of the next race.
+
+        Returns:
+            Release time as a local time.time_ns() value
+        """
+        pass
+
+    @abstractmethod
+    def gather_results(self, state_name: str, results: List[RaceResult]) -> List[RaceResult]:
+        """
+        Exchange the results of the current race.
+
+        Args:
+            state_name: Race state name
+            results: Results of this node's threads
+
+        Returns:
+            Results of every node (coordinator) or the local results (worker)
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Leave the distributed race."""
+        pass
+
+
+class _Peer:
+    """Coordinator-side view of one connected worker."""
+
+    def __init__(self, node_id: int, channel: ControlChannel, address: Any):
+        self.node_id = node_id
+        self.channel = channel
+        self.address = address
+        self.inbox: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self.alive = True
+        self.reader = threading.Thread(target=self._read_loop, daemon=True)
+
+    def _read_loop(self) -> None:
+        """Answer clock pings immediately; queue everything else."""
+        try:
+            while True:
+                message = self.channel.recv()
+                if message.get("type") == "ping":
+                    t1 = time.time_ns()
+                    self.channel.send({"type": "pong", "t0": message["t0"], "t1": t1, "t2": time.time_ns()})
+                else:
+                    self.inbox.put(message)
+        except (ConnectionError, OSError, ValueError):
+            self.inbox.put(None)
+
+    def expect(self, kind: str, round_id: int, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Wait for a message of a given type for a given round.
+
+        Returns:
+            The message, or None if the worker is gone or timed out
+        """
+        if not self.alive:
+            return None
+        try:
+            message = self.inbox.get(timeout=timeout)
+        except queue.Empty:
+            message = None
+            logger.error(f"[Coordinator] Worker {self.node_id} timed out waiting for '{kind}'")
+        if message is None:
+            self.alive = False
+            logger.error(f"[Coordinator] Worker {self.node_id} ({self.address}) left the race")
+            return None
+        if message.get("type") != kind or message.get("round") != round_id:
+            self.alive = False
+            logger.error(
+                f"[Coordinator] Worker {self.node_id} is out of step: expected '{kind}' "
+                f"for round {round_id}, got '{message.get('type')}' for round {message.get('round')}"
+            )
+            return None
+        return message
+
+
+class CoordinatorNode(DistributedNode):
+    """
+    Distributed race coordinator.
+
+    Waits for the workers, answers their clock pings, picks the release time
+    of each race once every node is ready and merges their results.
+
+    Example:
+        node = CoordinatorNode("0.0.0.0", 7000, workers=2)
+        node.start()                 # Blocks until 2 workers joined
+        deadline = node.release_time()
+        merged = node.gather_results("race", local_results)
+        node.close()
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        workers: int,
+        lead_ms: int = 250,
+        join_timeout: float = 300.0,
+        round_timeout: float = 300.0,
+    ):
+        """
+        Initialize the coordinator.
+
+        Args:
+            host: Address to listen on
+            port: Port to listen on (0 for any free port)
+            workers: Number of workers to wait for
+            lead_ms: Delay between the last node being ready and the release
+            join_timeout: Maximum time to wait for all workers to join
+            round_timeout: Maximum time to wait for a worker in each race
+        """
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.lead_ns = lead_ms * 1_000_000
+        self.join_timeout = join_timeout
+        self.round_timeout = round_timeout
+        self.peers: List[_Peer] = []
+        self._server: Optional[socket.socket] = None
+
+    def listen(self) -> int:
+        """
+        Bind the control channel.
+
+        Returns:
+            The port being listened on
+        """
+        if self._server is None:
+            self._server = socket.create_server((self.host, self.port))
+            self.port = self._server.getsockname()[1]
+            logger.info(f"[Coordinator] Listening on {self.host}:{self.port}")
+        return self.port
+
+    def start(self) -> None:
+        """Accept workers until all of them have joined."""
+        self.listen()
+        assert self._server is not None
+        self._server.settimeout(self.join_timeout)
+
+        while len(self.peers) < self.workers:
+            try:
+                sock, address = self._server.accept()
+            except socket.timeout as e:
+                raise TimeoutError(
+                    f"Only {len(self.peers)}/{self.workers} workers joined within {self.join_timeout}s"
+                ) from e
+            sock.settimeout(None)
+            channel = ControlChannel(sock)
+            hello = channel.recv()
+            if hello.get("type") != "hello":
+                channel.close()
+                continue
+
+            peer = _Peer(len(self.peers) + 1, channel, address)
+            channel.send({"type": "welcome", "node": peer.node_id})
+            peer.reader.start()
+            self.peers.append(peer)
+            logger.info(f"[Coordinator] Worker {peer.node_id} joined from {address[0]}:{address[1]}")
+
+        logger.info(f"[Coordinator] All {self.workers} workers joined")
+
+    def release_time(self) -> int:
+        """Wait for every worker to be ready and broadcast the release time."""
+        self.round += 1
+        ready = []
+        for peer in self.peers:
+            message = peer.expect("ready", self.round, self.round_timeout)
+            if message is not None:
+                ready.append(peer)
+                logger.info(
+                    f"[Coordinator] Worker {peer.node_id} ready "
+                    f"(clock offset {message['offset_ns'] / 1e6:+.3f}ms, rtt {message['rtt_ns'] / 1e6:.3f}ms)"
+                )
+
+        release_at = time.time_ns() + self.lead_ns
+        for peer in ready:
+            peer.channel.send({"type": "release", "round": self.round, "at": release_at})
+
+        logger.info(f"[Coordinator] Round {self.round}: {len(ready) + 1} nodes release together")
+        return release_at
+
+    def gather_results(self, state_name: str, results: List[RaceResult]) -> List[RaceResult]:
+        """Collect the workers' results and renumber their thread IDs."""
+        to_coordinator_clock(results)
+        merged = list(results)
+        offset = max((r.thread_id for r in results), default=-1) + 1
+
+        for peer in self.peers:
+            message = peer.expect("results", self.round, self.round_timeout)
+            if message is None:
+                continue
+            if message.get("state") != state_name:
+                logger.warning(
+                    f"[Coordinator] Worker {peer.node_id} sent results for '{message.get('state')}' "
+                    f"while '{state_name}' was expected"
+                )
+            block = [RaceResult(**data) for data in message["results"]]
+            for result in block:
+                result.thread_id += offset
+            merged.extend(block)
+            if block:
+                offset = max(r.thread_id for r in block) + 1
+            logger.info(f"[Coordinator] Worker {peer.node_id}: {len(block)} results")
+
+        return merged
+
+    def close(self) -> None:
+        """Disconnect the workers and stop listening."""
+        for peer in self.peers:
+            peer.channel.close()
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+
+
+class WorkerNode(DistributedNode):
+    """
+    Distributed race worker.
+
+    Connects to the coordinator, estimates the clock offset, and for each
+    race reports ready, waits for the release time and sends its results.
+
+    Example:
+        node = WorkerNode("10.0.0.1", 7000)
+        node.start()
+        deadline = node.release_time()   # In local clock
+        node.gather_results("race", local_results)
+        node.close()
+    """
+
+    def __init__(self, host: str, port: int, connect_timeout: float = 30.0):
+        """
+        Initialize the worker.
+
+        Args:
+            host: Coordinator host
+            port: Coordinator port
+            connect_timeout: Maximum time to keep retrying the connection
+        """
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.node_id = 0
+        self.offset_ns = 0
+        self.rtt_ns = 0
+        self.channel: Optional[ControlChannel] = None
+
+    def start(self) -> None:
+        """Connect to the coordinator and synchronize clocks."""
+        deadline = time.monotonic() + self.connect_timeout
+        while True:
+            try:
+                sock = socket.create_connection((self.host, self.port), timeout=self.connect_timeout)
+                break
+            except OSError:
+                # The coordinator may not be listening yet
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.2)
+
+        sock.settimeout(None)
+        self.channel = ControlChannel(sock)
+        self.channel.send({"type": "hello"})
+        welcome = self.channel.recv()
+        self.node_id = welcome["node"]
+
+        self.sync_clock(JOIN_CLOCK_SAMPLES)
+        logger.info(
+            f"[Worker {self.node_id}] Joined {self.host}:{self.port} "
+            f"(clock offset {self.offset_ns / 1e6:+.3f}ms, rtt {self.rtt_ns / 1e6:.3f}ms)"
+        )
+
+    def sync_clock(self, samples: int) -> None:
+        """
+        Estimate the offset between the coordinator clock and the local one.
+
+        The sample with the lowest round trip is kept, as its offset has the
+        smallest error bound (rtt / 2).
+
+        Args:
+            samples: Number of ping/pong exchanges
+        """
+        assert self.channel is not None
+        best_rtt = None
+        for _ in range(samples):
+            t0 = time.time_ns()
+            self.channel.send({"type": "ping", "t0": t0})
+            pong = self.channel.recv()
+            t3 = time.time_ns()
+
+            rtt = (t3 - t0) - (pong["t2"] - pong["t1"])
+            if best_rtt is None or rtt < best_rtt:
+                best_rtt = rtt
+                self.rtt_ns = rtt
+                self.offset_ns = ((pong["t1"] - t0) + (pong["t2"] - t3)) // 2
+
+    def release_time(self) -> int:
+        """Report ready and convert the coordinator's release time."""
+        assert self.channel is not None
+        self.round += 1
+        self.sync_clock(ROUND_CLOCK_SAMPLES)
+        self.channel.send({
+            "type": "ready",
+            "round": self.round,
+            "offset_ns": self.offset_ns,
+            "rtt_ns": self.rtt_ns,
+        })
+
+        message = self.channel.recv()
+        if message.get("type") != "release" or message.get("round") != self.round:
+            raise ConnectionError(f"Unexpected control message: {message}")
+        return message["at"] - self.offset_ns
+
+    def gather_results(self, state_name: str, results: List[RaceResult]) -> List[RaceResult]:
+        """Send the local results to the coordinator."""
+        assert self.channel is not None
+        to_coordinator_clock(results, self.offset_ns)
+        self.channel.send({
+            "type": "results",
+            "round": self.round,
+            "state": state_name,
+            "results": [asdict(r) for r in results],
+        })
+        return results
+
+    def close(self) -> None:
+        """Disconnect from the coordinator."""
+        if self.channel is not None:
+            self.channel.close()
+            self.channel = None
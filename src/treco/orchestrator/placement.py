@@ -0,0 +1,226 @@
+"""
+CPU placement and scheduling policy of race threads.
+
+Pins each race thread to a CPU (race.cpu_affinity) and optionally raises
+its priority or switches it to a real-time policy (race.scheduling), so
+threads do not migrate between cores right at release. Also reports the
+CPU a thread is running on, so the effect can be measured.
+
+Linux only; elsewhere (or without the needed privileges) a warning is
+logged once and threads run unpinned.
+"""
+
+import ctypes
+import logging
+import os
+import threading
+from typing import List, Optional, Set, Union
+
+logger = logging.getLogger(__name__)
+
+VALID_SCHEDULING = {"default", "high", "fifo", "rr"}
+
+# Nice value for scheduling: high (needs CAP_SYS_NICE below 0)
+HIGH_PRIORITY_NICE = -10
+
+# Real-time priority for scheduling: fifo/rr. Deliberately mid-range, so
+# spinning race threads cannot starve kernel threads.
+REALTIME_PRIORITY = 50
+
+CpuAffinity = Union[None, str, List[int]]
+
+
+def _load_sched_getcpu():
+    """Return libc's sched_getcpu(), or None where unavailable."""
+    try:
+        sched_getcpu = ctypes.CDLL(None, use_errno=True).sched_getcpu
+    except (OSError, AttributeError, TypeError):
+        return None
+    sched_getcpu.restype = ctypes.c_int
+    sched_getcpu.argtypes = []
+    return sched_getcpu
+
+
+_sched_getcpu = _load_sched_getcpu()
+
+
+def current_cpu() -> Optional[int]:
+    """
+    Return the CPU the calling thread is running on.
+
+    Returns:
+        CPU number, or None if it cannot be determined on this platform
+    """
+    if _sched_getcpu is None:
+        return None
+    cpu = _sched_getcpu()
+    return cpu if cpu >= 0 else None
+
+
+def available_cpus() -> List[int]:
+    """Return the CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def parse_cpu_list(spec: str) -> List[int]:
+    """
+    Parse a CPU list such as "0-3,8,10-11".
+
+    Args:
+        spec: Comma-separated CPU numbers and ranges
+
+    Returns:
+        CPU numbers in the given order
+
+    Raises:
+        ValueError: If the list is malformed
+    """
+    cpus: List[int] = []
+    for part in spec.split(","):
+        part = part.strip()
+        start, sep, end = part.partition("-")
+        if not start.isdigit() or (sep and not end.isdigit()):
+            raise ValueError(f"Invalid CPU list '{spec}'")
+        if sep:
+            if int(end) < int(start):
+                raise ValueError(f"Invalid CPU range '{part}'")
+            cpus.extend(range(int(start), int(end) + 1))
+        else:
+            cpus.append(int(start))
+    return cpus
+
+
+def resolve_cpus(cpu_affinity: CpuAffinity) -> Optional[List[int]]:
+    """
+    Resolve race.cpu_affinity into the CPUs threads are spread over.
+
+    Args:
+        cpu_affinity: None (no pinning), "spread" (every available CPU),
+                      a CPU list string ("0-3,8") or a list of CPU numbers
+
+    Returns:
+        CPU numbers, or None when threads are not pinned
+    """
+    if cpu_affinity is None:
+        return None
+    if cpu_affinity == "spread":
+        return available_cpus()
+    if isinstance(cpu_affinity, str):
+        return parse_cpu_list(cpu_affinity)
+    return [int(cpu) for cpu in cpu_affinity]
+
+
+class ThreadPlacement:
+    """
+    Applies race.cpu_affinity and race.scheduling to race threads.
+
+    Thread N is pinned to the N-th CPU of the list, wrapping around, so
+    consecutive threads land on different cores.
+
+    Example:
+        placement = ThreadPlacement("spread", "high")
+
+        # In each race thread, before connecting:
+        placement.apply(thread_id)
+        ...
+        placement.restore()  # Threads are reused across races
+    """
+
+    def __init__(self, cpu_affinity: CpuAffinity = None, scheduling: str = "default"):
+        """
+        Initialize the placement.
+
+        Args:
+            cpu_affinity: CPU affinity spec (see resolve_cpus)
+            scheduling: default, high (lower nice value), fifo or rr
+                        (real-time policies)
+
+        Raises:
+            ValueError: If the scheduling policy or CPU list is invalid
+        """
+        if scheduling not in VALID_SCHEDULING:
+            raise ValueError(
+                f"Unknown scheduling: {scheduling}. Valid options: {sorted(VALID_SCHEDULING)}"
+            )
+        self.cpus = resolve_cpus(cpu_affinity)
+        self.scheduling = scheduling
+        self._warned: Set[str] = set()
+        self._lock = threading.Lock()
+        # Per-thread settings replaced by apply(), put back by restore()
+        self._saved = threading.local()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether anything is applied to threads."""
+        return bool(self.cpus) or self.scheduling != "default"
+
+    def cpu_for(self, index: int) -> Optional[int]:
+        """Return the CPU thread index is pinned to, if any."""
+        if not self.cpus:
+            return None
+        return self.cpus[index % len(self.cpus)]
+
+    def apply(self, index: int) -> None:
+        """
+        Pin the calling thread and set its scheduling policy.
+
+        Failures (unsupported platform, missing privileges, CPU outside the
+        allowed set) are logged once per race and otherwise ignored.
+
+        Args:
+            index: Thread index used to pick the CPU
+        """
+        if not self.enabled:
+            return
+
+        native_id = threading.get_native_id()
+
+        cpu = self.cpu_for(index)
+        if cpu is not None:
+            try:
+                affinity = os.sched_getaffinity(native_id)
+                os.sched_setaffinity(native_id, {cpu})
+                self._saved.affinity = affinity
+            except (OSError, AttributeError) as e:
+                self._warn_once("affinity", f"Cannot pin race threads to CPUs: {e}")
+
+        try:
+            if self.scheduling == "high":
+                nice = os.getpriority(os.PRIO_PROCESS, native_id)
+                os.setpriority(os.PRIO_PROCESS, native_id, HIGH_PRIORITY_NICE)
+                self._saved.nice = nice
+            elif self.scheduling in ("fifo", "rr"):
+                policy = os.SCHED_FIFO if self.scheduling == "fifo" else os.SCHED_RR
+                previous = (os.sched_getscheduler(native_id), os.sched_getparam(native_id))
+                os.sched_setscheduler(native_id, policy, os.sched_param(REALTIME_PRIORITY))
+                self._saved.policy = previous
+        except (OSError, AttributeError) as e:
+            self._warn_once("scheduling", f"Cannot apply scheduling '{self.scheduling}': {e}")
+
+    def restore(self) -> None:
+        """Undo apply() on the calling thread, so a reused thread starts clean."""
+        saved = self._saved.__dict__
+        if not saved:
+            return
+
+        native_id = threading.get_native_id()
+        try:
+            if "affinity" in saved:
+                os.sched_setaffinity(native_id, saved["affinity"])
+            if "nice" in saved:
+                os.setpriority(os.PRIO_PROCESS, native_id, saved["nice"])
+            if "policy" in saved:
+                os.sched_setscheduler(native_id, *saved["policy"])
+        except OSError as e:
+            logger.warning(f"Cannot restore race thread scheduling: {e}")
+        saved.clear()
+
+    def _warn_once(self, key: str, message: str) -> None:
+        """Log a warning the first time a given kind of failure happens."""
+        with self._lock:
+            if key in self._warned:
+                return
+            self._warned.add(key)
+        logger.warning(message)
@@ -0,0 +1,397 @@
+"""
+Multi-process race engine.
+
+Shards race threads across worker processes (one per core by default) so
+that standard GIL builds of CPython do not serialize the release and send
+phases of thousands of threads on one interpreter lock.
+
+The parent renders every request, hands each worker its shard, waits until
+every thread in every worker has connected and staged its request, then
+flips a spin flag in shared memory. Status and timing of every thread are
+written straight into shared arrays. Extracted values, timelines and
+responses vary in size, so each worker sends them to the parent in one
+batch on a queue once its threads have finished, after the race window.
+
+Workers are spawned rather than forked: the parent can already run threads
+(e.g. the coordinator's worker pool), and forking a multi-threaded process
+can leave locks held in the child.
+"""
+
+import ctypes
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from treco.http import extractor
+from treco.http.extractor import ExtractPlan
+from treco.http.compiler import CompiledRequest
+from treco.http.partial import send_request
+from treco.http.raw import RawResponse
+from treco.logging import setup_logging
+from treco.models.config import ExtractPattern, TargetConfig
+from treco.orchestrator.placement import CpuAffinity, ThreadPlacement, current_cpu
+from treco.orchestrator.timeline import create_timeline
+from treco.sync.release_schedule import ReleaseSchedule
+from treco.sync.spin import sleep_until_ns, spin_until
+
+logger = logging.getLogger(__name__)
+
+# Start method of worker processes
+START_METHOD = "spawn"
+
+@dataclass
+class ShardThread:
+    """
+    One race thread assigned to a worker process.
+
+    Attributes:
+        thread_id: Global thread ID
+        request: Pre-rendered request
+        offset_ns: Send offset from the release (thread groups only)
+    """
+
+    thread_id: int
+    request: CompiledRequest
+    offset_ns: Optional[int] = None
+
+
+@dataclass
+class ShardConfig:
+    """
+    Everything a worker process needs to run its shard.
+
+    Only plain data is included so it can be sent to spawned processes.
+
+    Attributes:
+        target: Target configuration (host, port, TLS, proxy)
+        connection_strategy: Connection strategy name
+        send_engine: Send engine name (httpx, raw)
+        warmup: Warmup mode
+        warmup_path: Warmup path
+        bypass_proxy: Whether to bypass the proxy
+        extract: Extraction patterns of the race state
+        keep_responses: Send responses back to the parent (for on_thread_leave)
+        cpu_affinity: CPU affinity of race threads (race.cpu_affinity)
+        scheduling: Scheduling policy of race threads (race.scheduling)
+        timeline: Record per-thread phase timestamps (race.timeline)
+        kernel_timestamps: Record kernel TX/RX timestamps (race.kernel_timestamps)
+        body_limit: Response body bytes to read (state response.read)
+        log_level: Log level name of the parent (None: leave logging unconfigured)
+        threads: Threads of this shard
+    """
+
+    target: TargetConfig
+    connection_strategy: str
+    send_engine: str
+    warmup: str
+    warmup_path: str
+    bypass_proxy: bool
+    extract: Union[ExtractPlan, Dict[str, ExtractPattern]]
+    keep_responses: bool = False
+    cpu_affinity: CpuAffinity = None
+    scheduling: str = "default"
+    timeline: bool = False
+    kernel_timestamps: bool = False
+    body_limit: Optional[int] = None
+    log_level: Optional[str] = None
+    threads: List[ShardThread] = field(default_factory=list)
+
+
+class SharedRelease:
+    """
+    Cross-process release point in shared memory.
+
+    Workers count their threads in with arrive(); the parent waits for the
+    total with wait_ready() and then flips the release flag. Once all of its
+    threads have arrived, each worker spins on the flag in one thread and
+    wakes its own threads, so the flag is read by one spinner per process
+    instead of every thread.
+
+    Example:
+        release = SharedRelease(slots=2000)
+        # In workers: release.arrive() per thread, then release.spin()
+        release.wait_ready(2000, workers)
+        release.release()
+    """
+
+    def __init__(self, slots: int, mp_context: Any = None):
+        """
+        Allocate the shared counters and result arrays.
+
+        Args:
+            slots: Size of the result arrays, indexed by thread ID (highest
+                   thread ID + 1, which can exceed the number of threads)
+            mp_context: multiprocessing context (default: multiprocessing module)
+        """
+        ctx = mp_context or multiprocessing
+        self.ready = ctx.Value(ctypes.c_long, 0)
+        self.flag = ctx.RawValue(ctypes.c_int, 0)
+        self.status = ctx.RawArray(ctypes.c_long, slots)
+        self.timing_ns = ctx.RawArray(ctypes.c_longlong, slots)
+
+    def arrive(self) -> None:
+        """Count one thread as connected and staged."""
+        with self.ready.get_lock():
+            self.ready.value += 1
+
+    def wait_ready(self, total: int, workers: List[Any], timeout: Optional[float] = None) -> bool:
+        """
+        Wait until total threads have arrived.
+
+        Args:
+            total: Number of threads to wait for
+            workers: Worker processes (stop waiting if one of them dies)
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if all threads arrived
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.ready.value < total:
+            if any(w.exitcode is not None for w in workers):
+                return False
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+    def release(self) -> None:
+        """Flip the release flag."""
+        self.flag.value = 1
+
+    def spin(self) -> None:
+        """Busy-wait until the release flag is set (yielding the GIL on GIL builds)."""
+        flag = self.flag
+        spin_until(lambda: flag.value)
+
+
+def _thread_main(
+    index: int,
+    shard_thread: ShardThread,
+    config: ShardConfig,
+    conn_strategy: Any,
+    placement: ThreadPlacement,
+    shared: SharedRelease,
+    local_arrival: threading.Barrier,
+    local_barrier: threading.Barrier,
+    schedule: ReleaseSchedule,
+    outcomes: List[Optional[Dict[str, Any]]],
+) -> None:
+    """Connect, stage, wait for release and send one request."""
+    thread_id = shard_thread.thread_id
+    outcome: Dict[str, Any] = {"extracted": {}, "error": "", "response": None, "cpu": None}
+    timeline = create_timeline(config.timeline)
+    client = None
+    request = None
+
+    try:
+        placement.apply(thread_id)
+        timeline.mark("connect")
+        conn_strategy.connect(index)
+        client = conn_strategy.get_session(index)
+        request = shard_thread.request.build(client)
+        timeline.attach(request)
+        conn_strategy.stage_request(index, request)
+    except Exception as e:
+        logger.error(f"[Thread {thread_id}] ERROR: {e}")
+        traceback.print_exc()
+        outcome["error"] = str(e)
+
+    # Always arrive, so a failed thread cannot hold back the release
+    timeline.mark("sync_arrival")
+    shared.arrive()
+    local_arrival.wait()
+    local_barrier.wait()
+    timeline.mark("sync_release")
+
+    if not outcome["error"]:
+        try:
+            release_ns = schedule.wait(shard_thread.offset_ns or 0)
+
+            outcome["cpu"] = current_cpu()
+            start_time_ns = time.perf_counter_ns()
+            outcome["send_start_ns"] = start_time_ns
+            outcome["send_offset_ns"] = start_time_ns - release_ns
+            response = send_request(client, request, config.body_limit)
+            end_time_ns = time.perf_counter_ns()
+            timeline.mark("complete")
+
+            shared.status[thread_id] = response.status_code
+            shared.timing_ns[thread_id] = end_time_ns - start_time_ns
+
+            stamps = getattr(client, "kernel_timestamps", None)
+            if stamps is not None:
+                outcome["tx_timestamp_ns"] = stamps.tx_ns
+                outcome["rx_timestamp_ns"] = stamps.rx_ns
+            outcome["unstaged"] = getattr(client, "unstaged", False)
+
+            outcome["extracted"] = extractor.extract_all(response, config.extract)
+            if config.keep_responses:
+                outcome["response"] = _portable_response(response)
+        except Exception as e:
+            logger.error(f"[Thread {thread_id}] ERROR: {e}")
+            traceback.print_exc()
+            outcome["error"] = str(e)
+
+    outcome["timeline"] = timeline.as_dict()
+    outcomes[index] = outcome
+
+
+def _portable_response(response: Any) -> RawResponse:
+    """Convert a response into a RawResponse that can be sent to the parent."""
+    # The body is already decoded, so its Content-Encoding no longer applies
+    headers = [(k, v) for k, v in response.headers.raw if k.lower() != b"content-encoding"]
+    return RawResponse(
+        status_code=response.status_code,
+        reason=getattr(response, "reason_phrase", ""),
+        http_version=getattr(response, "http_version", "HTTP/1.1"),
+        raw_headers=headers,
+        raw_content=response.content,
+        url=str(getattr(response, "url", "")),
+    )
+
+
+def worker_main(config: ShardConfig, shared: SharedRelease, results: Any) -> None:
+    """
+    Entry point of a worker process.
+
+    Prepares the connection strategy for the shard, starts one thread per
+    race thread and blocks until all of them have connected and staged.
+    Only then does it spin on the shared release flag and wake the threads,
+    so the spinner does not compete with them for the GIL while they connect.
+    Extracted values and errors are put on the results queue once, after
+    every thread has finished.
+
+    Args:
+        config: Shard configuration
+        shared: Shared release point and result arrays
+        results: multiprocessing queue for per-thread extras
+    """
+    from treco.connection import create_connection_strategy
+    from treco.http import HTTPClient
+
+    if config.log_level:
+        setup_logging(config.log_level)
+
+    num_threads = len(config.threads)
+    outcomes: List[Optional[Dict[str, Any]]] = [None] * num_threads
+    http_client = HTTPClient(config.target)
+    conn_strategy = create_connection_strategy(
+        config.connection_strategy,
+        bypass_proxy=config.bypass_proxy,
+        send_engine=config.send_engine,
+        warmup=config.warmup,
+        warmup_path=config.warmup_path,
+        kernel_timestamps=config.kernel_timestamps,
+    )
+    # Threads + this spinner thread
+    local_arrival = threading.Barrier(num_threads + 1)
+    local_barrier = threading.Barrier(num_threads + 1)
+    placement = ThreadPlacement(config.cpu_affinity, config.scheduling)
+    schedule = ReleaseSchedule()
+
+    try:
+        conn_strategy.prepare(num_threads, http_client)
+    except Exception as e:
+        logger.error(f"[Worker {os.getpid()}] ERROR: {e}")
+        traceback.print_exc()
+        outcomes = [{"extracted": {}, "error": str(e), "response": None}] * num_threads
+        for _ in range(num_threads):
+            shared.arrive()
+    else:
+        threads = [
+            threading.Thread(
+                target=_thread_main,
+                args=(
+                    i, shard_thread, config, conn_strategy, placement, shared,
+                    local_arrival, local_barrier, schedule, outcomes,
+                ),
+            )
+            for i, shard_thread in enumerate(config.threads)
+        ]
+        for thread in threads:
+            thread.start()
+
+        local_arrival.wait()
+        shared.spin()
+        local_barrier.wait()
+
+        for thread in threads:
+            thread.join()
+    finally:
+        conn_strategy.cleanup()
+        http_client.close()
+
+    results.put([
+        (shard_thread.thread_id, outcome or {"extracted": {}, "error": "thread did not finish", "response": None})
+        for shard_thread, outcome in zip(config.threads, outcomes, strict=True)
+    ])
+
+
+def default_process_count(num_threads: int) -> int:
+    """Return one process per core, but never more processes than threads."""
+    return max(1, min(os.cpu_count() or 1, num_threads))
+
+
+def run_sharded_race(
+    shards: List[ShardConfig],
+    ready_timeout: Optional[float] = None,
+    release_time: Optional[Callable[[], int]] = None,
+) -> Tuple[SharedRelease, Dict[int, Dict[str, Any]]]:
+    """
+    Run shards in worker processes with a shared release point.
+
+    Args:
+        shards: One ShardConfig per worker process
+        ready_timeout: Maximum time to wait for all threads to connect
+        release_time: Optional callable returning the time.time_ns() at
+                      which to release once all threads are ready
+
+    Returns:
+        Tuple of (shared arrays with status and timing by thread ID,
+        per-thread extras with extracted values, error and optional response)
+    """
+    mp_context = multiprocessing.get_context(START_METHOD)
+    total = sum(len(shard.threads) for shard in shards)
+    slots = max((t.thread_id for shard in shards for t in shard.threads), default=-1) + 1
+    shared = SharedRelease(slots, mp_context)
+    results = mp_context.Queue()
+
+    workers = [
+        mp_context.Process(target=worker_main, args=(shard, shared, results), daemon=True)
+        for shard in shards
+    ]
+    for worker in workers:
+        worker.start()
+
+    if shared.wait_ready(total, workers, timeout=ready_timeout):
+        logger.info(f"All {total} threads ready in {len(workers)} processes, releasing")
+    else:
+        logger.error(f"Only {shared.ready.value}/{total} threads ready, releasing anyway")
+    if release_time is not None:
+        sleep_until_ns(release_time())
+    shared.release()
+
+    # Drain the queue before joining so workers are not blocked on a full pipe
+    extras: Dict[int, Dict[str, Any]] = {}
+    pending = len(workers)
+    while pending:
+        try:
+            batch = results.get(timeout=0.5)
+        except queue.Empty:
+            if not any(w.is_alive() for w in workers):
+                break
+            continue
+        extras.update(batch)
+        pending -= 1
+
+    for worker in workers:
+        worker.join()
+
+    return shared, extras
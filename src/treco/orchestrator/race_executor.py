@@ -2,44 +2,75 @@
 Race condition attack executor.
 
 Handles the execution of race condition attacks with multi-threaded
-coordination, input distribution, and result collection.
+(or asyncio) coordination, input distribution, and result collection.
 """
 
+import asyncio
+import functools
 import threading
 import time
 import traceback
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import httpx
 import logging
 
 from treco.http import extractor
+from treco.http.compiler import CompiledRequest, compile_request
+from treco.http.partial import asend_request, send_request
+from treco.http.raw import RawResponse
 from treco.input import InputDistributor, InputMode
 from treco.input.config import InputConfig
-from treco.logging import user_output
+from treco.logging import get_level_name, user_output
 from treco.models import ExecutionContext, State, build_template_context
 from treco.models.config import RaceConfig, ThreadGroup
-from treco.sync import create_sync_mechanism
+from treco.sync import (
+    ReleaseSchedule,
+    TimedReleaseSync,
+    create_async_sync_mechanism,
+    create_sync_mechanism,
+)
 from treco.connection import create_connection_strategy
+from treco.orchestrator.placement import ThreadPlacement, current_cpu
+from treco.orchestrator.rounds import RaceRounds, RoundStats
+from treco.orchestrator.timeline import NULL_TIMELINE, Timeline, create_timeline
+from treco.orchestrator.worker_pool import RaceWorkerPool
+from treco.orchestrator.process_engine import (
+    ShardConfig,
+    ShardThread,
+    default_process_count,
+    run_sharded_race,
+)
 
 if TYPE_CHECKING:
-    from treco.http import HTTPClient, HTTPParser
+    from treco.http import HTTPClient
     from treco.template import TemplateEngine
+    from treco.template.partial import BoundTemplate
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RaceResult:
-    """Result from a single thread in a race attack."""
+    """Result from a single thread in a race attack (slotted: one per thread and round)."""
 
     thread_id: int
     status: int
     extracted: Dict[str, Any]
     timing_ns: int
     error: str = ""
+    cpu: Optional[int] = None
+    round: int = 1
+    target_offset_ns: Optional[int] = None
+    send_offset_ns: Optional[int] = None
+    timeline: Optional[Dict[str, Optional[int]]] = None
+    send_start_ns: Optional[int] = None
+    group: str = ""
+    tx_timestamp_ns: Optional[int] = None
+    rx_timestamp_ns: Optional[int] = None
+    unstaged: bool = False
 
 
 class RaceExecutor:
@@ -48,15 +79,15 @@ class RaceExecutor:
 
     The executor handles:
     1. Sync mechanism creation (barrier/latch/semaphore)
-    2. Connection strategy setup (preconnect/multiplexed/lazy/pooled)
+    2. Connection strategy setup (preconnect/multiplexed/single_packet/last_byte/lazy/pooled)
     3. Input distribution across threads
-    4. Multi-threaded request execution
+    4. Request execution on threads, asyncio tasks (race.engine: asyncio)
+       or worker processes (race.engine: processes)
     5. Result collection and timing measurement
 
     Example:
         executor = RaceExecutor(
             http_client=http_client,
-            http_parser=http_parser,
             template_engine=template_engine,
             config=config,
         )
@@ -67,23 +98,36 @@ class RaceExecutor:
     def __init__(
         self,
         http_client: "HTTPClient",
-        http_parser: "HTTPParser",
         template_engine: "TemplateEngine",
         entrypoint_input: Dict[str, Any],
+        release_time: Optional[Callable[[], int]] = None,
+        worker_pool: Optional[RaceWorkerPool] = None,
     ):
         """
         Initialize the race executor.
 
         Args:
             http_client: HTTP client for making requests
-            http_parser: Parser for raw HTTP text
             template_engine: Template engine for rendering
             entrypoint_input: Input configuration from entrypoint
+            release_time: Distributed mode: called once all local threads
+                          are ready, returns the local time.time_ns() at
+                          which to release them
         """
         self.http_client = http_client
-        self.http_parser = http_parser
         self.template_engine = template_engine
         self.entrypoint_input = entrypoint_input
+        self.release_time = release_time
+        self.worker_pool = worker_pool
+
+        # Release skew of the last race, where the sync mechanism measures it
+        self.release_skew_ns: Optional[int] = None
+
+        # Request templates of the current race with their invariant parts rendered
+        self._request_templates: Dict[str, "BoundTemplate"] = {}
+
+        # Requests of the current race that every thread renders identically
+        self._invariant_requests: Dict[str, CompiledRequest] = {}
 
     def execute(
         self,
@@ -107,7 +151,14 @@ class RaceExecutor:
             raise ValueError("State is not configured for race condition attack")
 
         race_config: RaceConfig = state.race
-        
+        self.release_skew_ns = None
+        self._prepare_requests(state, context)
+
+        if self.release_time is not None and race_config.engine == "asyncio":
+            raise ValueError("race.engine 'asyncio' is not supported in distributed mode")
+        if race_config.rounds > 1 and (race_config.engine != "threads" or self.release_time is not None):
+            raise ValueError("race.rounds requires race.engine 'threads' and is not supported in distributed mode")
+
         # Check if using thread groups mode
         if race_config.thread_groups:
             return self._execute_thread_groups(state, context, race_config)
@@ -115,6 +166,60 @@ class RaceExecutor:
             # Legacy mode
             return self._execute_legacy(state, context, race_config)
     
+    def _prepare_requests(self, state: State, context: ExecutionContext) -> None:
+        """
+        Render the thread-invariant parts of the race's request templates once.
+
+        Templates the loader split (see TemplateEngine.compile_plan) are bound
+        by source. Templates without per-thread parts are also compiled here,
+        so every thread shares one CompiledRequest.
+        """
+        plans = [(state.request, state.request_plan)]
+        plans += [(group.request, group.request_plan) for group in state.race.thread_groups or []]
+
+        variables = build_template_context(context=context, target=self.http_client.config)
+        self._request_templates = {}
+        self._invariant_requests = {}
+        for source, plan in plans:
+            if plan is None or not plan.has_invariant:
+                continue
+            try:
+                bound = self.template_engine.bind(plan, variables, context)
+                if plan.is_invariant:
+                    self._invariant_requests[source] = compile_request(bound.render(variables, context))
+            except Exception as e:
+                # Threads render the whole template and report the error
+                logger.debug(f"Request template not pre-rendered: {e}")
+                continue
+            self._request_templates[source] = bound
+
+    def _compile_request(
+        self,
+        template: str,
+        context_input: Dict[str, Any],
+        context: ExecutionContext,
+        timeline: Timeline = NULL_TIMELINE,
+    ) -> CompiledRequest:
+        """
+        Render and compile a request template for one thread.
+
+        Pre-rendered invariant parts are reused, and requests that are the
+        same for every thread come from _prepare_requests(). Render and
+        parse times are recorded on timeline.
+        """
+        compiled = self._invariant_requests.get(template)
+        if compiled is not None:
+            timeline.mark("parse")
+            return compiled
+
+        bound = self._request_templates.get(template)
+        if bound is None:
+            http_text = self.template_engine.render(template, context_input, context)
+        else:
+            http_text = bound.render(context_input, context)
+        timeline.mark("parse")
+        return compile_request(http_text)
+
     def _execute_legacy(
         self,
         state: State,
@@ -136,9 +241,21 @@ class RaceExecutor:
 
         self._log_race_start(state, race_config)
 
+        if race_config.engine in ("asyncio", "processes"):
+            input_distributor = self._setup_input_distributor(
+                state, context, race_config, num_threads
+            )
+            assignments = [
+                {'global_id': i, 'local_id': i, 'group': None} for i in range(num_threads)
+            ]
+            if race_config.engine == "processes":
+                return self._execute_processes(state, context, race_config, assignments, input_distributor)
+            return self._execute_async(state, context, race_config, assignments, input_distributor)
+
         # Create sync mechanisms
         conn_sync = create_sync_mechanism("barrier")
-        race_sync = create_sync_mechanism(race_config.sync_mechanism)
+        race_sync = self._create_race_sync(race_config)
+        placement = self._create_placement(race_config)
 
         # Check proxy bypass
         bypass_proxy = state.should_bypass_proxy()
@@ -150,12 +267,18 @@ class RaceExecutor:
             race_config.connection_strategy,
             sync=conn_sync,
             bypass_proxy=bypass_proxy,
+            send_engine=race_config.send_engine,
+            warmup=race_config.warmup,
+            warmup_path=race_config.warmup_path,
+            kernel_timestamps=race_config.kernel_timestamps,
         )
 
         # Prepare strategies
         conn_strategy.prepare(num_threads, self.http_client)
         race_sync.prepare(num_threads)
 
+        rounds = self._create_rounds(state, context, race_config, num_threads, race_sync)
+
         # Setup input distribution
         input_distributor = self._setup_input_distributor(
             state, context, race_config, num_threads
@@ -169,8 +292,12 @@ class RaceExecutor:
             conn_strategy=conn_strategy,
             race_sync=race_sync,
             input_distributor=input_distributor,
+            placement=placement,
+            rounds=rounds,
         )
 
+        self._log_release_skew(race_sync)
+
         # Cleanup
         conn_strategy.cleanup()
 
@@ -200,9 +327,16 @@ class RaceExecutor:
         
         self._log_race_start_groups(state, race_config, thread_groups, num_threads)
 
+        if race_config.engine in ("asyncio", "processes"):
+            assignments = self._build_thread_assignments(thread_groups)
+            if race_config.engine == "processes":
+                return self._execute_processes(state, context, race_config, assignments, None)
+            return self._execute_async(state, context, race_config, assignments, None)
+
         # Create sync mechanisms
         conn_sync = create_sync_mechanism("barrier")
-        race_sync = create_sync_mechanism(race_config.sync_mechanism)
+        race_sync = self._create_race_sync(race_config)
+        placement = self._create_placement(race_config)
 
         # Check proxy bypass
         bypass_proxy = state.should_bypass_proxy()
@@ -214,11 +348,16 @@ class RaceExecutor:
             race_config.connection_strategy,
             sync=conn_sync,
             bypass_proxy=bypass_proxy,
+            send_engine=race_config.send_engine,
+            warmup=race_config.warmup,
+            warmup_path=race_config.warmup_path,
+            kernel_timestamps=race_config.kernel_timestamps,
         )
 
         # Prepare strategies
         conn_strategy.prepare(num_threads, self.http_client)
         race_sync.prepare(num_threads)
+        rounds = self._create_rounds(state, context, race_config, num_threads, race_sync)
 
         # Execute race attack with thread groups
         race_results = self._execute_thread_groups_workers(
@@ -228,19 +367,94 @@ class RaceExecutor:
             num_threads=num_threads,
             conn_strategy=conn_strategy,
             race_sync=race_sync,
+            placement=placement,
+            rounds=rounds,
         )
 
+        self._log_release_skew(race_sync)
+
         # Cleanup
         conn_strategy.cleanup()
 
         return race_results
 
+    def _create_race_sync(self, race_config: RaceConfig):
+        """
+        Create the race sync mechanism.
+
+        In distributed mode the configured mechanism is replaced by a timed
+        release at the time agreed with the other nodes.
+        """
+        if self.release_time is not None:
+            logger.info("Distributed mode: releasing at the time agreed with the coordinator")
+            return TimedReleaseSync(self.release_time)
+        return create_sync_mechanism(race_config.sync_mechanism)
+
+    def _create_rounds(
+        self,
+        state: State,
+        context: ExecutionContext,
+        race_config: RaceConfig,
+        num_threads: int,
+        race_sync,
+    ) -> RaceRounds:
+        """Create the round coordinator (race.rounds, race.until, race.round_delay_ms)."""
+        until = None
+        if race_config.until:
+            until = functools.partial(self._evaluate_until, race_config.until, context)
+
+        if race_config.rounds > 1:
+            logger.info(
+                f"Rounds: up to {race_config.rounds}, {race_config.round_delay_ms}ms apart"
+                + (f", until {race_config.until}" if race_config.until else "")
+            )
+        return RaceRounds(
+            rounds=race_config.rounds,
+            num_threads=num_threads,
+            race_sync=race_sync,
+            until=until,
+            delay_ms=race_config.round_delay_ms,
+        )
+
+    def _evaluate_until(self, expression: str, context: ExecutionContext, stats: RoundStats) -> bool:
+        """
+        Evaluate race.until after a round.
+
+        The expression sees the usual template variables plus ``round``
+        (number, total, successful, failed, window_ms).
+        """
+        context_input = build_template_context(context=context, target=self.http_client.config)
+        context_input["round"] = asdict(stats)
+        try:
+            result = self.template_engine.render(expression, context_input, context).strip()
+        except Exception as e:
+            logger.error(f"Error evaluating race.until '{expression}': {e}")
+            return False
+        return result.lower() not in ("", "false", "0", "none")
+
+    def _create_placement(self, race_config: RaceConfig) -> ThreadPlacement:
+        """Create the CPU placement of race threads (race.cpu_affinity, race.scheduling)."""
+        placement = ThreadPlacement(race_config.cpu_affinity, race_config.scheduling)
+        if placement.enabled:
+            cpus = placement.cpus if placement.cpus else "unpinned"
+            logger.info(f"Thread placement: CPUs {cpus}, scheduling {placement.scheduling}")
+        return placement
+
+    def _log_release_skew(self, race_sync) -> None:
+        """Log how far apart the threads left the sync point, if measured."""
+        skew_ns = race_sync.release_skew_ns()
+        self.release_skew_ns = skew_ns
+        if skew_ns is not None:
+            mechanism = type(race_sync).__name__
+            logger.info(f"Release skew ({mechanism}): {skew_ns / 1000:.1f}μs")
+
     def _log_race_start(self, state: State, race_config: RaceConfig) -> None:
         """Log race attack configuration."""
         logger.info(f"\n{'='*70}")
         logger.info(f"RACE ATTACK: {state.name}")
         logger.info(f"{'='*70}")
         logger.info(f"Threads: {race_config.threads}")
+        logger.info(f"Engine: {race_config.engine}")
         logger.info(f"Sync Mechanism: {race_config.sync_mechanism}")
         logger.info(f"Connection Strategy: {race_config.connection_strategy}")
         logger.info(f"Thread Propagation: {race_config.thread_propagation}")
@@ -258,9 +472,10 @@ class RaceExecutor:
         logger.info(f"RACE ATTACK (THREAD GROUPS): {state.name}")
         logger.info(f"{'='*70}")
         logger.info(f"Total Threads: {num_threads}")
+        logger.info(f"Engine: {race_config.engine}")
         logger.info(f"Thread Groups: {len(thread_groups)}")
         for group in thread_groups:
-            logger.info(f"  - {group.name}: {group.threads} threads, {group.delay_ms}ms delay")
+            logger.info(f"  - {group.name}: {group.threads} threads, {group.offset_ns / 1000:.1f}μs delay")
         logger.info(f"Sync Mechanism: {race_config.sync_mechanism}")
         logger.info(f"Connection Strategy: {race_config.connection_strategy}")
         logger.info(f"Thread Propagation: {race_config.thread_propagation}")
@@ -397,7 +612,9 @@ class RaceExecutor:
         num_threads: int,
         conn_strategy,
         race_sync,
+        placement: ThreadPlacement,
         input_distributor: Optional[InputDistributor],
+        rounds: RaceRounds,
     ) -> List[RaceResult]:
         """
         Execute all race threads and collect results.
@@ -408,46 +625,57 @@ class RaceExecutor:
             num_threads: Number of threads
             conn_strategy: Connection strategy
             race_sync: Race synchronization mechanism
+            placement: CPU placement and scheduling of race threads
             input_distributor: Optional input distributor
+            rounds: Round coordinator collecting the results
 
         Returns:
-            List of RaceResult from all threads
+            List of RaceResult from all threads and rounds
         """
-        race_results: List[RaceResult] = []
-        results_lock = threading.Lock()
-
         def worker(thread_id: int) -> None:
-            result = self._race_worker(
-                thread_id=thread_id,
-                state=state,
-                context=context,
-                num_threads=num_threads,
-                conn_strategy=conn_strategy,
-                race_sync=race_sync,
-                input_distributor=input_distributor,
-            )
-            with results_lock:
-                race_results.append(result)
+            placement.apply(thread_id)
+            try:
+                self._race_worker(
+                    thread_id=thread_id,
+                    state=state,
+                    context=context,
+                    num_threads=num_threads,
+                    conn_strategy=conn_strategy,
+                    race_sync=race_sync,
+                    input_distributor=input_distributor,
+                    rounds=rounds,
+                )
+            finally:
+                placement.restore()
 
-        # Create and start threads
-        threads: List[threading.Thread] = []
         logger.info(f"\nStarting {num_threads} threads...\n")
 
         # Initialize context list for this state
-        context.setdefault(state.name, [None] * num_threads)
+        context.reserve_list(state.name, num_threads)
 
-        for i in range(num_threads):
-            thread = threading.Thread(target=worker, args=(i,))
-            threads.append(thread)
-            thread.start()
-
-        # Wait for completion
-        for thread in threads:
-            thread.join()
+        # Run threads and wait for completion
+        self._run_workers(worker, list(range(num_threads)))
 
         logger.info("\n⚡ ALL THREADS RELEASED ⚡\n")
 
-        return race_results
+        return rounds.results
+
+    def _run_workers(self, worker: Callable[[Any], None], items: List[Any]) -> None:
+        """
+        Run worker(item) concurrently for every item and wait for all.
+
+        Uses the persistent worker pool when there is one, so no thread is
+        created during the race; otherwise starts one thread per item.
+        """
+        if self.worker_pool is not None:
+            self.worker_pool.run([functools.partial(worker, item) for item in items])
+            return
+
+        threads = [threading.Thread(target=worker, args=(item,)) for item in items]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
 
     def _race_worker(
         self,
@@ -458,10 +686,14 @@ class RaceExecutor:
         conn_strategy,
         race_sync,
         input_distributor: Optional[InputDistributor],
-    ) -> RaceResult:
+        rounds: RaceRounds,
+    ) -> None:
         """
         Worker function for a single race thread.
 
+        The request is rendered and the connection opened once; the request
+        is then sent once per round and each result reported to rounds.
+
         Args:
             thread_id: Thread identifier
             state: Race state
@@ -470,9 +702,7 @@ class RaceExecutor:
             conn_strategy: Connection strategy
             race_sync: Race synchronization mechanism
             input_distributor: Optional input distributor
-
-        Returns:
-            RaceResult for this thread
+            rounds: Round coordinator
         """
         thread_info: Dict[str, Any] = {"id": thread_id, "count": num_threads}
         thread_input = None
@@ -481,91 +711,142 @@ class RaceExecutor:
             thread_input = input_distributor.get_for_thread(thread_id)
             thread_info["input"] = thread_input
 
+        setup_timeline = create_timeline(state.race.timeline)
+
         try:
             # Phase 1: Log thread entry
             self._log_thread_enter(state, context, thread_info, thread_input)
 
             # Phase 2: Prepare request
+            setup_timeline.mark("render")
             context_input = build_template_context(
                 context=context,
                 target=self.http_client.config,
                 thread=thread_info,
             )
 
-            http_text = self.template_engine.render(
-                state.request, context_input, context
-            )
-            method, path, headers, body = self.http_parser.parse(http_text)
+            compiled = self._compile_request(state.request, context_input, context, setup_timeline)
 
             # Phase 3: Connect
+            setup_timeline.mark("connect")
             conn_strategy.connect(thread_id)
             client = conn_strategy.get_session(thread_id)
 
             # Build prepared request
-            request = client.build_request(
-                method=method,
-                url=path,
-                headers=headers,
-                content=body if body else None,
-            )
+            request = compiled.build(client)
+        except Exception as e:
+            rounds.leave(self._failed_result(thread_id, f"[Thread {thread_id}]", e))
+            return
 
-            # Phase 4: Race sync
-            logger.debug(f"[Thread {thread_id}] Ready, waiting at race sync point...")
-            race_sync.wait(thread_id)
+        while True:
+            timeline = setup_timeline.next_round()
+            try:
+                timeline.attach(request)
+                conn_strategy.stage_request(thread_id, request)
 
-            # Phase 5: Send request (RACE WINDOW)
-            start_time_ns = time.perf_counter_ns()
-            response = client.send(request)
-            end_time_ns = time.perf_counter_ns()
+                # Phase 4: Race sync
+                logger.debug(f"[Thread {thread_id}] Ready, waiting at race sync point...")
+                timeline.mark("sync_arrival")
+                race_sync.wait(thread_id)
+                timeline.mark("sync_release")
 
-            timing_ns = end_time_ns - start_time_ns
+                # Phase 5: Send request (RACE WINDOW)
+                cpu = current_cpu()
+                start_time_ns = time.perf_counter_ns()
+                response = send_request(client, request, state.response.body_limit)
+                end_time_ns = time.perf_counter_ns()
+                timeline.mark("complete")
 
-            # Extract data
-            extracted = extractor.extract_all(response, state.extract)
+                timing_ns = end_time_ns - start_time_ns
 
-            # Update context
-            context.set_list_item(
-                state.name,
-                thread_id,
-                {
+                # Extract data
+                extracted = extractor.extract_all(response, state.extract_plan or state.extract)
+
+                # Update context
+                item: Dict[str, Any] = {
                     "thread": thread_info,
                     "status": response.status_code,
                     "timing_ms": timing_ns / 1_000_000,
-                    **extracted,
-                },
-            )
-
-            logger.info(
-                f"[Thread {thread_id}] Status: {response.status_code}, "
-                f"Time: {timing_ns/1_000_000:.2f}ms"
-            )
-
-            # Log thread leave
-            self._log_thread_leave(
-                state, context, thread_info, thread_input, response, timing_ns
-            )
+                }
+                if timeline is not NULL_TIMELINE:
+                    item["timeline"] = timeline.as_dict()
+                context.set_list_item(state.name, thread_id, {**item, **extracted})
+
+                logger.info(
+                    f"[Thread {thread_id}] Status: {response.status_code}, "
+                    f"Time: {timing_ns/1_000_000:.2f}ms"
+                )
+
+                # Log thread leave
+                self._log_thread_leave(
+                    state, context, thread_info, thread_input, response, timing_ns
+                )
+
+                result = RaceResult(
+                    thread_id=thread_id,
+                    status=response.status_code,
+                    extracted=extracted,
+                    timing_ns=timing_ns,
+                    cpu=cpu,
+                    timeline=timeline.as_dict(),
+                    send_start_ns=start_time_ns,
+                )
+                self._add_kernel_timestamps(result, client)
+                result.unstaged = getattr(client, "unstaged", False)
+            except Exception as e:
+                result = self._failed_result(thread_id, f"[Thread {thread_id}]", e)
+                result.timeline = timeline.as_dict()
+
+            if not rounds.complete(result):
+                return
+
+    @staticmethod
+    def _add_kernel_timestamps(result: RaceResult, client: Any) -> None:
+        """Copy the kernel TX/RX timestamps of the client's last request, if any."""
+        stamps = getattr(client, "kernel_timestamps", None)
+        if stamps is not None:
+            result.tx_timestamp_ns = stamps.tx_ns
+            result.rx_timestamp_ns = stamps.rx_ns
+
+    def _failed_result(self, thread_id: int, label: str, error: Exception) -> RaceResult:
+        """Log a race thread error and turn it into a RaceResult."""
+        logger.error(f"\n{'='*70}")
+        logger.error(f"{label} ERROR: {str(error)}")
+        logger.error(f"{'='*70}\n")
+        traceback.print_exc()
+
+        return RaceResult(
+            thread_id=thread_id,
+            status=0,
+            extracted={},
+            timing_ns=0,
+            error=str(error),
+        )
+    
+    def _build_thread_assignments(self, thread_groups: List[ThreadGroup]) -> List[Dict[str, Any]]:
+        """
+        Assign global and group-local thread IDs to every thread of every group.
 
-            return RaceResult(
-                thread_id=thread_id,
-                status=response.status_code,
-                extracted=extracted,
-                timing_ns=timing_ns,
-            )
+        Args:
+            thread_groups: List of ThreadGroup configurations
 
-        except Exception as e:
-            logger.error(f"\n{'='*70}")
-            logger.error(f"[Thread {thread_id}] ERROR: {str(e)}")
-            logger.error(f"{'='*70}\n")
-            traceback.print_exc()
+        Returns:
+            List of assignments with global_id, local_id, and group
+        """
+        thread_assignments = []
+        global_thread_id = 0
+        
+        for group in thread_groups:
+            for local_thread_id in range(group.threads):
+                thread_assignments.append({
+                    'global_id': global_thread_id,
+                    'local_id': local_thread_id,
+                    'group': group,
+                })
+                global_thread_id += 1
+        
+        return thread_assignments
 
-            return RaceResult(
-                thread_id=thread_id,
-                status=0,
-                extracted={},
-                timing_ns=0,
-                error=str(e),
-            )
-    
     def _execute_thread_groups_workers(
         self,
         state: State,
@@ -574,6 +855,8 @@ class RaceExecutor:
         num_threads: int,
         conn_strategy,
         race_sync,
+        placement: ThreadPlacement,
+        rounds: RaceRounds,
     ) -> List[RaceResult]:
         """
         Execute all race threads using thread groups and collect results.
@@ -585,57 +868,42 @@ class RaceExecutor:
             num_threads: Total number of threads across all groups
             conn_strategy: Connection strategy
             race_sync: Race synchronization mechanism
+            placement: CPU placement and scheduling of race threads
+            rounds: Round coordinator collecting the results
 
         Returns:
-            List of RaceResult from all threads
+            List of RaceResult from all threads and rounds
         """
-        race_results: List[RaceResult] = []
-        results_lock = threading.Lock()
-        
-        # Build thread assignments
-        thread_assignments = []
-        global_thread_id = 0
-        
-        for group in thread_groups:
-            for local_thread_id in range(group.threads):
-                thread_assignments.append({
-                    'global_id': global_thread_id,
-                    'local_id': local_thread_id,
-                    'group': group,
-                })
-                global_thread_id += 1
+        thread_assignments = self._build_thread_assignments(thread_groups)
+        schedule = ReleaseSchedule()
 
         def worker(assignment: Dict[str, Any]) -> None:
-            result = self._race_worker_group(
-                assignment=assignment,
-                state=state,
-                context=context,
-                num_threads=num_threads,
-                conn_strategy=conn_strategy,
-                race_sync=race_sync,
-            )
-            with results_lock:
-                race_results.append(result)
+            placement.apply(assignment['global_id'])
+            try:
+                self._race_worker_group(
+                    assignment=assignment,
+                    state=state,
+                    context=context,
+                    num_threads=num_threads,
+                    conn_strategy=conn_strategy,
+                    race_sync=race_sync,
+                    schedule=schedule,
+                    rounds=rounds,
+                )
+            finally:
+                placement.restore()
 
-        # Create and start threads
-        threads: List[threading.Thread] = []
         logger.info(f"\nStarting {num_threads} threads across {len(thread_groups)} groups...\n")
 
         # Initialize context list for this state
-        context.setdefault(state.name, [None] * num_threads)
+        context.reserve_list(state.name, num_threads)
 
-        for assignment in thread_assignments:
-            thread = threading.Thread(target=worker, args=(assignment,))
-            threads.append(thread)
-            thread.start()
-
-        # Wait for completion
-        for thread in threads:
-            thread.join()
+        # Run threads and wait for completion
+        self._run_workers(worker, thread_assignments)
 
         logger.info("\n⚡ ALL THREADS RELEASED ⚡\n")
 
-        return race_results
+        return rounds.results
     
     def _race_worker_group(
         self,
@@ -645,10 +913,15 @@ class RaceExecutor:
         num_threads: int,
         conn_strategy,
         race_sync,
-    ) -> RaceResult:
+        schedule: ReleaseSchedule,
+        rounds: RaceRounds,
+    ) -> None:
         """
         Worker function for a single thread in a thread group.
 
+        Like _race_worker(), prepares once and sends once per round. The
+        group's delay is an offset from the release timestamp in schedule.
+
         Args:
             assignment: Thread assignment with global_id, local_id, and group
             state: Race state
@@ -656,13 +929,13 @@ class RaceExecutor:
             num_threads: Total number of threads
             conn_strategy: Connection strategy
             race_sync: Race synchronization mechanism
-
-        Returns:
-            RaceResult for this thread
+            schedule: Common release timestamp of the group offsets
+            rounds: Round coordinator
         """
         global_thread_id = assignment['global_id']
         local_thread_id = assignment['local_id']
         group = assignment['group']
+        label = f"[Thread {global_thread_id}] [{group.name}]"
         
         thread_info: Dict[str, Any] = {
             "id": global_thread_id,
@@ -670,12 +943,16 @@ class RaceExecutor:
             "count": num_threads,
         }
 
+        setup_timeline = create_timeline(state.race.timeline)
+
         try:
             # Phase 1: Prepare request with group context
+            setup_timeline.mark("render")
             group_context = {
                 'name': group.name,
                 'threads': group.threads,
                 'delay_ms': group.delay_ms,
+                'offset_ns': group.offset_ns,
                 'variables': group.variables,
             }
             
@@ -686,85 +963,557 @@ class RaceExecutor:
                 group=group_context,
             )
 
-            http_text = self.template_engine.render(
-                group.request, context_input, context
-            )
-            method, path, headers, body = self.http_parser.parse(http_text)
+            compiled = self._compile_request(group.request, context_input, context, setup_timeline)
 
             # Phase 2: Connect
+            setup_timeline.mark("connect")
             conn_strategy.connect(global_thread_id)
             client = conn_strategy.get_session(global_thread_id)
 
             # Build prepared request
-            request = client.build_request(
-                method=method,
-                url=path,
-                headers=headers,
-                content=body if body else None,
-            )
+            request = compiled.build(client)
+        except Exception as e:
+            rounds.leave(self._failed_result(global_thread_id, label, e))
+            return
 
-            # Phase 3: Race sync (barrier)
-            logger.debug(f"[Thread {global_thread_id}] [{group.name}] Ready, waiting at race sync point...")
-            race_sync.wait(global_thread_id)
-            
-            # Phase 4: Apply group delay
-            if group.delay_ms > 0:
-                time.sleep(group.delay_ms / 1000.0)
+        while True:
+            timeline = setup_timeline.next_round()
+            try:
+                timeline.attach(request)
+                conn_strategy.stage_request(global_thread_id, request)
 
-            # Phase 5: Send request (RACE WINDOW)
-            start_time_ns = time.perf_counter_ns()
-            response = client.send(request)
-            end_time_ns = time.perf_counter_ns()
+                # Phase 3: Race sync (barrier)
+                logger.debug(f"{label} Ready, waiting at race sync point...")
+                timeline.mark("sync_arrival")
+                race_sync.wait(global_thread_id)
+                timeline.mark("sync_release")
 
-            timing_ns = end_time_ns - start_time_ns
+                # Phase 4: Wait for the group's offset from the release
+                release_ns = schedule.wait(group.offset_ns, rounds.number)
 
-            # Extract data
-            extracted = extractor.extract_all(response, state.extract)
+                # Phase 5: Send request (RACE WINDOW)
+                cpu = current_cpu()
+                start_time_ns = time.perf_counter_ns()
+                response = send_request(client, request, state.response.body_limit)
+                end_time_ns = time.perf_counter_ns()
+                timeline.mark("complete")
+
+                timing_ns = end_time_ns - start_time_ns
 
-            # Update context
-            context.set_list_item(
-                state.name,
-                global_thread_id,
-                {
+                # Extract data
+                extracted = extractor.extract_all(response, state.extract_plan or state.extract)
+
+                # Update context
+                item: Dict[str, Any] = {
                     "thread": thread_info,
                     "group": group_context,
                     "status": response.status_code,
                     "timing_ms": timing_ns / 1_000_000,
-                    **extracted,
-                },
-            )
+                }
+                if timeline is not NULL_TIMELINE:
+                    item["timeline"] = timeline.as_dict()
+                context.set_list_item(state.name, global_thread_id, {**item, **extracted})
+
+                logger.info(
+                    f"[Thread {global_thread_id}] [{group.name}:{local_thread_id}] "
+                    f"Status: {response.status_code}, Time: {timing_ns/1_000_000:.2f}ms"
+                )
+
+                # Log thread leave (with group context)
+                self._log_thread_leave(
+                    state, context, thread_info, None, response, timing_ns, group_context
+                )
+
+                result = RaceResult(
+                    thread_id=global_thread_id,
+                    status=response.status_code,
+                    extracted=extracted,
+                    timing_ns=timing_ns,
+                    cpu=cpu,
+                    target_offset_ns=group.offset_ns,
+                    send_offset_ns=start_time_ns - release_ns,
+                    timeline=timeline.as_dict(),
+                    send_start_ns=start_time_ns,
+                    group=group.name,
+                )
+                self._add_kernel_timestamps(result, client)
+                result.unstaged = getattr(client, "unstaged", False)
+            except Exception as e:
+                result = self._failed_result(global_thread_id, label, e)
+                result.timeline = timeline.as_dict()
+                result.group = group.name
+
+            if not rounds.complete(result):
+                return
+
+    def _execute_async(
+        self,
+        state: State,
+        context: ExecutionContext,
+        race_config: RaceConfig,
+        assignments: List[Dict[str, Any]],
+        input_distributor: Optional[InputDistributor],
+    ) -> List[RaceResult]:
+        """
+        Execute the race as asyncio tasks on a single event loop.
 
-            logger.info(
-                f"[Thread {global_thread_id}] [{group.name}:{local_thread_id}] "
-                f"Status: {response.status_code}, Time: {timing_ns/1_000_000:.2f}ms"
+        Used when race.engine is "asyncio". Each assignment becomes a task
+        with its own httpx.AsyncClient (or a shared one, depending on the
+        connection strategy), so thousands of requests do not need thousands
+        of OS threads. Sync mechanisms are their asyncio counterparts.
+
+        Args:
+            state: Race state
+            context: Execution context
+            race_config: Race configuration
+            assignments: Thread assignments (group is None in legacy mode)
+            input_distributor: Optional input distributor (legacy mode)
+
+        Returns:
+            List of RaceResult from all tasks
+        """
+        num_threads = len(assignments)
+
+        bypass_proxy = state.should_bypass_proxy()
+        if bypass_proxy:
+            logger.info(f"Proxy bypass enabled for state: {state.name}")
+
+        conn_strategy = create_connection_strategy(
+            race_config.connection_strategy,
+            sync=create_async_sync_mechanism("barrier"),
+            bypass_proxy=bypass_proxy,
+            send_engine=race_config.send_engine,
+            warmup=race_config.warmup,
+            warmup_path=race_config.warmup_path,
+            kernel_timestamps=race_config.kernel_timestamps,
+            engine="asyncio",
+        )
+        race_sync = create_async_sync_mechanism(race_config.sync_mechanism)
+
+        logger.info(f"\nStarting {num_threads} asyncio tasks...\n")
+
+        # Initialize context list for this state
+        context.reserve_list(state.name, num_threads)
+
+        race_results = asyncio.run(
+            self._run_race_tasks(
+                state=state,
+                context=context,
+                assignments=assignments,
+                conn_strategy=conn_strategy,
+                race_sync=race_sync,
+                input_distributor=input_distributor,
             )
+        )
+
+        logger.info("\n⚡ ALL THREADS RELEASED ⚡\n")
+
+        return race_results
+
+    async def _run_race_tasks(
+        self,
+        state: State,
+        context: ExecutionContext,
+        assignments: List[Dict[str, Any]],
+        conn_strategy,
+        race_sync,
+        input_distributor: Optional[InputDistributor],
+    ) -> List[RaceResult]:
+        """
+        Prepare the strategy on the event loop, run all race tasks and clean up.
+
+        Returns:
+            List of RaceResult from all tasks
+        """
+        num_threads = len(assignments)
+        schedule = ReleaseSchedule()
+
+        await conn_strategy.prepare_async(num_threads, self.http_client)
+        race_sync.prepare(num_threads)
+
+        try:
+            results = await asyncio.gather(*(
+                self._race_task(
+                    assignment=assignment,
+                    state=state,
+                    context=context,
+                    num_threads=num_threads,
+                    conn_strategy=conn_strategy,
+                    race_sync=race_sync,
+                    schedule=schedule,
+                    input_distributor=input_distributor,
+                )
+                for assignment in assignments
+            ))
+        finally:
+            await conn_strategy.cleanup_async()
+
+        return list(results)
+
+    async def _race_task(
+        self,
+        assignment: Dict[str, Any],
+        state: State,
+        context: ExecutionContext,
+        num_threads: int,
+        conn_strategy,
+        race_sync,
+        schedule: ReleaseSchedule,
+        input_distributor: Optional[InputDistributor],
+    ) -> RaceResult:
+        """
+        Asyncio counterpart of _race_worker() and _race_worker_group().
+
+        Group offsets are awaited with asyncio.sleep(), so unlike with
+        threads they are only as precise as the event loop's timers.
 
-            # Log thread leave (with group context)
-            self._log_thread_leave(
-                state, context, thread_info, None, response, timing_ns, group_context
+        Args:
+            assignment: Thread assignment with global_id, local_id, and group
+                        (None in legacy mode)
+            state: Race state
+            context: Execution context
+            num_threads: Total number of tasks
+            conn_strategy: Connection strategy (async lifecycle)
+            race_sync: Asyncio race synchronization mechanism
+            schedule: Common release timestamp of the group offsets
+            input_distributor: Optional input distributor (legacy mode)
+
+        Returns:
+            RaceResult for this task
+        """
+        thread_id = assignment['global_id']
+        group = assignment['group']
+        thread_info, thread_input, group_context, label = self._describe_assignment(
+            assignment, num_threads, input_distributor
+        )
+
+        timeline = create_timeline(state.race.timeline)
+
+        try:
+            # Phase 1-2: Log thread entry and prepare request
+            compiled = self._render_assignment(
+                assignment, state, context, thread_info, thread_input, group_context, timeline
             )
 
-            return RaceResult(
-                thread_id=global_thread_id,
-                status=response.status_code,
-                extracted=extracted,
-                timing_ns=timing_ns,
+            # Phase 3: Connect
+            timeline.mark("connect")
+            await conn_strategy.connect_async(thread_id)
+            client = conn_strategy.get_async_session(thread_id)
+
+            request = compiled.build(client)
+            timeline.attach(request, asynchronous=True)
+
+            # Phase 4: Race sync
+            logger.debug(f"{label} Ready, waiting at race sync point...")
+            timeline.mark("sync_arrival")
+            await race_sync.wait(thread_id)
+            timeline.mark("sync_release")
+
+            offset_ns = group.offset_ns if group is not None else 0
+            release_ns = schedule.mark()
+            if offset_ns > 0:
+                await asyncio.sleep((release_ns + offset_ns - time.perf_counter_ns()) / 1_000_000_000)
+
+            # Phase 5: Send request (RACE WINDOW)
+            start_time_ns = time.perf_counter_ns()
+            response = await asend_request(client, request, state.response.body_limit)
+            end_time_ns = time.perf_counter_ns()
+            timeline.mark("complete")
+
+            timing_ns = end_time_ns - start_time_ns
+
+            # Extract data
+            extracted = extractor.extract_all(response, state.extract_plan or state.extract)
+
+            result = self._record_result(
+                state, context, thread_info, thread_input, group_context, label,
+                response, extracted, timing_ns, timeline=timeline, send_start_ns=start_time_ns,
             )
+            if group is not None:
+                result.target_offset_ns = offset_ns
+                result.send_offset_ns = start_time_ns - release_ns
+            return result
 
         except Exception as e:
             logger.error(f"\n{'='*70}")
-            logger.error(f"[Thread {global_thread_id}] [{group.name}] ERROR: {str(e)}")
+            logger.error(f"{label} ERROR: {str(e)}")
             logger.error(f"{'='*70}\n")
             traceback.print_exc()
 
             return RaceResult(
-                thread_id=global_thread_id,
+                thread_id=thread_id,
                 status=0,
                 extracted={},
                 timing_ns=0,
                 error=str(e),
+                timeline=timeline.as_dict(),
             )
 
+    def _describe_assignment(
+        self,
+        assignment: Dict[str, Any],
+        num_threads: int,
+        input_distributor: Optional[InputDistributor],
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]], Optional[Dict[str, Any]], str]:
+        """
+        Build thread info, input, group context and log label for an assignment.
+
+        Used by the asyncio and process engines, which handle legacy and
+        thread group assignments in one code path.
+
+        Args:
+            assignment: Thread assignment with global_id, local_id, and group
+                        (None in legacy mode)
+            num_threads: Total number of threads
+            input_distributor: Optional input distributor (legacy mode)
+
+        Returns:
+            Tuple of (thread_info, thread_input, group_context, label)
+        """
+        thread_id = assignment['global_id']
+        group = assignment['group']
+
+        if group is None:
+            thread_info: Dict[str, Any] = {"id": thread_id, "count": num_threads}
+            thread_input = None
+            if input_distributor:
+                thread_input = input_distributor.get_for_thread(thread_id)
+                thread_info["input"] = thread_input
+            return thread_info, thread_input, None, f"[Thread {thread_id}]"
+
+        thread_info = {
+            "id": thread_id,
+            "group_id": assignment['local_id'],
+            "count": num_threads,
+        }
+        group_context = {
+            'name': group.name,
+            'threads': group.threads,
+            'delay_ms': group.delay_ms,
+            'offset_ns': group.offset_ns,
+            'variables': group.variables,
+        }
+        label = f"[Thread {thread_id}] [{group.name}:{assignment['local_id']}]"
+        return thread_info, None, group_context, label
+
+    def _render_assignment(
+        self,
+        assignment: Dict[str, Any],
+        state: State,
+        context: ExecutionContext,
+        thread_info: Dict[str, Any],
+        thread_input: Optional[Dict[str, Any]],
+        group_context: Optional[Dict[str, Any]],
+        timeline: Timeline = NULL_TIMELINE,
+    ) -> CompiledRequest:
+        """
+        Log thread entry (legacy mode) and render the request of an assignment.
+
+        Render and parse times are recorded on timeline.
+
+        Returns:
+            Compiled request
+        """
+        group = assignment['group']
+        if group is None:
+            self._log_thread_enter(state, context, thread_info, thread_input)
+
+        timeline.mark("render")
+        context_input = build_template_context(
+            context=context,
+            target=self.http_client.config,
+            thread=thread_info,
+            group=group_context,
+        )
+
+        template = state.request if group is None else group.request
+        return self._compile_request(template, context_input, context, timeline)
+
+    def _record_result(
+        self,
+        state: State,
+        context: ExecutionContext,
+        thread_info: Dict[str, Any],
+        thread_input: Optional[Dict[str, Any]],
+        group_context: Optional[Dict[str, Any]],
+        label: str,
+        response: Any,
+        extracted: Dict[str, Any],
+        timing_ns: int,
+        cpu: Optional[int] = None,
+        timeline: Timeline = NULL_TIMELINE,
+        send_start_ns: Optional[int] = None,
+    ) -> RaceResult:
+        """
+        Store a thread's outcome in the context, log it and build its RaceResult.
+
+        Returns:
+            RaceResult for the thread
+        """
+        thread_id = thread_info["id"]
+
+        item: Dict[str, Any] = {"thread": thread_info}
+        if group_context is not None:
+            item["group"] = group_context
+        item["status"] = response.status_code
+        item["timing_ms"] = timing_ns / 1_000_000
+        if timeline is not NULL_TIMELINE:
+            item["timeline"] = timeline.as_dict()
+        context.set_list_item(state.name, thread_id, {**item, **extracted})
+
+        logger.info(
+            f"{label} Status: {response.status_code}, "
+            f"Time: {timing_ns/1_000_000:.2f}ms"
+        )
+
+        self._log_thread_leave(
+            state, context, thread_info, thread_input, response, timing_ns, group_context
+        )
+
+        return RaceResult(
+            thread_id=thread_id,
+            status=response.status_code,
+            extracted=extracted,
+            timing_ns=timing_ns,
+            cpu=cpu,
+            timeline=timeline.as_dict(),
+            send_start_ns=send_start_ns,
+            group=group_context["name"] if group_context is not None else "",
+        )
+
+    def _execute_processes(
+        self,
+        state: State,
+        context: ExecutionContext,
+        race_config: RaceConfig,
+        assignments: List[Dict[str, Any]],
+        input_distributor: Optional[InputDistributor],
+    ) -> List[RaceResult]:
+        """
+        Execute the race sharded across worker processes.
+
+        Used when race.engine is "processes". Requests are rendered here,
+        then each worker process gets a round-robin shard of threads. All
+        threads are released together through a shared-memory spin flag,
+        and status and timing come back through shared arrays.
+
+        Args:
+            state: Race state
+            context: Execution context
+            race_config: Race configuration
+            assignments: Thread assignments (group is None in legacy mode)
+            input_distributor: Optional input distributor (legacy mode)
+
+        Returns:
+            List of RaceResult from all threads
+        """
+        num_threads = len(assignments)
+        num_processes = min(race_config.processes or default_process_count(num_threads), num_threads)
+
+        bypass_proxy = state.should_bypass_proxy()
+        if bypass_proxy:
+            logger.info(f"Proxy bypass enabled for state: {state.name}")
+
+        # Initialize context list for this state
+        context.reserve_list(state.name, num_threads)
+
+        shards = [
+            ShardConfig(
+                target=self.http_client.config,
+                connection_strategy=race_config.connection_strategy,
+                send_engine=race_config.send_engine,
+                warmup=race_config.warmup,
+                warmup_path=race_config.warmup_path,
+                bypass_proxy=bypass_proxy,
+                extract=state.extract_plan or state.extract,
+                keep_responses=bool(state.logger.on_thread_leave),
+                cpu_affinity=race_config.cpu_affinity,
+                scheduling=race_config.scheduling,
+                timeline=race_config.timeline,
+                kernel_timestamps=race_config.kernel_timestamps,
+                body_limit=state.response.body_limit,
+                log_level=get_level_name(),
+            )
+            for _ in range(num_processes)
+        ]
+
+        # Render every request up front; workers only connect and send
+        described: Dict[int, Tuple[Any, ...]] = {}
+        timelines: Dict[int, Timeline] = {}
+        race_results: List[RaceResult] = []
+
+        for i, assignment in enumerate(assignments):
+            thread_id = assignment['global_id']
+            thread_info, thread_input, group_context, label = self._describe_assignment(
+                assignment, num_threads, input_distributor
+            )
+            described[thread_id] = (thread_info, thread_input, group_context, label)
+            timelines[thread_id] = create_timeline(race_config.timeline)
+
+            try:
+                request = self._render_assignment(
+                    assignment, state, context, thread_info, thread_input, group_context,
+                    timelines[thread_id],
+                )
+            except Exception as e:
+                logger.error(f"{label} ERROR: {str(e)}")
+                race_results.append(
+                    RaceResult(thread_id=thread_id, status=0, extracted={}, timing_ns=0, error=str(e))
+                )
+                continue
+
+            group = assignment['group']
+            shards[i % num_processes].threads.append(
+                ShardThread(
+                    thread_id=thread_id,
+                    request=request,
+                    offset_ns=group.offset_ns if group is not None else None,
+                )
+            )
+
+        shards = [shard for shard in shards if shard.threads]
+        logger.info(f"\nStarting {num_threads} threads across {len(shards)} processes...\n")
+
+        shared, extras = run_sharded_race(shards, release_time=self.release_time)
+
+        logger.info("\n⚡ ALL THREADS RELEASED ⚡\n")
+
+        for shard in shards:
+            for shard_thread in shard.threads:
+                thread_id = shard_thread.thread_id
+                thread_info, thread_input, group_context, label = described[thread_id]
+                extra = extras.get(thread_id, {"error": "worker process failed"})
+                # perf_counter_ns() is the system-wide monotonic clock, so
+                # worker timestamps line up with the ones taken here
+                timeline = timelines[thread_id]
+                timeline.update(extra.get("timeline"))
+
+                if extra.get("error"):
+                    logger.error(f"{label} ERROR: {extra['error']}")
+                    race_results.append(
+                        RaceResult(
+                            thread_id=thread_id, status=0, extracted={}, timing_ns=0,
+                            error=extra["error"], timeline=timeline.as_dict(),
+                        )
+                    )
+                    continue
+
+                response = extra.get("response") or RawResponse(status_code=shared.status[thread_id])
+                result = self._record_result(
+                    state, context, thread_info, thread_input, group_context, label,
+                    response, extra.get("extracted", {}), shared.timing_ns[thread_id],
+                    cpu=extra.get("cpu"), timeline=timeline, send_start_ns=extra.get("send_start_ns"),
+                )
+                result.tx_timestamp_ns = extra.get("tx_timestamp_ns")
+                result.rx_timestamp_ns = extra.get("rx_timestamp_ns")
+                result.unstaged = extra.get("unstaged", False)
+                if shard_thread.offset_ns is not None:
+                    result.target_offset_ns = shard_thread.offset_ns
+                    result.send_offset_ns = extra.get("send_offset_ns")
+                race_results.append(result)
+
+        return race_results
+
     def _log_thread_enter(
         self,
         state: State,
@@ -8,6 +8,16 @@ timing analysis, vulnerability assessment, and context aggregation.
 import logging
 from typing import Any, Dict, List, TYPE_CHECKING
 
+from treco.orchestrator.dispersion import (
+    EXCELLENT_SPREAD_NS,
+    GOOD_SPREAD_NS,
+    Dispersion,
+    analyze_dispersion,
+    kernel_timestamped,
+)
+from treco.orchestrator.rounds import summarize_round
+from treco.orchestrator.timeline import PHASES, phase_durations
+
 if TYPE_CHECKING:
     from treco.models import ExecutionContext
     from treco.orchestrator.race_executor import RaceResult
@@ -15,13 +25,25 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Width of the longest send-start histogram bar
+HISTOGRAM_WIDTH = 40
+
+
+def _format_ns(value_ns: float) -> str:
+    """Format a duration in μs, or in ms from one millisecond up."""
+    if value_ns >= 1_000_000:
+        return f"{value_ns / 1_000_000:.2f}ms"
+    return f"{value_ns / 1000:.1f}μs"
+
 
 class ResultAnalyzer:
     """
     Analyzes race attack results and manages context propagation.
 
     Provides:
-    - Timing analysis (average, min, max, race window)
+    - Timing analysis (average, min, max response time)
+    - Race window from the spread of send starts (percentiles, histogram,
+      per thread group)
     - Success/failure counting
     - Vulnerability assessment
     - Context aggregation for parallel propagation
@@ -54,6 +76,12 @@ class ResultAnalyzer:
         # Timing analysis
         if successful:
             self._analyze_timing(successful)
+            self._analyze_cpus(successful)
+
+        self._analyze_dispersion(results)
+        self._analyze_offsets(results)
+        self._analyze_timeline(results)
+        self._analyze_rounds(results)
 
         # Vulnerability analysis
         # self._analyze_vulnerability(successful)
@@ -61,26 +89,155 @@ class ResultAnalyzer:
         logger.info(f"\n{'='*70}\n")
 
     def _analyze_timing(self, successful: List["RaceResult"]) -> None:
-        """Analyze timing of successful requests."""
+        """Analyze response times of successful requests."""
         timings_ms = [r.timing_ns / 1_000_000 for r in successful]
         avg_timing = sum(timings_ms) / len(timings_ms)
         min_timing = min(timings_ms)
         max_timing = max(timings_ms)
-        race_window_ms = max_timing - min_timing
 
         logger.info("\nTiming Analysis:")
         logger.info(f"  Average response time: {avg_timing:.2f}ms")
         logger.info(f"  Fastest response: {min_timing:.2f}ms")
         logger.info(f"  Slowest response: {max_timing:.2f}ms")
-        logger.info(f"  Race window: {race_window_ms:.2f}ms")
-
-        # Evaluate race quality
-        if race_window_ms < 1.0:
-            logger.info("  ✓ EXCELLENT race window (< 1ms)")
-        elif race_window_ms < 100.0:
-            logger.info("  ⚠ GOOD race window (< 100ms)")
+        logger.info(f"  Response time spread: {max_timing - min_timing:.2f}ms")
+
+    def _analyze_dispersion(self, results: List["RaceResult"]) -> None:
+        """Log the race window: how far apart requests were actually sent."""
+        overall, by_group = analyze_dispersion(results)
+        if overall is None:
+            return
+
+        kernel = kernel_timestamped(results)
+        source = "kernel TX timestamps" if kernel else "send-start spread"
+        logger.info(f"\nRace Window ({source}):")
+        logger.info(f"  Requests sent: {overall.count}")
+        logger.info(f"  Race window: {_format_ns(overall.spread_ns)}")
+        logger.info(
+            "  Percentiles: "
+            + ", ".join(f"p{p} +{_format_ns(v)}" for p, v in overall.percentiles_ns.items())
+        )
+        self._log_histogram(overall)
+        if kernel:
+            self._log_kernel_latency(results)
+
+        if overall.verdict == "excellent":
+            logger.info(f"  ✓ EXCELLENT race window (< {_format_ns(EXCELLENT_SPREAD_NS)})")
+        elif overall.verdict == "good":
+            logger.info(f"  ⚠ GOOD race window (< {_format_ns(GOOD_SPREAD_NS)})")
         else:
-            logger.info("  ✗ POOR race window (> 100ms)")
+            logger.info(f"  ✗ POOR race window (>= {_format_ns(GOOD_SPREAD_NS)})")
+
+        unstaged = sum(1 for r in results if r.unstaged)
+        if unstaged:
+            logger.warning(
+                f"  ⚠ {unstaged} request(s) not staged (body exceeds the HTTP/2 flow-control "
+                f"window) and sent outside the single packet"
+            )
+
+        if by_group:
+            logger.info("  Thread groups (relative to their intended offset):")
+            for name, dispersion in by_group.items():
+                logger.info(
+                    f"    {name}: {dispersion.count} sent, first +{_format_ns(dispersion.first_ns)}, "
+                    f"window {_format_ns(dispersion.spread_ns)}, "
+                    f"p99 +{_format_ns(dispersion.percentiles_ns[99])}"
+                )
+
+    def _log_kernel_latency(self, results: List["RaceResult"]) -> None:
+        """Log the median time from kernel TX to kernel RX timestamp."""
+        latencies = sorted(
+            r.rx_timestamp_ns - r.tx_timestamp_ns
+            for r in results
+            if r.tx_timestamp_ns is not None and r.rx_timestamp_ns is not None
+        )
+        if latencies:
+            logger.info(f"  Kernel TX→RX (median): {_format_ns(latencies[len(latencies) // 2])}")
+
+    def _log_histogram(self, dispersion: Dispersion) -> None:
+        """Log the send-start histogram as text bars."""
+        if dispersion.count < 2 or not dispersion.spread_ns:
+            return
+
+        bin_ns = dispersion.spread_ns / len(dispersion.histogram)
+        peak = max(dispersion.histogram)
+        logger.info(f"  Histogram ({_format_ns(bin_ns)} bins):")
+        for index, count in enumerate(dispersion.histogram):
+            bar = "█" * max(1 if count else 0, count * HISTOGRAM_WIDTH // peak)
+            start = "+" + _format_ns(index * bin_ns)
+            logger.info(f"    {start:>10} {bar} {count}")
+
+    def _analyze_cpus(self, successful: List["RaceResult"]) -> None:
+        """Log on which CPUs requests were sent, with their response times."""
+        by_cpu: Dict[int, List[float]] = {}
+        for result in successful:
+            if result.cpu is not None:
+                by_cpu.setdefault(result.cpu, []).append(result.timing_ns / 1_000_000)
+
+        if not by_cpu:
+            return
+
+        logger.info(f"\nSend CPUs ({len(by_cpu)} distinct):")
+        for cpu in sorted(by_cpu):
+            timings_ms = by_cpu[cpu]
+            logger.info(
+                f"  CPU {cpu}: {len(timings_ms)} threads, "
+                f"avg {sum(timings_ms) / len(timings_ms):.2f}ms, max {max(timings_ms):.2f}ms"
+            )
+
+    def _analyze_offsets(self, results: List["RaceResult"]) -> None:
+        """Compare intended and actual send offsets of thread groups."""
+        by_target: Dict[int, List[int]] = {}
+        for result in results:
+            if result.target_offset_ns is not None and result.send_offset_ns is not None:
+                by_target.setdefault(result.target_offset_ns, []).append(result.send_offset_ns)
+
+        if not by_target:
+            return
+
+        logger.info("\nSend offsets (intended → actual):")
+        for target in sorted(by_target):
+            actual = by_target[target]
+            error_us = max(abs(offset - target) for offset in actual) / 1000
+            logger.info(
+                f"  {target / 1000:.1f}μs → avg {sum(actual) / len(actual) / 1000:.1f}μs "
+                f"over {len(actual)} threads, max error {error_us:.1f}μs"
+            )
+
+    def _analyze_timeline(self, results: List["RaceResult"]) -> None:
+        """Log median and maximum time spent between phases (race.timeline)."""
+        by_step: Dict[str, List[int]] = {}
+        for result in results:
+            if result.timeline:
+                for step, duration_ns in phase_durations(result.timeline).items():
+                    by_step.setdefault(step, []).append(duration_ns)
+
+        if not by_step:
+            return
+
+        logger.info("\nPhase timeline (median / max):")
+        for step in sorted(by_step, key=lambda step: PHASES.index(step.split("->")[0])):
+            durations = sorted(by_step[step])
+            logger.info(
+                f"  {step}: {durations[len(durations) // 2] / 1000:.1f}μs / "
+                f"{durations[-1] / 1000:.1f}μs over {len(durations)} threads"
+            )
+
+    def _analyze_rounds(self, results: List["RaceResult"]) -> None:
+        """Log successes and race window of each round (race.rounds)."""
+        by_round: Dict[int, List["RaceResult"]] = {}
+        for result in results:
+            by_round.setdefault(result.round, []).append(result)
+
+        if len(by_round) < 2:
+            return
+
+        logger.info(f"\nRounds ({len(by_round)} fired):")
+        for number in sorted(by_round):
+            stats = summarize_round(number, by_round[number])
+            logger.info(
+                f"  Round {number}: {stats.successful}/{stats.total} successful, "
+                f"window {stats.window_ms:.2f}ms"
+            )
 
     def _analyze_vulnerability(self, successful: List["RaceResult"]) -> None:
         """Analyze potential vulnerability based on results."""
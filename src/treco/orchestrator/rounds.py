@@ -0,0 +1,213 @@
+"""
+Multi-round race campaigns (race.rounds).
+
+A race state can fire its requests several times in a row. Connections,
+rendered requests and race threads are set up once; after each send the
+threads meet at the end of the round, where the last one to arrive
+summarizes the round, checks the stop condition (race.until), re-arms the
+race sync and waits out race.round_delay_ms before the next round.
+
+Results are stored in one preallocated slot per thread and round, indexed
+by thread id. A single-round race records results without taking a lock:
+each thread writes only its own slot.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+if TYPE_CHECKING:
+    from treco.orchestrator.race_executor import RaceResult
+    from treco.sync.base import SyncMechanism
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RoundStats:
+    """Summary of one race round."""
+
+    number: int
+    total: int
+    successful: int
+    failed: int
+    window_ms: float
+
+
+def summarize_round(number: int, results: List["RaceResult"]) -> RoundStats:
+    """
+    Summarize the results of one round.
+
+    Args:
+        number: Round number (1-based)
+        results: Results of every thread in the round
+
+    Returns:
+        RoundStats, with the race window as the spread of send starts
+        (corrected by thread group offsets)
+    """
+    successful = sum(1 for r in results if r.status == 200)
+    starts = [r.send_start_ns - (r.target_offset_ns or 0) for r in results if r.send_start_ns is not None]
+    return RoundStats(
+        number=number,
+        total=len(results),
+        successful=successful,
+        failed=len(results) - successful,
+        window_ms=(max(starts) - min(starts)) / 1_000_000 if starts else 0.0,
+    )
+
+
+class RaceRounds:
+    """
+    Collects race results and coordinates threads between rounds.
+
+    Every thread reports each result with complete(), which blocks until
+    all threads finished the round and tells whether another round follows.
+    A thread that cannot take part anymore calls leave() instead, so the
+    others do not wait for it. Thread ids must be below num_threads.
+
+    Example:
+        rounds = RaceRounds(rounds=10, num_threads=20, race_sync=sync, until=stop)
+
+        # In each race thread, after setup:
+        while True:
+            sync.wait(thread_id)
+            result = send()
+            if not rounds.complete(result):
+                break
+    """
+
+    def __init__(
+        self,
+        rounds: int,
+        num_threads: int,
+        race_sync: "SyncMechanism",
+        until: Optional[Callable[[RoundStats], bool]] = None,
+        delay_ms: float = 0.0,
+    ):
+        """
+        Initialize the campaign.
+
+        Args:
+            rounds: Maximum number of rounds
+            num_threads: Number of race threads
+            race_sync: Race sync mechanism, prepared again before each round
+            until: Stop condition, checked after each round
+            delay_ms: Pause between rounds
+        """
+        self.rounds = rounds
+        self.race_sync = race_sync
+        self.until = until
+        self.delay_ms = delay_ms
+        self.stats: List[RoundStats] = []
+        self.number = 1
+        self.stopped = False
+        self._num_threads = num_threads
+        self._slots: List[List[Optional["RaceResult"]]] = [[None] * num_threads]
+        self._active = num_threads
+        self._arrived = 0
+        self._cond = threading.Condition()
+
+    def complete(self, result: "RaceResult") -> bool:
+        """
+        Record a thread's result and wait for the rest of the round.
+
+        Args:
+            result: Result of the calling thread for the current round
+
+        Returns:
+            True if the thread should fire again in a next round
+        """
+        if self.rounds == 1:
+            self._record(result)
+            return False
+
+        with self._cond:
+            self._record(result)
+            number = self.number
+            self._arrived += 1
+            if self._arrived < self._active:
+                while number == self.number and not self.stopped:
+                    self._cond.wait()
+                return not self.stopped
+            stats = self._summarize()
+
+        self._close_round(stats)
+        return not self.stopped
+
+    def leave(self, result: "RaceResult") -> None:
+        """
+        Record a thread's final result and stop waiting for it.
+
+        Args:
+            result: Result (usually the error) of the calling thread
+        """
+        if self.rounds == 1:
+            self._record(result)
+            return
+
+        with self._cond:
+            self._record(result)
+            self._active -= 1
+            if not self._active or self._arrived != self._active:
+                return
+            stats = self._summarize()
+
+        self._close_round(stats)
+
+    @property
+    def results(self) -> List["RaceResult"]:
+        """Results of every round, by round and thread id (read once threads finished)."""
+        return [result for slots in self._slots for result in slots if result is not None]
+
+    def _record(self, result: "RaceResult") -> None:
+        result.round = self.number
+        self._slots[-1][result.thread_id] = result
+
+    def _summarize(self) -> RoundStats:
+        """Summarize the round every thread has arrived at (lock held)."""
+        stats = summarize_round(self.number, [result for result in self._slots[-1] if result is not None])
+        self.stats.append(stats)
+        return stats
+
+    def _close_round(self, stats: RoundStats) -> None:
+        """
+        Decide whether another round follows, then arm it and wake the threads.
+
+        Runs without the lock, so the stop condition and the pause between
+        rounds do not block the lock; the other threads keep waiting for the
+        round number to change.
+        """
+        logger.info(
+            f"Round {stats.number}/{self.rounds}: {stats.successful} successful, "
+            f"{stats.failed} failed, window {stats.window_ms:.2f}ms"
+        )
+
+        stop = stats.number >= self.rounds or self._until_met(stats)
+        if not stop and self.delay_ms > 0:
+            time.sleep(self.delay_ms / 1000.0)
+
+        with self._cond:
+            if stop:
+                self.stopped = True
+            else:
+                self.race_sync.prepare(self._active)
+                self.number += 1
+                self._slots.append([None] * self._num_threads)
+            self._arrived = 0
+            self._cond.notify_all()
+
+    def _until_met(self, stats: RoundStats) -> bool:
+        """Evaluate the stop condition; an error counts as not met."""
+        if self.until is None:
+            return False
+        try:
+            met = self.until(stats)
+        except Exception as e:
+            logger.error(f"Stop condition failed after round {stats.number}: {e}")
+            return False
+        if met:
+            logger.info(f"Stop condition met after round {stats.number}")
+        return bool(met)
@@ -0,0 +1,181 @@
+"""
+Per-thread phase timeline (race.timeline).
+
+With race.timeline enabled, every race thread records when each phase of
+its request happened, on the time.perf_counter_ns() clock (monotonic and
+shared by all threads and worker processes of the machine):
+
+    render_ns         rendering of the request template starts
+    parse_ns          parsing of the rendered HTTP text starts
+    connect_ns        connection setup starts
+    sync_arrival_ns   the thread arrives at the race sync point
+    sync_release_ns   the thread leaves the race sync point
+    first_write_ns    the release write of the request reached the socket
+    first_byte_ns     the response headers were received
+    complete_ns       the response body is complete
+
+Write and response timestamps come from the httpcore trace extension
+(request.extensions["trace"]), which the raw send engine and the
+single_packet strategy emit as well. When the timeline is disabled workers
+get NULL_TIMELINE, whose methods do nothing, and no trace hook is installed.
+"""
+
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+import httpx
+
+PHASES = (
+    "render",
+    "parse",
+    "connect",
+    "sync_arrival",
+    "sync_release",
+    "first_write",
+    "first_byte",
+    "complete",
+)
+
+# Trace events ending the first write of a request (HTTP/1.1 and HTTP/2)
+_WRITE_EVENTS = (
+    ".send_request_headers.complete",
+    ".send_request_body.complete",
+)
+_FIRST_BYTE_EVENT = ".receive_response_headers.complete"
+
+
+@dataclass
+class Timeline:
+    """
+    Phase timestamps of one race thread (one round).
+
+    Example:
+        timeline = Timeline()
+        timeline.mark("render")
+        ...
+        timeline.attach(request)
+        response = client.send(request)
+        timeline.mark("complete")
+        result.timeline = timeline.as_dict()
+    """
+
+    render_ns: Optional[int] = None
+    parse_ns: Optional[int] = None
+    connect_ns: Optional[int] = None
+    sync_arrival_ns: Optional[int] = None
+    sync_release_ns: Optional[int] = None
+    first_write_ns: Optional[int] = None
+    first_byte_ns: Optional[int] = None
+    complete_ns: Optional[int] = None
+
+    def mark(self, phase: str) -> None:
+        """
+        Record the current time for a phase.
+
+        Args:
+            phase: Phase name from PHASES (e.g. "render")
+        """
+        setattr(self, f"{phase}_ns", time.perf_counter_ns())
+
+    def next_round(self) -> "Timeline":
+        """Return a timeline for the next send, keeping the setup phases."""
+        return Timeline(render_ns=self.render_ns, parse_ns=self.parse_ns, connect_ns=self.connect_ns)
+
+    def attach(self, request: httpx.Request, asynchronous: bool = False) -> None:
+        """
+        Install the trace hook on a request.
+
+        Args:
+            request: Request about to be sent
+            asynchronous: Request is sent by an httpx.AsyncClient
+        """
+        request.extensions["trace"] = self.atrace if asynchronous else self.trace
+
+    def trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """
+        httpcore trace callback.
+
+        info may carry "timestamp_ns" when the event happened earlier than
+        the callback (e.g. a write shared by several streams).
+        """
+        now = info.get("timestamp_ns") or time.perf_counter_ns()
+        if self.first_write_ns is None and event_name.endswith(_WRITE_EVENTS):
+            self.first_write_ns = now
+        elif self.first_byte_ns is None and event_name.endswith(_FIRST_BYTE_EVENT):
+            self.first_byte_ns = now
+
+    async def atrace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """httpcore trace callback for async clients."""
+        self.trace(event_name, info)
+
+    def update(self, timestamps: Optional[Dict[str, Optional[int]]]) -> None:
+        """
+        Copy the recorded timestamps of another timeline.
+
+        Args:
+            timestamps: Timeline.as_dict() of the same thread, e.g. recorded
+                        in a worker process
+        """
+        for name, value in (timestamps or {}).items():
+            if value is not None:
+                setattr(self, name, value)
+
+    def as_dict(self) -> Optional[Dict[str, Optional[int]]]:
+        """Return the timestamps by field name (None when disabled)."""
+        return asdict(self)
+
+
+class _NullTimeline(Timeline):
+    """Timeline that records nothing, used when race.timeline is off."""
+
+    def mark(self, phase: str) -> None:
+        pass
+
+    def next_round(self) -> "Timeline":
+        return self
+
+    def attach(self, request: httpx.Request, asynchronous: bool = False) -> None:
+        pass
+
+    def update(self, timestamps: Optional[Dict[str, Optional[int]]]) -> None:
+        pass
+
+    def as_dict(self) -> Optional[Dict[str, Optional[int]]]:
+        return None
+
+
+NULL_TIMELINE: Timeline = _NullTimeline()
+
+
+def create_timeline(enabled: bool) -> Timeline:
+    """
+    Return a new timeline, or NULL_TIMELINE when disabled.
+
+    Args:
+        enabled: Value of race.timeline
+    """
+    return Timeline() if enabled else NULL_TIMELINE
+
+
+def phase_durations(timeline: Dict[str, Optional[int]]) -> Dict[str, int]:
+    """
+    Turn timestamps into the time spent between consecutive phases.
+
+    Args:
+        timeline: Timestamps as returned by Timeline.as_dict()
+
+    Returns:
+        Durations in ns keyed by "<phase>-><next phase>", for phases that
+        were both recorded
+    """
+    durations: Dict[str, int] = {}
+    previous: Optional[str] = None
+    for phase in PHASES:
+        value = timeline.get(f"{phase}_ns")
+        if value is None:
+            continue
+        if previous is not None:
+            durations[f"{previous}->{phase}"] = value - timeline[f"{previous}_ns"]
+        previous = phase
+    return durations
@@ -0,0 +1,241 @@
+"""
+Automatic tuning of race parameters (treco --tune).
+
+Runs one race state with different threads, connection_strategy and
+sync_mechanism values and keeps the configuration that gets the most
+successful requests at an acceptable error rate, with the smallest release
+skew. Every trial is a complete RaceCoordinator run, so states before the
+race (login, setup) run again and feed it as usual.
+
+Search:
+1. Every connection strategy x sync mechanism at the configured thread count
+2. With the best pair, bisect the thread count between the configured value
+   and max_threads for the largest count that keeps the error rate low
+"""
+
+import itertools
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import yaml
+
+from treco.connection.transport import clear_ssl_contexts
+from treco.models import Config
+from treco.parser import YAMLLoader
+
+from .coordinator import RaceCoordinator
+from .rounds import summarize_round
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STRATEGIES = ("preconnect", "last_byte")
+DEFAULT_SYNC_MECHANISMS = ("barrier", "spin_barrier", "hybrid")
+
+# Stop bisecting once the thread range is this fraction of its lower end
+BISECT_RESOLUTION = 0.1
+
+
+@dataclass
+class TrialResult:
+    """Outcome of one tuning trial."""
+
+    threads: int
+    connection_strategy: str
+    sync_mechanism: str
+    total: int = 0
+    successful: int = 0
+    errors: int = 0
+    skew_ns: Optional[int] = None
+    window_ms: float = 0.0
+    failure: str = ""
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of requests that failed (1.0 if the trial itself failed)."""
+        if self.failure or not self.total:
+            return 1.0
+        return self.errors / self.total
+
+    def describe(self) -> str:
+        """One-line summary."""
+        label = f"threads={self.threads} {self.connection_strategy}/{self.sync_mechanism}"
+        if self.failure:
+            return f"{label}: failed ({self.failure})"
+        skew = f"{self.skew_ns / 1000:.1f}μs" if self.skew_ns is not None else "n/a"
+        return (
+            f"{label}: {self.successful}/{self.total} successful, "
+            f"errors {self.error_rate:.0%}, skew {skew}, window {self.window_ms:.2f}ms"
+        )
+
+
+class RaceTuner:
+    """
+    Searches race parameters for one race state.
+
+    Example:
+        tuner = RaceTuner("attack.yaml", state_name="race", max_threads=100)
+        best = tuner.run()
+        print(tuner.overlay(best))
+    """
+
+    def __init__(
+        self,
+        config_path: str,
+        cli_inputs: Optional[Dict[str, Any]] = None,
+        state_name: Optional[str] = None,
+        strategies: Sequence[str] = DEFAULT_STRATEGIES,
+        sync_mechanisms: Sequence[str] = DEFAULT_SYNC_MECHANISMS,
+        max_threads: int = 0,
+        rounds: int = 3,
+        max_error_rate: float = 0.05,
+    ):
+        """
+        Initialize the tuner.
+
+        Args:
+            config_path: Path to YAML configuration file
+            cli_inputs: Command-line input variables (as for RaceCoordinator)
+            state_name: Race state to tune (default: the first race state)
+            strategies: Connection strategies to try
+            sync_mechanisms: Sync mechanisms to try
+            max_threads: Upper bound of the thread count search
+                         (default: 4x the configured threads)
+            rounds: Rounds fired per trial (race.rounds)
+            max_error_rate: Highest acceptable fraction of failed requests
+
+        Raises:
+            ValueError: If the state cannot be tuned
+        """
+        self.config_path = config_path
+        self.cli_inputs = cli_inputs or {}
+        self.strategies = list(strategies)
+        self.sync_mechanisms = list(sync_mechanisms)
+        self.rounds = rounds
+        self.max_error_rate = max_error_rate
+        self.trials: List[TrialResult] = []
+
+        config = YAMLLoader().load(config_path)
+        self.state_name = state_name or self._first_race_state(config)
+
+        state = config.states.get(self.state_name)
+        if state is None or state.race is None:
+            raise ValueError(f"State '{self.state_name}' is not a race state")
+        if state.race.engine != "threads":
+            raise ValueError("Tuning requires race.engine 'threads'")
+        if state.race.thread_groups:
+            raise ValueError("Tuning does not support thread_groups")
+
+        self.base_threads = state.race.threads
+        self.max_threads = max(max_threads or 4 * self.base_threads, self.base_threads)
+
+    @staticmethod
+    def _first_race_state(config: Config) -> str:
+        for name, state in config.states.items():
+            if state.race is not None:
+                return name
+        raise ValueError("Configuration has no race state to tune")
+
+    def run(self) -> TrialResult:
+        """
+        Run the search.
+
+        Returns:
+            Best trial
+        """
+        logger.info(
+            f"[Tuner] Tuning '{self.state_name}': {len(self.strategies)} strategies x "
+            f"{len(self.sync_mechanisms)} sync mechanisms, threads {self.base_threads}-{self.max_threads}"
+        )
+
+        matrix = [
+            self._trial(self.base_threads, strategy, mechanism)
+            for strategy, mechanism in itertools.product(self.strategies, self.sync_mechanisms)
+        ]
+        best = min(matrix, key=self._rank)
+
+        if self._acceptable(best) and self.max_threads > best.threads:
+            best = self._bisect_threads(best)
+
+        logger.info(f"[Tuner] Best: {best.describe()}")
+        return best
+
+    def overlay(self, best: TrialResult) -> str:
+        """
+        Render the winning parameters as a YAML overlay of the config.
+
+        Args:
+            best: Trial returned by run()
+
+        Returns:
+            YAML text with the race settings of the tuned state
+        """
+        race = {
+            "threads": best.threads,
+            "connection_strategy": best.connection_strategy,
+            "sync_mechanism": best.sync_mechanism,
+        }
+        return yaml.safe_dump({"states": {self.state_name: {"race": race}}}, sort_keys=False)
+
+    def _acceptable(self, trial: TrialResult) -> bool:
+        return trial.error_rate <= self.max_error_rate
+
+    def _rank(self, trial: TrialResult) -> Tuple[bool, int, float, float]:
+        """Sort key: acceptable first, then most successes, lowest skew, narrowest window."""
+        skew = trial.skew_ns if trial.skew_ns is not None else float("inf")
+        return (not self._acceptable(trial), -trial.successful, skew, trial.window_ms)
+
+    def _bisect_threads(self, best: TrialResult) -> TrialResult:
+        """Find the largest acceptable thread count for the best strategy/sync pair."""
+        strategy, mechanism = best.connection_strategy, best.sync_mechanism
+
+        top = self._trial(self.max_threads, strategy, mechanism)
+        if self._acceptable(top):
+            return top
+
+        low, high = best.threads, self.max_threads
+        while high - low > max(1, int(low * BISECT_RESOLUTION)):
+            middle = (low + high) // 2
+            trial = self._trial(middle, strategy, mechanism)
+            if self._acceptable(trial):
+                low, best = middle, trial
+            else:
+                high = middle
+        return best
+
+    def _trial(self, threads: int, strategy: str, mechanism: str) -> TrialResult:
+        """Run the attack once with the given race parameters."""
+        trial = TrialResult(threads, strategy, mechanism)
+
+        try:
+            coordinator = RaceCoordinator(self.config_path, self.cli_inputs)
+            race = coordinator.config.states[self.state_name].race
+            race.threads = threads
+            race.connection_strategy = strategy
+            race.sync_mechanism = mechanism
+            race.rounds = self.rounds
+            race.until = ""
+
+            # Every trial starts cold: no context or session left by the previous one
+            clear_ssl_contexts()
+            coordinator.run()
+
+            results = coordinator.race_results.get(self.state_name, [])
+            windows = [
+                summarize_round(number, [r for r in results if r.round == number]).window_ms
+                for number in sorted({r.round for r in results})
+            ]
+            stats = summarize_round(0, results)
+            trial.total = stats.total
+            trial.successful = stats.successful
+            trial.errors = sum(1 for r in results if r.error or r.status == 0)
+            trial.skew_ns = coordinator.race_executor.release_skew_ns
+            trial.window_ms = sum(windows) / len(windows) if windows else 0.0
+            if not results:
+                trial.failure = f"state '{self.state_name}' was not reached"
+        except Exception as e:
+            trial.failure = str(e)
+
+        logger.info(f"[Tuner] {trial.describe()}")
+        self.trials.append(trial)
+        return trial
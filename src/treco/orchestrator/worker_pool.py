@@ -0,0 +1,162 @@
+"""
+Persistent race worker pool.
+
+Race threads are spawned once, when the coordinator starts, and park
+between races. Each race hands its work items to already-running workers,
+so thread creation is neither part of race setup time nor of the order in
+which threads reach the barrier.
+"""
+
+import logging
+import queue
+import threading
+from typing import Any, Callable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# threading.stack_size() rejects anything smaller
+MIN_STACK_SIZE_KB = 32
+
+
+class _Batch:
+    """Work items of one run() call and their results."""
+
+    def __init__(self, size: int):
+        self.results: List[Any] = [None] * size
+        self.errors: List[BaseException] = []
+        self.remaining = size
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+        if size == 0:
+            self.done.set()
+
+    def finish(self, index: int, result: Any, error: Optional[BaseException]) -> None:
+        with self.lock:
+            self.results[index] = result
+            if error is not None:
+                self.errors.append(error)
+            self.remaining -= 1
+            if self.remaining == 0:
+                self.done.set()
+
+
+class _Worker:
+    """One parked thread with its own inbox."""
+
+    def __init__(self, name: str):
+        self.inbox: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self.thread = threading.Thread(target=self._loop, name=name, daemon=True)
+        self.thread.start()
+
+    def _loop(self) -> None:
+        while True:
+            item = self.inbox.get()
+            if item is None:
+                return
+            batch, index, task = item
+            try:
+                result = task()
+            except BaseException as e:
+                batch.finish(index, None, e)
+            else:
+                batch.finish(index, result, None)
+
+
+class RaceWorkerPool:
+    """
+    Long-lived pool of race worker threads.
+
+    Work item N always runs on worker N, and every worker waits on its own
+    queue, so dispatching a race is one queue put per thread. The pool
+    grows when a race needs more threads than it has; those extra threads
+    are then reused too. Concurrent run() calls are serialized, since the
+    tasks of one race usually wait for each other at a barrier.
+
+    Example:
+        pool = RaceWorkerPool(size=500, stack_size_kb=256)
+        results = pool.run([partial(work, i) for i in range(500)])
+        pool.shutdown()
+    """
+
+    def __init__(self, size: int = 0, stack_size_kb: int = 0):
+        """
+        Pre-spawn the workers.
+
+        Args:
+            size: Number of workers to start now
+            stack_size_kb: Stack size of worker threads in KiB
+                           (0: interpreter default)
+
+        Raises:
+            ValueError: If the stack size is too small
+        """
+        if stack_size_kb and stack_size_kb < MIN_STACK_SIZE_KB:
+            raise ValueError(f"Worker stack size must be at least {MIN_STACK_SIZE_KB} KiB")
+        self.stack_size = stack_size_kb * 1024
+        self._workers: List[_Worker] = []
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()
+        self.ensure(size)
+
+    @property
+    def size(self) -> int:
+        """Number of running workers."""
+        return len(self._workers)
+
+    def ensure(self, count: int) -> None:
+        """
+        Grow the pool to at least count workers.
+
+        Args:
+            count: Minimum number of workers
+        """
+        with self._lock:
+            missing = count - len(self._workers)
+            if missing <= 0:
+                return
+
+            previous = threading.stack_size(self.stack_size) if self.stack_size else None
+            try:
+                for _ in range(missing):
+                    self._workers.append(_Worker(f"treco-race-{len(self._workers)}"))
+            finally:
+                if previous is not None:
+                    threading.stack_size(previous)
+
+            logger.info(f"[RaceWorkerPool] {len(self._workers)} workers ready")
+
+    def run(self, tasks: Sequence[Callable[[], Any]]) -> List[Any]:
+        """
+        Run one task per worker and wait for all of them.
+
+        Args:
+            tasks: Callables to run concurrently
+
+        Returns:
+            Return values, in task order
+
+        Raises:
+            Exception: The first exception raised by a task, once all
+                       tasks have finished
+        """
+        with self._run_lock:
+            self.ensure(len(tasks))
+            batch = _Batch(len(tasks))
+
+            for index, task in enumerate(tasks):
+                self._workers[index].inbox.put((batch, index, task))
+
+            batch.done.wait()
+
+        if batch.errors:
+            raise batch.errors[0]
+        return batch.results
+
+    def shutdown(self) -> None:
+        """Stop and join every worker."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.inbox.put(None)
+        for worker in workers:
+            worker.thread.join()
@@ -4,14 +4,17 @@ YAML configuration loader.
 Loads YAML files and converts them into typed Config objects.
 """
 
+import jinja2
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
 import logging
 
-from treco.models.config import ExtractPattern, HTTPConfig, ProxyAuth, ProxyConfig, StateOptions
+from treco.http.extractor import ExtractPlan, UnknownExtractorError
+from treco.models.config import ExtractPattern, HTTPConfig, ProxyAuth, ProxyConfig, ResponseConfig, SocketConfig, StateOptions, WorkerPoolConfig
 from treco.template.engine import TemplateEngine
+from treco.template.partial import TemplatePlan
 
 from treco.models import (
     Config,
@@ -114,6 +117,7 @@ class YAMLLoader:
             target=self._build_target_config(data["target"]),
             entrypoint=self._build_entrypoint(data["entrypoint"]),
             states=self._build_states(data["states"]),
+            worker_pool=self._build_worker_pool(data.get("worker_pool", {})),
         )
 
     def _build_metadata(self, data: Dict[str, Any]) -> Metadata:
@@ -159,6 +163,16 @@ class YAMLLoader:
                 ) if "auth" in proxy_data else None
             )
 
+        socket_data = data.get("socket", {})
+        socket_config = SocketConfig(
+            nodelay=socket_data.get("nodelay", True),
+            quickack=socket_data.get("quickack", False),
+            sndbuf=socket_data.get("sndbuf", 0),
+            rcvbuf=socket_data.get("rcvbuf", 0),
+            cork=socket_data.get("cork", False),
+            bind=socket_data.get("bind", ""),
+        )
+
         return TargetConfig(
             host=self.engine.render(data["host"], {}),
             port=data["port"],
@@ -167,6 +181,14 @@ class YAMLLoader:
             tls=tls_config,
             http=http_config,
             proxy=proxy_config,
+            socket=socket_config,
+        )
+
+    def _build_worker_pool(self, data: Dict[str, Any]) -> WorkerPoolConfig:
+        """Build WorkerPoolConfig from dictionary."""
+        return WorkerPoolConfig(
+            size=data.get("size", 0),
+            stack_size_kb=data.get("stack_size_kb", 0),
         )
 
     def _build_entrypoint_input(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -271,6 +293,44 @@ class YAMLLoader:
         # This allows for both simple values and complex InputConfig specs
         return data
 
+    def _compile_request(self, state_name: str, request: str) -> Optional[TemplatePlan]:
+        """
+        Split a race request template into thread-invariant and per-thread parts.
+
+        Args:
+            state_name: Name of the state (for logging)
+            request: Request template
+
+        Returns:
+            TemplatePlan, or None if the template does not compile (the
+            error is then reported when threads render it)
+        """
+        try:
+            return self.engine.compile_plan(request)
+        except jinja2.TemplateError as e:
+            logger.debug(f"State '{state_name}' request not precompiled: {e}")
+            return None
+
+    def _compile_extracts(self, state_name: str, extracts: Dict[str, ExtractPattern]) -> Optional[ExtractPlan]:
+        """
+        Compile the extract patterns of a state once.
+
+        Args:
+            state_name: Name of the state (for logging)
+            extracts: Extract patterns of the state
+
+        Returns:
+            ExtractPlan, or None if the state extracts nothing or uses an
+            unknown extractor (the error is then reported on extraction)
+        """
+        if not extracts:
+            return None
+        try:
+            return ExtractPlan(extracts)
+        except UnknownExtractorError as e:
+            logger.debug(f"State '{state_name}' extracts not precompiled: {e}")
+            return None
+
     def _build_state(self, name: str, data: Dict[str, Any]) -> State:
         """Build a single State object."""
         # Build transitions
@@ -333,7 +393,10 @@ class YAMLLoader:
                         delay_ms=group_data.get("delay_ms", 0),
                         request=group_data.get("request", ""),
                         variables=group_data.get("variables", {}),
+                        delay_us=group_data.get("delay_us", 0),
+                        delay_ns=group_data.get("delay_ns", 0),
                     )
+                    thread_group.request_plan = self._compile_request(name, thread_group.request)
                     thread_groups.append(thread_group)
             
             race_config = RaceConfig(
@@ -344,6 +407,18 @@ class YAMLLoader:
                 thread_propagation=race_data.get("thread_propagation", "single"),
                 input_mode=race_data.get("input_mode", "same"),
                 thread_groups=thread_groups,
+                send_engine=race_data.get("send_engine", "httpx"),
+                warmup=race_data.get("warmup", "handshake"),
+                warmup_path=race_data.get("warmup_path", "/"),
+                engine=race_data.get("engine", "threads"),
+                processes=race_data.get("processes", 0),
+                cpu_affinity=race_data.get("cpu_affinity"),
+                scheduling=race_data.get("scheduling", "default"),
+                rounds=race_data.get("rounds", 1),
+                round_delay_ms=race_data.get("round_delay_ms", 0),
+                until=race_data.get("until", ""),
+                timeline=race_data.get("timeline", False),
+                kernel_timestamps=race_data.get("kernel_timestamps", False),
             )
 
         # Build extract patterns
@@ -352,6 +427,12 @@ class YAMLLoader:
         # Build state-level input configuration (if present)
         state_input = self._build_state_input(data.get("input", {}))
 
+        response_data = data.get("response", {})
+        response_config = ResponseConfig(
+            read=response_data.get("read", "full"),
+            max_bytes=response_data.get("max_bytes", 65536),
+        )
+
         return State(
             name=name,
             description=data.get("description", ""),
@@ -362,4 +443,7 @@ class YAMLLoader:
             logger=logger_config,
             race=race_config,
             input=state_input,
+            response=response_config,
+            request_plan=self._compile_request(name, data.get("request", "")) if race_config else None,
+            extract_plan=self._compile_extracts(name, extracts),
         )
@@ -4,9 +4,12 @@ Configuration validator.
 Validates YAML structure, required fields, and references.
 """
 
+import ipaddress
+import re
 from typing import Dict, Any, Set
 
 from treco.http.extractor import get_extractor, ExtractorRegistry
+from treco.http.extractor.base import BODY_FULL, BODY_NONE
 
 
 class ConfigValidator:
@@ -25,9 +28,24 @@ class ConfigValidator:
         validator.validate(yaml_data)  # Raises ValueError if invalid
     """
 
-    VALID_SYNC_MECHANISMS = {"barrier", "countdown_latch", "semaphore"}
-    VALID_CONNECTION_STRATEGIES = {"preconnect", "lazy", "pooled", "multiplexed"}
+    VALID_SYNC_MECHANISMS = {"barrier", "countdown_latch", "semaphore", "spin_barrier", "hybrid", "eventfd"}
+    ASYNC_SYNC_MECHANISMS = {"barrier", "countdown_latch", "semaphore"}
+    VALID_CONNECTION_STRATEGIES = {"preconnect", "lazy", "pooled", "multiplexed", "single_packet", "last_byte"}
     VALID_THREAD_PROPAGATIONS = {"single", "parallel"}
+    VALID_SEND_ENGINES = {"httpx", "raw"}
+    RAW_ENGINE_STRATEGIES = {"preconnect", "last_byte"}
+    VALID_WARMUP_MODES = {"handshake", "head", "options", "get"}
+    VALID_ENGINES = {"threads", "asyncio", "processes"}
+    ASYNC_ENGINE_STRATEGIES = {"preconnect", "multiplexed", "lazy"}
+    PROCESS_ENGINE_STRATEGIES = {"preconnect", "multiplexed", "last_byte", "lazy", "pooled"}
+    # Strategies that open their sockets themselves (preconnect only with send_engine raw)
+    KERNEL_TIMESTAMP_STRATEGIES = {"last_byte", "single_packet"}
+    VALID_SCHEDULING = {"default", "high", "fifo", "rr"}
+    VALID_RESPONSE_READS = {"full", "headers", "capped"}
+    # when conditions that need the body, and those that need all of it
+    BODY_CONDITIONS = {"body_contains", "body_not_contains", "body_matches", "body_equals"}
+    FULL_BODY_CONDITIONS = {"body_not_contains", "body_equals"}
+    CPU_LIST_PATTERN = re.compile(r"^\d+(-\d+)?(,\d+(-\d+)?)*$")
 
     def validate(self, data: Dict[str, Any]) -> None:
         """
@@ -44,6 +62,7 @@ class ConfigValidator:
         self._validate_target(data["target"])
         self._validate_entrypoint(data["entrypoint"], data["states"])
         self._validate_states(data["states"])
+        self._validate_worker_pool(data.get("worker_pool", {}))
 
     def _check_required_sections(self, data: Dict[str, Any]) -> None:
         """Check that all required top-level sections exist."""
@@ -84,6 +103,26 @@ class ConfigValidator:
             # Validate mTLS configuration
             self._validate_mtls_config(tls)
 
+        # Validate socket options if present
+        sock = config.get("socket", {})
+        for name in ("nodelay", "quickack", "cork"):
+            if name in sock and not isinstance(sock[name], bool):
+                raise ValueError(f"socket.{name} must be boolean, got: {type(sock[name])}")
+        for name in ("sndbuf", "rcvbuf"):
+            if name in sock and (not isinstance(sock[name], int) or sock[name] < 0):
+                raise ValueError(f"socket.{name} must be a size in bytes >= 0, got: {sock[name]}")
+        if "bind" in sock:
+            try:
+                ipaddress.ip_address(sock["bind"])
+            except ValueError:
+                raise ValueError(f"socket.bind must be a local IP address, got: {sock['bind']}") from None
+
+    def _validate_worker_pool(self, pool: Dict[str, Any]) -> None:
+        """Validate worker_pool section."""
+        stack_size_kb = pool.get("stack_size_kb", 0)
+        if not isinstance(stack_size_kb, int) or (stack_size_kb and stack_size_kb < 32):
+            raise ValueError(f"worker_pool.stack_size_kb must be 0 or at least 32, got: {stack_size_kb}")
+
     def _validate_entrypoint(self, entrypoint: dict, states: Dict[str, Any]) -> None:
         """Validate entrypoint section."""
         if not entrypoint:
@@ -143,6 +182,9 @@ class ConfigValidator:
         if "extract" in data:
             self._validate_extractor_patterns(name, data["extract"])
 
+        if "response" in data:
+            self._validate_response(name, data["response"], data)
+
     def _validate_state_options(self, state_name: str, options: Dict[str, Any]) -> None:
         """Validate state options."""
         if "proxy_bypass" in options:
@@ -360,6 +402,127 @@ class ConfigValidator:
                     f"Valid options: {self.VALID_CONNECTION_STRATEGIES}"
                 )
 
+        # Validate send engine
+        if "send_engine" in race:
+            engine = race["send_engine"]
+            if engine not in self.VALID_SEND_ENGINES:
+                raise ValueError(
+                    f"State '{state_name}' has invalid send_engine: {engine}. "
+                    f"Valid options: {self.VALID_SEND_ENGINES}"
+                )
+            strategy = race.get("connection_strategy", "preconnect")
+            if engine == "raw" and strategy not in self.RAW_ENGINE_STRATEGIES:
+                raise ValueError(
+                    f"State '{state_name}' uses send_engine 'raw' with connection_strategy "
+                    f"'{strategy}'. Raw engine requires one of: {self.RAW_ENGINE_STRATEGIES}"
+                )
+
+        # Validate race engine
+        if "engine" in race:
+            engine = race["engine"]
+            if engine not in self.VALID_ENGINES:
+                raise ValueError(
+                    f"State '{state_name}' has invalid engine: {engine}. "
+                    f"Valid options: {self.VALID_ENGINES}"
+                )
+            if engine == "asyncio":
+                strategy = race.get("connection_strategy", "preconnect")
+                if strategy not in self.ASYNC_ENGINE_STRATEGIES:
+                    raise ValueError(
+                        f"State '{state_name}' uses engine 'asyncio' with connection_strategy "
+                        f"'{strategy}'. Asyncio engine requires one of: {self.ASYNC_ENGINE_STRATEGIES}"
+                    )
+                if race.get("send_engine", "httpx") != "httpx":
+                    raise ValueError(
+                        f"State '{state_name}' uses engine 'asyncio' with send_engine "
+                        f"'{race['send_engine']}'. Asyncio engine requires send_engine 'httpx'"
+                    )
+                mechanism = race.get("sync_mechanism", "barrier")
+                if mechanism not in self.ASYNC_SYNC_MECHANISMS:
+                    raise ValueError(
+                        f"State '{state_name}' uses engine 'asyncio' with sync_mechanism "
+                        f"'{mechanism}'. Asyncio engine requires one of: {self.ASYNC_SYNC_MECHANISMS}"
+                    )
+            if engine == "processes":
+                strategy = race.get("connection_strategy", "preconnect")
+                if strategy not in self.PROCESS_ENGINE_STRATEGIES:
+                    raise ValueError(
+                        f"State '{state_name}' uses engine 'processes' with connection_strategy "
+                        f"'{strategy}'. Processes engine requires one of: {self.PROCESS_ENGINE_STRATEGIES}"
+                    )
+                if race.get("sync_mechanism", "barrier") != "barrier":
+                    raise ValueError(
+                        f"State '{state_name}' uses engine 'processes' with sync_mechanism "
+                        f"'{race['sync_mechanism']}'. Processes engine always releases with a barrier"
+                    )
+
+        if "processes" in race:
+            processes = race["processes"]
+            if not isinstance(processes, int) or processes < 0:
+                raise ValueError(
+                    f"State '{state_name}' has invalid processes: {processes}. Must be >= 0"
+                )
+
+        if "rounds" in race:
+            rounds = race["rounds"]
+            if not isinstance(rounds, int) or rounds < 1:
+                raise ValueError(
+                    f"State '{state_name}' has invalid rounds: {rounds}. Must be >= 1"
+                )
+            if rounds > 1 and race.get("engine", "threads") != "threads":
+                raise ValueError(
+                    f"State '{state_name}' uses rounds with engine '{race['engine']}'. "
+                    f"Rounds require engine 'threads'"
+                )
+
+        if "round_delay_ms" in race:
+            delay = race["round_delay_ms"]
+            if not isinstance(delay, (int, float)) or delay < 0:
+                raise ValueError(
+                    f"State '{state_name}' has invalid round_delay_ms: {delay}. Must be >= 0"
+                )
+
+        if "timeline" in race and not isinstance(race["timeline"], bool):
+            raise ValueError(
+                f"State '{state_name}' has invalid timeline: {race['timeline']}. Must be true or false"
+            )
+
+        if "kernel_timestamps" in race:
+            if not isinstance(race["kernel_timestamps"], bool):
+                raise ValueError(
+                    f"State '{state_name}' has invalid kernel_timestamps: {race['kernel_timestamps']}. "
+                    f"Must be true or false"
+                )
+            strategy = race.get("connection_strategy", "preconnect")
+            raw = strategy == "preconnect" and race.get("send_engine", "httpx") == "raw"
+            if race["kernel_timestamps"] and not raw and strategy not in self.KERNEL_TIMESTAMP_STRATEGIES:
+                raise ValueError(
+                    f"State '{state_name}' uses kernel_timestamps with connection_strategy '{strategy}'. "
+                    f"Kernel timestamps require one of: {self.KERNEL_TIMESTAMP_STRATEGIES}, "
+                    f"or preconnect with send_engine 'raw'"
+                )
+
+        # Validate CPU placement
+        if "cpu_affinity" in race:
+            self._validate_cpu_affinity(state_name, race["cpu_affinity"])
+
+        if "scheduling" in race:
+            scheduling = race["scheduling"]
+            if scheduling not in self.VALID_SCHEDULING:
+                raise ValueError(
+                    f"State '{state_name}' has invalid scheduling: {scheduling}. "
+                    f"Valid options: {self.VALID_SCHEDULING}"
+                )
+
+        # Validate warmup mode
+        if "warmup" in race:
+            warmup = race["warmup"]
+            if warmup not in self.VALID_WARMUP_MODES:
+                raise ValueError(
+                    f"State '{state_name}' has invalid warmup: {warmup}. "
+                    f"Valid options: {self.VALID_WARMUP_MODES}"
+                )
+
         # Validate thread propagation
         if "thread_propagation" in race:
             propagation = race["thread_propagation"]
@@ -378,6 +541,74 @@ class ConfigValidator:
                     "Must be positive integer."
                 )
 
+    def _validate_response(self, state_name: str, response: Dict[str, Any], state: Dict[str, Any]) -> None:
+        """
+        Validate the response read mode against what the state reads.
+
+        Extractors and when conditions that need the body cannot run on
+        headers only; those that parse a whole document cannot run on a
+        capped body.
+
+        Args:
+            state_name: Name of the state
+            response: Response configuration dictionary
+            state: State data dictionary
+        """
+        read = response.get("read", "full")
+        if read not in self.VALID_RESPONSE_READS:
+            raise ValueError(
+                f"State '{state_name}' has invalid response read: {read}. "
+                f"Valid options: {self.VALID_RESPONSE_READS}"
+            )
+
+        if "max_bytes" in response:
+            max_bytes = response["max_bytes"]
+            if not isinstance(max_bytes, int) or isinstance(max_bytes, bool) or max_bytes < 1:
+                raise ValueError(
+                    f"State '{state_name}' has invalid response max_bytes: {max_bytes}. Must be >= 1"
+                )
+
+        if read == "full":
+            return
+
+        if (state.get("race") or {}).get("rounds", 1) > 1:
+            raise ValueError(
+                f"State '{state_name}' uses response read '{read}' with rounds. "
+                f"Rounds reuse connections and require response read 'full'"
+            )
+
+        for var_name, pattern in (state.get("extract") or {}).items():
+            pattern_type = pattern.get("type", "regex") if isinstance(pattern, dict) else "regex"
+            access = get_extractor(pattern_type).body_access
+            if (read == "headers" and access != BODY_NONE) or access == BODY_FULL:
+                raise ValueError(
+                    f"State '{state_name}' extractor for variable '{var_name}' ({pattern_type}) "
+                    f"reads the response body and cannot run with response read '{read}'"
+                )
+
+        blocked = self.BODY_CONDITIONS if read == "headers" else self.FULL_BODY_CONDITIONS
+        for transition in state.get("next") or []:
+            for condition in transition.get("when", None) or []:
+                used = blocked & set(condition) if isinstance(condition, dict) else set()
+                if used:
+                    raise ValueError(
+                        f"State '{state_name}' uses when condition '{sorted(used)[0]}', "
+                        f"which cannot run with response read '{read}'"
+                    )
+
+    def _validate_cpu_affinity(self, state_name: str, cpu_affinity: Any) -> None:
+        """Validate race.cpu_affinity ("spread", a CPU list string or a list of CPUs)."""
+        if isinstance(cpu_affinity, str):
+            if cpu_affinity == "spread" or self.CPU_LIST_PATTERN.match(cpu_affinity.replace(" ", "")):
+                return
+        elif isinstance(cpu_affinity, list) and cpu_affinity:
+            if all(isinstance(cpu, int) and cpu >= 0 for cpu in cpu_affinity):
+                return
+        raise ValueError(
+            f"State '{state_name}' has invalid cpu_affinity: {cpu_affinity}. "
+            f"Use 'spread', a CPU list such as '0-3,8', or a list of CPU numbers"
+        )
+
     def _validate_extractor_patterns(self, state_name: str, extracts: Dict[str, Any]) -> None:
         """
         Validate extractor patterns in a state.
@@ -194,7 +194,7 @@ class ConditionEvaluator:
         """
         try:
             # Render the expression with context
-            result = self.template_engine.render(expression, context.to_dict(), context)
+            result = self.template_engine.render(expression, context.view(), context)
             
             # Convert result to boolean
             # Handle string results like "True", "False", "true", "false"
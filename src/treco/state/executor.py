@@ -12,7 +12,7 @@ import logging
 
 from treco.http.extractor import extract_all
 
-from treco.models import State, ExecutionContext
+from treco.models import State, ExecutionContext, build_template_context
 from treco.template import TemplateEngine
 from treco.http import HTTPClient
 
@@ -126,8 +126,7 @@ class StateExecutor:
 
         try:
             # Render HTTP request template
-            context_input = context.to_dict()
-            context_input["target"] = self.http_client.config
+            context_input = build_template_context(context=context, target=self.http_client.config)
             http_text = self.template_engine.render(state.request, context_input, context)
 
             logger.debug(f"[StateExecutor] Rendered HTTP request for state '{state.name}':\n{http_text}")
@@ -142,7 +141,7 @@ class StateExecutor:
             logger.debug(f"[StateExecutor] Response received:\n{response.text}")
 
             # Extract data from response
-            extracted = extract_all(response, state.extract, context.to_dict())
+            extracted = extract_all(response, state.extract_plan or state.extract, context.view())
 
             if extracted:
                 logger.info(f"[StateExecutor] Extracted variables: {list(extracted.keys())}")
@@ -6,7 +6,7 @@ Manages the execution flow through states with automatic transitions.
 
 from dataclasses import asdict
 import time
-from typing import Any, Dict, Optional
+from typing import Any, MutableMapping, Optional
 
 import logging
 
@@ -142,7 +142,7 @@ class StateMachine:
 
         return results
     
-    def _get_render_context(self, **extra: Any) -> Dict[str, Any]:
+    def _get_render_context(self, **extra: Any) -> MutableMapping[str, Any]:
         """Get base context for template rendering."""
         return build_template_context(
             context=self.context,
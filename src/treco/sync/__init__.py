@@ -9,6 +9,17 @@ from .base import SyncMechanism
 from .barrier import BarrierSync
 from .countdown_latch import CountdownLatchSync
 from .semaphore import SemaphoreSync
+from .spin_barrier import SpinBarrierSync
+from .hybrid import HybridSync
+from .eventfd import EventfdSync
+from .timed_release import TimedReleaseSync
+from .release_schedule import ReleaseSchedule
+from .aio import (
+    AsyncSyncMechanism,
+    AsyncBarrierSync,
+    AsyncCountdownLatchSync,
+    AsyncSemaphoreSync,
+)
 
 
 # Factory for creating sync mechanisms
@@ -16,6 +27,16 @@ SYNC_MECHANISMS = {
     "barrier": BarrierSync,
     "countdown_latch": CountdownLatchSync,
     "semaphore": SemaphoreSync,
+    "spin_barrier": SpinBarrierSync,
+    "hybrid": HybridSync,
+    "eventfd": EventfdSync,
+}
+
+# Asyncio counterparts (race.engine: asyncio)
+ASYNC_SYNC_MECHANISMS = {
+    "barrier": AsyncBarrierSync,
+    "countdown_latch": AsyncCountdownLatchSync,
+    "semaphore": AsyncSemaphoreSync,
 }
 
 
@@ -24,7 +45,8 @@ def create_sync_mechanism(mechanism_type: str) -> SyncMechanism:
     Factory function to create sync mechanism by name.
 
     Args:
-        mechanism_type: Type of sync mechanism ("barrier", "countdown_latch", "semaphore")
+        mechanism_type: Type of sync mechanism ("barrier", "countdown_latch", "semaphore",
+                        "spin_barrier", "hybrid", "eventfd")
 
     Returns:
         Instance of SyncMechanism
@@ -46,11 +68,49 @@ def create_sync_mechanism(mechanism_type: str) -> SyncMechanism:
     return mechanism_class()
 
 
+def create_async_sync_mechanism(mechanism_type: str) -> AsyncSyncMechanism:
+    """
+    Factory function to create an asyncio sync mechanism by name.
+
+    Args:
+        mechanism_type: Type of sync mechanism ("barrier", "countdown_latch", "semaphore")
+
+    Returns:
+        Instance of AsyncSyncMechanism
+
+    Raises:
+        ValueError: If mechanism_type is not recognized
+
+    Example:
+        sync = create_async_sync_mechanism("barrier")
+        sync.prepare(2000)
+    """
+    if mechanism_type not in ASYNC_SYNC_MECHANISMS:
+        raise ValueError(
+            f"Unknown sync mechanism: {mechanism_type}. "
+            f"Valid options: {list(ASYNC_SYNC_MECHANISMS.keys())}"
+        )
+
+    mechanism_class = ASYNC_SYNC_MECHANISMS[mechanism_type]
+    return mechanism_class()
+
+
 __all__ = [
     "SyncMechanism",
     "BarrierSync",
     "CountdownLatchSync",
     "SemaphoreSync",
+    "SpinBarrierSync",
+    "HybridSync",
+    "EventfdSync",
+    "TimedReleaseSync",
+    "ReleaseSchedule",
     "create_sync_mechanism",
     "SYNC_MECHANISMS",
+    "AsyncSyncMechanism",
+    "AsyncBarrierSync",
+    "AsyncCountdownLatchSync",
+    "AsyncSemaphoreSync",
+    "create_async_sync_mechanism",
+    "ASYNC_SYNC_MECHANISMS",
 ]
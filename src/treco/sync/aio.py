@@ -0,0 +1,222 @@
+"""
+Asyncio synchronization mechanisms.
+
+Counterparts of the threading sync mechanisms for the asyncio race engine,
+where every race "thread" is a task on a single event loop.
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSyncMechanism(ABC):
+    """
+    Abstract base class for asyncio synchronization mechanisms.
+
+    Same contract as SyncMechanism, except that wait() is a coroutine.
+    prepare() and release() are plain methods so they can be called from
+    outside a task (release() must still run on the event loop's thread).
+
+    Example:
+        sync = AsyncBarrierSync()
+        sync.prepare(20)
+
+        # In each task:
+        await sync.wait(thread_id)
+    """
+
+    @abstractmethod
+    def prepare(self, num_threads: int) -> None:
+        """
+        Prepare the synchronization mechanism for N tasks.
+
+        Args:
+            num_threads: Number of tasks that will participate
+        """
+        pass
+
+    @abstractmethod
+    async def wait(self, thread_id: int) -> None:
+        """
+        Suspend the calling task until the synchronization point is reached.
+
+        Args:
+            thread_id: Unique identifier for the calling task (0 to N-1)
+        """
+        pass
+
+    @abstractmethod
+    def release(self) -> None:
+        """Release waiting tasks (if applicable)."""
+        pass
+
+
+class AsyncBarrierSync(AsyncSyncMechanism):
+    """
+    Barrier for asyncio tasks.
+
+    Tasks wait until N tasks arrive, then the last one wakes all of them in
+    the same event loop iteration. Like threading.Barrier, the barrier is
+    reusable: it resets after each release.
+
+    Example:
+        sync = AsyncBarrierSync()
+        sync.prepare(20)
+
+        # In each task:
+        await sync.wait(thread_id)  # Suspend until all 20 arrive
+    """
+
+    def __init__(self):
+        """Initialize empty barrier."""
+        self.parties = 0
+        self.count = 0
+        self.event: Optional[asyncio.Event] = None
+
+    def prepare(self, num_threads: int) -> None:
+        """
+        Create barrier for N tasks.
+
+        Args:
+            num_threads: Number of tasks that will participate
+        """
+        self.parties = num_threads
+        self.count = 0
+        self.event = asyncio.Event()
+        logger.info(f"[AsyncBarrierSync] Prepared barrier for {num_threads} tasks")
+
+    async def wait(self, thread_id: int) -> None:
+        """
+        Suspend until all tasks arrive at the barrier.
+
+        Args:
+            thread_id: Task identifier (for logging)
+        """
+        if self.event is None:
+            raise RuntimeError("Barrier not prepared. Call prepare() first.")
+
+        event = self.event
+        self.count += 1
+        if self.count >= self.parties:
+            # Last arrival: reset for the next generation and wake everyone
+            self.count = 0
+            self.event = asyncio.Event()
+            event.set()
+            return
+
+        await event.wait()
+
+    def release(self) -> None:
+        """No-op for barrier (auto-releases when all tasks arrive)."""
+        pass
+
+
+class AsyncCountdownLatchSync(AsyncSyncMechanism):
+    """
+    Countdown latch for asyncio tasks.
+
+    Tasks wait until release() has been called N times.
+
+    Example:
+        sync = AsyncCountdownLatchSync()
+        sync.prepare(20)
+
+        # In each task:
+        await sync.wait(thread_id)
+
+        # In the controller:
+        sync.release()  # Decrement counter
+    """
+
+    def __init__(self):
+        """Initialize countdown latch."""
+        self.count = 0
+        self.event: Optional[asyncio.Event] = None
+
+    def prepare(self, num_threads: int) -> None:
+        """
+        Initialize counter to N.
+
+        Args:
+            num_threads: Initial count value
+        """
+        self.count = num_threads
+        self.event = asyncio.Event()
+        logger.info(f"[AsyncCountdownLatchSync] Prepared latch with count={num_threads}")
+
+    async def wait(self, thread_id: int) -> None:
+        """
+        Suspend until the counter reaches zero.
+
+        Args:
+            thread_id: Task identifier (for logging)
+        """
+        if self.event is None:
+            raise RuntimeError("Latch not prepared. Call prepare() first.")
+
+        await self.event.wait()
+
+    def release(self) -> None:
+        """Decrement counter by 1, releasing all tasks when it reaches 0."""
+        if self.event is None:
+            raise RuntimeError("Latch not prepared. Call prepare() first.")
+
+        if self.count > 0:
+            self.count -= 1
+            if self.count == 0:
+                self.event.set()
+                logger.info("[AsyncCountdownLatchSync] Counter reached 0, releasing all tasks")
+
+
+class AsyncSemaphoreSync(AsyncSyncMechanism):
+    """
+    Semaphore for asyncio tasks.
+
+    Limits the number of tasks past the sync point to N. As with
+    SemaphoreSync, this is NOT ideal for race conditions.
+
+    Example:
+        sync = AsyncSemaphoreSync()
+        sync.prepare(5)
+
+        # In each task:
+        await sync.wait(thread_id)  # Acquire slot
+        send_request()
+        sync.release()
+    """
+
+    def __init__(self):
+        """Initialize semaphore."""
+        self.semaphore: Optional[asyncio.Semaphore] = None
+
+    def prepare(self, num_threads: int) -> None:
+        """
+        Create semaphore with limit N.
+
+        Args:
+            num_threads: Maximum number of concurrent tasks
+        """
+        self.semaphore = asyncio.Semaphore(num_threads)
+        logger.info(f"[AsyncSemaphoreSync] Prepared semaphore with limit={num_threads}")
+        logger.info("[AsyncSemaphoreSync] WARNING: Semaphore is not ideal for race conditions!")
+
+    async def wait(self, thread_id: int) -> None:
+        """
+        Acquire a semaphore slot.
+
+        Args:
+            thread_id: Task identifier (for logging)
+        """
+        if self.semaphore is None:
+            raise RuntimeError("Semaphore not prepared. Call prepare() first.")
+
+        await self.semaphore.acquire()
+
+    def release(self) -> None:
+        """Release a semaphore slot."""
+        if self.semaphore is not None:
+            self.semaphore.release()
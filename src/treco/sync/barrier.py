@@ -60,6 +60,7 @@ class BarrierSync(SyncMechanism):
             num_threads: Number of threads that will participate
         """
         self.barrier = threading.Barrier(num_threads)
+        self._reset_release_times(num_threads)
         logger.info(f"[BarrierSync] Prepared barrier for {num_threads} threads")
 
     def wait(self, thread_id: int) -> None:
@@ -79,6 +80,7 @@ class BarrierSync(SyncMechanism):
         self.barrier.wait()
 
         # All threads released simultaneously at this point
+        self._mark_released(thread_id)
 
     def release(self) -> None:
         """
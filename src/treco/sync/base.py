@@ -4,7 +4,9 @@ Base interface for synchronization mechanisms.
 Defines the contract that all sync mechanisms must implement.
 """
 
+import time
 from abc import ABC, abstractmethod
+from typing import List, Optional
 
 
 class SyncMechanism(ABC):
@@ -16,6 +18,11 @@ class SyncMechanism(ABC):
     - wait(thread_id): Block thread until ready
     - release(): Release waiting threads (if applicable)
 
+    Mechanisms that release threads together may also record when each
+    thread left wait() (_reset_release_times() in prepare(),
+    _mark_released() in wait()), so that release_skew_ns() reports how far
+    apart the threads actually resumed.
+
     Sync mechanisms are used to coordinate multiple threads in race
     condition attacks, ensuring they send requests simultaneously.
 
@@ -74,3 +81,28 @@ class SyncMechanism(ABC):
         This method should be idempotent (safe to call multiple times).
         """
         pass
+
+    _release_ns: List[int] = []
+
+    def _reset_release_times(self, num_threads: int) -> None:
+        """Allocate one release timestamp per thread."""
+        self._release_ns = [0] * num_threads
+
+    def _mark_released(self, thread_id: int) -> None:
+        """Record when a thread left wait()."""
+        if thread_id < len(self._release_ns):
+            self._release_ns[thread_id] = time.perf_counter_ns()
+
+    def release_skew_ns(self) -> Optional[int]:
+        """
+        Measured release skew of the last release.
+
+        Returns:
+            Nanoseconds between the first and the last thread leaving
+            wait(), or None if the mechanism does not record releases or
+            fewer than two threads were released
+        """
+        released = [t for t in self._release_ns if t]
+        if len(released) < 2:
+            return None
+        return max(released) - min(released)
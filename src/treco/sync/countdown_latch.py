@@ -69,6 +69,7 @@ class CountdownLatchSync(SyncMechanism):
         """
         self.count = num_threads
         self.event = threading.Event()
+        self._reset_release_times(num_threads)
         logger.info(f"[CountdownLatchSync] Prepared latch with count={num_threads}")
 
     def wait(self, thread_id: int) -> None:
@@ -83,6 +84,7 @@ class CountdownLatchSync(SyncMechanism):
 
         # Block until event is set (count reaches 0)
         self.event.wait()
+        self._mark_released(thread_id)
 
     def release(self) -> None:
         """
@@ -0,0 +1,105 @@
+"""
+eventfd broadcast synchronization mechanism (Linux).
+
+Threads block in the kernel on one eventfd and are woken by a single
+write from the last thread to arrive.
+"""
+
+import os
+import threading
+from typing import Optional
+
+import logging
+
+from .base import SyncMechanism
+
+logger = logging.getLogger(__name__)
+
+
+class EventfdSync(SyncMechanism):
+    """
+    Barrier released through a Linux eventfd.
+
+    How it works:
+    1. Each thread counts itself in and blocks in read() on a semaphore-mode
+       eventfd, with the GIL released
+    2. The last thread to arrive writes N-1 to the eventfd
+    3. The kernel wakes every reader in one pass, each consuming one count
+
+    Waiters sleep in the kernel, like a futex broadcast, instead of queueing
+    on a Python condition variable that notifies them one at a time.
+
+    Requires Linux and Python 3.10+ (os.eventfd). The barrier can be reused
+    once every thread has returned from wait().
+
+    Example:
+        sync = EventfdSync()
+        sync.prepare(200)
+
+        # In each thread:
+        sync.wait(thread_id)  # Block until all 200 arrive
+    """
+
+    def __init__(self):
+        """Initialize empty barrier."""
+        self.parties = 0
+        self.count = 0
+        self.fd: Optional[int] = None
+        self.lock = threading.Lock()
+
+    def prepare(self, num_threads: int) -> None:
+        """
+        Create the eventfd for N threads.
+
+        Args:
+            num_threads: Number of threads that will participate
+
+        Raises:
+            RuntimeError: If eventfd is not available on this platform
+        """
+        if not hasattr(os, "eventfd"):
+            raise RuntimeError("eventfd sync mechanism requires Linux and Python 3.10+")
+
+        self._close()
+        self.fd = os.eventfd(0, os.EFD_SEMAPHORE | os.EFD_CLOEXEC)
+        self.parties = num_threads
+        self.count = 0
+        self._reset_release_times(num_threads)
+        logger.info(f"[EventfdSync] Prepared eventfd barrier for {num_threads} threads")
+
+    def wait(self, thread_id: int) -> None:
+        """
+        Block until all threads arrive.
+
+        Args:
+            thread_id: Thread identifier (for logging)
+        """
+        if self.fd is None:
+            raise RuntimeError("eventfd barrier not prepared. Call prepare() first.")
+
+        with self.lock:
+            self.count += 1
+            last = self.count == self.parties
+            if last:
+                self.count = 0
+
+        if last:
+            if self.parties > 1:
+                os.eventfd_write(self.fd, self.parties - 1)
+        else:
+            os.eventfd_read(self.fd)
+
+        self._mark_released(thread_id)
+
+    def release(self) -> None:
+        """No-op for barrier (auto-releases when all threads arrive)."""
+        pass
+
+    def _close(self) -> None:
+        """Close the eventfd, if any."""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    def __del__(self):
+        self._close()
@@ -0,0 +1,106 @@
+"""
+Hybrid sleep/spin synchronization mechanism.
+
+Threads sleep until the last one arrives, then all of them spin until a
+common deadline a little later, so wake-up jitter is absorbed before the
+release instead of showing up in it.
+"""
+
+import threading
+import time
+from typing import Optional
+
+import logging
+
+from .base import SyncMechanism
+from .spin import sleep_until_ns
+
+logger = logging.getLogger(__name__)
+
+# Default lead between the last arrival and the release
+MIN_LEAD_NS = 1_000_000
+LEAD_PER_THREAD_NS = 10_000
+
+
+class HybridSync(SyncMechanism):
+    """
+    Barrier that sleeps, then spins to a common deadline.
+
+    How it works:
+    1. Threads block on an event (no CPU used while connecting)
+    2. The last thread to arrive sets deadline = now + lead and wakes all
+    3. Each woken thread busy-waits on perf_counter_ns() until the deadline
+
+    Threads do not resume together when the event fires, but as long as
+    the lead covers the broadcast, they all leave the spin at the same
+    clock instant. The default lead grows with the thread count
+    (1ms + 10μs per thread).
+
+    Example:
+        sync = HybridSync()
+        sync.prepare(200)
+
+        # In each thread:
+        sync.wait(thread_id)  # Returns at the common deadline
+    """
+
+    def __init__(self, lead_ns: Optional[int] = None):
+        """
+        Initialize the hybrid barrier.
+
+        Args:
+            lead_ns: Delay between the last arrival and the release
+                     (default: scaled with the thread count)
+        """
+        self.lead_ns = lead_ns
+        self.parties = 0
+        self.count = 0
+        self.deadline_ns = 0
+        self._lead = 0
+        self.event: Optional[threading.Event] = None
+        self.lock = threading.Lock()
+
+    def prepare(self, num_threads: int) -> None:
+        """
+        Prepare the barrier for N threads.
+
+        Args:
+            num_threads: Number of threads that will participate
+        """
+        self.parties = num_threads
+        self.count = 0
+        self.event = threading.Event()
+        self._lead = self.lead_ns or MIN_LEAD_NS + LEAD_PER_THREAD_NS * num_threads
+        self._reset_release_times(num_threads)
+        logger.info(
+            f"[HybridSync] Prepared hybrid barrier for {num_threads} threads "
+            f"(lead {self._lead / 1_000_000:.2f}ms)"
+        )
+
+    def wait(self, thread_id: int) -> None:
+        """
+        Sleep until all threads arrive, then spin until the deadline.
+
+        Args:
+            thread_id: Thread identifier (for logging)
+        """
+        if self.event is None:
+            raise RuntimeError("Hybrid barrier not prepared. Call prepare() first.")
+
+        event = self.event
+        with self.lock:
+            self.count += 1
+            if self.count == self.parties:
+                # Last arrival: pick the deadline, reset and wake everyone
+                self.deadline_ns = time.perf_counter_ns() + self._lead
+                self.count = 0
+                self.event = threading.Event()
+                event.set()
+
+        event.wait()
+        sleep_until_ns(self.deadline_ns, clock=time.perf_counter_ns)
+        self._mark_released(thread_id)
+
+    def release(self) -> None:
+        """No-op for barrier (auto-releases when all threads arrive)."""
+        pass
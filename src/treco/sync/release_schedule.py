@@ -0,0 +1,69 @@
+"""
+Release schedule for thread group offsets.
+
+Thread groups can send at a fixed offset after the race sync point
+(delay_ms, delay_us, delay_ns). Instead of each thread sleeping for its own
+delay from whenever it happened to resume, every offset is measured from
+one release timestamp, taken by the first thread out of the sync point, and
+reached with a sleep-then-spin wait.
+"""
+
+import threading
+import time
+from typing import Any
+
+from .spin import sleep_until_ns
+
+
+class ReleaseSchedule:
+    """
+    Common release timestamp for offset sends.
+
+    Example:
+        schedule = ReleaseSchedule()
+
+        # In each thread, right after race_sync.wait():
+        release_ns = schedule.wait(offset_ns)
+        start_ns = time.perf_counter_ns()
+        send_offset_ns = start_ns - release_ns
+    """
+
+    def __init__(self):
+        """Initialize the schedule."""
+        self.release_ns = 0
+        self._epoch: Any = None
+        self._lock = threading.Lock()
+
+    def mark(self, epoch: Any = 1) -> int:
+        """
+        Return the release timestamp of epoch, taking it on the first call.
+
+        Args:
+            epoch: Identifies one release (e.g. the round number), so the
+                   schedule can be reused without resetting it
+
+        Returns:
+            Release timestamp on the time.perf_counter_ns() clock
+        """
+        if self._epoch != epoch:
+            with self._lock:
+                if self._epoch != epoch:
+                    self.release_ns = time.perf_counter_ns()
+                    self._epoch = epoch
+        return self.release_ns
+
+    def wait(self, offset_ns: int, epoch: Any = 1) -> int:
+        """
+        Block until offset_ns after the release of epoch.
+
+        Args:
+            offset_ns: Offset from the release timestamp
+            epoch: Release the offset is relative to (see mark())
+
+        Returns:
+            Release timestamp on the time.perf_counter_ns() clock
+        """
+        release_ns = self.mark(epoch)
+        if offset_ns > 0:
+            sleep_until_ns(release_ns + offset_ns, clock=time.perf_counter_ns)
+        return release_ns
@@ -0,0 +1,56 @@
+"""
+Busy-wait helpers shared by the high-precision sync mechanisms.
+
+On free-threaded builds (3.13t/3.14t) spinning threads run truly in
+parallel. On GIL builds a spinning thread would hold the GIL for a whole
+switch interval (5ms by default) and starve the thread it is waiting for,
+so the spin loops yield the GIL on every iteration instead.
+"""
+
+import sys
+import time
+from typing import Callable
+
+# Sleep until this close to a deadline, then busy-wait the rest
+SPIN_THRESHOLD_NS = 1_000_000
+
+
+def gil_enabled() -> bool:
+    """Return True unless running on a free-threaded build with the GIL off."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled() if is_gil_enabled is not None else True
+
+
+GIL_ENABLED = gil_enabled()
+
+
+def spin_until(done: Callable[[], bool]) -> None:
+    """
+    Busy-wait until done() returns True.
+
+    Args:
+        done: Condition polled in the loop
+    """
+    if GIL_ENABLED:
+        while not done():
+            time.sleep(0)
+    else:
+        while not done():
+            pass
+
+
+def sleep_until_ns(deadline_ns: int, clock: Callable[[], int] = time.time_ns) -> None:
+    """
+    Block until clock() reaches deadline_ns.
+
+    Sleeps for most of the wait and busy-waits the final stretch, since
+    time.sleep() alone can overshoot by far more than a race window.
+
+    Args:
+        deadline_ns: Deadline in nanoseconds, on the same clock
+        clock: Clock to compare against (time.time_ns by default)
+    """
+    remaining = deadline_ns - clock()
+    if remaining > SPIN_THRESHOLD_NS:
+        time.sleep((remaining - SPIN_THRESHOLD_NS) / 1_000_000_000)
+    spin_until(lambda: clock() >= deadline_ns)
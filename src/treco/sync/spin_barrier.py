@@ -0,0 +1,86 @@
+"""
+Spin barrier synchronization mechanism.
+
+All threads busy-wait on a shared generation counter instead of sleeping on
+a condition variable, so they resume as soon as the last thread arrives.
+"""
+
+import threading
+
+import logging
+
+from .base import SyncMechanism
+from .spin import GIL_ENABLED, spin_until
+
+logger = logging.getLogger(__name__)
+
+
+class SpinBarrierSync(SyncMechanism):
+    """
+    Busy-wait barrier on a shared flag.
+
+    How it works:
+    1. Each thread increments the arrival count and spins on the
+       barrier generation
+    2. The last thread to arrive bumps the generation
+    3. Every spinning thread sees the change on its next poll
+
+    threading.Barrier wakes its waiters one by one through a condition
+    variable; here nobody sleeps, so there is no wake-up latency. This is
+    meant for free-threaded builds (3.14t) with at most one race thread per
+    core. On GIL builds the spinners yield the GIL on every poll, which
+    works but is usually not tighter than "hybrid".
+
+    Example:
+        sync = SpinBarrierSync()
+        sync.prepare(8)
+
+        # In each thread:
+        sync.wait(thread_id)  # Spin until all 8 arrive
+    """
+
+    def __init__(self):
+        """Initialize empty barrier."""
+        self.parties = 0
+        self.count = 0
+        self.generation = 0
+        self.lock = threading.Lock()
+
+    def prepare(self, num_threads: int) -> None:
+        """
+        Prepare the barrier for N threads.
+
+        Args:
+            num_threads: Number of threads that will participate
+        """
+        self.parties = num_threads
+        self.count = 0
+        self._reset_release_times(num_threads)
+        logger.info(f"[SpinBarrierSync] Prepared spin barrier for {num_threads} threads")
+        if GIL_ENABLED:
+            logger.warning("[SpinBarrierSync] GIL is enabled: spinners yield the GIL on every poll")
+
+    def wait(self, thread_id: int) -> None:
+        """
+        Spin until all threads arrive at the barrier.
+
+        Args:
+            thread_id: Thread identifier (for logging)
+        """
+        if self.parties == 0:
+            raise RuntimeError("Spin barrier not prepared. Call prepare() first.")
+
+        with self.lock:
+            generation = self.generation
+            self.count += 1
+            if self.count == self.parties:
+                # Last arrival: reset for the next generation and release everyone
+                self.count = 0
+                self.generation += 1
+
+        spin_until(lambda: self.generation != generation)
+        self._mark_released(thread_id)
+
+    def release(self) -> None:
+        """No-op for barrier (auto-releases when all threads arrive)."""
+        pass
@@ -0,0 +1,84 @@
+"""
+Timed release synchronization mechanism.
+
+Threads meet at a barrier, then all of them are released at an absolute
+wall-clock time. Used to release several TRECO processes (possibly on
+different hosts) at the same instant.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from .base import SyncMechanism
+from .spin import sleep_until_ns
+
+logger = logging.getLogger(__name__)
+
+
+class TimedReleaseSync(SyncMechanism):
+    """
+    Barrier followed by a release at an agreed absolute time.
+
+    How it works:
+    1. Each thread calls wait() and blocks at a barrier
+    2. When the last thread arrives, release_time() is called once to
+       agree on the release instant (e.g. with other nodes)
+    3. Every thread sleeps until that instant and returns
+
+    Example:
+        sync = TimedReleaseSync(node.release_time)
+        sync.prepare(20)
+
+        # In each thread:
+        sync.wait(thread_id)  # Returns at the agreed instant
+    """
+
+    def __init__(self, release_time: Callable[[], int]):
+        """
+        Initialize the timed release.
+
+        Args:
+            release_time: Called once per release by the last arriving
+                          thread; returns the local time.time_ns() at which
+                          all threads are released
+        """
+        self._release_time = release_time
+        self.barrier: Optional[threading.Barrier] = None
+        self.deadline_ns = 0
+
+    def prepare(self, num_threads: int) -> None:
+        """
+        Create the barrier for N threads.
+
+        Args:
+            num_threads: Number of threads that will participate
+        """
+        self.barrier = threading.Barrier(num_threads, action=self._agree)
+        self._reset_release_times(num_threads)
+        logger.info(f"[TimedReleaseSync] Prepared timed release for {num_threads} threads")
+
+    def _agree(self) -> None:
+        """Barrier action: fetch the release instant."""
+        self.deadline_ns = self._release_time()
+        delay_ms = (self.deadline_ns - time.time_ns()) / 1_000_000
+        logger.info(f"[TimedReleaseSync] Release in {delay_ms:.1f}ms")
+
+    def wait(self, thread_id: int) -> None:
+        """
+        Block until all threads arrive, then until the release instant.
+
+        Args:
+            thread_id: Thread identifier (for logging)
+        """
+        if self.barrier is None:
+            raise RuntimeError("Timed release not prepared. Call prepare() first.")
+
+        self.barrier.wait()
+        sleep_until_ns(self.deadline_ns)
+        self._mark_released(thread_id)
+
+    def release(self) -> None:
+        """No-op (release happens at the agreed time)."""
+        pass
@@ -5,17 +5,55 @@ Provides a configured Jinja2 environment with custom filters for:
 - TOTP generation
 - Environment variable access
 - CLI argument access
+
+Templates are compiled once per source string and kept in an LRU cache, so
+race threads, condition evaluations and input generators rendering the
+same template do not lex, parse and compile it again. Compiled code is also
+stored in a Jinja bytecode cache on disk, so large templates load without
+compiling on later runs.
 """
 
 import os
+import threading
+from collections import OrderedDict
+
 import jinja2
+import jinja2.bccache
 import logging
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional
+from treco.metrics import MetricsRegistry
 from treco.models import ExecutionContext
+from treco.template.layers import render_template
+from treco.template.partial import BoundTemplate, TemplatePlan, compile_plan
 
 logger = logging.getLogger(__name__)
 
+# Compiled templates kept in memory per engine
+DEFAULT_CACHE_SIZE = 512
+
+# Bytecode cache bucket names are prefixed so they never collide with
+# templates that other Jinja users store in the same directory
+_BUCKET_PREFIX = "treco:"
+
+
+def _create_bytecode_cache(directory: Optional[str] = None) -> Optional[jinja2.BytecodeCache]:
+    """
+    Create the on-disk bytecode cache.
+
+    Args:
+        directory: Cache directory (default: a per-user directory in the
+                   system temp dir, created by Jinja)
+
+    Returns:
+        FileSystemBytecodeCache, or None if the directory is unusable
+    """
+    try:
+        return jinja2.FileSystemBytecodeCache(directory)
+    except (OSError, RuntimeError) as e:
+        logger.debug(f"Template bytecode cache disabled: {e}")
+        return None
+
 
 
 class TemplateEngine:
@@ -47,8 +85,21 @@ class TemplateEngine:
         )
     """
 
-    def __init__(self):
-        """Initialize Jinja2 environment and register custom filters."""
+    def __init__(
+        self,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        bytecode_cache: bool = True,
+        bytecode_cache_dir: Optional[str] = None,
+    ):
+        """
+        Initialize Jinja2 environment and register custom filters.
+
+        Args:
+            cache_size: Number of compiled templates kept in memory
+            bytecode_cache: Store compiled templates on disk across runs
+            bytecode_cache_dir: Bytecode cache directory (default: Jinja's
+                                per-user directory in the system temp dir)
+        """
         # Create Jinja2 environment
         self.env = jinja2.Environment(
             loader=jinja2.FileSystemLoader(os.getcwd()),
@@ -60,6 +111,12 @@ class TemplateEngine:
         # Register custom filters
         self._register_filters()
 
+        # Compiled templates by source string, least recently used first
+        self._cache_size = cache_size
+        self._templates: "OrderedDict[str, jinja2.Template]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._bytecode_cache = _create_bytecode_cache(bytecode_cache_dir) if bytecode_cache else None
+
     def _register_filters(self) -> None:
         """
         Auto-discover and register all custom filters.
@@ -103,7 +160,7 @@ class TemplateEngine:
     def render(
         self,
         template_str: str,
-        variables: Dict[str, Any],
+        variables: Mapping[str, Any],
         context: Optional[ExecutionContext] = None,
     ) -> str:
         """
@@ -111,7 +168,7 @@ class TemplateEngine:
 
         Args:
             template_str: Template string with Jinja2 syntax
-            variables: Dictionary of variables to interpolate
+            variables: Variables to interpolate (read, never copied)
             context: Optional ExecutionContext for argv/env access
 
         Returns:
@@ -137,19 +194,96 @@ class TemplateEngine:
             )
             # Output: "User: alice"
         """
-        # Create a copy of variables and inject context for argv filter
-        render_input = variables.copy()
-        if context:
-            render_input["_context"] = context
+        # Render the cached compiled template; context is injected for argv
+        return render_template(self.get_template(template_str), variables, context)
+
+    def get_template(self, template_str: str) -> jinja2.Template:
+        """
+        Return the compiled template for a source string.
+
+        Compiled templates are cached by source (LRU, thread-safe); cache
+        hits and misses are counted as template.cache.hit and
+        template.cache.miss in MetricsRegistry.
+
+        Args:
+            template_str: Template string with Jinja2 syntax
+
+        Returns:
+            Compiled jinja2.Template
+        """
+        counter = MetricsRegistry.get_counter()
+
+        with self._cache_lock:
+            template = self._templates.get(template_str)
+            if template is not None:
+                self._templates.move_to_end(template_str)
+
+        if template is not None:
+            counter.increment("template.cache.hit")
+            return template
+
+        counter.increment("template.cache.miss")
+        template = self._compile(template_str)
+
+        with self._cache_lock:
+            self._templates[template_str] = template
+            while len(self._templates) > self._cache_size:
+                self._templates.popitem(last=False)
+        return template
+
+    def _compile(self, template_str: str) -> jinja2.Template:
+        """Compile a template, loading and storing its code in the bytecode cache."""
+        if self._bytecode_cache is None:
+            return self.env.from_string(template_str)
+
+        bucket = self._bytecode_cache.get_bucket(self.env, _BUCKET_PREFIX + template_str, None, template_str)
+        if bucket.code is None:
+            bucket.code = self.env.compile(template_str)
+            try:
+                self._bytecode_cache.set_bucket(bucket)
+            except OSError as e:
+                logger.debug(f"Could not store template bytecode: {e}")
+        return self.env.template_class.from_code(self.env, bucket.code, self.env.make_globals(None))
+
+    def compile_plan(self, template_str: str) -> TemplatePlan:
+        """
+        Split a template into thread-invariant and per-thread segments.
+
+        Args:
+            template_str: Template string with Jinja2 syntax
+
+        Returns:
+            TemplatePlan to bind() before a race
+        """
+        return compile_plan(self.env, template_str)
+
+    def bind(
+        self,
+        plan: TemplatePlan,
+        variables: Mapping[str, Any],
+        context: Optional[ExecutionContext] = None,
+    ) -> BoundTemplate:
+        """
+        Render the thread-invariant segments of a plan once.
+
+        Args:
+            plan: Plan from compile_plan()
+            variables: Variables shared by every thread (no thread, input or group)
+            context: Optional ExecutionContext for argv access
 
-        # Parse and render template
-        template = self.env.from_string(template_str)
-        return template.render(**render_input)
+        Returns:
+            BoundTemplate that renders only the varying segments per thread
+        """
+        parts = []
+        for segment in plan.segments:
+            template = self.env.template_class.from_code(self.env, segment.code, self.env.make_globals(None))
+            parts.append(template if segment.varying else render_template(template, variables, context))
+        return BoundTemplate(parts)
 
     def render_dict(
         self,
         data: Dict[str, Any],
-        variables: Dict[str, Any],
+        variables: Mapping[str, Any],
         context: Optional[ExecutionContext] = None,
     ) -> Dict[str, Any]:
         """
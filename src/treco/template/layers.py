@@ -0,0 +1,45 @@
+"""
+Rendering templates over layered variables.
+
+Template variables are built in layers: the ExecutionContext's variables,
+the variables of a state or thread on top (see build_template_context),
+and the template globals at the bottom. Jinja's Template.render() copies
+all of them into one dict per call; render_template() hands the layers to
+Jinja as a read-through mapping instead, so nothing is copied per render.
+"""
+
+from collections import ChainMap
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+
+import jinja2
+
+if TYPE_CHECKING:
+    from treco.models import ExecutionContext
+
+
+def render_template(
+    template: jinja2.Template,
+    variables: Mapping[str, Any],
+    context: Optional["ExecutionContext"] = None,
+) -> str:
+    """
+    Render a compiled template without copying its variables.
+
+    Args:
+        template: Compiled template
+        variables: Template variables (any mapping; it is only read)
+        context: Optional ExecutionContext for argv access (as _context)
+
+    Returns:
+        Rendered string
+    """
+    layers = ChainMap(variables, template.globals)
+    if context:
+        layers = layers.new_child({"_context": context})
+
+    # shared=True makes the mapping the template's parent scope as is
+    jinja_context = template.new_context(layers, shared=True)
+    try:
+        return template.environment.concat(template.root_render_func(jinja_context))
+    except Exception:
+        return template.environment.handle_exception()
@@ -0,0 +1,174 @@
+"""
+Partial evaluation of request templates.
+
+Race threads render the same request template with the same variables,
+except for the few that differ per thread (``thread``, ``input`` and
+``group``). A template is split once, at load time, into top-level
+segments that use one of those variables and segments that do not. Before
+a race, the thread-invariant segments are rendered once (bind()); each
+thread then renders only its varying segments and joins the pieces.
+
+Templates that assign or import names ({% set %}, macros, blocks,
+includes, ...) are not split, since a later segment may depend on an
+earlier one. Segments calling functions whose output changes from call to
+call (totp, random, ...) are treated as varying.
+"""
+
+from dataclasses import dataclass, field
+from types import CodeType
+from typing import TYPE_CHECKING, Any, List, Mapping, Optional, Union
+
+import jinja2
+from jinja2 import meta, nodes
+
+from treco.template.layers import render_template
+
+if TYPE_CHECKING:
+    from treco.models import ExecutionContext
+
+# Template variables that differ between race threads
+THREAD_VARIABLES = frozenset({"thread", "input", "group"})
+
+# Functions and filters whose output differs between calls
+VOLATILE_NAMES = frozenset({"totp", "random", "lipsum", "cycler", "joiner"})
+
+# Nodes that bind names visible to later segments
+_SCOPE_NODES = (
+    nodes.Assign,
+    nodes.AssignBlock,
+    nodes.Macro,
+    nodes.CallBlock,
+    nodes.Block,
+    nodes.Extends,
+    nodes.Import,
+    nodes.FromImport,
+    nodes.Include,
+)
+
+
+@dataclass
+class TemplateSegment:
+    """
+    Consecutive top-level nodes of a template, compiled on their own.
+
+    Attributes:
+        varying: Whether the segment depends on per-thread variables
+        code: Compiled Jinja code of the segment
+    """
+
+    varying: bool
+    code: CodeType
+
+
+@dataclass
+class TemplatePlan:
+    """
+    A template split into thread-invariant and varying segments.
+
+    Attributes:
+        segments: Segments in template order (adjacent segments of the
+                  same kind are merged)
+    """
+
+    segments: List[TemplateSegment] = field(default_factory=list)
+
+    @property
+    def has_invariant(self) -> bool:
+        """Whether any part of the template can be rendered once per race."""
+        return any(not segment.varying for segment in self.segments)
+
+    @property
+    def is_invariant(self) -> bool:
+        """Whether every thread renders the same text."""
+        return not any(segment.varying for segment in self.segments)
+
+
+class BoundTemplate:
+    """
+    A TemplatePlan with its invariant segments already rendered.
+
+    Example:
+        bound = engine.bind(plan, race_variables, context)
+        http_text = bound.render(thread_variables, context)
+    """
+
+    def __init__(self, parts: List[Union[str, jinja2.Template]]):
+        """
+        Args:
+            parts: Rendered text of invariant segments, templates of varying ones
+        """
+        self._parts = parts
+
+    def render(self, variables: Mapping[str, Any], context: Optional["ExecutionContext"] = None) -> str:
+        """
+        Render the varying segments and join them with the invariant text.
+
+        Args:
+            variables: Template variables of the thread
+            context: Optional ExecutionContext for argv access
+
+        Returns:
+            Rendered template
+        """
+        return "".join(
+            part if isinstance(part, str) else render_template(part, variables, context) for part in self._parts
+        )
+
+
+def _is_varying(env: jinja2.Environment, node: nodes.Node) -> bool:
+    """Return True if a top-level node reads a per-thread or volatile name."""
+    template = nodes.Template([node], lineno=1)
+    template.set_environment(env)
+    if meta.find_undeclared_variables(template) & THREAD_VARIABLES:
+        return True
+    # Globals such as totp() are not reported as undeclared variables
+    return any(
+        named.name in VOLATILE_NAMES for named in node.find_all((nodes.Name, nodes.Filter))
+    )
+
+
+def _top_level_nodes(template: nodes.Template) -> List[nodes.Node]:
+    """Split top-level output into one node per expression or text block."""
+    result: List[nodes.Node] = []
+    for node in template.body:
+        if isinstance(node, nodes.Output):
+            result.extend(nodes.Output([child], lineno=child.lineno) for child in node.nodes)
+        else:
+            result.append(node)
+    return result
+
+
+def compile_plan(env: jinja2.Environment, source: str) -> TemplatePlan:
+    """
+    Split a template into thread-invariant and varying segments.
+
+    Args:
+        env: Environment the template is rendered with
+        source: Template source
+
+    Returns:
+        TemplatePlan; a template that cannot be split has a single
+        varying segment
+
+    Raises:
+        jinja2.TemplateSyntaxError: If the template is invalid
+    """
+    template = env.parse(source)
+
+    groups: List[Any] = []
+    if template.find(_SCOPE_NODES) is not None:
+        groups.append((True, list(template.body)))
+    else:
+        for node in _top_level_nodes(template):
+            varying = _is_varying(env, node)
+            if groups and groups[-1][0] == varying:
+                groups[-1][1].append(node)
+            else:
+                groups.append((varying, [node]))
+
+    segments = []
+    for varying, body in groups:
+        segment = nodes.Template(body, lineno=1)
+        segment.set_environment(env)
+        segments.append(TemplateSegment(varying=varying, code=env.compile(segment)))
+    return TemplatePlan(segments=segments)
@@ -0,0 +1,42 @@
+"""
+Tests for layered execution contexts.
+"""
+
+from treco.models import ExecutionContext, build_template_context
+from treco.template import TemplateEngine
+
+
+class TestExecutionContextLayers:
+    """Test cases for ExecutionContext.copy() and build_template_context()."""
+
+    def test_child_reads_through_and_writes_locally(self):
+        """Test that a child sees parent variables but keeps its own writes."""
+        parent = ExecutionContext(argv={"user": "alice"})
+        parent.set("token", "abc")
+        child = parent.copy()
+        child.set("token", "xyz")
+        parent.set("balance", 10)
+
+        assert (child.get("token"), child.get("balance"), child.get_argv("user")) == ("xyz", 10, "alice")
+        assert parent.get("token") == "abc"
+
+    def test_child_list_items_copy_on_write(self):
+        """Test that list writes in a child do not change the parent's list."""
+        parent = ExecutionContext()
+        parent.reserve_list("results", 2)
+        child = parent.copy()
+        child.set_list_item("results", 1, "child")
+
+        assert parent.get("results") == [None, None]
+        assert child.get("results") == [None, "child"]
+
+    def test_template_context_is_not_copied(self):
+        """Test that template variables are layered over the live context."""
+        context = ExecutionContext()
+        context.set("token", "abc")
+        variables = build_template_context(context, target={"host": "example.com"}, thread={"id": 3})
+        context.set("token", "xyz")
+        variables["extra"] = 1
+
+        assert TemplateEngine(bytecode_cache=False).render("{{ token }}-{{ thread.id }}", variables) == "xyz-3"
+        assert context.get("extra") is None
@@ -0,0 +1,90 @@
+"""
+Tests for send-start dispersion (race window) analysis.
+"""
+
+from treco.orchestrator.dispersion import analyze_dispersion, kernel_timestamped, measure_dispersion, send_offsets
+from treco.orchestrator.race_executor import RaceResult
+
+
+def _result(start_ns, group="", target_offset_ns=None, round=1, tx_ns=None):
+    return RaceResult(
+        thread_id=0,
+        status=200,
+        extracted={},
+        timing_ns=0,
+        round=round,
+        target_offset_ns=target_offset_ns,
+        send_start_ns=start_ns,
+        group=group,
+        tx_timestamp_ns=tx_ns,
+    )
+
+
+class TestMeasureDispersion:
+    """Test cases for measure_dispersion."""
+
+    def test_percentiles_and_histogram(self):
+        """Test percentiles by rank and equal-width histogram bins."""
+        dispersion = measure_dispersion(list(range(1000, 1100)), bins=4)
+
+        assert dispersion.count == 100
+        assert dispersion.spread_ns == 99
+        assert dispersion.first_ns == 1000
+        assert dispersion.percentiles_ns == {50: 50, 90: 90, 99: 99}
+        assert dispersion.histogram == [25, 25, 25, 25]
+
+    def test_single_send(self):
+        """Test that one send has no spread and lands in the first bin."""
+        dispersion = measure_dispersion([42], bins=3)
+
+        assert dispersion.spread_ns == 0
+        assert dispersion.histogram == [1, 0, 0]
+        assert dispersion.verdict == "excellent"
+
+    def test_verdict(self):
+        """Test the verdict thresholds on the spread."""
+        assert measure_dispersion([0, 50_000_000]).verdict == "good"
+        assert measure_dispersion([0, 100_000_000]).verdict == "poor"
+
+
+class TestAnalyzeDispersion:
+    """Test cases for send offsets and per-group breakdown."""
+
+    def test_rounds_are_measured_separately(self):
+        """Test that each round is measured from its own first send."""
+        results = [_result(100), _result(130), _result(10_000, round=2), _result(10_010, round=2)]
+
+        assert [offset for offset, _ in send_offsets(results)] == [0, 0, 10, 30]
+
+    def test_skips_unsent(self):
+        """Test that results without a send start are ignored."""
+        overall, by_group = analyze_dispersion([_result(None)])
+
+        assert overall is None
+        assert by_group == {}
+
+    def test_group_offsets_are_not_spread(self):
+        """Test that intended group offsets are removed before measuring."""
+        results = [
+            _result(1_000, group="first"),
+            _result(1_020, group="first"),
+            _result(251_010, group="second", target_offset_ns=250_000),
+            _result(251_050, group="second", target_offset_ns=250_000),
+        ]
+
+        overall, by_group = analyze_dispersion(results)
+
+        assert overall.spread_ns == 50
+        assert (by_group["first"].first_ns, by_group["first"].spread_ns) == (0, 20)
+        assert (by_group["second"].first_ns, by_group["second"].spread_ns) == (10, 40)
+
+    def test_kernel_timestamps_replace_send_starts(self):
+        """Test that TX timestamps are used only when every send has one."""
+        results = [_result(100, tx_ns=5_000), _result(900, tx_ns=5_030)]
+
+        assert kernel_timestamped(results)
+        assert [offset for offset, _ in send_offsets(results)] == [0, 30]
+
+        results.append(_result(950))
+        assert not kernel_timestamped(results)
+        assert send_offsets(results)[-1][0] == 850
@@ -0,0 +1,121 @@
+"""
+Tests for distributed race coordination.
+"""
+
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from treco.orchestrator.distributed import CoordinatorNode, WorkerNode, parse_address
+from treco.orchestrator.race_executor import RaceResult
+from treco.sync import TimedReleaseSync
+
+
+def _run_worker(port, results):
+    """Join a coordinator, race two threads at the agreed time, report back."""
+    node = WorkerNode("127.0.0.1", port)
+    node.start()
+    sync = TimedReleaseSync(node.release_time)
+    sync.prepare(2)
+
+    released = []
+
+    def thread_main():
+        sync.wait(0)
+        released.append(time.time_ns())
+
+    threads = [threading.Thread(target=thread_main) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    local = [RaceResult(thread_id=i, status=200, extracted={"t": t}, timing_ns=1) for i, t in enumerate(released)]
+    node.gather_results("race", local)
+    results.put((sync.deadline_ns, node.offset_ns))
+    node.close()
+
+
+class TestDistributedRace:
+    """Coordinator and workers in separate local processes."""
+
+    def test_release_and_gather(self):
+        """Test that all nodes agree on the release time and results are merged."""
+        coordinator = CoordinatorNode("127.0.0.1", 0, workers=2, lead_ms=200, join_timeout=30, round_timeout=30)
+        port = coordinator.listen()
+
+        ctx = multiprocessing.get_context()
+        queue = ctx.Queue()
+        workers = [ctx.Process(target=_run_worker, args=(port, queue), daemon=True) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+
+        try:
+            coordinator.start()
+            deadline = coordinator.release_time()
+            local = [RaceResult(thread_id=i, status=200, extracted={}, timing_ns=1) for i in range(3)]
+            merged = coordinator.gather_results("race", local)
+            reported = [queue.get(timeout=30) for _ in workers]
+        finally:
+            coordinator.close()
+            for worker in workers:
+                worker.join(timeout=10)
+
+        assert sorted(r.thread_id for r in merged) == list(range(7))
+        for worker_deadline, offset_ns in reported:
+            # Same host: converted deadlines match within clock-sync error
+            assert abs(offset_ns) < 5_000_000
+            assert abs(worker_deadline - deadline) < 5_000_000
+
+        # Worker threads were released at (or just after) the agreed time
+        released = [r.extracted["t"] for r in merged if "t" in r.extracted]
+        assert len(released) == 4
+        assert all(0 <= t - deadline < 50_000_000 for t in released)
+
+    def test_join_timeout(self):
+        """Test that start() fails when workers do not join in time."""
+        coordinator = CoordinatorNode("127.0.0.1", 0, workers=1, join_timeout=0.1)
+        try:
+            with pytest.raises(TimeoutError):
+                coordinator.start()
+        finally:
+            coordinator.close()
+
+
+class TestTimedReleaseSync:
+    """Test cases for TimedReleaseSync."""
+
+    def test_release_time_called_once(self):
+        """Test that the last thread agrees on the time and nobody leaves early."""
+        calls = []
+
+        def release_time():
+            calls.append(1)
+            return time.time_ns() + 20_000_000
+
+        sync = TimedReleaseSync(release_time)
+        sync.prepare(3)
+        released = []
+
+        threads = [
+            threading.Thread(target=lambda: (sync.wait(0), released.append(time.time_ns())))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(calls) == 1
+        assert len(released) == 3
+        assert all(t >= sync.deadline_ns for t in released)
+
+
+def test_parse_address():
+    """Test HOST:PORT parsing."""
+    assert parse_address("0.0.0.0:7000") == ("0.0.0.0", 7000)
+    assert parse_address("[::1]:7000") == ("::1", 7000)
+    with pytest.raises(ValueError):
+        parse_address("localhost")
@@ -0,0 +1,89 @@
+"""
+Tests for precompiled extraction plans.
+"""
+
+import pickle
+import re
+
+import httpx
+import jwt
+
+from treco.http.extractor import ExtractPlan, extract_all
+from treco.http.extractor.boundary import Boundaries
+from treco.models.config import ExtractPattern
+
+EXTRACTS = {
+    "token": ExtractPattern("regex", r'"token":\s*"(\w+)"'),
+    "user": ExtractPattern("jpath", "$.user.name"),
+    "id": ExtractPattern("jpath", "$.user.id"),
+    "between": ExtractPattern("boundary", '"token": "|||"'),
+    "ctype": ExtractPattern("header", "content-type"),
+}
+
+
+class _CountingResponse:
+    """Response counting how often its JSON body is parsed."""
+
+    def __init__(self, response):
+        self._response = response
+        self.json_calls = 0
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+    def json(self):
+        self.json_calls += 1
+        return self._response.json()
+
+
+def _response():
+    return httpx.Response(200, json={"token": "abc", "user": {"name": "alice", "id": 7}})
+
+
+class TestExtractPlan:
+    """Test cases for ExtractPlan."""
+
+    def test_matches_uncompiled_extraction(self):
+        """Test that a plan extracts the same values as the raw patterns."""
+        plan = ExtractPlan(EXTRACTS)
+
+        assert plan.run(_response()) == extract_all(_response(), EXTRACTS)
+        assert extract_all(_response(), plan)["user"] == "alice"
+
+    def test_patterns_are_compiled(self):
+        """Test that patterns are prepared when the plan is built."""
+        steps = {step.name: step.pattern for step in ExtractPlan(EXTRACTS).steps}
+
+        assert isinstance(steps["token"], re.Pattern)
+        assert not isinstance(steps["user"], str)
+        assert steps["between"] == Boundaries('"token": "', '"', False, False)
+
+    def test_json_parsed_once(self):
+        """Test that several JSONPath extracts share one parsed body."""
+        response = _CountingResponse(_response())
+        ExtractPlan(EXTRACTS).run(response)
+
+        assert response.json_calls == 1
+
+    def test_invalid_pattern_falls_back(self):
+        """Test that a pattern that does not compile still extracts None at runtime."""
+        plan = ExtractPlan({"bad": ExtractPattern("boundary", "no separator")})
+
+        assert plan.steps[0].pattern == "no separator"
+        assert plan.run(_response()) == {"bad": None}
+
+    def test_pickles_for_worker_processes(self):
+        """Test that plans with compiled XPath survive pickling."""
+        plan = ExtractPlan({"title": ExtractPattern("xpath", "//title/text()")})
+        response = httpx.Response(200, text="<html><title>hi</title></html>")
+
+        assert pickle.loads(pickle.dumps(plan)).run(response) == {"title": "hi"}
+
+    def test_jwt_literal_secret_prepared(self):
+        """Test that a literal JWT secret is prepared once and verifies tokens."""
+        token = jwt.encode({"sub": "alice"}, "0123456789abcdef0123456789abcdef", algorithm="HS256")
+        pattern = {"source": token, "claim": "sub", "verify": True, "secret": "0123456789abcdef0123456789abcdef"}
+        plan = ExtractPlan({"sub": ExtractPattern("jwt", pattern)})
+
+        assert "_prepared_key" in plan.steps[0].pattern
+        assert plan.run(_response()) == {"sub": "alice"}
@@ -0,0 +1,123 @@
+"""
+Tests for partial response reads (state response.read).
+"""
+
+import socket
+
+import httpx
+import pytest
+
+from treco.http.partial import send_request
+from treco.http.raw import HTTP11Reader
+from treco.models.config import ResponseConfig
+from treco.parser.validator import ConfigValidator
+
+
+class TestHTTP11ReaderLimit:
+    """Test cases for body limits in HTTP11Reader."""
+
+    @pytest.fixture
+    def sockets(self):
+        """Create a connected socket pair."""
+        client, server = socket.socketpair()
+        yield client, server
+        client.close()
+        server.close()
+
+    def test_capped_content_length(self, sockets):
+        """Test that only the first bytes of a body are read."""
+        client, server = sockets
+        server.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\n0123")
+
+        raw = HTTP11Reader(client).read_response("GET", body_limit=4)
+
+        assert raw.content == b"0123"
+
+    def test_capped_chunked(self, sockets):
+        """Test that a chunked body stops at the limit."""
+        client, server = sockets
+        server.sendall(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n3\r\nabc\r\n3\r\ndef\r\n")
+
+        raw = HTTP11Reader(client).read_response("GET", body_limit=4)
+
+        assert raw.content == b"abcd"
+
+    def test_headers_only_blocks_next_read(self, sockets):
+        """Test that a connection with an unread body is not read again."""
+        client, server = sockets
+        server.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\n")
+        reader = HTTP11Reader(client)
+
+        assert reader.read_response("GET", body_limit=0).status_code == 200
+        with pytest.raises(httpx.RemoteProtocolError):
+            reader.read_response("GET")
+
+    def test_complete_body_within_limit(self, sockets):
+        """Test that a body shorter than the limit keeps the connection usable."""
+        client, server = sockets
+        server.sendall(
+            b"HTTP/1.1 200 OK\r\nContent-Length: 1\r\n\r\na"
+            b"HTTP/1.1 200 OK\r\nContent-Length: 1\r\n\r\nb"
+        )
+        reader = HTTP11Reader(client)
+
+        assert reader.read_response("GET", body_limit=4).content == b"a"
+        assert reader.read_response("GET").content == b"b"
+
+
+def test_send_request_caps_httpx_body():
+    """Test that httpx responses are streamed and cut at the limit."""
+    client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b"x" * 100)))
+    request = client.build_request("GET", "http://example.com/")
+
+    assert send_request(client, request, ResponseConfig(read="capped", max_bytes=10).body_limit).content == b"x" * 10
+    assert send_request(client, request, ResponseConfig(read="headers").body_limit).content == b""
+    assert len(send_request(client, request, ResponseConfig().body_limit).content) == 100
+
+
+class TestResponseValidation:
+    """Test cases for response read validation in ConfigValidator."""
+
+    def _config(self, response, extract):
+        return {
+            "metadata": {"name": "t", "version": "1.0", "author": "a", "vulnerability": "CWE-362"},
+            "target": {"host": "example.com", "port": 80},
+            "entrypoint": {"state": "race"},
+            "states": {
+                "race": {
+                    "description": "race",
+                    "request": "GET / HTTP/1.1\nHost: example.com\n",
+                    "race": {"threads": 2},
+                    "response": response,
+                    "extract": extract,
+                    "next": [{"goto": "end"}],
+                },
+                "end": {"description": "end"},
+            },
+        }
+
+    def test_headers_allows_header_extractors(self):
+        """Test that header and cookie extractors run on headers only."""
+        extract = {"ct": {"type": "header", "pattern": "content-type"}, "sid": {"type": "cookie", "pattern": "sid"}}
+
+        ConfigValidator().validate(self._config({"read": "headers"}, extract))
+
+    def test_headers_rejects_body_extractor(self):
+        """Test that a regex extractor needs the body."""
+        with pytest.raises(ValueError, match="reads the response body"):
+            ConfigValidator().validate(self._config({"read": "headers"}, {"token": "token=(\\w+)"}))
+
+    def test_capped_rejects_document_extractor(self):
+        """Test that JSONPath needs the whole body while regex works on a prefix."""
+        ConfigValidator().validate(self._config({"read": "capped", "max_bytes": 256}, {"token": "token=(\\w+)"}))
+
+        with pytest.raises(ValueError, match="cannot run with response read 'capped'"):
+            ConfigValidator().validate(self._config({"read": "capped"}, {"ok": {"type": "jpath", "pattern": "$.ok"}}))
+
+    def test_rejects_body_condition(self):
+        """Test that body conditions need the body."""
+        config = self._config({"read": "headers"}, {})
+        config["states"]["race"]["next"] = [{"when": [{"body_contains": "ok"}], "goto": "end"}]
+
+        with pytest.raises(ValueError, match="body_contains"):
+            ConfigValidator().validate(config)
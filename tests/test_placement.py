@@ -0,0 +1,91 @@
+"""
+Tests for CPU placement of race threads.
+"""
+
+import os
+import threading
+
+import pytest
+
+from treco.orchestrator.placement import (
+    ThreadPlacement,
+    available_cpus,
+    current_cpu,
+    parse_cpu_list,
+    resolve_cpus,
+)
+
+
+class TestCpuLists:
+    """Test cases for CPU list parsing."""
+
+    def test_parse_ranges(self):
+        """Test CPU numbers and ranges."""
+        assert parse_cpu_list("0-3,8,10-11") == [0, 1, 2, 3, 8, 10, 11]
+
+    @pytest.mark.parametrize("spec", ["", "a", "3-1", "1-", "1,,2"])
+    def test_parse_invalid(self, spec):
+        """Test that malformed lists are rejected."""
+        with pytest.raises(ValueError):
+            parse_cpu_list(spec)
+
+    def test_resolve(self):
+        """Test every cpu_affinity form."""
+        assert resolve_cpus(None) is None
+        assert resolve_cpus("spread") == available_cpus()
+        assert resolve_cpus("2-3") == [2, 3]
+        assert resolve_cpus([5, 1]) == [5, 1]
+
+
+class TestThreadPlacement:
+    """Test cases for ThreadPlacement."""
+
+    def test_round_robin(self):
+        """Test that threads wrap around the CPU list."""
+        placement = ThreadPlacement([4, 6])
+
+        assert [placement.cpu_for(i) for i in range(4)] == [4, 6, 4, 6]
+
+    def test_disabled_by_default(self):
+        """Test that nothing is applied without options."""
+        placement = ThreadPlacement()
+
+        assert not placement.enabled
+        assert placement.cpu_for(0) is None
+
+    def test_invalid_scheduling(self):
+        """Test that unknown policies are rejected."""
+        with pytest.raises(ValueError):
+            ThreadPlacement(scheduling="turbo")
+
+    @pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="requires sched_setaffinity")
+    def test_pins_thread(self):
+        """Test that apply() pins the calling thread only."""
+        cpu = available_cpus()[-1]
+        placement = ThreadPlacement([cpu])
+        seen = {}
+
+        def worker():
+            placement.apply(0)
+            seen["affinity"] = os.sched_getaffinity(0)
+            seen["cpu"] = current_cpu()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert seen["affinity"] == {cpu}
+        assert seen["cpu"] in (cpu, None)
+
+    def test_unusable_cpu_warns(self, caplog):
+        """Test that a CPU outside the allowed set only logs a warning."""
+        placement = ThreadPlacement([max(available_cpus()) + 4096])
+        affinity = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else None
+
+        thread = threading.Thread(target=placement.apply, args=(0,))
+        thread.start()
+        thread.join()
+
+        assert "Cannot pin" in caplog.text
+        if affinity is not None:
+            assert os.sched_getaffinity(0) == affinity
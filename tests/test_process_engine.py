@@ -0,0 +1,99 @@
+"""
+Tests for the multi-process race engine.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from treco.http.compiler import compile_request
+from treco.models.config import TargetConfig
+from treco.orchestrator.process_engine import (
+    SharedRelease,
+    ShardConfig,
+    ShardThread,
+    default_process_count,
+    run_sharded_race,
+)
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    """Answer every GET with 204."""
+
+    def do_GET(self):
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestSharedRelease:
+    """Test cases for SharedRelease."""
+
+    def test_spinners_wait_for_release(self):
+        """Test that spinners pass only after release() is called."""
+        shared = SharedRelease(slots=3)
+        passed = []
+
+        def spinner(i):
+            shared.arrive()
+            shared.spin()
+            passed.append(i)
+
+        threads = [threading.Thread(target=spinner, args=(i,)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+
+        assert shared.wait_ready(3, workers=[], timeout=5)
+        assert passed == []
+
+        shared.release()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert sorted(passed) == [0, 1, 2]
+
+    def test_wait_ready_timeout(self):
+        """Test that wait_ready() gives up after the timeout."""
+        shared = SharedRelease(slots=2)
+        shared.arrive()
+
+        assert not shared.wait_ready(2, workers=[], timeout=0.01)
+
+    def test_result_arrays(self):
+        """Test that result arrays are sized and zeroed per thread."""
+        shared = SharedRelease(slots=4)
+
+        assert list(shared.status) == [0, 0, 0, 0]
+        assert list(shared.timing_ns) == [0, 0, 0, 0]
+
+
+def test_sharded_race_with_missing_thread_ids():
+    """Test that results are stored by thread ID when lower IDs were not sharded."""
+    server = HTTPServer(("127.0.0.1", 0), _OkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    shard = ShardConfig(
+        target=TargetConfig(host="127.0.0.1", port=server.server_port),
+        connection_strategy="preconnect",
+        send_engine="httpx",
+        warmup="head",
+        warmup_path="/",
+        bypass_proxy=False,
+        extract={},
+        # Thread 0 failed to render and was never sharded
+        threads=[ShardThread(thread_id=1, request=compile_request("GET /"))],
+    )
+
+    try:
+        shared, extras = run_sharded_race([shard], ready_timeout=10)
+    finally:
+        server.shutdown()
+
+    assert extras[1]["error"] == ""
+    assert list(shared.status) == [0, 204]
+
+
+def test_default_process_count():
+    """Test that there are never more processes than threads."""
+    assert default_process_count(1) == 1
+    assert 1 <= default_process_count(10_000)
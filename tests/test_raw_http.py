@@ -0,0 +1,179 @@
+"""
+Tests for raw HTTP/1.1 serialization and response reading.
+"""
+
+import gzip
+import socket
+
+import httpx
+import pytest
+
+from treco.http.extractor import ResponseProtocol, extract_all
+from treco.http.raw import HTTP11Reader, RawResponse, serialize_request
+from treco.models.config import ExtractPattern
+
+
+class TestSerializeRequest:
+    """Test cases for serialize_request."""
+
+    def test_request_line_and_headers(self):
+        """Test that the request line, headers and body are serialized."""
+        request = httpx.Request(
+            "POST", "http://example.com:8080/api?x=1", headers={"X-Test": "1"}, content=b"a=b"
+        )
+        data = serialize_request(request)
+
+        head, body = data.split(b"\r\n\r\n", 1)
+        lines = head.split(b"\r\n")
+
+        assert lines[0] == b"POST /api?x=1 HTTP/1.1"
+        assert b"Host: example.com:8080" in lines
+        assert b"X-Test: 1" in lines
+        assert b"Content-Length: 3" in lines
+        assert body == b"a=b"
+
+    def test_no_body(self):
+        """Test that a bodiless request ends with the header terminator."""
+        request = httpx.Request("GET", "http://example.com/")
+        assert serialize_request(request).endswith(b"\r\n\r\n")
+
+
+class TestHTTP11Reader:
+    """Test cases for HTTP11Reader."""
+
+    @pytest.fixture
+    def sockets(self):
+        """Create a connected socket pair."""
+        client, server = socket.socketpair()
+        yield client, server
+        client.close()
+        server.close()
+
+    def test_content_length(self, sockets):
+        """Test reading a Content-Length framed response."""
+        client, server = sockets
+        server.sendall(b"HTTP/1.1 201 Created\r\nContent-Length: 5\r\nX-A: b\r\n\r\nhello")
+
+        raw = HTTP11Reader(client).read_response("GET")
+
+        assert raw.status_code == 201
+        assert raw.reason == "Created"
+        assert raw.headers["x-a"] == "b"
+        assert raw.content == b"hello"
+
+    def test_chunked_with_trailers(self, sockets):
+        """Test reading a chunked response with trailers."""
+        client, server = sockets
+        server.sendall(
+            b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+            b"3;ext=1\r\nabc\r\n2\r\nde\r\n0\r\nX-Trailer: 1\r\n\r\n"
+        )
+
+        raw = HTTP11Reader(client).read_response("GET")
+
+        assert raw.content == b"abcde"
+
+    def test_skips_interim_response(self, sockets):
+        """Test that 1xx responses are skipped."""
+        client, server = sockets
+        server.sendall(b"HTTP/1.1 100 Continue\r\n\r\nHTTP/1.1 204 No Content\r\n\r\n")
+
+        raw = HTTP11Reader(client).read_response("POST")
+
+        assert raw.status_code == 204
+        assert raw.content == b""
+
+    def test_read_until_close(self, sockets):
+        """Test reading a body delimited by connection close."""
+        client, server = sockets
+        server.sendall(b"HTTP/1.0 200 OK\r\n\r\nbody")
+        server.shutdown(socket.SHUT_WR)
+
+        raw = HTTP11Reader(client).read_response("GET")
+
+        assert raw.http_version == "HTTP/1.0"
+        assert raw.content == b"body"
+
+    def test_keeps_pipelined_bytes(self, sockets):
+        """Test that bytes after one response are kept for the next."""
+        client, server = sockets
+        server.sendall(
+            b"HTTP/1.1 200 OK\r\nContent-Length: 1\r\n\r\na"
+            b"HTTP/1.1 200 OK\r\nContent-Length: 1\r\n\r\nb"
+        )
+
+        reader = HTTP11Reader(client)
+
+        assert reader.read_response().content == b"a"
+        assert reader.read_response().content == b"b"
+
+    def test_initial_bytes(self, sockets):
+        """Test that bytes received before the reader was created are parsed first."""
+        client, server = sockets
+        server.sendall(b"lo")
+
+        raw = HTTP11Reader(client, initial=b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nhel").read_response()
+
+        assert raw.content == b"hello"
+
+    def test_truncated_body(self, sockets):
+        """Test that a truncated body raises RemoteProtocolError."""
+        client, server = sockets
+        server.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nshort")
+        server.shutdown(socket.SHUT_WR)
+
+        with pytest.raises(httpx.RemoteProtocolError):
+            HTTP11Reader(client).read_response()
+
+    def test_to_httpx_decodes_content_encoding(self, sockets):
+        """Test conversion to httpx.Response with gzip content."""
+        client, server = sockets
+        body = gzip.compress(b"payload")
+        server.sendall(
+            b"HTTP/1.1 200 OK\r\nContent-Encoding: gzip\r\nContent-Length: "
+            + str(len(body)).encode()
+            + b"\r\n\r\n"
+            + body
+        )
+
+        request = httpx.Request("GET", "http://example.com/")
+        response = HTTP11Reader(client).read_response().to_httpx(request)
+
+        assert response.status_code == 200
+        assert response.text == "payload"
+        assert response.reason_phrase == "OK"
+
+
+class TestRawResponse:
+    """Test cases for RawResponse as an extractor input."""
+
+    def test_satisfies_response_protocol(self):
+        """Test that RawResponse works with extractors."""
+        raw = RawResponse(
+            status_code=200,
+            raw_headers=[
+                (b"Content-Type", b"application/json; charset=utf-8"),
+                (b"Set-Cookie", b"session=abc; Path=/; HttpOnly"),
+                (b"Set-Cookie", b"theme=dark"),
+            ],
+            raw_content=b'{"token": "t0k3n"}',
+        )
+
+        assert isinstance(raw, ResponseProtocol)
+        assert raw.json() == {"token": "t0k3n"}
+        assert raw.cookies == {"session": "abc", "theme": "dark"}
+        assert raw.headers.get("content-type").startswith("application/json")
+
+        extracted = extract_all(raw, {"token": ExtractPattern(pattern_type="jpath", pattern_data="$.token")})
+        assert extracted == {"token": "t0k3n"}
+
+    def test_decodes_content_encoding(self):
+        """Test that gzip bodies are decoded on access."""
+        raw = RawResponse(
+            status_code=200,
+            raw_headers=[(b"Content-Encoding", b"gzip")],
+            raw_content=gzip.compress(b"hello"),
+        )
+
+        assert raw.content == b"hello"
+        assert raw.text == "hello"
@@ -0,0 +1,49 @@
+"""
+Tests for the bytes-level request compiler.
+"""
+
+import httpx
+
+from treco.http.compiler import compile_request
+from treco.http.raw import request_bytes, serialize_request
+
+
+class TestCompileRequest:
+    """Test cases for compile_request and CompiledRequest."""
+
+    def test_parses_crlf_and_lf(self):
+        """Test that LF and CRLF line ends give the same request."""
+        lf = compile_request('post /api HTTP/1.1\nHost: a\nX-Token: a:b\n\n{"a": 1}\n')
+        crlf = compile_request('post /api HTTP/1.1\r\nHost: a\r\nX-Token: a:b\r\n\r\n{"a": 1}\r\n')
+
+        assert lf == crlf
+        assert (lf.method, lf.target, lf.body) == ("POST", "/api", b'{"a": 1}')
+        assert lf.headers == ((b"Host", b"a"), (b"X-Token", b"a:b"))
+
+    def test_content_length_matches_body(self):
+        """Test that a Content-Length from the template is set to the body length."""
+        compiled = compile_request("POST /p HTTP/1.1\nContent-Length: 99\n\nabc")
+
+        assert compiled.headers == ((b"Content-Length", b"3"),)
+
+    def test_binary_body_and_duplicate_headers(self):
+        """Test that bodies are kept byte for byte and repeated headers are kept."""
+        compiled = compile_request(b"POST /p\nCookie: a=1\nCookie: b=2\n\n\x00\xff\r\n\x01")
+
+        assert compiled.body == b"\x00\xff\r\n\x01"
+        assert [value for _, value in compiled.headers] == [b"a=1", b"b=2"]
+
+    def test_build_applies_base_url(self):
+        """Test that built requests use the client's base_url and compute lengths."""
+        client = httpx.Client(base_url="http://example.com:8080")
+        request = compile_request("POST /api?x=1\n\nab").build(client)
+
+        assert str(request.url) == "http://example.com:8080/api?x=1"
+        assert request.headers["Content-Length"] == "2"
+
+    def test_request_bytes_serialized_once(self):
+        """Test that the wire buffer is computed once per request."""
+        request = compile_request("GET /").build(httpx.Client(base_url="http://example.com"))
+
+        assert request_bytes(request) is request_bytes(request)
+        assert request_bytes(request) == serialize_request(request)
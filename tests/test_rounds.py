@@ -0,0 +1,130 @@
+"""
+Tests for multi-round races.
+"""
+
+import threading
+
+from treco.orchestrator.race_executor import RaceResult
+from treco.orchestrator.rounds import RaceRounds, summarize_round
+from treco.sync import BarrierSync
+
+
+def _result(thread_id, status=200, timing_ms=1, start_ms=None):
+    return RaceResult(
+        thread_id=thread_id,
+        status=status,
+        extracted={},
+        timing_ns=timing_ms * 1_000_000,
+        send_start_ns=start_ms * 1_000_000 if start_ms is not None else None,
+    )
+
+
+def _run(rounds, num_threads, status=200):
+    """Fire num_threads threads until rounds says to stop; return rounds fired per thread."""
+    fired = [0] * num_threads
+
+    def worker(thread_id):
+        while True:
+            rounds.race_sync.wait(thread_id)
+            fired[thread_id] += 1
+            if not rounds.complete(_result(thread_id, status)):
+                return
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    return fired
+
+
+def _rounds(num_threads, **kwargs):
+    sync = BarrierSync()
+    sync.prepare(num_threads)
+    return RaceRounds(num_threads=num_threads, race_sync=sync, **kwargs)
+
+
+class TestRaceRounds:
+    """Test cases for RaceRounds."""
+
+    def test_single_round(self):
+        """Test that one round does not wait at the end."""
+        rounds = _rounds(4, rounds=1)
+
+        assert _run(rounds, 4) == [1] * 4
+        assert len(rounds.results) == 4
+        assert rounds.stats == []
+
+    def test_all_rounds_fire(self):
+        """Test that every thread fires once per round."""
+        rounds = _rounds(4, rounds=3)
+
+        assert _run(rounds, 4) == [3] * 4
+        assert [r.round for r in rounds.results].count(3) == 4
+        assert [s.successful for s in rounds.stats] == [4, 4, 4]
+
+    def test_until_stops_early(self):
+        """Test that the stop condition ends the race after a round."""
+        rounds = _rounds(3, rounds=10, until=lambda stats: stats.number == 2)
+
+        assert _run(rounds, 3) == [2] * 3
+        assert len(rounds.stats) == 2
+
+    def test_failing_until_advances_round(self):
+        """Test that an error in the stop condition still wakes the threads for the next round."""
+        def until(stats):
+            raise ValueError("bad expression")
+
+        rounds = _rounds(3, rounds=3, until=until)
+
+        assert _run(rounds, 3) == [3] * 3
+
+    def test_until_runs_without_lock(self):
+        """Test that the stop condition is evaluated with the round lock released."""
+        unlocked = []
+
+        def until(stats):
+            acquired = rounds._cond.acquire(blocking=False)
+            if acquired:
+                rounds._cond.release()
+            unlocked.append(acquired)
+            return False
+
+        rounds = _rounds(2, rounds=3, until=until)
+
+        assert _run(rounds, 2) == [3, 3]
+        assert unlocked == [True, True]
+
+    def test_leave_does_not_block(self):
+        """Test that a thread leaving does not hold the round back."""
+        rounds = _rounds(3, rounds=2)
+        rounds.leave(_result(2, status=0))
+        rounds.race_sync.prepare(2)
+
+        assert _run(rounds, 2) == [2, 2]
+        assert rounds.stats[0].failed == 1
+
+    def test_results_in_thread_slots(self):
+        """Test that results land in per-thread slots, round by round."""
+        rounds = _rounds(3, rounds=1)
+        for thread_id in (2, 0, 1):
+            rounds.complete(_result(thread_id))
+
+        assert [r.thread_id for r in rounds.results] == [0, 1, 2]
+        assert not hasattr(rounds.results[0], "__dict__")
+
+
+def test_summarize_round():
+    """Test the per-round window over send starts, not response times."""
+    stats = summarize_round(
+        1,
+        [
+            _result(0, timing_ms=2, start_ms=10),
+            _result(1, timing_ms=50, start_ms=13),
+            _result(2, status=500, start_ms=11),
+            _result(3, status=0),
+        ],
+    )
+
+    assert (stats.total, stats.successful, stats.failed) == (4, 2, 2)
+    assert stats.window_ms == 3.0
@@ -286,6 +286,27 @@ class TestSchemaValidator:
         
         assert "timeout" in str(exc_info.value).lower() or "minimum" in str(exc_info.value).lower()
 
+    def test_socket_options(self, validator, valid_config):
+        """Test that socket options are validated."""
+        valid_config["target"]["socket"] = {
+            "nodelay": False,
+            "quickack": True,
+            "sndbuf": 65536,
+            "rcvbuf": 131072,
+            "cork": True,
+            "bind": "10.0.0.2"
+        }
+        
+        # Should not raise any exception
+        validator.validate(valid_config)
+
+    def test_invalid_socket_buffer(self, validator, valid_config):
+        """Test that a negative buffer size raises error."""
+        valid_config["target"]["socket"] = {"sndbuf": -1}
+        
+        with pytest.raises(SchemaValidationError):
+            validator.validate(valid_config)
+
     def test_mtls_client_cert_and_key(self, validator, valid_config):
         """Test that mTLS with separate cert and key is valid."""
         valid_config["target"]["tls"]["client_cert"] = "/path/to/client.crt"
@@ -0,0 +1,145 @@
+"""
+Frame-level tests for the HTTP/2 single-packet strategy.
+"""
+
+import socket
+
+import h2.config
+import h2.connection
+import h2.events
+import h2.settings
+import httpx
+
+from treco.connection.single_packet import SinglePacketSession, SinglePacketStrategy
+
+
+class _CountingSocket:
+    """Socket wrapper counting sendall() calls."""
+
+    def __init__(self, sock):
+        self._sock = sock
+        self.writes = 0
+
+    def __getattr__(self, name):
+        return getattr(self._sock, name)
+
+    def sendall(self, data):
+        self.writes += 1
+        return self._sock.sendall(data)
+
+
+class _Server:
+    """In-memory HTTP/2 server end of a socket pair."""
+
+    def __init__(self, sock, initial_window):
+        self.sock = sock
+        self.sock.settimeout(0.2)
+        config = h2.config.H2Configuration(client_side=False, header_encoding=None)
+        self.h2 = h2.connection.H2Connection(config=config)
+        self.h2.local_settings = h2.settings.Settings(
+            client=False,
+            initial_values={h2.settings.SettingCodes.INITIAL_WINDOW_SIZE: initial_window},
+        )
+        self.h2.initiate_connection()
+        self.sock.sendall(self.h2.data_to_send())
+
+    def events(self):
+        """Return the events of every frame received so far."""
+        events = []
+        while True:
+            try:
+                data = self.sock.recv(65535)
+            except socket.timeout:
+                return events
+            events.extend(self.h2.receive_data(data))
+            self.sock.sendall(self.h2.data_to_send())
+
+
+def _strategy(initial_window=65535, handler=None):
+    client_sock, server_sock = socket.socketpair()
+    strategy = SinglePacketStrategy()
+    strategy._sock = _CountingSocket(client_sock)
+    strategy._h2 = h2.connection.H2Connection(
+        config=h2.config.H2Configuration(client_side=True, header_encoding=None)
+    )
+    strategy._h2.initiate_connection()
+    strategy._sock.sendall(strategy._h2.data_to_send())
+
+    server = _Server(server_sock, initial_window)
+    strategy._wait_for_remote_settings()
+    server.events()
+
+    transport = httpx.MockTransport(handler or (lambda request: httpx.Response(204)))
+    strategy._request_builder = httpx.Client(base_url="http://example.com", transport=transport)
+    strategy._sock.writes = 0
+    return strategy, server
+
+
+def _body(events, stream_id):
+    return b"".join(e.data for e in events if isinstance(e, h2.events.DataReceived) and e.stream_id == stream_id)
+
+
+class TestSinglePacketStaging:
+    """Test cases for staging and releasing streams."""
+
+    def test_last_byte_withheld_until_release(self):
+        """Test that staging sends all but the last body byte without ending the stream."""
+        strategy, server = _strategy()
+        strategy.stage_request(0, strategy._request_builder.build_request("POST", "/a", content=b"abcdef"))
+
+        events = server.events()
+        assert [type(e) for e in events] == [h2.events.RequestReceived, h2.events.DataReceived]
+        assert events[0].stream_ended is None
+        assert _body(events, 1) == b"abcde"
+
+        assert not SinglePacketSession(strategy, 0).unstaged
+
+        strategy._flush_pending()
+        events = server.events()
+        assert _body(events, 1) == b"f"
+        assert any(isinstance(e, h2.events.StreamEnded) and e.stream_id == 1 for e in events)
+        strategy.cleanup()
+
+    def test_release_is_one_write(self):
+        """Test that the final frames of all staged streams go out in one write."""
+        strategy, server = _strategy()
+        for thread_id in range(3):
+            request = strategy._request_builder.build_request("POST", "/a", content=b"xy")
+            strategy.stage_request(thread_id, request)
+        server.events()
+
+        strategy._sock.writes = 0
+        strategy._flush_pending()
+        events = server.events()
+
+        assert strategy._sock.writes == 1
+        assert sorted(e.stream_id for e in events if isinstance(e, h2.events.StreamEnded)) == [1, 3, 5]
+        strategy.cleanup()
+
+    def test_body_over_window_sent_without_staging(self):
+        """Test that a body larger than the flow-control window falls back to a normal send."""
+        sent = []
+        strategy, server = _strategy(
+            initial_window=16,
+            handler=lambda request: sent.append(request.content) or httpx.Response(204),
+        )
+        request = strategy._request_builder.build_request("POST", "/a", content=b"x" * 32)
+        strategy.stage_request(0, request)
+
+        assert server.events() == []
+        assert strategy._sock.writes == 0
+        assert SinglePacketSession(strategy, 0).unstaged
+
+        response = strategy._send(0, request)
+        assert response.status_code == 204
+        assert sent == [b"x" * 32]
+        strategy.cleanup()
+
+    def test_window_counts_withheld_bytes(self):
+        """Test that bytes withheld by staged streams are reserved in the connection window."""
+        strategy, _ = _strategy()
+        window = strategy._staging_window()
+        strategy.stage_request(0, strategy._request_builder.build_request("POST", "/a", content=b"abc"))
+
+        assert strategy._staging_window() == window - 3
+        strategy.cleanup()
@@ -0,0 +1,45 @@
+"""
+Tests for target.socket options.
+"""
+
+import socket
+
+from treco.http.sockopts import connect_socket, corked, describe_socket_options, socket_options
+from treco.models.config import SocketConfig
+
+
+def test_default_options_disable_nagle():
+    """Test that only TCP_NODELAY is set by default."""
+    assert socket_options(SocketConfig()) == [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+
+def test_describe_socket_options():
+    """Test the startup log description."""
+    config = SocketConfig(nodelay=False, sndbuf=4096, bind="127.0.0.1")
+
+    assert describe_socket_options(config) == "TCP_NODELAY=off, SO_SNDBUF=4096, bind=127.0.0.1"
+
+
+def test_connect_socket_applies_options():
+    """Test that options and the local address are set on the connection."""
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    host, port = listener.getsockname()
+
+    config = SocketConfig(nodelay=False, rcvbuf=65536, cork=True)
+    sock = connect_socket(host, port, 5.0, socket_options(config), local_address="127.0.0.1")
+    server, _ = listener.accept()
+    try:
+        assert sock.getsockname()[0] == "127.0.0.1"
+        assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY) == 0
+        # Linux doubles the requested size for bookkeeping
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) >= 65536
+
+        with corked(sock, config.cork):
+            sock.sendall(b"corked")
+        assert server.recv(6) == b"corked"
+    finally:
+        sock.close()
+        server.close()
+        listener.close()
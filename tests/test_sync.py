@@ -0,0 +1,135 @@
+"""
+Tests for the threading sync mechanisms.
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from treco.models.config import ThreadGroup
+from treco.sync import (
+    EventfdSync,
+    HybridSync,
+    ReleaseSchedule,
+    SpinBarrierSync,
+    create_sync_mechanism,
+)
+
+
+def _run(sync, num_threads):
+    """Run num_threads threads through sync.wait() and return when they passed."""
+    passed = []
+
+    def worker(thread_id):
+        sync.wait(thread_id)
+        passed.append(thread_id)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    return passed
+
+
+BARRIERS = [
+    "barrier",
+    "spin_barrier",
+    "hybrid",
+    pytest.param("eventfd", marks=pytest.mark.skipif(not hasattr(os, "eventfd"), reason="requires eventfd")),
+]
+
+
+@pytest.mark.parametrize("name", BARRIERS)
+class TestBarriers:
+    """Behaviour shared by every barrier-like mechanism."""
+
+    def test_releases_all_threads(self, name):
+        """Test that every thread passes once all of them arrived."""
+        sync = create_sync_mechanism(name)
+        sync.prepare(8)
+
+        assert sorted(_run(sync, 8)) == list(range(8))
+
+    def test_reports_release_skew(self, name):
+        """Test that the release skew is measured."""
+        sync = create_sync_mechanism(name)
+        sync.prepare(4)
+        _run(sync, 4)
+
+        skew = sync.release_skew_ns()
+        assert skew is not None and skew >= 0
+
+    def test_holds_until_last_arrival(self, name):
+        """Test that nobody passes while a thread is missing."""
+        sync = create_sync_mechanism(name)
+        sync.prepare(3)
+        passed = []
+
+        def worker(thread_id):
+            sync.wait(thread_id)
+            passed.append(thread_id)
+
+        early = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(2)]
+        for thread in early:
+            thread.start()
+        for thread in early:
+            thread.join(timeout=0.1)
+        assert passed == []
+
+        worker(2)
+        for thread in early:
+            thread.join(timeout=10)
+        assert sorted(passed) == [0, 1, 2]
+
+
+def test_not_prepared():
+    """Test that wait() before prepare() raises."""
+    for sync in (SpinBarrierSync(), HybridSync(), EventfdSync()):
+        with pytest.raises(RuntimeError):
+            sync.wait(0)
+
+
+def test_spin_barrier_is_reusable():
+    """Test that the spin barrier resets after each release."""
+    sync = SpinBarrierSync()
+    sync.prepare(2)
+
+    assert sorted(_run(sync, 2)) == [0, 1]
+    assert sorted(_run(sync, 2)) == [0, 1]
+
+
+def test_no_skew_without_release():
+    """Test that mechanisms report no skew before a release."""
+    sync = HybridSync(lead_ns=100_000)
+    sync.prepare(2)
+
+    assert sync.release_skew_ns() is None
+
+
+class TestReleaseSchedule:
+    """Test cases for ReleaseSchedule."""
+
+    def test_one_timestamp_per_epoch(self):
+        """Test that every thread of a release shares the first timestamp."""
+        schedule = ReleaseSchedule()
+        first = schedule.mark(1)
+
+        assert schedule.mark(1) == first
+        assert schedule.mark(2) > first
+
+    def test_waits_for_offset(self):
+        """Test that wait() returns no earlier than the offset."""
+        schedule = ReleaseSchedule()
+
+        release_ns = schedule.wait(300_000)
+
+        assert time.perf_counter_ns() - release_ns >= 300_000
+
+    def test_group_offset(self):
+        """Test that group delays add up to one offset."""
+        group = ThreadGroup(name="g", threads=1, delay_ms=1, delay_us=250, delay_ns=7)
+
+        assert group.offset_ns == 1_250_007
@@ -0,0 +1,98 @@
+"""
+Tests for asyncio synchronization mechanisms.
+"""
+
+import asyncio
+
+import pytest
+
+from treco.sync import (
+    AsyncBarrierSync,
+    AsyncCountdownLatchSync,
+    AsyncSemaphoreSync,
+    create_async_sync_mechanism,
+)
+
+
+class TestAsyncBarrierSync:
+    """Test cases for AsyncBarrierSync."""
+
+    def test_releases_when_all_arrive(self):
+        """Test that no task passes the barrier before the last one arrives."""
+        sync = AsyncBarrierSync()
+        order = []
+
+        async def task(thread_id):
+            order.append(("arrive", thread_id))
+            await sync.wait(thread_id)
+            order.append(("pass", thread_id))
+
+        async def main():
+            sync.prepare(5)
+            await asyncio.gather(*(task(i) for i in range(5)))
+
+        asyncio.run(main())
+
+        assert [kind for kind, _ in order[:5]] == ["arrive"] * 5
+        assert [kind for kind, _ in order[5:]] == ["pass"] * 5
+
+    def test_reusable(self):
+        """Test that the barrier resets after each release."""
+        sync = AsyncBarrierSync()
+
+        async def main():
+            sync.prepare(3)
+            for _ in range(2):
+                await asyncio.wait_for(asyncio.gather(*(sync.wait(i) for i in range(3))), timeout=1)
+
+        asyncio.run(main())
+
+    def test_not_prepared(self):
+        """Test that wait() before prepare() raises RuntimeError."""
+        with pytest.raises(RuntimeError):
+            asyncio.run(AsyncBarrierSync().wait(0))
+
+
+class TestAsyncCountdownLatchSync:
+    """Test cases for AsyncCountdownLatchSync."""
+
+    def test_releases_at_zero(self):
+        """Test that waiting tasks are released after N release() calls."""
+        sync = AsyncCountdownLatchSync()
+
+        async def main():
+            sync.prepare(2)
+            waiter = asyncio.ensure_future(sync.wait(0))
+            await asyncio.sleep(0)
+            sync.release()
+            await asyncio.sleep(0)
+            assert not waiter.done()
+            sync.release()
+            await asyncio.wait_for(waiter, timeout=1)
+
+        asyncio.run(main())
+
+
+class TestAsyncSemaphoreSync:
+    """Test cases for AsyncSemaphoreSync."""
+
+    def test_limits_concurrency(self):
+        """Test that at most N tasks pass until a slot is released."""
+        sync = AsyncSemaphoreSync()
+
+        async def main():
+            sync.prepare(1)
+            await sync.wait(0)
+            second = asyncio.ensure_future(sync.wait(1))
+            await asyncio.sleep(0)
+            assert not second.done()
+            sync.release()
+            await asyncio.wait_for(second, timeout=1)
+
+        asyncio.run(main())
+
+
+def test_factory_unknown_mechanism():
+    """Test that unknown mechanism names are rejected."""
+    with pytest.raises(ValueError):
+        create_async_sync_mechanism("spin")
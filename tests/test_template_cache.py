@@ -0,0 +1,51 @@
+"""
+Tests for the compiled template cache of TemplateEngine.
+"""
+
+import pytest
+
+from treco.metrics import MetricsRegistry
+from treco.template import TemplateEngine
+
+
+@pytest.fixture
+def counter():
+    """Enable metrics for one test."""
+    MetricsRegistry.initialize(enabled=True)
+    yield MetricsRegistry.get_counter()
+    MetricsRegistry.initialize(enabled=False)
+
+
+def _count(counter, name):
+    return counter.counts.get((name, frozenset()), 0)
+
+
+class TestTemplateCache:
+    """Test cases for compiled template caching."""
+
+    def test_compiles_once_per_source(self, counter):
+        """Test that the same source is compiled once and counted as hits after."""
+        engine = TemplateEngine(bytecode_cache=False)
+
+        assert [engine.render("id={{ n }}", {"n": n}) for n in range(3)] == ["id=0", "id=1", "id=2"]
+        assert (_count(counter, "template.cache.miss"), _count(counter, "template.cache.hit")) == (1, 2)
+
+    def test_evicts_least_recently_used(self):
+        """Test that the cache keeps at most cache_size templates."""
+        engine = TemplateEngine(cache_size=2, bytecode_cache=False)
+        first = engine.get_template("a")
+        engine.get_template("b")
+        engine.get_template("a")
+        engine.get_template("c")
+
+        assert engine.get_template("a") is first
+        assert list(engine._templates) == ["c", "a"]
+
+    def test_bytecode_cache_is_reused(self, tmp_path):
+        """Test that compiled code is stored on disk and loaded by a new engine."""
+        TemplateEngine(bytecode_cache_dir=str(tmp_path)).render("{{ x | upper }}", {"x": "a"})
+        stored = list(tmp_path.iterdir())
+
+        assert len(stored) == 1
+        assert TemplateEngine(bytecode_cache_dir=str(tmp_path)).render("{{ x | upper }}", {"x": "b"}) == "B"
+        assert list(tmp_path.iterdir()) == stored
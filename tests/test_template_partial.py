@@ -0,0 +1,64 @@
+"""
+Tests for partial evaluation of request templates.
+"""
+
+from treco.template import TemplateEngine
+
+REQUEST = """POST /redeem HTTP/1.1
+Host: {{ target.host }}
+Authorization: Bearer {{ token | upper }}
+
+{"voucher": "{{ thread.input.code }}", "id": {{ thread.id }}}
+{% if group %}group={{ group.name }}{% endif %}
+"""
+
+
+def _engine():
+    return TemplateEngine(bytecode_cache=False)
+
+
+class TestTemplatePlan:
+    """Test cases for TemplateEngine.compile_plan() and bind()."""
+
+    def test_renders_like_full_template(self):
+        """Test that bound templates render exactly what render() does."""
+        engine = _engine()
+        shared = {"target": {"host": "example.com"}, "token": "abc"}
+        bound = engine.bind(engine.compile_plan(REQUEST), shared)
+
+        for thread_id in range(3):
+            variables = dict(shared, thread={"id": thread_id, "input": {"code": f"V{thread_id}"}}, group=None)
+            assert bound.render(variables) == engine.render(REQUEST, variables)
+
+    def test_splits_on_thread_variables(self):
+        """Test that only segments reading thread, input or group vary."""
+        plan = _engine().compile_plan("A {{ token }} B {{ thread.id }} C {{ input.x }}{{ group }}")
+
+        assert [segment.varying for segment in plan.segments] == [False, True, False, True]
+
+    def test_is_invariant(self):
+        """Test that only templates without varying segments are invariant."""
+        engine = _engine()
+
+        assert engine.compile_plan("GET /{{ token }} HTTP/1.1").is_invariant
+        assert not engine.compile_plan("GET /{{ thread.id }} HTTP/1.1").is_invariant
+
+    def test_invariant_parts_render_once(self):
+        """Test that invariant segments are not rendered again per thread."""
+        engine = _engine()
+        bound = engine.bind(engine.compile_plan("{{ token }}-{{ thread.id }}"), {"token": "first"})
+
+        assert bound.render({"token": "second", "thread": {"id": 7}}) == "first-7"
+
+    def test_assignments_are_not_split(self):
+        """Test that templates binding names stay in one varying segment."""
+        plan = _engine().compile_plan("{% set n = thread.id %}{{ token }}{{ n }}")
+
+        assert [segment.varying for segment in plan.segments] == [True]
+        assert not plan.has_invariant
+
+    def test_volatile_functions_vary(self):
+        """Test that totp and random are evaluated per thread."""
+        plan = _engine().compile_plan("{{ totp(seed) }} {{ [1, 2] | random }}")
+
+        assert [segment.varying for segment in plan.segments] == [True, False, True]
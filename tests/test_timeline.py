@@ -0,0 +1,78 @@
+"""
+Tests for per-thread phase timelines.
+"""
+
+import socket
+
+import httpx
+
+from treco.http.raw import RawSession
+from treco.orchestrator.timeline import NULL_TIMELINE, Timeline, create_timeline, phase_durations
+
+
+class TestTimeline:
+    """Test cases for Timeline."""
+
+    def test_trace_events(self):
+        """Test that only the first write and response head are recorded."""
+        timeline = Timeline()
+
+        timeline.trace("http11.send_request_headers.complete", {"timestamp_ns": 10})
+        timeline.trace("http11.send_request_body.complete", {"timestamp_ns": 20})
+        timeline.trace("http11.receive_response_headers.complete", {"timestamp_ns": 30})
+        timeline.trace("http11.receive_response_body.complete", {"timestamp_ns": 40})
+
+        assert (timeline.first_write_ns, timeline.first_byte_ns) == (10, 30)
+        assert timeline.complete_ns is None
+
+    def test_next_round_keeps_setup(self):
+        """Test that a new round keeps render/parse/connect only."""
+        timeline = Timeline(render_ns=1, parse_ns=2, connect_ns=3, sync_arrival_ns=4, first_write_ns=5)
+
+        assert timeline.next_round() == Timeline(render_ns=1, parse_ns=2, connect_ns=3)
+
+    def test_update_skips_missing(self):
+        """Test merging timestamps recorded elsewhere (worker processes)."""
+        timeline = Timeline(render_ns=1, parse_ns=2)
+        timeline.update(Timeline(connect_ns=3, complete_ns=9).as_dict())
+
+        assert (timeline.render_ns, timeline.connect_ns, timeline.complete_ns) == (1, 3, 9)
+
+    def test_disabled(self):
+        """Test that the disabled timeline records nothing and installs no hook."""
+        timeline = create_timeline(False)
+        request = httpx.Request("GET", "http://example.com/")
+
+        timeline.mark("render")
+        timeline.attach(request)
+
+        assert timeline is NULL_TIMELINE
+        assert timeline.as_dict() is None
+        assert "trace" not in request.extensions
+
+
+def test_phase_durations():
+    """Test durations between recorded phases, skipping missing ones."""
+    durations = phase_durations(Timeline(render_ns=0, parse_ns=5, connect_ns=7, sync_release_ns=20).as_dict())
+
+    assert durations == {"render->parse": 5, "parse->connect": 2, "connect->sync_release": 13}
+
+
+def test_raw_session_emits_trace():
+    """Test that the raw send engine reports its write and the response head."""
+    client, server = socket.socketpair()
+    try:
+        server.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+        session = RawSession(client, httpx.Client(base_url="http://example.com"))
+        request = session.build_request("GET", "/")
+
+        timeline = Timeline()
+        timeline.attach(request)
+        response = session.send(request)
+
+        assert response.status_code == 200
+        assert timeline.first_write_ns is not None
+        assert timeline.first_byte_ns >= timeline.first_write_ns
+    finally:
+        client.close()
+        server.close()
@@ -0,0 +1,114 @@
+"""
+Tests for kernel socket timestamps (SO_TIMESTAMPING).
+"""
+
+import socket
+import sys
+import threading
+import time
+
+import httpx
+import pytest
+
+from treco.http.raw import RawSession
+from treco.http.timestamping import SocketTimestamper
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="SO_TIMESTAMPING is Linux only")
+
+
+@pytest.fixture
+def tcp_pair():
+    """Connected loopback TCP sockets (client, server)."""
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    client = socket.create_connection(listener.getsockname())
+    server, _ = listener.accept()
+    listener.close()
+    yield client, server
+    client.close()
+    server.close()
+
+
+class TestSocketTimestamper:
+    """Test cases for SocketTimestamper."""
+
+    def test_last_tx_is_latest_write(self, tcp_pair):
+        """Test that the TX timestamp of the last of several writes is returned."""
+        client, server = tcp_pair
+        stamper = SocketTimestamper(client)
+        try:
+            client.sendall(b"first")
+            first = stamper.wait_tx(1.0)
+            client.sendall(b"second")
+            second = stamper.wait_tx(1.0)
+
+            assert first is not None and second is not None
+            assert second >= first
+            assert stamper.last_tx() is None
+        finally:
+            stamper.close()
+
+    def test_peek_rx_keeps_data(self, tcp_pair):
+        """Test that reading the RX timestamp does not consume data."""
+        client, server = tcp_pair
+        stamper = SocketTimestamper(client)
+        try:
+            server.sendall(b"response")
+
+            assert stamper.peek_rx(1.0) is not None
+            assert client.recv(100) == b"response"
+        finally:
+            stamper.close()
+
+    def test_close_keeps_socket_open(self, tcp_pair):
+        """Test that closing the timestamper leaves the socket usable."""
+        client, server = tcp_pair
+        SocketTimestamper(client).close()
+
+        client.sendall(b"ping")
+        assert server.recv(4) == b"ping"
+
+
+def test_raw_session_records_kernel_timestamps(tcp_pair):
+    """Test that the raw send engine stores TX and RX timestamps per request."""
+    client, server = tcp_pair
+    session = RawSession(
+        client,
+        httpx.Client(base_url="http://example.com"),
+        timestamper=SocketTimestamper.attach(client),
+    )
+    server.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+
+    response = session.send(session.build_request("GET", "/"))
+    stamps = session.kernel_timestamps
+
+    assert response.status_code == 200
+    assert stamps.tx_ns is not None and stamps.rx_ns is not None
+    session.close()
+
+
+def test_raw_session_rx_timestamp_of_later_response(tcp_pair):
+    """Test that the RX timestamp is read when the response follows the send."""
+    client, server = tcp_pair
+    session = RawSession(
+        client,
+        httpx.Client(base_url="http://example.com"),
+        timestamper=SocketTimestamper.attach(client),
+    )
+
+    def reply():
+        server.recv(65536)
+        time.sleep(0.05)
+        server.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+
+    replier = threading.Thread(target=reply)
+    replier.start()
+    response = session.send(session.build_request("GET", "/"))
+    replier.join()
+    stamps = session.kernel_timestamps
+
+    assert response.status_code == 200
+    assert stamps.tx_ns is not None and stamps.rx_ns is not None
+    assert stamps.rx_ns - stamps.tx_ns >= 40_000_000
+    session.close()
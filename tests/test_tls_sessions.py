@@ -0,0 +1,158 @@
+"""
+Tests for shared SSL contexts and TLS session resumption.
+"""
+
+import shutil
+import socket
+import ssl
+import subprocess
+import threading
+import time
+
+import pytest
+
+from treco.connection import transport
+from treco.connection.transport import TLSSessionCache, clear_ssl_contexts, shared_ssl_context
+
+
+@pytest.fixture(scope="module")
+def certificate(tmp_path_factory):
+    """Self-signed certificate and key for localhost."""
+    if shutil.which("openssl") is None:
+        pytest.skip("requires openssl")
+    directory = tmp_path_factory.mktemp("tls")
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+            "-subj", "/CN=localhost", "-keyout", str(key), "-out", str(cert),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return str(cert), str(key)
+
+
+class _TLSServer:
+    """TLS server that keeps connections open; optionally drops the first one."""
+
+    def __init__(self, certificate, drop_first=False):
+        self._context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self._context.load_cert_chain(*certificate)
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.bind(("127.0.0.1", 0))
+        self._listener.listen(8)
+        self.port = self._listener.getsockname()[1]
+        self._drop_first = drop_first
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self._listener.accept()
+            except OSError:
+                return
+            if self._drop_first:
+                self._drop_first = False
+                conn.close()
+                continue
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        try:
+            with self._context.wrap_socket(conn, server_side=True) as tls:
+                while tls.recv(65535):
+                    pass
+        except OSError:
+            pass
+
+    def close(self):
+        self._listener.close()
+
+
+def _client_context():
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def _connect(cache, context, port):
+    sock = socket.create_connection(("127.0.0.1", port))
+    return cache.wrap_socket(context, sock, "localhost", port, timeout=5)[0]
+
+
+class TestSharedSSLContext:
+    """Test cases for shared_ssl_context and clear_ssl_contexts."""
+
+    def test_one_context_per_key(self):
+        """Test that the factory runs once per key and the context is shared."""
+        clear_ssl_contexts()
+        created = []
+
+        def factory():
+            created.append(_client_context())
+            return created[-1]
+
+        first = shared_ssl_context(("example.com", 443), factory)
+        assert shared_ssl_context(("example.com", 443), factory) is first
+        assert shared_ssl_context(("example.com", 8443), factory) is not first
+        assert len(created) == 2
+
+        clear_ssl_contexts()
+        assert shared_ssl_context(("example.com", 443), factory) is not first
+
+
+class TestTLSSessionCache:
+    """Test cases for TLSSessionCache."""
+
+    def test_second_connection_resumes(self, certificate):
+        """Test that the second connection to a target resumes the first one's session."""
+        server = _TLSServer(certificate)
+        cache = TLSSessionCache()
+        context = _client_context()
+        try:
+            first = _connect(cache, context, server.port)
+            second = _connect(cache, context, server.port)
+
+            assert not first.session_reused
+            assert second.session_reused
+            assert (cache.full_handshakes, cache.resumed_handshakes) == (1, 1)
+            first.close()
+            second.close()
+        finally:
+            server.close()
+
+    def test_failed_first_handshake_releases_gate(self, certificate):
+        """Test that a failed first handshake does not hold back the next connection."""
+        server = _TLSServer(certificate, drop_first=True)
+        cache = TLSSessionCache()
+        context = _client_context()
+        try:
+            with pytest.raises(OSError):
+                _connect(cache, context, server.port)
+
+            start = time.monotonic()
+            sock = _connect(cache, context, server.port)
+            assert time.monotonic() - start < transport._GATE_WAIT
+            assert not sock.session_reused
+            sock.close()
+        finally:
+            server.close()
+
+    def test_gate_wait_times_out(self, certificate, monkeypatch):
+        """Test that a connection stops waiting for a stalled first handshake."""
+        monkeypatch.setattr(transport, "_GATE_WAIT", 0.05)
+        server = _TLSServer(certificate)
+        cache = TLSSessionCache()
+        context = _client_context()
+        gate = cache._gate((id(context), "localhost", server.port))
+        gate.acquire()
+        try:
+            sock = _connect(cache, context, server.port)
+            assert not sock.session_reused
+            assert cache.full_handshakes == 1
+            sock.close()
+        finally:
+            gate.release()
+            server.close()
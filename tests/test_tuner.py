@@ -0,0 +1,97 @@
+"""
+Tests for race parameter tuning.
+"""
+
+import pytest
+import yaml
+
+from treco.orchestrator.tuner import RaceTuner, TrialResult
+
+CONFIG = """
+metadata: {name: t, version: "1.0", author: a, vulnerability: CWE-362}
+target: {host: 127.0.0.1, port: 8080}
+entrypoint: {state: race}
+states:
+  race:
+    description: r
+    race:
+      threads: 10
+    request: |
+      GET / HTTP/1.1
+      Host: 127.0.0.1
+    next:
+      - on_status: 200
+        goto: end
+  end:
+    description: e
+    request: ""
+"""
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "attack.yaml"
+    path.write_text(CONFIG)
+    return str(path)
+
+
+def _fake_trials(tuner, limit, best_pair=("last_byte", "hybrid")):
+    """Replace real runs: threads above limit fail, best_pair has the lowest skew."""
+
+    def trial(threads, strategy, mechanism):
+        result = TrialResult(threads, strategy, mechanism, total=threads, successful=threads)
+        result.errors = threads if threads > limit else 0
+        result.skew_ns = 10 if (strategy, mechanism) == best_pair else 1000
+        tuner.trials.append(result)
+        return result
+
+    tuner._trial = trial
+
+
+class TestRaceTuner:
+    """Test cases for RaceTuner."""
+
+    def test_finds_race_state(self, config_path):
+        """Test that the first race state and its threads are picked."""
+        tuner = RaceTuner(config_path)
+
+        assert tuner.state_name == "race"
+        assert tuner.max_threads == 40
+
+    def test_rejects_non_race_state(self, config_path):
+        """Test that only race states can be tuned."""
+        with pytest.raises(ValueError):
+            RaceTuner(config_path, state_name="end")
+
+    def test_picks_lowest_skew_pair(self, config_path):
+        """Test that the matrix winner is used for the thread search."""
+        tuner = RaceTuner(config_path, max_threads=10)
+        _fake_trials(tuner, limit=100)
+
+        best = tuner.run()
+
+        assert (best.connection_strategy, best.sync_mechanism) == ("last_byte", "hybrid")
+        assert len(tuner.trials) == 6
+
+    def test_bisects_thread_count(self, config_path):
+        """Test that the largest thread count without errors is found."""
+        tuner = RaceTuner(config_path, max_threads=100)
+        _fake_trials(tuner, limit=37)
+
+        best = tuner.run()
+
+        assert 34 <= best.threads <= 37
+        assert best.error_rate == 0
+
+    def test_overlay(self, config_path):
+        """Test that the overlay targets the tuned state."""
+        tuner = RaceTuner(config_path)
+        overlay = yaml.safe_load(tuner.overlay(TrialResult(25, "preconnect", "barrier")))
+
+        assert overlay == {
+            "states": {
+                "race": {
+                    "race": {"threads": 25, "connection_strategy": "preconnect", "sync_mechanism": "barrier"}
+                }
+            }
+        }
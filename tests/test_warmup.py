@@ -0,0 +1,102 @@
+"""
+Tests for handshake-only connection warmup.
+"""
+
+import socket
+import threading
+import time
+
+import httpx
+import pytest
+
+from treco.connection.preconnect import PreconnectStrategy
+from treco.connection.transport import PrewarmedBackend
+from treco.http import HTTPClient
+from treco.models.config import ProxyConfig, TargetConfig
+
+
+class _RecordingServer:
+    """HTTP/1.1 server recording the request lines received on each connection."""
+
+    def __init__(self):
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.bind(("127.0.0.1", 0))
+        self._listener.listen(8)
+        self.port = self._listener.getsockname()[1]
+        self.connections = []
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self._listener.accept()
+            except OSError:
+                return
+            lines = []
+            self.connections.append(lines)
+            threading.Thread(target=self._serve, args=(conn, lines), daemon=True).start()
+
+    def _serve(self, conn, lines):
+        buffer = b""
+        with conn:
+            while True:
+                while b"\r\n\r\n" not in buffer:
+                    data = conn.recv(65536)
+                    if not data:
+                        return
+                    buffer += data
+                head, buffer = buffer.split(b"\r\n\r\n", 1)
+                lines.append(head.split(b"\r\n", 1)[0].decode())
+                conn.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+
+    def close(self):
+        self._listener.close()
+
+
+@pytest.fixture
+def server():
+    """Start a recording server."""
+    server = _RecordingServer()
+    yield server
+    server.close()
+
+
+def _strategy(target):
+    strategy = PreconnectStrategy()
+    strategy._store_client_config(HTTPClient(target))
+    return strategy
+
+
+def _wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestHandshakeWarmup:
+    """Test cases for the handshake warmup mode."""
+
+    def test_direct_connection_is_parked(self, server):
+        """Test that warmup connects without a request and the connection is reused."""
+        strategy = _strategy(TargetConfig(host="127.0.0.1", port=server.port))
+        client = httpx.Client(**strategy._build_client_kwargs())
+
+        strategy._warmup_connection(client)
+        _wait_for(lambda: server.connections)
+        assert server.connections == [[]]
+
+        client.get("/race")
+        assert server.connections == [["GET /race HTTP/1.1"]]
+        client.close()
+
+    def test_proxied_client_falls_back_to_head(self, server):
+        """Test that a proxied client warms up with HEAD through the proxy."""
+        target = TargetConfig(host="127.0.0.1", port=1, proxy=ProxyConfig(host="127.0.0.1", port=server.port))
+        strategy = _strategy(target)
+        client = httpx.Client(**strategy._build_client_kwargs())
+
+        assert PrewarmedBackend.install(client) is None
+        strategy._warmup_connection(client)
+
+        assert server.connections == [["HEAD http://127.0.0.1:1/ HTTP/1.1"]]
+        client.close()
@@ -0,0 +1,95 @@
+"""
+Tests for the persistent race worker pool.
+"""
+
+import threading
+
+import pytest
+
+from treco.orchestrator.worker_pool import RaceWorkerPool
+from treco.parser.loaders.yaml import YAMLLoader
+
+
+@pytest.fixture
+def pool():
+    """Create a small pool."""
+    pool = RaceWorkerPool(size=4)
+    yield pool
+    pool.shutdown()
+
+
+class TestRaceWorkerPool:
+    """Test cases for RaceWorkerPool."""
+
+    def test_results_in_task_order(self, pool):
+        """Test that results come back in task order."""
+        assert pool.run([lambda i=i: i * i for i in range(4)]) == [0, 1, 4, 9]
+
+    def test_tasks_run_concurrently(self, pool):
+        """Test that all tasks of a run can meet at a barrier."""
+        barrier = threading.Barrier(4, timeout=5)
+
+        assert pool.run([barrier.wait for _ in range(4)]) is not None
+
+    def test_workers_are_reused(self, pool):
+        """Test that no thread is created for a second run."""
+        first = pool.run([threading.get_ident for _ in range(4)])
+        second = pool.run([threading.get_ident for _ in range(4)])
+
+        assert first == second
+        assert len(set(first)) == 4
+
+    def test_grows_on_demand(self, pool):
+        """Test that the pool grows when a run needs more workers."""
+        pool.run([lambda: None for _ in range(6)])
+
+        assert pool.size == 6
+
+    def test_reraises_task_error(self, pool):
+        """Test that a failing task raises after the others finished."""
+        done = []
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            pool.run([fail, lambda: done.append(1)])
+        assert done == [1]
+
+    def test_stack_size_is_restored(self):
+        """Test that the global thread stack size is put back."""
+        before = threading.stack_size()
+        pool = RaceWorkerPool(size=1, stack_size_kb=256)
+        pool.shutdown()
+
+        assert threading.stack_size() == before
+
+    def test_rejects_tiny_stack(self):
+        """Test that stacks below the minimum are rejected."""
+        with pytest.raises(ValueError):
+            RaceWorkerPool(size=1, stack_size_kb=4)
+
+
+class TestWorkerPoolConfig:
+    """Test cases for the top-level worker_pool section."""
+
+    def test_loaded_from_top_level(self, tmp_path):
+        """Test that worker_pool is read from the top level, not from target."""
+        path = tmp_path / "attack.yaml"
+        path.write_text(
+            "metadata: {name: t, version: '1.0', author: a, vulnerability: CWE-362}\n"
+            "target: {host: example.com, port: 80}\n"
+            "worker_pool: {size: 8, stack_size_kb: 256}\n"
+            "entrypoint: {state: race}\n"
+            "states:\n"
+            "  race:\n"
+            "    description: race\n"
+            "    request: \"GET / HTTP/1.1\\nHost: example.com\\n\"\n"
+            "    race: {threads: 2}\n"
+            "    next: [{goto: end}]\n"
+            "  end: {description: end}\n"
+        )
+
+        config = YAMLLoader().load(str(path))
+
+        assert (config.worker_pool.size, config.worker_pool.stack_size_kb) == (8, 256)